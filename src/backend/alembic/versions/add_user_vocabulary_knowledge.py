@@ -0,0 +1,35 @@
+"""add user vocabulary knowledge bitsets
+
+Revision ID: user_vocab_knowledge
+Revises: add_chunk_duration
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "user_vocab_knowledge"
+down_revision = "add_chunk_duration"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Derived snapshot of user_vocabulary_progress; rebuilt whenever it is missing or stale
+    op.create_table(
+        "user_vocabulary_knowledge",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("language", sa.String(length=5), primary_key=True),
+        sa.Column("index_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("progress_stamp", sa.String(length=100), nullable=False),
+        sa.Column("known_bits", sa.LargeBinary(), nullable=False),
+        sa.Column("extra_lemmas", sa.Text(), nullable=False, server_default=""),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("user_vocabulary_knowledge")
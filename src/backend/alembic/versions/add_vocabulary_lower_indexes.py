@@ -0,0 +1,34 @@
+"""add case-insensitive vocabulary lookup indexes
+
+Revision ID: vocab_lower_indexes
+Revises: user_vocab_knowledge
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "vocab_lower_indexes"
+down_revision = "user_vocab_knowledge"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Bulk word lookups match lower(lemma) / lower(word) within a language
+    op.execute(
+        sa.text(
+            "CREATE INDEX IF NOT EXISTS idx_vocabulary_lang_lower_lemma ON vocabulary_words (language, LOWER(lemma))"
+        )
+    )
+    op.execute(
+        sa.text("CREATE INDEX IF NOT EXISTS idx_vocabulary_lang_lower_word ON vocabulary_words (language, LOWER(word))")
+    )
+
+
+def downgrade():
+    op.execute(sa.text("DROP INDEX IF EXISTS idx_vocabulary_lang_lower_word"))
+    op.execute(sa.text("DROP INDEX IF EXISTS idx_vocabulary_lang_lower_lemma"))
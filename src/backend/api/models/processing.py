@@ -29,6 +29,9 @@ class ProcessingStatus(BaseModel):
     )
     subtitle_path: str | None = Field(None, description="Path to German transcription subtitle file (yellow)")
     translation_path: str | None = Field(None, description="Path to English translation subtitle file (white)")
+    speech_ratio: float | None = Field(
+        None, ge=0, le=1, description="Fraction of the last transcribed chunk detected as speech (VAD pre-pass)"
+    )
 
     model_config = ConfigDict(
         # Allow extra fields for flexibility (background tasks may add custom fields)
@@ -110,6 +113,26 @@ class ChunkProcessingRequest(BaseModel):
     )
 
 
+class EpisodePipelineRequest(BaseModel):
+    video_path: str = Field(..., min_length=1, description="Path to the video file to process")
+    start_time: float = Field(..., ge=0, description="Start of the chunk being watched in seconds")
+    end_time: float = Field(..., gt=0, description="End of the last chunk in seconds (episode duration)")
+    is_reprocessing: bool = Field(
+        default=False, description="True if reprocessing after vocabulary game (generates postgame filtered subtitles)"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "video_path": "/videos/Superstore/S01/E01.mp4",
+                "start_time": 0.0,
+                "end_time": 1320.0,
+                "is_reprocessing": False,
+            }
+        }
+    )
+
+
 class SelectiveTranslationRequest(BaseModel):
     srt_path: str = Field(..., min_length=1, description="Path to the SRT subtitle file")
     known_words: list[str] = Field(..., description="List of words that the user already knows")
@@ -126,10 +149,5 @@ class TaskResponse(BaseModel):
     status: str = Field(..., description="Initial status of the task (e.g., 'started')")
 
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "task_id": "transcribe_123_1234567890.123",
-                "status": "started"
-            }
-        }
+        json_schema_extra={"example": {"task_id": "transcribe_123_1234567890.123", "status": "started"}}
     )
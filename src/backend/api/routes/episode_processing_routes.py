@@ -13,11 +13,13 @@ from core.config import settings
 from core.dependencies import (
     current_active_user,
     get_task_progress_registry,
+    require_transcription_capacity,
 )
 from database.models import User
 
 from ..models.processing import (
     ChunkProcessingRequest,
+    EpisodePipelineRequest,
     ProcessingStatus,
 )
 
@@ -72,7 +74,7 @@ async def run_chunk_processing(
         )
 
 
-@router.post("/chunk", name="process_chunk")
+@router.post("/chunk", name="process_chunk", dependencies=[Depends(require_transcription_capacity)])
 async def process_chunk(
     request: ChunkProcessingRequest,
     background_tasks: BackgroundTasks,
@@ -175,6 +177,103 @@ async def process_chunk(
         raise HTTPException(status_code=500, detail=f"Chunk processing failed: {e!s}") from e
 
 
+async def run_episode_pipeline(
+    video_path: str,
+    chunks: list,
+    task_progress: dict[str, Any],
+    user_id: int,
+    is_reprocessing: bool = False,
+) -> None:
+    """Process consecutive chunks of a video with overlapping extract/transcribe/finalize stages"""
+    from core.database import get_async_session
+    from services.processing.chunk_processor import ChunkProcessingService
+    from services.processing.episode_pipeline import EpisodePipeline
+
+    try:
+        async for db_session in get_async_session():
+            pipeline = EpisodePipeline(ChunkProcessingService(db_session))
+            await pipeline.run(
+                video_path, chunks, user_id, task_progress, session_token=None, is_reprocessing=is_reprocessing
+            )
+            break  # Only use the first (and only) session
+
+    except Exception as e:
+        # Per-chunk failures are recorded in task_progress by the pipeline itself
+        logger.error(f"Episode pipeline failed for {video_path}: {e}", exc_info=True)
+
+
+@router.post(
+    "/episode-pipeline", name="process_episode_pipeline", dependencies=[Depends(require_transcription_capacity)]
+)
+async def process_episode_pipeline(
+    request: EpisodePipelineRequest,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(current_active_user),
+    task_progress: dict[str, Any] = Depends(get_task_progress_registry),
+):
+    """
+    Process consecutive chunks of a video as an overlapping pipeline.
+
+    Splits the range into chunks of the user's preferred chunk length
+    (`chunk_duration_minutes`) and processes them in playback order. While one chunk is
+    filtered and translated, the next one is already being transcribed and the one after
+    that extracted. Call this when the user starts watching a chunk so the following chunks
+    are ready by the time playback reaches them.
+
+    **Authentication Required**: Yes
+
+    Args:
+        request (EpisodePipelineRequest): Range specification with:
+            - video_path (str): Relative or absolute path to video file
+            - start_time (float): Start of the chunk being watched in seconds (>= 0)
+            - end_time (float): End of the last chunk in seconds (> start_time)
+        background_tasks (BackgroundTasks): FastAPI background task manager
+        current_user (User): Authenticated user
+        task_progress (dict): Task progress tracking registry
+
+    Returns:
+        dict: Pipeline initiation response with:
+            - status: "started"
+            - chunks: One entry per chunk with task_id, start_time and end_time
+
+    Raises:
+        HTTPException: 400 if the time range is invalid
+        HTTPException: 404 if video file not found
+
+    Note:
+        Each chunk task_id behaves like one returned by /chunk; monitor it with
+        /api/processing/progress/{task_id}.
+    """
+    normalized_path = request.video_path.replace("\\", "/")
+    full_path = (
+        Path(normalized_path) if normalized_path.startswith("/") else settings.get_videos_path() / normalized_path
+    )
+
+    if request.start_time < 0 or request.end_time <= request.start_time:
+        raise HTTPException(status_code=400, detail="Invalid chunk timing")
+
+    if not full_path.exists():
+        logger.error(f"Video file not found: {full_path}")
+        raise HTTPException(status_code=404, detail="Video file not found")
+
+    from services.processing.episode_pipeline import EpisodePipeline
+
+    chunks = EpisodePipeline.plan_chunks(
+        request.start_time, request.end_time, current_user.chunk_duration_minutes, current_user.id
+    )
+    background_tasks.add_task(
+        run_episode_pipeline, str(full_path), chunks, task_progress, current_user.id, request.is_reprocessing
+    )
+
+    logger.info(f"Started episode pipeline for {full_path.name}: {len(chunks)} chunks")
+    return {
+        "status": "started",
+        "chunks": [
+            {"task_id": chunk.task_id, "start_time": chunk.start_time, "end_time": chunk.end_time} for chunk in chunks
+        ],
+    }
+
+
 async def run_processing_pipeline(
     video_path: str,
     task_id: str,
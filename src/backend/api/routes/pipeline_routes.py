@@ -11,6 +11,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from core.dependencies import (
     current_active_user,
     get_task_progress_registry,
+    require_transcription_capacity,
 )
 from database.models import User
 
@@ -20,7 +21,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["pipeline"])
 
 
-@router.post("/full-pipeline", name="full_pipeline")
+@router.post("/full-pipeline", name="full_pipeline", dependencies=[Depends(require_transcription_capacity)])
 async def full_pipeline(
     request: FullPipelineRequest,
     background_tasks: BackgroundTasks,
@@ -14,8 +14,10 @@ from core.dependencies import (
     current_active_user,
     get_task_progress_registry,
     get_transcription_service,
+    require_transcription_capacity,
 )
 from database.models import User
+from services.model_registry import get_model_registry
 from services.transcriptionservice.interface import ITranscriptionService
 from utils.media_validator import is_valid_video_file
 
@@ -68,7 +70,8 @@ async def run_transcription(
         srt_path = video_file.with_suffix(".srt")
 
         logger.info(f"Transcribing video: {video_file} -> {srt_path}")
-        result = await transcription_service.transcribe_video(video_path=str(video_file), output_path=str(srt_path))
+        async with get_model_registry().async_lease(transcription_service):
+            result = await transcription_service.transcribe_video(video_path=str(video_file), output_path=str(srt_path))
 
         if result.get("success", False):
             task_progress[task_id] = {
@@ -103,7 +106,12 @@ async def run_transcription(
         }
 
 
-@router.post("/transcribe", name="transcribe_video", response_model=TaskResponse)
+@router.post(
+    "/transcribe",
+    name="transcribe_video",
+    response_model=TaskResponse,
+    dependencies=[Depends(require_transcription_capacity)],
+)
 async def transcribe_video(
     request: TranscribeRequest,
     background_tasks: BackgroundTasks,
@@ -141,7 +149,7 @@ async def transcribe_video(
         # Service availability check handled by dependency injection (would raise 500 if fails instantiation)
         # But we can check if it's None (though Depends usually implies success or error)
         if transcription_service is None:
-             # This shouldn't happen with proper DI unless factory returns None
+            # This shouldn't happen with proper DI unless factory returns None
             logger.warning("Transcription service not available")
             raise HTTPException(
                 status_code=422, detail="Transcription service is not available. Please check server configuration."
@@ -2,6 +2,7 @@
 
 This module handles:
 - Mark word as known/unknown
+- Mark a batch of words (one vocabulary game) as known/unknown
 - Bulk mark level operations
 - Delete progress entries
 - Get vocabulary statistics
@@ -17,6 +18,7 @@ from api.error_handlers import handle_api_errors, raise_not_found
 from core.database import get_async_session
 from core.dependencies import current_active_user, get_vocabulary_service
 from database.models import User
+from services.vocabulary.events import ProgressUpdatedEvent, publish_event
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["vocabulary"])
@@ -30,6 +32,22 @@ class MarkKnownRequest(BaseModel):
     known: bool = Field(..., description="Whether to mark as known")
 
 
+class MarkKnownDecision(BaseModel):
+    """One known/unknown decision of a batch"""
+
+    lemma: str = Field(..., min_length=1, max_length=200, description="The word lemma (base form)")
+    known: bool = Field(..., description="Whether to mark as known")
+
+
+class MarkKnownBatchRequest(BaseModel):
+    """Request to mark many words as known or unknown, e.g. all swipes of one game"""
+
+    language: str = Field(..., pattern=r"^[a-z]{2,3}$", description="Language code (required)")
+    decisions: list[MarkKnownDecision] = Field(
+        ..., min_length=1, max_length=500, description="Decisions in the order they were made"
+    )
+
+
 class BulkMarkLevelRequest(BaseModel):
     """Request to mark all words in a level as known"""
 
@@ -77,6 +95,48 @@ async def mark_word_known(
     return response
 
 
+@router.post("/mark-known/batch", name="mark_words_known_batch")
+@handle_api_errors("marking words as known/unknown")
+async def mark_words_known_batch(
+    request: MarkKnownBatchRequest,
+    current_user: User = Depends(current_active_user),
+    db: AsyncSession = Depends(get_async_session),
+    vocabulary_service=Depends(get_vocabulary_service),
+):
+    """
+    Mark many vocabulary words as known or unknown for the current user in one transaction.
+
+    **Authentication Required**: Yes
+
+    Args:
+        request (MarkKnownBatchRequest): Language and the list of lemma/known decisions
+
+    Returns:
+        dict: Update result with success, updated_count and one result (known, word, lemma,
+        level) per decision
+    """
+    result = await vocabulary_service.mark_words_known(
+        user_id=current_user.id,
+        decisions=[(decision.lemma, decision.known) for decision in request.decisions],
+        language=request.language,
+        db=db,
+    )
+
+    return {
+        "success": result.get("success", True),
+        "updated_count": result.get("updated_count", 0),
+        "results": [
+            {
+                "known": item["is_known"],
+                "word": item["word"],
+                "lemma": item["lemma"],
+                "level": item["level"],
+            }
+            for item in result.get("results", [])
+        ],
+    }
+
+
 @router.get("/stats", name="get_vocabulary_stats")
 @handle_api_errors("retrieving vocabulary statistics")
 async def get_vocabulary_stats(
@@ -94,9 +154,7 @@ async def get_vocabulary_stats(
     Returns:
         VocabularyStats: Statistics including total_words, known_words, by_level, mastery_percentage
     """
-    stats = await vocabulary_service.get_vocabulary_stats(
-        db, current_user.id, target_language, translation_language
-    )
+    stats = await vocabulary_service.get_vocabulary_stats(db, current_user.id, target_language, translation_language)
     return stats
 
 
@@ -176,6 +234,13 @@ async def delete_vocabulary_progress(
     )
     await db.execute(delete_stmt)
     await db.commit()
+    publish_event(
+        ProgressUpdatedEvent(
+            user_id=current_user.id,
+            metadata={"language": language, "lemmas": [lemma.lower()], "is_known": False},
+            action="delete",
+        )
+    )
 
     logger.info(f"Deleted vocabulary progress for user {current_user.id}, lemma '{lemma}'")
 
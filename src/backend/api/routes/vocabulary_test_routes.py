@@ -44,9 +44,7 @@ async def get_test_data(
 
     **Authentication Required**: Yes
     """
-    test_vocabulary = [
-        {"id": "test-word-1", "word": "Hallo", "translation": "Hello", "level": "A1", "language": "de"}
-    ]
+    test_vocabulary = [{"id": "test-word-1", "word": "Hallo", "translation": "Hello", "level": "A1", "language": "de"}]
 
     return {
         "test_vocabulary": test_vocabulary,
@@ -110,6 +108,7 @@ async def create_vocabulary(
     from sqlalchemy import select
 
     from database.models import VocabularyWord
+    from services.vocabulary.events import VocabularyAddedEvent, publish_event
 
     # Map difficulty level to CEFR level for storage
     difficulty_to_level = {"beginner": "A1", "intermediate": "B1", "advanced": "C1"}
@@ -117,9 +116,7 @@ async def create_vocabulary(
 
     # Check if word already exists
     result = await db.execute(
-        select(VocabularyWord).where(
-            VocabularyWord.word == request.word, VocabularyWord.language == request.language
-        )
+        select(VocabularyWord).where(VocabularyWord.word == request.word, VocabularyWord.language == request.language)
     )
     existing_word = result.scalar_one_or_none()
 
@@ -145,6 +142,7 @@ async def create_vocabulary(
 
     db.add(new_word)
     await db.commit()
+    publish_event(VocabularyAddedEvent(user_id=current_user.id, vocabulary_word=new_word, source="manual"))
 
     logger.info(f"Created test vocabulary for E2E: {request.word} ({cefr_level})")
     return {
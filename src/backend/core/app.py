@@ -69,6 +69,7 @@ async def lifespan(app: FastAPI):
             # Mark services as ready in test mode so frontend readiness checks pass
             from core.dependencies.task_dependencies import _services_ready
             import core.dependencies.task_dependencies as task_deps
+
             task_deps._services_ready = True
 
         logger.info(f"LangPlug API server started successfully on port {port}")
@@ -123,12 +124,15 @@ def create_app() -> FastAPI:
     # Health check endpoint
     @app.get("/health")
     async def health_check():
-        """Health check endpoint"""
+        """Health check endpoint (models: warm-up state per LANGPLUG_MODEL_WARMUP target)"""
+        from services.model_warmup import get_model_warm_pool
+
         return {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
             "debug": settings.debug,
+            "models": get_model_warm_pool().get_status(),
         }
 
     # Readiness check endpoint - returns whether services are fully initialized
@@ -139,6 +143,14 @@ def create_app() -> FastAPI:
 
         Returns 200 when ready, 503 when still initializing
         """
+        from services.model_registry import get_model_registry
+        from services.transcriptionservice.asr_worker_pool import get_asr_worker_pool_stats
+        from services.transcriptionservice.transcription_scheduler import get_transcription_scheduler_stats
+        from services.translationservice.translation_scheduler import translation_mode_stats
+        from services.vocabulary.known_lemma_cache import known_lemma_cache
+        from services.vocabulary.vocabulary_index import vocabulary_index_registry
+        from services.vocabulary.vocabulary_stats_cache import vocabulary_stats_cache
+
         from .dependencies.task_dependencies import is_services_ready
 
         ready = is_services_ready()
@@ -148,6 +160,13 @@ def create_app() -> FastAPI:
                 "status": "ready",
                 "message": "All services initialized and ready to handle requests",
                 "timestamp": datetime.now().isoformat(),
+                "vocabulary_index": vocabulary_index_registry.get_stats(),
+                "known_lemma_cache": known_lemma_cache.get_stats(),
+                "vocabulary_stats_cache": vocabulary_stats_cache.get_stats(),
+                "transcription_scheduler": get_transcription_scheduler_stats(),
+                "asr_worker_pool": get_asr_worker_pool_stats(),
+                "model_registry": get_model_registry().get_stats(),
+                "translation_modes": translation_mode_stats.snapshot(),
             }
         else:
             from fastapi import Response
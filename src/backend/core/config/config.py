@@ -4,6 +4,7 @@ Configuration management using Pydantic Settings.
 
 import json
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -50,6 +51,80 @@ class Settings(BaseSettings):
     translation_service: str = Field(default="opus-de-es-big", alias="LANGPLUG_TRANSLATION_SERVICE")  # de->es big model
     default_language: str = Field(default="de", alias="LANGPLUG_DEFAULT_LANGUAGE")
 
+    # Translation cache (persistent translation memory under data path)
+    translation_cache_enabled: bool = Field(default=True, alias="LANGPLUG_TRANSLATION_CACHE_ENABLED")
+    translation_cache_max_entries: int = Field(default=200_000, alias="LANGPLUG_TRANSLATION_CACHE_MAX_ENTRIES")
+
+    # Decode chunk audio into memory for engines that accept sample arrays (WAV temp file otherwise)
+    audio_streaming_enabled: bool = Field(default=True, alias="LANGPLUG_AUDIO_STREAMING_ENABLED")
+
+    # Audio track cache (whole-video 16 kHz PCM, sliced per chunk instead of re-running FFmpeg)
+    audio_track_cache_enabled: bool = Field(default=True, alias="LANGPLUG_AUDIO_TRACK_CACHE_ENABLED")
+    audio_track_cache_max_mb: int = Field(default=2048, alias="LANGPLUG_AUDIO_TRACK_CACHE_MAX_MB")
+
+    # Transcription scheduler (batches in-memory chunk audio of concurrent requests on the shared model)
+    transcription_batching_enabled: bool = Field(default=True, alias="LANGPLUG_TRANSCRIPTION_BATCHING_ENABLED")
+    transcription_batch_window_ms: int = Field(default=50, alias="LANGPLUG_TRANSCRIPTION_BATCH_WINDOW_MS")
+    transcription_max_batch_size: int = Field(default=8, alias="LANGPLUG_TRANSCRIPTION_MAX_BATCH_SIZE")
+    transcription_inference_batch_size: int = Field(default=16, alias="LANGPLUG_TRANSCRIPTION_INFERENCE_BATCH_SIZE")
+
+    # Word timestamps (aligned by faster-whisper while decoding, stored in a .words.npy sidecar next to the SRT)
+    transcription_word_timestamps: bool = Field(default=True, alias="LANGPLUG_TRANSCRIPTION_WORD_TIMESTAMPS")
+
+    # CPU profile (size ASR/translation threads from the available cores; "fixed" keeps the defaults)
+    cpu_profile: Literal["auto", "fixed"] = Field(default="auto", alias="LANGPLUG_CPU_PROFILE")
+    cpu_profile_translation_models: int = Field(default=1, alias="LANGPLUG_CPU_PROFILE_TRANSLATION_MODELS")
+    cpu_profile_calibrate: bool = Field(default=True, alias="LANGPLUG_CPU_PROFILE_CALIBRATE")
+
+    # ASR worker processes (0 = transcribe in threads of the API process)
+    asr_worker_processes: int = Field(default=0, alias="LANGPLUG_ASR_WORKER_PROCESSES")
+    asr_worker_cpu_threads: int = Field(default=0, alias="LANGPLUG_ASR_WORKER_CPU_THREADS")
+    asr_worker_max_jobs: int = Field(default=100, alias="LANGPLUG_ASR_WORKER_MAX_JOBS")
+    asr_worker_max_queue: int = Field(default=16, alias="LANGPLUG_ASR_WORKER_MAX_QUEUE")
+
+    # VAD pre-pass (only speech islands of in-memory chunk audio are sent to the transcription model)
+    vad_prepass_enabled: bool = Field(default=True, alias="LANGPLUG_VAD_PREPASS_ENABLED")
+    vad_prepass_max_speech_ratio: float = Field(default=0.9, alias="LANGPLUG_VAD_PREPASS_MAX_SPEECH_RATIO")
+
+    # Model residency (LRU unloading of ASR/translation models over the budget; 0 = half of physical RAM)
+    model_memory_budget_mb: int = Field(default=0, alias="LANGPLUG_MODEL_MEMORY_BUDGET_MB")
+
+    # Converted CTranslate2 models (prepared by scripts/setup/prepare_models.py; empty dir = <data>/models/ctranslate2)
+    ct2_model_dir: str = Field(default="", alias="LANGPLUG_CT2_MODEL_DIR")
+    ct2_quantization: str = Field(default="float16", alias="LANGPLUG_CT2_QUANTIZATION")
+
+    # Translation beam sizes per request class (live chunk processing vs offline pre-processing; 1 = greedy)
+    translation_live_beam_size: int = Field(default=1, alias="LANGPLUG_TRANSLATION_LIVE_BEAM_SIZE")
+    translation_offline_beam_size: int = Field(default=4, alias="LANGPLUG_TRANSLATION_OFFLINE_BEAM_SIZE")
+
+    # Startup warm pool (comma-separated: "asr", "translation" and/or language pairs like "de-es"; empty = none)
+    model_warmup: str = Field(default="", alias="LANGPLUG_MODEL_WARMUP")
+    model_warmup_workers: int = Field(default=2, alias="LANGPLUG_MODEL_WARMUP_WORKERS")
+
+    # Subtitle streaming (chunk SRT cues pushed over the user's WebSocket as they are decoded)
+    subtitle_streaming_enabled: bool = Field(default=True, alias="LANGPLUG_SUBTITLE_STREAMING_ENABLED")
+
+    # Transcript cache (chunk transcripts reused across reprocessing and users)
+    transcript_cache_enabled: bool = Field(default=True, alias="LANGPLUG_TRANSCRIPT_CACHE_ENABLED")
+    transcript_cache_max_entries: int = Field(default=2000, alias="LANGPLUG_TRANSCRIPT_CACHE_MAX_ENTRIES")
+
+    # Vocabulary index (in-memory lemma lookup for subtitle filtering, built at startup)
+    vocabulary_index_enabled: bool = Field(default=True, alias="LANGPLUG_VOCABULARY_INDEX_ENABLED")
+
+    # Known lemma cache (per-user known lemma sets for subtitle filtering, patched by progress events)
+    known_lemma_cache_enabled: bool = Field(default=True, alias="LANGPLUG_KNOWN_LEMMA_CACHE_ENABLED")
+    known_lemma_cache_max_users: int = Field(default=1000, alias="LANGPLUG_KNOWN_LEMMA_CACHE_MAX_USERS")
+    known_lemma_cache_ttl_seconds: float = Field(default=60.0, alias="LANGPLUG_KNOWN_LEMMA_CACHE_TTL_SECONDS")
+
+    # Vocabulary stats cache (per-user dashboard statistics, dropped by progress events)
+    vocabulary_stats_cache_enabled: bool = Field(default=True, alias="LANGPLUG_VOCABULARY_STATS_CACHE_ENABLED")
+    vocabulary_stats_cache_ttl_seconds: float = Field(default=30.0, alias="LANGPLUG_VOCABULARY_STATS_CACHE_TTL_SECONDS")
+
+    # Episode pipeline (capacity of the queues between extract, transcribe and finalize stages)
+    episode_pipeline_queue_size: int = Field(default=1, alias="LANGPLUG_EPISODE_PIPELINE_QUEUE_SIZE")
+    # Decode all chunk audio of an episode with one FFmpeg run (needs audio streaming)
+    episode_audio_split_enabled: bool = Field(default=True, alias="LANGPLUG_EPISODE_AUDIO_SPLIT_ENABLED")
+
     # SpaCy model settings
     spacy_model_de: str = Field(default="de_core_news_lg", alias="LANGPLUG_SPACY_MODEL_DE")
     spacy_model_en: str = Field(default="en_core_web_sm", alias="LANGPLUG_SPACY_MODEL_EN")
@@ -3,7 +3,7 @@
 import logging
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.auth.auth_dependencies import current_active_user
@@ -27,9 +27,7 @@ logger = logging.getLogger(__name__)
 
 
 # Core service dependencies using direct imports
-def get_vocabulary_service(
-    db: Annotated[AsyncSession, Depends(get_db_session)]
-) -> "VocabularyService":
+def get_vocabulary_service(db: Annotated[AsyncSession, Depends(get_db_session)]) -> "VocabularyService":
     """Get vocabulary service instance with proper dependency injection"""
     from services.vocabulary.vocabulary_progress_service import get_vocabulary_progress_service
     from services.vocabulary.vocabulary_query_service import get_vocabulary_query_service
@@ -68,10 +66,10 @@ def get_processing_service(
     db: Annotated[AsyncSession, Depends(get_db_session)] | None = None,
 ) -> "ChunkProcessingService":
     """Get processing pipeline service instance.
-    
+
     Args:
         db: Optional database session for utilities that need DB access
-        
+
     Returns:
         Configured ChunkProcessingService instance
     """
@@ -87,7 +85,12 @@ def get_transcription_service() -> "ITranscriptionService | None":
         from services.transcriptionservice.factory import get_transcription_service as _get_transcription_service
 
         logger.info(f"Initializing transcription service: {settings.transcription_service}")
-        service = _get_transcription_service(settings.transcription_service)
+        if settings.asr_worker_processes > 0:
+            from services.transcriptionservice.asr_worker_pool import get_pooled_transcription_service
+
+            service = get_pooled_transcription_service(settings.transcription_service)
+        else:
+            service = _get_transcription_service(settings.transcription_service)
         logger.info("Transcription service initialized successfully")
         return service
     except ImportError as e:
@@ -102,6 +105,18 @@ def get_transcription_service() -> "ITranscriptionService | None":
         return None
 
 
+def require_transcription_capacity() -> None:
+    """Reject new transcription work with 503 + Retry-After while the ASR worker queue is full"""
+    from services.transcriptionservice.asr_worker_pool import RETRY_AFTER_SECONDS, asr_pool_saturated
+
+    if asr_pool_saturated():
+        raise HTTPException(
+            status_code=503,
+            detail="Transcription workers are busy, please retry later",
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
+
 def get_translation_service() -> "ITranslationService | None":
     """Get translation service instance"""
     try:
@@ -154,4 +169,5 @@ __all__ = [
     "get_translation_service",
     "get_user_subtitle_processor",
     "get_vocabulary_service",
+    "require_transcription_capacity",
 ]
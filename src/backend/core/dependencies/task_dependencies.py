@@ -10,6 +10,9 @@ _task_progress_registry: dict = {}
 # Global readiness flag - tracks whether services are fully initialized
 _services_ready: bool = False
 
+# Background task loading the LANGPLUG_MODEL_WARMUP models after startup
+_model_warmup_task = None
+
 
 def get_task_progress_registry() -> dict:
     """
@@ -29,7 +32,7 @@ def is_services_ready() -> bool:
 
 async def init_services():
     """Initialize all services on startup"""
-    global _services_ready
+    global _services_ready, _model_warmup_task
 
     logger.info("[STARTUP] Initializing services...")
     logger.info("[STARTUP] This may take 5-10 minutes on first run to download AI models")
@@ -49,10 +52,17 @@ async def init_services():
         await init_db()
         logger.info("[STARTUP] Database initialized successfully")
 
-        # Initialize transcription service
-        logger.info("[STARTUP] Step 3/5: Initializing transcription service...")
+        # Warm the in-memory vocabulary index (subtitle filtering falls back to the database on failure)
         from core.config.config import settings
+        from services.vocabulary.vocabulary_index import vocabulary_index_registry
 
+        try:
+            await vocabulary_index_registry.get(settings.default_language)
+        except Exception as e:
+            logger.warning(f"[STARTUP] Vocabulary index not built, using database lookups: {e}")
+
+        # Initialize transcription service
+        logger.info("[STARTUP] Step 3/5: Initializing transcription service...")
         from .service_dependencies import get_transcription_service
 
         logger.info(f"[STARTUP] Using transcription model: {settings.transcription_service}")
@@ -67,6 +77,15 @@ async def init_services():
         get_translation_service()
         logger.info("[STARTUP] Translation service ready")
 
+        # Load the warm-up models in the background; /health reports their state
+        import asyncio
+
+        from services.model_warmup import get_model_warm_pool
+
+        warm_pool = get_model_warm_pool()
+        if warm_pool.targets:
+            _model_warmup_task = asyncio.create_task(warm_pool.warm())
+
         # Initialize task progress registry
         logger.info("[STARTUP] Step 5/5: Initializing task registry...")
         get_task_progress_registry()
@@ -96,6 +115,15 @@ async def cleanup_services():
 
     await engine.dispose()
 
+    # Stop warming models (loads already running in worker threads finish on their own)
+    if _model_warmup_task is not None:
+        _model_warmup_task.cancel()
+
+    # Stop ASR worker processes
+    from services.transcriptionservice.asr_worker_pool import shutdown_asr_worker_pools
+
+    shutdown_asr_worker_pools()
+
     # Clear task progress registry content (not cache, as we removed @lru_cache)
     _task_progress_registry.clear()
 
@@ -177,7 +177,7 @@ async def cache_event_health_check() -> dict:
         "cache": cache_health,
         "event_bus": {
             "handlers_registered": len(event_driven_cache.cache_handler.invalidation_rules),
-            "events_processed": len(event_bus.get_events()),
+            "events_processed": event_bus.published,
         },
         "integration": {"status": "active", "cache_stats": event_driven_cache.get_cache_stats()},
     }
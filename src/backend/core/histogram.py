@@ -0,0 +1,39 @@
+"""
+Bucket histograms for service statistics.
+
+The transcription scheduler (request latency, batch size) and the model registry (load latency)
+report distributions through their get_stats() endpoints; both record them with Histogram.
+"""
+
+from typing import Any
+
+
+class Histogram:
+    """Cumulative bucket histogram (Prometheus-style upper bounds)"""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation"""
+        index = next((i for i, bound in enumerate(self.buckets) if value <= bound), len(self.buckets))
+        self._counts[index] += 1
+        self.count += 1
+        self.total += value
+
+    def snapshot(self) -> dict[str, Any]:
+        """Cumulative counts per bucket, count, sum and mean"""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip([*map(str, self.buckets), "+Inf"], self._counts, strict=True):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            "buckets": buckets,
+            "count": self.count,
+            "sum": round(self.total, 3),
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+        }
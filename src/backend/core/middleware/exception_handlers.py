@@ -77,6 +77,7 @@ def setup_exception_handlers(app: FastAPI):
                     details={"status_code": exc.status_code},
                 )
             ).model_dump(),
+            headers=exc.headers,
         )
 
     @app.exception_handler(StarletteHTTPException)
@@ -99,6 +100,7 @@ def setup_exception_handlers(app: FastAPI):
                     details={"status_code": exc.status_code},
                 )
             ).model_dump(),
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
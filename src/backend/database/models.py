@@ -11,6 +11,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -154,6 +155,9 @@ class VocabularyWord(Base):
         Index("idx_vocabulary_level", "difficulty_level"),
         Index("idx_vocabulary_lemma_lang", "lemma", "language"),
         Index("idx_vocabulary_word_lang", "word", "language"),
+        # Case-insensitive bulk lookups (vocabulary_bulk_lookup) match lower(lemma) / lower(word)
+        Index("idx_vocabulary_lang_lower_lemma", language, func.lower(lemma)),
+        Index("idx_vocabulary_lang_lower_word", language, func.lower(word)),
     )
 
 
@@ -193,6 +197,20 @@ class UserVocabularyProgress(Base):
     )
 
 
+class UserVocabularyKnowledge(Base):
+    """Snapshot of a user's known lemmas as a bitset over the vocabulary index (derived data)"""
+
+    __tablename__ = "user_vocabulary_knowledge"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    language = Column(String(5), primary_key=True)
+    index_fingerprint = Column(String(64), nullable=False)  # VocabularyIndex the bit positions refer to
+    progress_stamp = Column(String(100), nullable=False)  # user_vocabulary_progress state it was built from
+    known_bits = Column(LargeBinary, nullable=False)
+    extra_lemmas = Column(Text, nullable=False, default="")  # known lemmas not in the index, newline separated
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
 class ProcessingSession(Base):
     """Video/subtitle processing sessions"""
 
@@ -330,5 +348,3 @@ class UnknownWord(Base):
         Index("idx_unknown_words_added", "added_to_vocabulary"),
         {"extend_existing": True},
     )
-
-
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Convert the OPUS-MT translation models to CTranslate2 ahead of deployment.
+
+Writes every model of OPUS_MODEL_MAP (plus the OPUS-MT translation service variants) into the
+versioned artifact store (LANGPLUG_CT2_MODEL_DIR), so the server never converts on first use.
+Run it in the image build or once per model volume:
+
+    python scripts/setup/prepare_models.py --quantization int8
+    python scripts/setup/prepare_models.py --pairs de-es,es-de --force
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main(argv: list[str] | None = None) -> bool:
+    """Prepare the requested models; True if all of them are ready."""
+    from core.config import settings
+    from services.translationservice.ct2_artifacts import ct2_model_root, opus_model_names, prepare_ct2_models
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pairs", help="Comma-separated language pairs such as de-es (default: all)")
+    parser.add_argument("--quantization", default=settings.ct2_quantization, help="CTranslate2 quantization")
+    parser.add_argument("--force", action="store_true", help="Convert again even if already prepared")
+    args = parser.parse_args(argv)
+
+    if args.pairs:
+        model_names = [f"Helsinki-NLP/opus-mt-{pair.strip()}" for pair in args.pairs.split(",") if pair.strip()]
+    else:
+        model_names = opus_model_names()
+
+    logger.info(f"Preparing {len(model_names)} models ({args.quantization}) in {ct2_model_root()}")
+    errors = prepare_ct2_models(model_names, args.quantization, force=args.force)
+
+    failed = {name: error for name, error in errors.items() if error}
+    for name, error in failed.items():
+        logger.error(f"{name}: {error}")
+    logger.info(f"{len(errors) - len(failed)} of {len(errors)} models ready")
+    return not failed
+
+
+if __name__ == "__main__":
+    try:
+        success = main()
+        sys.exit(0 if success else 1)
+    except KeyboardInterrupt:
+        sys.exit(1)
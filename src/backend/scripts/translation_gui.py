@@ -177,7 +177,7 @@ class SRTTranslationApp:
             texts_to_translate = [segment.text for segment in segments]
 
             # Batch translate all texts at once (much faster on GPU)
-            translation_results = service.translate_batch(texts_to_translate, source_lang, target_lang)
+            translation_results = service.translate_batch(texts_to_translate, source_lang, target_lang, mode="offline")
 
             # Create translated segments
             translated_segments = []
@@ -0,0 +1,237 @@
+"""
+Disk Cache - shared pieces of the persistent processing caches
+
+The translation, transcript and audio track caches all key entries on a content hash, count
+hits and misses, report the same statistics to /readiness and are opened lazily once per
+process when their setting is on. This module holds those parts once:
+
+    - content_key / video_key: SHA-256 keys; video keys include the file's identity (resolved
+      path, size, mtime), so replacing a video invalidates everything cached for it
+    - FileCache: one file per entry in a directory, atomic writes, LRU eviction by mtime
+    - ProcessCache: the process-wide instance behind get_translation_cache() and friends
+
+Usage Example:
+    ```python
+    class SubtitleCache(FileCache):
+        suffix = ".srt"
+        log_name = "SUBTITLE CACHE"
+
+        def _over_capacity(self, entries: int, size_bytes: int) -> bool:
+            return entries > 100
+
+    _subtitle_cache = ProcessCache("SUBTITLE CACHE", lambda: True, lambda: SubtitleCache(cache_dir))
+    cache = _subtitle_cache.get()  # None when disabled or the cache could not be opened
+    ```
+
+Thread Safety:
+    Yes. Counters are guarded by a lock; entries are written to a temporary file and moved
+    into place atomically.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def content_key(*parts: str) -> str:
+    """Hex SHA-256 of the parts joined with a unit separator"""
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def video_key(video_file: Path, *parts: str) -> str:
+    """
+    Build a cache key bound to a video file's identity
+
+    Args:
+        video_file: Source video file (must exist)
+        *parts: Further key components (time window, model, ...)
+
+    Returns:
+        Hex digest identifying the entry
+
+    Raises:
+        OSError: If the video file cannot be stat'ed
+    """
+    resolved = Path(video_file).resolve()
+    stat = resolved.stat()
+    return content_key(str(resolved), str(stat.st_size), str(stat.st_mtime_ns), *parts)
+
+
+def hit_ratio(hits: int, misses: int) -> float:
+    """Share of lookups served from the cache"""
+    total = hits + misses
+    return round(hits / total, 3) if total else 0.0
+
+
+class FileCache(ABC):
+    """
+    Directory of one file per cache entry, evicting the least recently used entries by mtime.
+
+    Subclasses set ``suffix`` and ``log_name`` and define the capacity in _over_capacity().
+
+    Attributes:
+        cache_dir (Path): Directory holding the entries
+    """
+
+    suffix = ""
+    log_name = "DISK CACHE"
+
+    def __init__(self, cache_dir: Path):
+        """
+        Open (or create) the cache directory
+
+        Args:
+            cache_dir: Directory for cached entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _entries(self) -> list[Path]:
+        return list(self.cache_dir.glob(f"*{self.suffix}"))
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write through a temporary file so readers never see a partial entry"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def contains(self, key: str) -> bool:
+        """
+        Check for a cached entry without reading it or counting a hit/miss
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if the entry is cached
+        """
+        return self._entry_path(key).exists()
+
+    @abstractmethod
+    def _over_capacity(self, entries: int, size_bytes: int) -> bool:
+        """Whether the cache holds more than it may keep"""
+
+    def _remove_entry(self, entry: Path) -> None:
+        """Delete an entry (and anything stored alongside it)"""
+        entry.unlink(missing_ok=True)
+
+    def _evict_if_needed(self, keep: str | None = None) -> None:
+        """Delete least recently used entries until the cache is within capacity (caller holds the lock)"""
+        entries = [(entry, entry.stat()) for entry in self._entries()]
+        count = len(entries)
+        size = sum(stat.st_size for _, stat in entries)
+        if not self._over_capacity(count, size):
+            return
+
+        evicted = 0
+        for entry, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+            if not self._over_capacity(count, size):
+                break
+            if entry.name == f"{keep}{self.suffix}":
+                continue
+            try:
+                self._remove_entry(entry)
+            except OSError as e:  # still mapped by a reader (Windows)
+                logger.debug(f"[{self.log_name}] Could not evict {entry.name}: {e}")
+                continue
+            count -= 1
+            size -= stat.st_size
+            evicted += 1
+        logger.info(f"[{self.log_name}] Evicted {evicted} least recently used entries")
+
+    def _capacity_stats(self, sizes: list[int]) -> dict[str, Any]:
+        """Capacity figures added to get_stats()"""
+        return {}
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache hit/miss counters and size
+
+        Returns:
+            Dictionary with hits, misses, hit ratio, entry count and the capacity figures
+        """
+        with self._lock:
+            hits, misses = self._hits, self._misses
+
+        sizes = [entry.stat().st_size for entry in self._entries()]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hit_ratio(hits, misses),
+            "entries": len(sizes),
+            **self._capacity_stats(sizes),
+        }
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset counters"""
+        with self._lock:
+            for entry in self._entries():
+                self._remove_entry(entry)
+            self._hits = 0
+            self._misses = 0
+
+
+class ProcessCache(Generic[T]):
+    """
+    Lazily opened, process-wide cache instance that stays off while its setting is off.
+
+    A cache that fails to open (e.g. unwritable data directory) is logged and treated as
+    disabled for that call, so processing continues without it.
+    """
+
+    def __init__(self, log_name: str, enabled: Callable[[], bool], factory: Callable[[], T]):
+        """
+        Initialize holder
+
+        Args:
+            log_name: Prefix for log messages
+            enabled: Reads the cache's setting on every call
+            factory: Opens the cache
+        """
+        self.log_name = log_name
+        self._enabled = enabled
+        self._factory = factory
+        self._instance: T | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T | None:
+        """Get the shared instance, or None when disabled or the cache could not be opened"""
+        if not self._enabled():
+            return None
+
+        with self._lock:
+            if self._instance is None:
+                try:
+                    self._instance = self._factory()
+                except Exception as e:
+                    logger.warning(f"[{self.log_name}] Disabled, failed to open cache: {e}")
+                    return None
+
+        return self._instance
+
+
+__all__ = ["FileCache", "ProcessCache", "content_key", "hit_ratio", "video_key"]
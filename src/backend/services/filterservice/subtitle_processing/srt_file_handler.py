@@ -5,14 +5,22 @@ Handles SRT file I/O, parsing, and conversion operations
 
 import logging
 import re
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from services.transcriptionservice.word_timings import read_word_sidecar
 from utils.srt_parser import SRTParser
 
 from ..interface import FilteredSubtitle, FilteredWord, FilteringResult, WordStatus
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Word timings must fall within their cue (give or take) to be trusted
+WORD_TIMING_TOLERANCE_SECONDS = 1.0
+
 
 class SRTFileHandler:
     """Service for handling SRT file operations"""
@@ -34,12 +42,17 @@ class SRTFileHandler:
 
         # Parse SRT file
         srt_segments = SRTParser.parse_file(srt_file_path)
-        logger.info(f"Parsed {len(srt_segments)} subtitle segments")
+        cue_word_timings = read_word_sidecar(Path(srt_file_path))
+        logger.info(
+            f"Parsed {len(srt_segments)} subtitle segments{' with ASR word timings' if cue_word_timings else ''}"
+        )
 
         # Convert to FilteredSubtitle objects
         filtered_subtitles = []
         for segment in srt_segments:
-            words = self.extract_words_from_text(segment.text, segment.start_time, segment.end_time)
+            words = self.extract_words_from_text(
+                segment.text, segment.start_time, segment.end_time, cue_word_timings.get(segment.index)
+            )
 
             filtered_subtitle = FilteredSubtitle(
                 original_text=segment.text, start_time=segment.start_time, end_time=segment.end_time, words=words
@@ -48,7 +61,9 @@ class SRTFileHandler:
 
         return filtered_subtitles
 
-    def extract_words_from_text(self, text: str, start_time: float, end_time: float) -> list[FilteredWord]:
+    def extract_words_from_text(
+        self, text: str, start_time: float, end_time: float, word_timings: "np.ndarray | None" = None
+    ) -> list[FilteredWord]:
         """
         Extract words from subtitle text and create FilteredWord objects
 
@@ -56,21 +71,27 @@ class SRTFileHandler:
             text: Subtitle text
             start_time: Start time in seconds
             end_time: End time in seconds
+            word_timings: ASR word timings of this cue (from the SRT's word timing sidecar)
 
         Returns:
-            List of FilteredWord objects
+            List of FilteredWord objects, timed from word_timings if they match the text,
+            otherwise with the cue duration spread evenly over the words
         """
-        word_matches = list(self._word_pattern.finditer(text.lower()))
+        word_matches = list(self._word_pattern.finditer(text))
         words = []
 
-        # Estimate timing for each word
-        duration = end_time - start_time
-        word_duration = duration / max(len(word_matches), 1)
+        word_times = self._asr_word_times(word_matches, text, start_time, end_time, word_timings)
+        if word_times is None:
+            # Estimate timing for each word
+            duration = end_time - start_time
+            word_duration = duration / max(len(word_matches), 1)
+            word_times = [
+                (start_time + (i * word_duration), start_time + ((i + 1) * word_duration))
+                for i in range(len(word_matches))
+            ]
 
-        for i, match in enumerate(word_matches):
-            word_text = match.group()
-            word_start = start_time + (i * word_duration)
-            word_end = word_start + word_duration
+        for match, (word_start, word_end) in zip(word_matches, word_times, strict=True):
+            word_text = match.group().lower()
 
             filtered_word = FilteredWord(
                 text=word_text,
@@ -85,6 +106,35 @@ class SRTFileHandler:
 
         return words
 
+    @staticmethod
+    def _asr_word_times(
+        word_matches: list[re.Match],
+        text: str,
+        start_time: float,
+        end_time: float,
+        word_timings: "np.ndarray | None",
+    ) -> list[tuple[float, float]] | None:
+        """Timestamps of the ASR word covering each match, or None if the timings do not fit this cue"""
+        if word_timings is None or not len(word_timings) or not word_matches:
+            return None
+        if (
+            int(word_timings["char_end"].max()) > len(text)
+            or float(word_timings["start"].min()) < start_time - WORD_TIMING_TOLERANCE_SECONDS
+            or float(word_timings["end"].max()) > end_time + WORD_TIMING_TOLERANCE_SECONDS
+        ):
+            return None  # SRT edited or re-timed since it was transcribed
+
+        import numpy as np
+
+        # A regex word belongs to the ASR word whose character span contains its first character
+        positions = np.array([match.start() for match in word_matches])
+        indices = np.searchsorted(word_timings["char_end"], positions, side="right")
+        if indices.max() >= len(word_timings) or np.any(word_timings["char_start"][indices] > positions):
+            return None
+
+        timed = word_timings[indices]
+        return [(float(start), float(end)) for start, end in zip(timed["start"], timed["end"], strict=True)]
+
     def format_processing_result(self, filtering_result: FilteringResult, srt_file_path: str) -> dict[str, Any]:
         """
         Format FilteringResult into expected output format
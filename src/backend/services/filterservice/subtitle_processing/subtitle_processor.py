@@ -4,9 +4,13 @@ Handles processing of subtitles through filtering pipeline
 """
 
 import logging
+from collections import defaultdict, deque
 from datetime import datetime
 from typing import Any
 
+from services.lemma_resolver import TokenAnalysis, analyze_texts
+from services.vocabulary.vocabulary_index import VocabularyIndexRegistry, vocabulary_index_registry
+
 from ..interface import FilteredSubtitle, FilteredWord, FilteringResult, WordStatus
 from .word_filter import WordFilter
 from .word_validator import WordValidator
@@ -17,9 +21,15 @@ logger = logging.getLogger(__name__)
 class SubtitleProcessor:
     """Service for processing subtitles with filtering logic"""
 
-    def __init__(self, validator: WordValidator | None = None, word_filter: WordFilter | None = None):
+    def __init__(
+        self,
+        validator: WordValidator | None = None,
+        word_filter: WordFilter | None = None,
+        index_registry: VocabularyIndexRegistry | None = None,
+    ):
         self.validator = validator or WordValidator()
         self.word_filter = word_filter or WordFilter()
+        self.index_registry = index_registry or vocabulary_index_registry
 
     async def process_subtitles(
         self,
@@ -49,15 +59,113 @@ class SubtitleProcessor:
         # Initialize processing state
         processing_state = self._initialize_processing_state()
 
+        # One spaCy pass over all subtitle lines (lemma, POS and entities with sentence context)
+        word_analyses = self._analyze_subtitles(subtitles, language)
+
+        # In-memory vocabulary index, with one bulk database lookup for words it does not know
+        word_infos = await self._load_word_infos(subtitles, word_analyses, language, vocab_service, db)
+
         # Process each subtitle
-        for subtitle in subtitles:
-            await self._process_single_subtitle(
-                subtitle, user_known_words, user_level, language, vocab_service, db, processing_state
+        for subtitle, analyses in zip(subtitles, word_analyses, strict=True):
+            self._process_single_subtitle(
+                subtitle, user_known_words, user_level, language, word_infos, processing_state, analyses
             )
 
         # Create and return result
         return self._create_filtering_result(processing_state, len(subtitles), user_level, language)
 
+    def _analyze_subtitles(self, subtitles: list[FilteredSubtitle], language: str) -> list[list[TokenAnalysis | None]]:
+        """
+        Tag all subtitle texts with a single spaCy nlp.pipe() pass
+
+        Args:
+            subtitles: Subtitles to analyze
+            language: Language code
+
+        Returns:
+            Per subtitle, the token analysis aligned with each of its words (None where spaCy
+            tokenized differently, or everywhere if spaCy fails; those words are analyzed one by one)
+        """
+        try:
+            analyses = analyze_texts([subtitle.original_text for subtitle in subtitles], language)
+        except Exception as e:
+            logger.warning(f"Sentence-level spaCy analysis failed, falling back to per-word analysis: {e}")
+            return [[None] * len(subtitle.words) for subtitle in subtitles]
+
+        word_analyses = []
+        for subtitle, tokens in zip(subtitles, analyses, strict=True):
+            lookup: dict[str, deque[TokenAnalysis]] = defaultdict(deque)
+            for token in tokens:
+                lookup[token.text].append(token)
+
+            # Words are extracted in order, so consume repeated tokens in sentence order
+            aligned = []
+            for word in subtitle.words:
+                candidates = lookup.get(word.text.lower())
+                aligned.append(candidates.popleft() if candidates else None)
+            word_analyses.append(aligned)
+        return word_analyses
+
+    async def _load_word_infos(
+        self,
+        subtitles: list[FilteredSubtitle],
+        word_analyses: list[list[TokenAnalysis | None]],
+        language: str,
+        vocab_service: Any,
+        db: "AsyncSession",
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Resolve word info for all valid words of the chunk
+
+        Words are resolved against the in-memory vocabulary index first. Only words it does not
+        contain (or all words, if the index is disabled or unavailable) go to the vocabulary
+        service in one bulk lookup, which also records them as unknown words.
+
+        Args:
+            subtitles: Subtitles to process
+            word_analyses: Token analyses aligned with subtitle words
+            language: Language code
+            vocab_service: Vocabulary service for word info
+            db: Database session
+
+        Returns:
+            Dictionary mapping normalized word text to word info (empty if the lookup fails)
+        """
+        word_lemmas = []
+        for subtitle, analyses in zip(subtitles, word_analyses, strict=True):
+            for word, analysis in zip(subtitle.words, analyses, strict=True):
+                word_text = word.text.lower().strip()
+                if self.validator.is_valid_vocabulary_word(word_text, language):
+                    word_lemmas.append((word_text, analysis.lemma if analysis else None))
+
+        word_infos: dict[str, dict[str, Any]] = {}
+        try:
+            index = await self.index_registry.get(language)
+        except Exception as exc:
+            logger.warning(f"Vocabulary index unavailable, using database lookup: {exc}")
+            index = None
+
+        if index is not None:
+            missing = []
+            for word_text, lemma in word_lemmas:
+                if word_text in word_infos:
+                    continue
+                word_info = index.lookup(word_text, lemma)
+                if word_info is None:
+                    missing.append((word_text, lemma))
+                else:
+                    word_infos[word_text] = word_info
+            word_lemmas = missing
+
+        if not word_lemmas:
+            return word_infos
+
+        try:
+            word_infos.update(await vocab_service.get_words_info(word_lemmas, language, db))
+        except Exception as exc:
+            logger.error(f"Failed to load word info for {len(word_lemmas)} words: {exc}")
+        return word_infos
+
     def _initialize_processing_state(self) -> dict:
         """Initialize state tracking for subtitle processing"""
         return {
@@ -69,25 +177,25 @@ class SubtitleProcessor:
             "filtered_words": 0,
         }
 
-    async def _process_single_subtitle(
+    def _process_single_subtitle(
         self,
         subtitle: FilteredSubtitle,
         user_known_words: set[str],
         user_level: str,
         language: str,
-        vocab_service: Any,
-        db: "AsyncSession",
+        word_infos: dict[str, dict[str, Any]],
         processing_state: dict,
+        word_analyses: list[TokenAnalysis | None],
     ) -> None:
         """Process a single subtitle and update processing state"""
         processed_words = []
         subtitle_active_words = []
 
-        for word in subtitle.words:
+        for word, token_analysis in zip(subtitle.words, word_analyses, strict=True):
             processing_state["total_words"] += 1
 
-            processed_word = await self._process_and_filter_word(
-                word, user_known_words, user_level, language, vocab_service, db
+            processed_word = self._process_and_filter_word(
+                word, user_known_words, user_level, language, word_infos, token_analysis
             )
             processed_words.append(processed_word)
 
@@ -103,8 +211,14 @@ class SubtitleProcessor:
         # Categorize subtitle
         self._categorize_subtitle(subtitle, subtitle_active_words, processing_state)
 
-    async def _process_and_filter_word(
-        self, word: FilteredWord, user_known_words: set[str], user_level: str, language: str, vocab_service: Any, db: "AsyncSession"
+    def _process_and_filter_word(
+        self,
+        word: FilteredWord,
+        user_known_words: set[str],
+        user_level: str,
+        language: str,
+        word_infos: dict[str, dict[str, Any]],
+        token_analysis: TokenAnalysis | None = None,
     ) -> FilteredWord:
         """Process and filter a single word"""
         word_text = word.text.lower().strip()
@@ -116,15 +230,13 @@ class SubtitleProcessor:
             word.filter_reason = f"Non-vocabulary word ({reason})"
             return word
 
-        # Step 2: Get word info from vocabulary service (using passed session, not creating new one)
-        try:
-            word_info = await vocab_service.get_word_info(word_text, language, db)
-        except Exception as exc:
-            logger.error(f"Failed to load word info for '{word_text}': {exc}")
-            word_info = None
+        # Step 2: Word info from the chunk-wide bulk lookup
+        word_info = word_infos.get(word_text)
 
         # Step 3: Apply filtering logic
-        return self.word_filter.filter_word(word, user_known_words, user_level, language, word_info=word_info)
+        return self.word_filter.filter_word(
+            word, user_known_words, user_level, language, word_info=word_info, token_analysis=token_analysis
+        )
 
     def _categorize_subtitle(
         self, subtitle: FilteredSubtitle, subtitle_active_words: list[FilteredWord], processing_state: dict
@@ -9,6 +9,8 @@ from inspect import isawaitable
 from sqlalchemy import text
 
 from core.database import AsyncSessionLocal
+from services.vocabulary.known_lemma_cache import get_user_knowledge, known_lemma_cache
+from services.vocabulary.user_knowledge import UserKnowledge
 
 logger = logging.getLogger(__name__)
 
@@ -18,45 +20,26 @@ class UserDataLoader:
 
     def __init__(self):
         self._word_difficulty_cache: dict[str, str] = {}
-        self._user_known_words_cache: dict[str, set[str]] = {}
 
-    async def get_user_known_words(self, user_id: str, language: str) -> set[str]:
+    async def get_user_known_words(self, user_id: str, language: str) -> UserKnowledge | frozenset[str]:
         """
-        Get set of lemmas the user already knows - always fetch fresh data
+        Get set of lemmas the user already knows
+
+        Served from the shared known-lemma cache, which progress events keep current. The
+        result is a UserKnowledge bitset, so membership tests are bit tests.
 
         Args:
             user_id: User ID
             language: Language code
 
         Returns:
-            Set of known word lemmas (lowercase)
+            Read-only set of known word lemmas (lowercase)
         """
-        user_id_str = str(user_id)
-
-        # Primary path: direct query from user_vocabulary_progress table
         try:
-            async with AsyncSessionLocal() as session:
-                result = await session.execute(
-                    text(
-                        """
-                        SELECT DISTINCT lemma
-                        FROM user_vocabulary_progress
-                        WHERE user_id = :user_id
-                        AND language = :lang
-                        AND is_known = 1
-                        """
-                    ),
-                    {"user_id": user_id_str, "lang": language},
-                )
-                rows = result.fetchall()
-                if isawaitable(rows):
-                    rows = await rows
-                lemmas = {lemma.lower() for (lemma,) in rows}
-                logger.info(f"Loaded {len(lemmas)} known lemmas for user {user_id_str}: {lemmas}")
-                return lemmas
+            return await get_user_knowledge(str(user_id), language)
         except Exception as exc:
             logger.error(f"Error loading user known words from database: {exc}")
-            return set()
+            return frozenset()
 
     async def load_word_difficulties(self, language: str) -> dict[str, str]:
         """
@@ -114,7 +97,7 @@ class UserDataLoader:
     def clear_cache(self) -> None:
         """Clear all caches"""
         self._word_difficulty_cache.clear()
-        self._user_known_words_cache.clear()
+        known_lemma_cache.clear()
         logger.debug("Cleared user data caches")
 
 
@@ -4,9 +4,10 @@ Handles filtering logic for words based on user knowledge and difficulty
 """
 
 import logging
+from collections.abc import Set
 from typing import Any
 
-from services.lemma_resolver import is_proper_name, lemmatize_word
+from services.lemma_resolver import TokenAnalysis, is_proper_name, lemmatize_word
 
 from ..interface import FilteredWord, WordStatus
 
@@ -22,10 +23,11 @@ class WordFilter:
     def filter_word(
         self,
         word: FilteredWord,
-        user_known_words: set[str],
+        user_known_words: Set[str],
         user_level: str,
         language: str,
         word_info: dict[str, Any] | None = None,
+        token_analysis: TokenAnalysis | None = None,
     ) -> FilteredWord:
         """
         Apply all filtering logic to a single word
@@ -36,6 +38,8 @@ class WordFilter:
             user_level: User's CEFR level
             language: Language code
             word_info: Optional word information from vocabulary service
+            token_analysis: Optional spaCy tags from a sentence-level pass; when omitted the
+                word is analyzed on its own (two spaCy calls)
 
         Returns:
             FilteredWord with status and metadata updated
@@ -43,7 +47,8 @@ class WordFilter:
         logger.debug(f"[FILTER TRACE] Processing word: '{word.text}' (user_level={user_level})")
 
         # Check if proper name - filter out immediately
-        if is_proper_name(word.text, language):
+        proper_name = token_analysis.is_proper_name if token_analysis else is_proper_name(word.text, language)
+        if proper_name:
             word.status = WordStatus.FILTERED_OTHER
             word.filter_reason = "Proper name (automatically filtered)"
             logger.debug(f"[FILTER TRACE] FILTERED: '{word.text}' - Proper name")
@@ -51,7 +56,10 @@ class WordFilter:
 
         # Generate lemma using spaCy (always, no fallbacks)
         try:
-            lemma = lemmatize_word(word.text, language)
+            if token_analysis and token_analysis.lemma:
+                lemma = token_analysis.lemma
+            else:
+                lemma = lemmatize_word(word.text, language)
             logger.debug(f"[FILTER TRACE] Lemmatized '{word.text}' -> '{lemma}'")
         except Exception as e:
             logger.error(f"spaCy lemmatization failed for '{word.text}': {e}")
@@ -86,9 +94,13 @@ class WordFilter:
         if is_at_or_below:
             # Word is at or below user level - user has mastered this level
             word.status = WordStatus.FILTERED_AT_LEVEL
-            word.filter_reason = f"Word level ({word_difficulty}) at or below user level ({user_level}) - considered mastered"
+            word.filter_reason = (
+                f"Word level ({word_difficulty}) at or below user level ({user_level}) - considered mastered"
+            )
             word.metadata.update({"user_level": user_level, "language": language})
-            logger.debug(f"[FILTER TRACE] FILTERED_AT_LEVEL: '{word.text}' (lemma='{lemma}') - User has mastered this level")
+            logger.debug(
+                f"[FILTER TRACE] FILTERED_AT_LEVEL: '{word.text}' (lemma='{lemma}') - User has mastered this level"
+            )
             return word
 
         # Word is above user level - needs learning/translation
@@ -119,13 +131,13 @@ class WordFilter:
 
         return lemma, difficulty
 
-    def is_known_by_user(self, lemma: str, user_known_words: set[str]) -> bool:
+    def is_known_by_user(self, lemma: str, user_known_words: Set[str]) -> bool:
         """
         Check if user knows the word lemma
 
         Args:
             lemma: Word lemma
-            user_known_words: Set of known lemmas
+            user_known_words: Set of known lemmas (e.g. a UserKnowledge bitset)
 
         Returns:
             True if user knows the word
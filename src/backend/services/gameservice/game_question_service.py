@@ -13,6 +13,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.enums import GameDifficulty, GameType
 from database.models import UserVocabularyProgress, VocabularyWord
+from services.vocabulary.known_lemma_cache import get_user_knowledge
+from services.vocabulary.vocabulary_index import vocabulary_index_registry
 
 logger = logging.getLogger(__name__)
 
@@ -125,31 +127,9 @@ class GameQuestionService:
             }
             cefr_levels = difficulty_map.get(difficulty, ["A1", "A2"])
 
-            # Query vocabulary words at the requested difficulty level
             # Exclude words the user has already marked as known
-            stmt = (
-                select(VocabularyWord)
-                .where(
-                    and_(
-                        VocabularyWord.language == "de",  # TODO: Make language configurable
-                        VocabularyWord.difficulty_level.in_(cefr_levels),
-                    )
-                )
-                .outerjoin(
-                    UserVocabularyProgress,
-                    and_(
-                        UserVocabularyProgress.vocabulary_id == VocabularyWord.id,
-                        UserVocabularyProgress.user_id == int(self.user_id),
-                    ),
-                )
-                .where(
-                    (UserVocabularyProgress.is_known.is_(None)) | (UserVocabularyProgress.is_known == False)  # noqa: E712
-                )
-                .limit(total_questions * 2)  # Get extra in case we need more
-            )
-
-            result = await self.db_session.execute(stmt)
-            vocabulary_words = list(result.scalars().all())
+            language = "de"  # TODO: Make language configurable
+            vocabulary_words = await self._select_unknown_words(language, cefr_levels, total_questions * 2)
 
             if not vocabulary_words:
                 logger.warning(f"No unknown words found for difficulty={difficulty}, using sample vocabulary")
@@ -158,12 +138,12 @@ class GameQuestionService:
             # Generate questions from database words
             questions = []
             for i in range(min(total_questions, len(vocabulary_words))):
-                word = vocabulary_words[i]
+                word, translation = vocabulary_words[i]
                 question = GameQuestion(
                     question_id=f"q{i + 1}",
                     question_type="translation",
-                    question_text=f"What is the translation of '{word.word}'?",
-                    correct_answer=word.translation_en,  # TODO: Make translation language configurable
+                    question_text=f"What is the translation of '{word}'?",
+                    correct_answer=translation,  # TODO: Make translation language configurable
                     points=10,
                 )
                 questions.append(question)
@@ -179,6 +159,53 @@ class GameQuestionService:
             logger.warning("Falling back to sample vocabulary")
             return self._generate_sample_vocabulary_questions(difficulty, total_questions)
 
+    async def _select_unknown_words(
+        self, language: str, cefr_levels: list[str], limit: int
+    ) -> list[tuple[str, str | None]]:
+        """
+        Select vocabulary words at the given levels that the user does not know
+
+        With the vocabulary index enabled this is a bitwise AND-NOT of the level mask and the
+        user's knowledge bitset; otherwise vocabulary_words is outer-joined with the progress rows.
+
+        Args:
+            language: Language code
+            cefr_levels: CEFR levels to draw from
+            limit: Maximum words
+
+        Returns:
+            (word, English translation) pairs
+        """
+        index = await vocabulary_index_registry.get(language)
+        if index is not None:
+            knowledge = await get_user_knowledge(self.user_id, language)
+            records = knowledge.rebase(index).unknown_records(cefr_levels, limit)
+            return [(info["found_word"], info["translation_en"]) for info in map(index.record_info, records)]
+
+        stmt = (
+            select(VocabularyWord.word, VocabularyWord.translation_en)
+            .where(
+                and_(
+                    VocabularyWord.language == language,
+                    VocabularyWord.difficulty_level.in_(cefr_levels),
+                )
+            )
+            .outerjoin(
+                UserVocabularyProgress,
+                and_(
+                    UserVocabularyProgress.vocabulary_id == VocabularyWord.id,
+                    UserVocabularyProgress.user_id == int(self.user_id),
+                ),
+            )
+            .where(
+                (UserVocabularyProgress.is_known.is_(None)) | (UserVocabularyProgress.is_known == False)  # noqa: E712
+            )
+            .limit(limit)
+        )
+
+        result = await self.db_session.execute(stmt)
+        return [(word, translation) for word, translation in result.all()]
+
     def _generate_sample_vocabulary_questions(self, difficulty: str, total_questions: int) -> list[GameQuestion]:
         """Generate questions from sample vocabulary (fallback)"""
         filtered_words = [w for w in self._sample_vocabulary if w["difficulty"] == difficulty]
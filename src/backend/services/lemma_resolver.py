@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
 
 try:
     import spacy  # type: ignore
@@ -23,6 +25,21 @@ _LANGUAGE_MODEL_OVERRIDES: dict[str, str] = {
 _MODEL_CACHE: dict[str, spacy.Language] = {}
 
 
+@dataclass(frozen=True, slots=True)
+class TokenAnalysis:
+    """spaCy tags for one token, computed with its sentence as context."""
+
+    text: str
+    lemma: str
+    pos: str
+    is_entity: bool
+
+    @property
+    def is_proper_name(self) -> bool:
+        """Same criteria as is_proper_name(): PROPN or part of a named entity."""
+        return self.pos == "PROPN" or self.is_entity
+
+
 def _resolve_model_name(language_code: str) -> str:
     language_code = (language_code or "").lower()
     if language_code in _LANGUAGE_MODEL_OVERRIDES:
@@ -109,4 +126,33 @@ def is_proper_name(word: str, language_code: str) -> bool:
     return False
 
 
-__all__ = ["is_proper_name", "lemmatize_word"]
+def analyze_texts(texts: Iterable[str], language_code: str, batch_size: int = 256) -> list[list[TokenAnalysis]]:
+    """Run spaCy once over many texts (e.g. all subtitle lines of a chunk).
+
+    Uses ``nlp.pipe`` so the whole chunk is one pipeline pass instead of two
+    ``nlp()`` calls per word, and tags each token with its sentence as context.
+    Token text and lemma are lowercased; whitespace tokens are dropped.
+
+    Raises RuntimeError if the spaCy model is unavailable.
+    """
+    model_name = _resolve_model_name(language_code)
+    nlp = _load_model(model_name)
+
+    results: list[list[TokenAnalysis]] = []
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        results.append(
+            [
+                TokenAnalysis(
+                    text=token.text.lower(),
+                    lemma=token.lemma_.strip().lower(),
+                    pos=token.pos_,
+                    is_entity=bool(token.ent_type_),
+                )
+                for token in doc
+                if not token.is_space
+            ]
+        )
+    return results
+
+
+__all__ = ["TokenAnalysis", "analyze_texts", "is_proper_name", "lemmatize_word"]
@@ -0,0 +1,276 @@
+"""
+Model Registry - memory-budgeted residency of ASR and MT models
+
+The transcription and translation factories cache one service instance per configuration, and
+every instance keeps its model loaded once it has been used. Serving many language pairs
+(one OPUS-MT model each) plus Whisper eventually exceeds the RAM of a node.
+
+The factories register their instances here. Callers lease a model while they use it; a lease
+loads the model if needed (timed) and pins it. After a load, least recently used models without
+leases are unloaded through their cleanup() until the resident models fit the memory budget
+(LANGPLUG_MODEL_MEMORY_BUDGET_MB). An evicted instance stays cached and loads its model again on
+its next lease.
+
+Model sizes are measured as the growth of the process RSS while loading (loads are serialized),
+so models on a GPU count only their host memory.
+
+Usage Example:
+    ```python
+    registry = get_model_registry()
+    async with registry.async_lease(translation_service):
+        results = await asyncio.to_thread(translation_service.translate_batch, texts, "de", "en")
+    registry.get_stats()  # loads, evictions, load latency, resident models
+    ```
+
+Thread Safety:
+    Yes. Leases may be taken from any thread or event loop.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.config import settings
+from core.histogram import Histogram
+from services.base_service import IAIService
+
+logger = logging.getLogger(__name__)
+
+LOAD_LATENCY_BUCKETS_SECONDS = (1, 5, 15, 30, 60, 120, 300)
+
+# Assumed footprint of models that were loaded outside a lease, until a lease measures them
+DEFAULT_MODEL_SIZE_MB = {"asr": 1500.0, "translation": 300.0}
+
+
+def _rss_mb() -> float:
+    import psutil
+
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def default_memory_budget_mb() -> float:
+    """Half of the physical memory of the host"""
+    import psutil
+
+    return psutil.virtual_memory().total / (1024 * 1024) / 2
+
+
+@dataclass
+class _Resident:
+    key: str
+    service: IAIService
+    kind: str
+    refs: int = 0
+    loaded: bool = False
+    size_mb: float = 0.0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ModelRegistry:
+    """
+    Central registry of model-backed services with LRU unloading under a memory budget.
+
+    Attributes:
+        memory_budget_mb (float): Memory the resident models may use together
+        loads (int): Models loaded through a lease
+        evictions (int): Models unloaded to stay within the budget
+        load_latency_histogram (Histogram): Seconds per model load
+    """
+
+    def __init__(self, memory_budget_mb: float):
+        """
+        Initialize registry
+
+        Args:
+            memory_budget_mb: Memory the resident models may use together
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self.loads = 0
+        self.evictions = 0
+        self.load_latency_histogram = Histogram(LOAD_LATENCY_BUCKETS_SECONDS)
+        self._residents: dict[int, _Resident] = {}
+        self._lock = threading.RLock()
+        self._load_lock = threading.Lock()
+
+    def register(self, key: str, service: IAIService, kind: str) -> None:
+        """
+        Put a service under residency management
+
+        Args:
+            key: Identifier of the model configuration (factory cache key)
+            service: Service instance; its model is loaded by initialize() and released by cleanup()
+            kind: 'asr' or 'translation'
+        """
+        with self._lock:
+            if id(service) not in self._residents:
+                self._residents[id(service)] = _Resident(key, service, kind)
+
+    def acquire(self, service: Any) -> None:
+        """
+        Pin a service's model and load it if needed (blocking)
+
+        Unregistered services (e.g. the ASR worker pool proxy) are not managed and pass through.
+        """
+        with self._lock:
+            resident = self._residents.get(id(service))
+            if resident is None:
+                return
+            resident.refs += 1
+            resident.last_used = time.monotonic()
+
+        try:
+            self._ensure_loaded(resident)
+        except BaseException:
+            self.release(service)
+            raise
+
+    def release(self, service: Any) -> None:
+        """Unpin a service's model; it becomes evictable once no lease holds it"""
+        with self._lock:
+            resident = self._residents.get(id(service))
+            if resident is None:
+                return
+            resident.refs = max(0, resident.refs - 1)
+            resident.last_used = time.monotonic()
+        self._enforce_budget()
+
+    @contextmanager
+    def lease(self, service: Any) -> Iterator[Any]:
+        """Hold a service's model loaded for the duration of the block"""
+        self.acquire(service)
+        try:
+            yield service
+        finally:
+            self.release(service)
+
+    @asynccontextmanager
+    async def async_lease(self, service: Any) -> AsyncIterator[Any]:
+        """lease() for async code; the model is loaded in a worker thread"""
+        await asyncio.to_thread(self.acquire, service)
+        try:
+            yield service
+        finally:
+            self.release(service)
+
+    def _ensure_loaded(self, resident: _Resident) -> None:
+        with self._load_lock:
+            if resident.service.is_initialized:
+                with self._lock:
+                    self._sync(resident)
+                return
+
+            rss_before = _rss_mb()
+            started = time.perf_counter()
+            resident.service.initialize()
+            elapsed = time.perf_counter() - started
+            size_mb = max(0.0, _rss_mb() - rss_before)
+
+        with self._lock:
+            resident.loaded = True
+            resident.size_mb = size_mb
+            self.loads += 1
+            self.load_latency_histogram.observe(elapsed)
+        logger.info(f"[MODEL REGISTRY] Loaded {resident.key} ({resident.kind}, {size_mb:.0f} MB) in {elapsed:.1f}s")
+        self._enforce_budget()
+
+    @staticmethod
+    def _sync(resident: _Resident) -> None:
+        """Pick up models loaded or unloaded outside the registry"""
+        initialized = resident.service.is_initialized
+        if initialized and not resident.loaded:
+            resident.loaded = True
+            resident.size_mb = resident.size_mb or DEFAULT_MODEL_SIZE_MB.get(resident.kind, 0.0)
+        elif not initialized:
+            resident.loaded = False
+
+    def resident_mb(self) -> float:
+        """Memory used by the loaded models"""
+        with self._lock:
+            for resident in self._residents.values():
+                self._sync(resident)
+            return sum(resident.size_mb for resident in self._residents.values() if resident.loaded)
+
+    def _enforce_budget(self) -> None:
+        """Unload least recently used models without leases until the loaded models fit the budget"""
+        # Eviction runs under the lock, so no lease can pin a model while it is being unloaded
+        with self._lock:
+            used = self.resident_mb()
+            if used <= self.memory_budget_mb:
+                return
+
+            idle = sorted(
+                (resident for resident in self._residents.values() if resident.loaded and resident.refs == 0),
+                key=lambda resident: resident.last_used,
+            )
+            for resident in idle:
+                if used <= self.memory_budget_mb:
+                    break
+                try:
+                    resident.service.cleanup()
+                except Exception as e:
+                    logger.warning(f"[MODEL REGISTRY] Failed to unload {resident.key}: {e}")
+                    continue
+                resident.loaded = False
+                used -= resident.size_mb
+                self.evictions += 1
+                logger.info(f"[MODEL REGISTRY] Evicted {resident.key} ({resident.size_mb:.0f} MB)")
+
+            if used > self.memory_budget_mb:
+                logger.warning(
+                    f"[MODEL REGISTRY] {used:.0f} MB of models resident, over the {self.memory_budget_mb:.0f} MB "
+                    "budget; all remaining models are in use"
+                )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get budget, load/eviction counters, load latency histogram and the registered models"""
+        now = time.monotonic()
+        with self._lock:
+            used = self.resident_mb()
+            models = [
+                {
+                    "key": resident.key,
+                    "kind": resident.kind,
+                    "loaded": resident.loaded,
+                    "leases": resident.refs,
+                    "size_mb": round(resident.size_mb, 1),
+                    "idle_seconds": round(now - resident.last_used, 1),
+                }
+                for resident in self._residents.values()
+            ]
+            return {
+                "memory_budget_mb": round(self.memory_budget_mb, 1),
+                "resident_mb": round(used, 1),
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "load_latency_seconds": self.load_latency_histogram.snapshot(),
+                "models": models,
+            }
+
+
+_model_registry: ModelRegistry | None = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Get the process-wide model registry
+
+    Returns:
+        Shared ModelRegistry with the budget from LANGPLUG_MODEL_MEMORY_BUDGET_MB
+        (0 = half of the physical memory)
+    """
+    global _model_registry
+
+    with _model_registry_lock:
+        if _model_registry is None:
+            budget = settings.model_memory_budget_mb or default_memory_budget_mb()
+            _model_registry = ModelRegistry(budget)
+    return _model_registry
+
+
+__all__ = ["ModelRegistry", "default_memory_budget_mb", "get_model_registry"]
@@ -0,0 +1,186 @@
+"""
+Model Warm Pool - load a configured subset of ASR/MT models at startup
+
+Models load lazily on their first lease, so the first transcription or translation after a
+deploy pays the model load (and, for CTranslate2 models that were not prepared, the conversion).
+LANGPLUG_MODEL_WARMUP names the models to load right after startup instead:
+
+    asr            the configured transcription service (LANGPLUG_TRANSCRIPTION_SERVICE)
+    translation    the configured translation service (LANGPLUG_TRANSLATION_SERVICE)
+    de-es, ...     the OPUS-MT model chunk processing uses for that language pair
+
+Targets are prepared in parallel (LANGPLUG_MODEL_WARMUP_WORKERS threads); the loads themselves go
+through the model registry, which serializes them and keeps the warmed models within the memory
+budget. Per-model state (pending, loading, ready, failed) is reported by /health.
+
+Usage Example:
+    ```python
+    warm_pool = get_model_warm_pool()
+    task = asyncio.create_task(warm_pool.warm())
+    warm_pool.get_status()  # {"de-es": {"state": "ready", "seconds": 4.2, ...}, ...}
+    ```
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelWarmupStatus:
+    """
+    Warm-up state of one target.
+
+    Attributes:
+        kind (str): 'asr' or 'translation'
+        state (str): 'pending', 'loading', 'ready' or 'failed'
+        model (str | None): Model name, once the target is resolved
+        seconds (float | None): Time to prepare and load the model
+        error (str | None): Failure reason
+    """
+
+    kind: str
+    state: str = "pending"
+    model: str | None = None
+    seconds: float | None = None
+    error: str | None = None
+
+
+def parse_warmup_targets(spec: str) -> list[str]:
+    """Split LANGPLUG_MODEL_WARMUP into unique, lower-case targets"""
+    return list(dict.fromkeys(target.strip().lower() for target in spec.split(",") if target.strip()))
+
+
+def _resolve_service(target: str) -> Any:
+    """Service instance a warm-up target refers to (the instance requests will use)"""
+    from core.dependencies.service_dependencies import get_transcription_service, get_translation_service
+
+    if target == "asr":
+        service = get_transcription_service()
+    elif target == "translation":
+        service = get_translation_service()
+    else:
+        from services.processing.chunk_translation_service import ChunkTranslationService
+
+        source_lang, _, target_lang = target.partition("-")
+        if not source_lang or not target_lang:
+            raise ValueError(f"Unknown warm-up target '{target}' (expected asr, translation or a pair like de-es)")
+        service = ChunkTranslationService().get_translation_service(source_lang, target_lang)
+
+    if service is None:
+        raise RuntimeError("service is not available")
+    return service
+
+
+class ModelWarmPool:
+    """
+    Loads the warm-up targets and tracks their state.
+
+    Attributes:
+        targets (list[str]): Warm-up targets in configuration order
+        workers (int): Targets prepared at the same time
+    """
+
+    def __init__(self, targets: list[str], workers: int = 2):
+        """
+        Initialize warm pool
+
+        Args:
+            targets: 'asr', 'translation' and/or language pairs such as 'de-es'
+            workers: Targets prepared at the same time
+        """
+        self.targets = targets
+        self.workers = max(1, workers)
+        self._statuses = {
+            target: ModelWarmupStatus(kind="asr" if target == "asr" else "translation") for target in targets
+        }
+        self._lock = threading.Lock()
+
+    def _set(self, target: str, **changes: Any) -> None:
+        with self._lock:
+            status = self._statuses[target]
+            for name, value in changes.items():
+                setattr(status, name, value)
+
+    def warm_target(self, target: str) -> None:
+        """Prepare and load one target (blocking); failures are recorded, not raised"""
+        from services.model_registry import get_model_registry
+        from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService
+
+        started = time.perf_counter()
+        self._set(target, state="loading")
+        try:
+            service = _resolve_service(target)
+            model_name = getattr(service, "model_name", None) or service.service_name
+            self._set(target, model=model_name)
+
+            if isinstance(service, OpusCT2TranslationService):
+                # Conversion runs in parallel across targets; only the loads are serialized
+                from .translationservice.ct2_artifacts import ensure_ct2_model
+
+                ensure_ct2_model(service.model_name, settings.ct2_quantization)
+
+            registry = get_model_registry()
+            registry.acquire(service)
+            registry.release(service)
+            if not service.is_initialized:
+                service.initialize()  # not managed by the registry (e.g. ASR worker pool)
+        except Exception as e:
+            logger.warning(f"[MODEL WARMUP] {target} failed: {e}")
+            self._set(target, state="failed", error=str(e), seconds=round(time.perf_counter() - started, 2))
+            return
+
+        elapsed = time.perf_counter() - started
+        self._set(target, state="ready", seconds=round(elapsed, 2))
+        logger.info(f"[MODEL WARMUP] {target} ({model_name}) ready in {elapsed:.1f}s")
+
+    async def warm(self) -> None:
+        """Warm all targets, at most `workers` at a time"""
+        if not self.targets:
+            return
+
+        logger.info(f"[MODEL WARMUP] Warming {', '.join(self.targets)} ({self.workers} workers)")
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="model-warmup")
+        try:
+            await asyncio.gather(*(loop.run_in_executor(executor, self.warm_target, target) for target in self.targets))
+        finally:
+            # Never block the event loop on shutdown; running loads finish in their threads
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_status(self) -> dict[str, dict[str, Any]]:
+        """Get the warm-up state of every target"""
+        with self._lock:
+            return {target: asdict(status) for target, status in self._statuses.items()}
+
+
+_model_warm_pool: ModelWarmPool | None = None
+_model_warm_pool_lock = threading.Lock()
+
+
+def get_model_warm_pool() -> ModelWarmPool:
+    """
+    Get the process-wide warm pool
+
+    Returns:
+        Shared ModelWarmPool with the targets from LANGPLUG_MODEL_WARMUP
+    """
+    global _model_warm_pool
+
+    with _model_warm_pool_lock:
+        if _model_warm_pool is None:
+            _model_warm_pool = ModelWarmPool(
+                parse_warmup_targets(settings.model_warmup), workers=settings.model_warmup_workers
+            )
+    return _model_warm_pool
+
+
+__all__ = ["ModelWarmPool", "ModelWarmupStatus", "get_model_warm_pool", "parse_warmup_targets"]
@@ -12,7 +12,7 @@ Key Components:
 
 Processing Pipeline:
     1. Extract audio chunk (0-20% progress)
-    2. Transcribe audio to text (5-35%)
+    2. Transcribe audio to text (5-35%), both skipped on a transcript cache hit
     3. Filter vocabulary for learning (35-65%)
     4. Generate filtered subtitles (85-95%)
     5. Build translation segments (95-100%)
@@ -127,7 +127,7 @@ class ChunkProcessingService(IChunkHandler):
         translation_manager=None,
     ):
         """Initialize with optional dependency injection.
-        
+
         Args:
             db_session: Database session (required for utilities if not provided)
             transcription_service: Audio extraction and transcription service
@@ -136,13 +136,13 @@ class ChunkProcessingService(IChunkHandler):
             vocabulary_filter: Service for filtering vocabulary from subtitles
             subtitle_generator: Service for generating filtered subtitle files
             translation_manager: Service for managing translations
-            
+
         Note:
             If services are not provided, defaults are created.
             This allows for proper testing with mocked dependencies.
         """
         self.db_session = db_session
-        
+
         # Use injected services or create defaults
         self.transcription_service = transcription_service or ChunkTranscriptionService()
         self.translation_service = translation_service or ChunkTranslationService()
@@ -190,60 +190,27 @@ class ChunkProcessingService(IChunkHandler):
             user = await self.utilities.get_authenticated_user(user_id, session_token)
             language_preferences = self.utilities.load_user_language_preferences(user)
 
-            # Step 1: Extract audio chunk (0-20% progress)
-            audio_file = await self.transcription_service.extract_audio_chunk(
-                task_id, task_progress, video_file, start_time, end_time
-            )
-
-            # Step 2: Transcribe chunk (5-35% progress)
-            srt_file = await self.transcription_service.transcribe_chunk(
-                task_id, task_progress, video_file, audio_file, language_preferences, start_time, end_time
+            # Step 1: Decode audio chunk (0-20% progress), or restore a cached transcript
+            srt_file, audio_file = await self.prepare_chunk_audio(
+                task_id, task_progress, video_file, language_preferences, start_time, end_time
             )
 
-            # Step 3: Filter vocabulary (35-65% progress)
-            vocabulary = await self._filter_vocabulary(task_id, task_progress, srt_file, user, language_preferences)
-
-            # Step 4: Generate filtered subtitles (85-95% progress)
-            # Use pregame version on first processing, postgame version on reprocessing
-            filtered_srt = await self._generate_filtered_subtitles(
-                task_id, task_progress, srt_file, vocabulary, language_preferences, is_pregame=not is_reprocessing
-            )
-
-            # Step 5: Build translation segments (95-100% progress)
-            translation_segments = await self.translation_service.build_translation_segments(
-                task_id,
-                task_progress,
-                srt_file,
-                vocabulary,
-                language_preferences,
-            )
-
-            # Step 6: Write translation segments to file
-            translation_srt_path = None
-            if translation_segments:
-                from pathlib import Path as PathLib
-
-                from utils.srt_parser import SRTParser
-
-                # Generate translation file path
-                srt_file_str = str(srt_file) if srt_file else str(video_file).replace(".mp4", ".srt")
-                translation_srt_path = srt_file_str.replace(".srt", "_translation.srt")
-
-                # Write translation SRT file
-                translation_content = SRTParser.segments_to_srt(translation_segments)
-                PathLib(translation_srt_path).write_text(translation_content, encoding="utf-8")
-
-                logger.info(
-                    f"[CHUNK DEBUG] Wrote {len(translation_segments)} translation segments to {translation_srt_path}"
+            if not srt_file:
+                # Step 2: Transcribe chunk (5-35% progress)
+                srt_file = await self.transcription_service.transcribe_chunk(
+                    task_id,
+                    task_progress,
+                    video_file,
+                    audio_file,
+                    language_preferences,
+                    start_time,
+                    end_time,
+                    user_id=user_id,
                 )
 
-            # Complete processing with subtitle paths
-            self.utilities.complete_processing(
-                task_id,
-                task_progress,
-                vocabulary,
-                subtitle_path=str(filtered_srt) if filtered_srt else str(srt_file),
-                translation_path=translation_srt_path,
+            # Steps 3-6: Filter, generate subtitles, translate (35-100% progress)
+            await self.finalize_chunk(
+                task_id, task_progress, video_file, srt_file, user, language_preferences, is_reprocessing
             )
 
             # Cleanup temporary audio file if it was created
@@ -260,6 +227,124 @@ class ChunkProcessingService(IChunkHandler):
             self.utilities.handle_error(task_id, task_progress, e)
             raise
 
+    async def prepare_chunk_audio(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        language_preferences: dict[str, Any],
+        start_time: float,
+        end_time: float,
+        srt_output: Path | None = None,
+        audio: Any = None,
+    ) -> tuple[str | None, Any]:
+        """
+        Restore the chunk transcript from cache, or load the chunk audio for transcription
+
+        Args:
+            task_id: Processing task ID
+            task_progress: Progress tracking dictionary
+            video_file: Resolved video file
+            language_preferences: User language preferences
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+            srt_output: Chunk SRT path (defaults to the video's .srt)
+            audio: Chunk samples already decoded by the caller (episode split), skips FFmpeg
+
+        Returns:
+            (cached SRT path, video_file) on a transcript cache hit, else (None, chunk audio) where the
+            audio is decoded samples in memory or a temporary WAV file in fallback mode
+        """
+        # Reuse the transcript of an identical chunk (reprocessing, other users) if cached
+        srt_file = self.transcription_service.load_cached_transcript(
+            task_id, task_progress, video_file, language_preferences, start_time, end_time, srt_output=srt_output
+        )
+        if srt_file:
+            return srt_file, video_file  # nothing extracted, nothing to clean up
+
+        if audio is not None:
+            task_progress[task_id].progress = 5
+            task_progress[task_id].current_step = "Extracting audio chunk..."
+            task_progress[task_id].message = "Audio decoded with the rest of the episode"
+            return None, audio
+
+        audio = await self.transcription_service.load_chunk_audio(
+            task_id, task_progress, video_file, start_time, end_time
+        )
+        return None, audio
+
+    async def finalize_chunk(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        srt_file: str,
+        user,
+        language_preferences: dict[str, Any],
+        is_reprocessing: bool = False,
+        translation_service: ChunkTranslationService | None = None,
+    ) -> None:
+        """
+        Filter vocabulary, write filtered and translation subtitles and complete the task
+
+        Args:
+            task_id: Processing task ID
+            task_progress: Progress tracking dictionary
+            video_file: Resolved video file
+            srt_file: Chunk transcript SRT path
+            user: Authenticated user object
+            language_preferences: User language preferences
+            is_reprocessing: True if reprocessing after vocabulary game (generates postgame subtitles)
+            translation_service: Translation segment builder for this chunk (defaults to the
+                processor's, which decodes in live mode)
+        """
+        # Step 3: Filter vocabulary (35-65% progress)
+        vocabulary = await self._filter_vocabulary(task_id, task_progress, srt_file, user, language_preferences)
+
+        # Step 4: Generate filtered subtitles (85-95% progress)
+        # Use pregame version on first processing, postgame version on reprocessing
+        filtered_srt = await self._generate_filtered_subtitles(
+            task_id, task_progress, srt_file, vocabulary, language_preferences, is_pregame=not is_reprocessing
+        )
+
+        # Step 5: Build translation segments (95-100% progress)
+        translation_service = translation_service or self.translation_service
+        translation_segments = await translation_service.build_translation_segments(
+            task_id,
+            task_progress,
+            srt_file,
+            vocabulary,
+            language_preferences,
+        )
+
+        # Step 6: Write translation segments to file
+        translation_srt_path = None
+        if translation_segments:
+            from pathlib import Path as PathLib
+
+            from utils.srt_parser import SRTParser
+
+            # Generate translation file path
+            srt_file_str = str(srt_file) if srt_file else str(video_file).replace(".mp4", ".srt")
+            translation_srt_path = srt_file_str.replace(".srt", "_translation.srt")
+
+            # Write translation SRT file
+            translation_content = SRTParser.segments_to_srt(translation_segments)
+            PathLib(translation_srt_path).write_text(translation_content, encoding="utf-8")
+
+            logger.info(
+                f"[CHUNK DEBUG] Wrote {len(translation_segments)} translation segments to {translation_srt_path}"
+            )
+
+        # Complete processing with subtitle paths
+        self.utilities.complete_processing(
+            task_id,
+            task_progress,
+            vocabulary,
+            subtitle_path=str(filtered_srt) if filtered_srt else str(srt_file),
+            translation_path=translation_srt_path,
+        )
+
     async def _filter_vocabulary(
         self,
         task_id: str,
@@ -297,7 +382,7 @@ class ChunkProcessingService(IChunkHandler):
             language_preferences=language_preferences,
             db_session=self.db_session,
             task_id=task_id,
-            task_progress=task_progress
+            task_progress=task_progress,
         )
 
         logger.info(f"[CHUNK DEBUG] Filtered {len(vocabulary)} vocabulary words")
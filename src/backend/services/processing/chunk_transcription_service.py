@@ -11,9 +11,14 @@ Key Components:
     - SRT file generation from transcription segments
 
 Processing Steps:
-    1. Extract audio chunk using FFmpeg (PCM 16kHz mono)
+    0. Reuse a cached transcript for the same video/window/model if available
+    1. Decode the audio chunk with FFmpeg (PCM 16kHz mono) straight into memory, or into a
+       temporary WAV file if the ASR engine only accepts paths (or streaming is disabled);
+       seeking is input-side, so late chunks do not decode the episode up to their start.
+       With the audio track cache, the whole track is decoded once per video and chunks are
+       memory-mapped slices of it
     2. Transcribe using Whisper model (language-specific)
-    3. Convert segments to SRT format
+    3. Convert segments to SRT format (and store it in the transcript cache)
     4. Cleanup temporary audio files
 
 Usage Example:
@@ -51,7 +56,7 @@ Dependencies:
     - utils.srt_parser: SRT file formatting
 
 Thread Safety:
-    Yes. Service is stateless, all operations use local variables.
+    Yes. Service holds no per-request state; the transcript cache is thread-safe.
 
 Performance Notes:
     - Audio extraction: ~2-5 seconds per 30s chunk (I/O bound)
@@ -67,15 +72,56 @@ Error Handling:
 
 import asyncio
 import logging
+import subprocess
+import sys
+from collections.abc import AsyncIterator
+from dataclasses import replace
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Lazy import to avoid circular dependencies
 from core.config import settings
 from services.interfaces.transcription_interface import IChunkTranscriptionService
+from services.model_registry import get_model_registry
+from services.transcriptionservice.audio_track_cache import AudioTrackCache, get_audio_track_cache
+from services.transcriptionservice.interface import TranscriptionResult, TranscriptionSegment
+from services.transcriptionservice.speech_detection import SpeechDetectionResult, detect_speech
+from services.transcriptionservice.transcript_cache import TranscriptCache, get_transcript_cache
+from services.transcriptionservice.transcription_scheduler import get_transcription_scheduler
+from services.transcriptionservice.word_timings import sidecar_path, write_word_sidecar
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE = 16000
+FFMPEG_TIMEOUT_SECONDS = 600
+
+# Input-side -ss jumps to the keyframe before (start - preroll) without decoding; output-side -ss
+# then decodes and discards at most the preroll, so the chunk still starts on the exact sample
+SEEK_PREROLL_SECONDS = 5.0
+
+# Raw 16kHz mono PCM 16-bit little-endian on stdout, no WAV header
+PCM_PIPE_ARGS = ["-vn", "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-ac", "1", "pipe:1"]
+
+
+def ffmpeg_seek_args(start_time: float, duration: float) -> tuple[list[str], list[str]]:
+    """
+    Build FFmpeg seek options for the window [start_time, start_time + duration)
+
+    Args:
+        start_time: Window start in seconds
+        duration: Window length in seconds
+
+    Returns:
+        (options placed before -i, options placed after -i)
+    """
+    coarse = max(0.0, start_time - SEEK_PREROLL_SECONDS)
+    input_args = ["-ss", f"{coarse:.3f}"] if coarse > 0 else []
+    output_args = ["-ss", f"{start_time - coarse:.3f}"] if start_time > coarse else []
+    return input_args, [*output_args, "-t", f"{duration:.3f}"]
+
 
 class ChunkTranscriptionError(Exception):
     """Exception for chunk transcription errors"""
@@ -118,6 +164,112 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         Automatically handles temporary file cleanup on success and error.
     """
 
+    def __init__(
+        self, transcript_cache: TranscriptCache | None = None, audio_track_cache: AudioTrackCache | None = None
+    ):
+        """
+        Initialize transcription service
+
+        Args:
+            transcript_cache: Chunk transcript store (defaults to the shared cache)
+            audio_track_cache: Decoded whole-video audio store (defaults to the shared cache)
+        """
+        self.transcript_cache = transcript_cache or get_transcript_cache()
+        self.audio_track_cache = audio_track_cache or get_audio_track_cache()
+
+    def _transcript_cache_key(
+        self, video_file: Path, start_time: float, end_time: float, target_language: str
+    ) -> str | None:
+        """Build the transcript cache key, or None if the video cannot be identified"""
+        try:
+            return self.transcript_cache.make_key(
+                video_file, start_time, end_time, settings.transcription_service, target_language
+            )
+        except OSError as e:
+            logger.debug(f"Transcript cache key unavailable for {video_file}: {e}")
+            return None
+
+    def has_cached_transcript(
+        self, video_file: Path, language_preferences: dict[str, Any] | None, start_time: float, end_time: float
+    ) -> bool:
+        """Check whether a chunk transcript is cached, without restoring it"""
+        if not self.transcript_cache:
+            return False
+
+        target_language = language_preferences.get("target") if language_preferences else settings.default_language
+        key = self._transcript_cache_key(video_file, start_time, end_time, target_language)
+        return key is not None and self.transcript_cache.contains(key)
+
+    def load_cached_transcript(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        language_preferences: dict[str, Any] | None = None,
+        start_time: float = 0,
+        end_time: float = 30,
+        srt_output: Path | None = None,
+    ) -> str | None:
+        """
+        Restore a previously transcribed chunk, skipping FFmpeg and Whisper
+
+        Args:
+            task_id: Processing task ID
+            task_progress: Progress tracking dictionary
+            video_file: Source video file
+            language_preferences: User language preferences (target = transcription language)
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+            srt_output: SRT file to restore into (defaults to the video's .srt)
+
+        Returns:
+            Path to the restored SRT file, or None on a cache miss
+        """
+        if not self.transcript_cache:
+            return None
+
+        target_language = language_preferences.get("target") if language_preferences else settings.default_language
+        key = self._transcript_cache_key(video_file, start_time, end_time, target_language)
+        if key is None:
+            return None
+
+        srt_content = self.transcript_cache.get(key)
+        if srt_content is None:
+            return None
+
+        srt_output = srt_output or video_file.with_suffix(".srt")
+        srt_output.write_text(srt_content, encoding="utf-8")
+        word_timings = self.transcript_cache.get_word_timings(key)
+        if word_timings is None:
+            sidecar_path(srt_output).unlink(missing_ok=True)
+        else:
+            sidecar_path(srt_output).write_bytes(word_timings)
+
+        task_progress[task_id].progress = 35
+        task_progress[task_id].current_step = "Transcribing audio..."
+        task_progress[task_id].message = "Transcript restored from cache"
+
+        logger.info(f"Transcript cache hit for {video_file.name} ({start_time}-{end_time}s) -> {srt_output}")
+        return str(srt_output)
+
+    def _store_cached_transcript(
+        self, video_file: Path, srt_output: Path, start_time: float, end_time: float, target_language: str
+    ) -> None:
+        """Store a freshly created chunk transcript; failures only cost a future cache miss"""
+        if not self.transcript_cache:
+            return
+
+        key = self._transcript_cache_key(video_file, start_time, end_time, target_language)
+        if key is None:
+            return
+
+        sidecar = sidecar_path(srt_output)
+        try:
+            word_timings = sidecar.read_bytes() if sidecar.exists() else None
+            self.transcript_cache.put(key, srt_output.read_text(encoding="utf-8"), word_timings)
+        except OSError as e:
+            logger.warning(f"Failed to cache transcript for {video_file.name}: {e}")
+
     async def extract_audio_chunk(
         self, task_id: str, task_progress: dict[str, Any], video_file: Path, start_time: float, end_time: float
     ) -> Path:
@@ -134,15 +286,14 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         logger.info(f"Output audio file: {audio_output}")
 
         try:
-            # Build ffmpeg command for audio extraction
+            # Build ffmpeg command for audio extraction (input-side seek, see ffmpeg_seek_args)
+            input_seek, output_seek = ffmpeg_seek_args(start_time, duration)
             cmd = [
                 "ffmpeg",
+                *input_seek,
                 "-i",
                 str(video_file),
-                "-ss",
-                str(start_time),
-                "-t",
-                str(duration),
+                *output_seek,
                 "-vn",  # No video
                 "-acodec",
                 "pcm_s16le",  # PCM 16-bit little-endian
@@ -228,7 +379,7 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
                     f"The video segment {start_time}-{end_time}s may not contain audio. "
                     f"Video: {video_file.name}"
                 )
-            
+
             # Also check for suspiciously small files (< 1KB for any chunk > 1s)
             min_expected_size = int(duration * 16000 * 2 * 0.01)  # ~1% of expected PCM size
             if audio_size < min_expected_size and duration > 1:
@@ -237,7 +388,9 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
                     f"(expected at least {min_expected_size} bytes). File: {audio_output}"
                 )
 
-            logger.info(f"Audio extracted for {video_file.name} ({start_time}-{end_time}s) -> {audio_output} ({audio_size} bytes)")
+            logger.info(
+                f"Audio extracted for {video_file.name} ({start_time}-{end_time}s) -> {audio_output} ({audio_size} bytes)"
+            )
             return audio_output
 
         except FileNotFoundError as e:
@@ -283,6 +436,231 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             logger.error(f"Audio extraction error: {e}", exc_info=True)
             raise ChunkTranscriptionError(f"Audio extraction failed: {e}") from e
 
+    def audio_streaming_supported(self) -> bool:
+        """Check whether chunk audio can be handed to the ASR engine in memory"""
+        if not settings.audio_streaming_enabled:
+            return False
+
+        from core.dependencies import get_transcription_service
+
+        transcription_service = get_transcription_service()
+        return bool(transcription_service) and transcription_service.supports_array_input() is True
+
+    async def load_chunk_audio(
+        self, task_id: str, task_progress: dict[str, Any], video_file: Path, start_time: float, end_time: float
+    ) -> "Path | np.ndarray":
+        """
+        Get the chunk audio for transcription, in memory when possible
+
+        Args:
+            task_id: Processing task ID
+            task_progress: Progress tracking dictionary
+            video_file: Source video file
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+
+        Returns:
+            16 kHz mono float32 samples, or the path of an extracted WAV file (fallback mode)
+        """
+        if self.audio_streaming_supported():
+            try:
+                return await self.decode_audio_chunk(task_id, task_progress, video_file, start_time, end_time)
+            except ChunkTranscriptionError as e:
+                logger.warning(f"In-memory audio decode failed, falling back to WAV extraction: {e}")
+
+        return await self.extract_audio_chunk(task_id, task_progress, video_file, start_time, end_time)
+
+    async def decode_audio_chunk(
+        self, task_id: str, task_progress: dict[str, Any], video_file: Path, start_time: float, end_time: float
+    ) -> "np.ndarray":
+        """
+        Decode the chunk audio with FFmpeg into a NumPy buffer (no temporary file)
+
+        FFmpeg writes raw 16 kHz mono s16le PCM to stdout, which is converted to the float32
+        samples in [-1, 1] that faster-whisper expects.
+
+        Args:
+            task_id: Processing task ID
+            task_progress: Progress tracking dictionary
+            video_file: Source video file
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+
+        Returns:
+            Float32 sample array
+
+        Raises:
+            ChunkTranscriptionError: If FFmpeg is missing, fails, times out or yields no audio
+        """
+        import numpy as np
+
+        task_progress[task_id].progress = 5
+        task_progress[task_id].current_step = "Extracting audio chunk..."
+        task_progress[task_id].message = "Isolating audio for this segment"
+
+        samples = await self._read_cached_track(video_file, start_time, end_time)
+        if samples is None:
+            samples = (await self._decode_pcm(video_file, start_time, end_time)).astype(np.float32) / 32768.0
+
+        if not len(samples):
+            raise ChunkTranscriptionError(
+                f"Audio decode failed: FFmpeg produced no audio. "
+                f"The video segment {start_time}-{end_time}s may not contain audio. Video: {video_file.name}"
+            )
+
+        logger.info(
+            f"Audio decoded in memory for {video_file.name} ({start_time}-{end_time}s): "
+            f"{len(samples) / SAMPLE_RATE:.1f}s, {samples.nbytes / 1024 / 1024:.1f} MiB"
+        )
+        return samples
+
+    async def split_episode_audio(
+        self, video_file: Path, windows: list[tuple[float, float]]
+    ) -> list["np.ndarray | None"]:
+        """
+        Decode the audio of many chunks with a single FFmpeg run and split it into chunk buffers
+
+        One pass over [first start, last end] replaces one FFmpeg process (open, probe, seek)
+        per chunk when a whole episode is pre-processed.
+
+        Args:
+            video_file: Source video file
+            windows: (start_time, end_time) of each chunk in seconds
+
+        Returns:
+            Float32 samples per window (in the given order), None for windows without audio
+
+        Raises:
+            ChunkTranscriptionError: If FFmpeg is missing, fails or times out
+        """
+        import numpy as np
+
+        if not windows:
+            return []
+
+        if self.audio_track_cache:
+            buffers = [await self._read_cached_track(video_file, start, end) for start, end in windows]
+            if all(samples is not None for samples in buffers):
+                return [samples if len(samples) else None for samples in buffers]
+
+        span_start = min(start for start, _ in windows)
+        span_end = max(end for _, end in windows)
+        pcm = await self._decode_pcm(video_file, span_start, span_end)
+
+        buffers: list[np.ndarray | None] = []
+        for start_time, end_time in windows:
+            first = round((start_time - span_start) * SAMPLE_RATE)
+            last = min(len(pcm), round((end_time - span_start) * SAMPLE_RATE))
+            # astype() copies, so the episode-wide buffer is released once all chunks are split
+            buffers.append(pcm[first:last].astype(np.float32) / 32768.0 if last > first else None)
+
+        logger.info(
+            f"Episode audio split for {video_file.name} ({span_start}-{span_end}s) into {len(windows)} chunks "
+            f"with one FFmpeg run: {len(pcm) / SAMPLE_RATE:.1f}s decoded"
+        )
+        return buffers
+
+    async def _read_cached_track(self, video_file: Path, start_time: float, end_time: float) -> "np.ndarray | None":
+        """
+        Slice the chunk out of the video's cached audio track, decoding the whole track on first use
+
+        Returns:
+            Float32 samples, or None if the track cache is disabled or the track cannot be decoded
+        """
+        if not self.audio_track_cache:
+            return None
+
+        try:
+            key = self.audio_track_cache.make_key(video_file)
+        except OSError as e:
+            logger.debug(f"Audio track cache key unavailable for {video_file}: {e}")
+            return None
+
+        async with self.audio_track_cache.fill_lock(key):
+            if not self.audio_track_cache.contains(key):
+                try:
+                    await self._decode_track_to_cache(video_file, key)
+                except ChunkTranscriptionError as e:
+                    logger.warning(f"Audio track caching failed for {video_file.name}, decoding per chunk: {e}")
+                    return None
+
+        return self.audio_track_cache.read_slice(key, start_time, end_time)
+
+    async def _decode_track_to_cache(self, video_file: Path, key: str) -> None:
+        """Decode the complete audio track of a video into the audio track cache"""
+        output = self.audio_track_cache.temp_path(key)
+        cmd = ["ffmpeg", "-nostdin", "-y", "-i", str(video_file), *PCM_PIPE_ARGS[:-1], str(output)]
+
+        try:
+            returncode, _stdout, stderr = await self._run_ffmpeg(cmd, video_file)
+            if returncode != 0:
+                error_msg = stderr.decode("utf-8", errors="replace") if stderr else "Unknown ffmpeg error"
+                raise ChunkTranscriptionError(f"FFmpeg audio decode failed for {video_file.name}. Error: {error_msg}")
+
+            self.audio_track_cache.commit(key, output)
+        finally:
+            output.unlink(missing_ok=True)
+
+        logger.info(f"Audio track of {video_file.name} decoded into the audio track cache")
+
+    async def _decode_pcm(self, video_file: Path, start_time: float, end_time: float) -> "np.ndarray":
+        """Decode [start_time, end_time) to 16 kHz mono int16 PCM in memory"""
+        import numpy as np
+
+        input_seek, output_seek = ffmpeg_seek_args(start_time, end_time - start_time)
+        cmd = ["ffmpeg", "-nostdin", *input_seek, "-i", str(video_file), *output_seek, *PCM_PIPE_ARGS]
+
+        returncode, stdout, stderr = await self._run_ffmpeg(cmd, video_file)
+        if returncode != 0:
+            error_msg = stderr.decode("utf-8", errors="replace") if stderr else "Unknown ffmpeg error"
+            logger.error(f"FFmpeg decode failed for video: {video_file}: {error_msg}")
+            raise ChunkTranscriptionError(f"FFmpeg audio decode failed for {video_file.name}. Error: {error_msg}")
+
+        return np.frombuffer(stdout or b"", dtype=np.int16)
+
+    async def _run_ffmpeg(self, cmd: list[str], video_file: Path) -> tuple[int, bytes, bytes]:
+        """
+        Run FFmpeg and capture its output
+
+        Returns:
+            (returncode, stdout, stderr)
+
+        Raises:
+            ChunkTranscriptionError: If FFmpeg is not installed or times out
+        """
+        process = None
+        try:
+            if sys.platform == "win32" and not isinstance(asyncio.get_running_loop(), asyncio.ProactorEventLoop):
+                # SelectorEventLoop doesn't support subprocesses - use sync fallback in a thread
+                result = await asyncio.to_thread(
+                    subprocess.run, cmd, check=False, capture_output=True, timeout=FFMPEG_TIMEOUT_SECONDS
+                )
+                return result.returncode, result.stdout, result.stderr
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=FFMPEG_TIMEOUT_SECONDS)
+            return process.returncode, stdout, stderr
+
+        except FileNotFoundError as e:
+            logger.error("FFmpeg not found - cannot decode audio chunk")
+            raise ChunkTranscriptionError(
+                "FFmpeg is not installed or not in PATH. "
+                "Please install FFmpeg to enable video chunk processing. "
+                "See: https://ffmpeg.org/download.html"
+            ) from e
+
+        except (TimeoutError, subprocess.TimeoutExpired) as e:
+            logger.error(f"FFmpeg process timed out for video: {video_file}")
+            if process is not None:
+                try:
+                    process.kill()
+                    await process.wait()
+                except Exception as kill_error:
+                    logger.warning(f"Failed to kill timed-out process: {kill_error}")
+            raise ChunkTranscriptionError(f"Audio extraction timed out for {video_file.name}") from e
+
     async def _simulate_transcription_progress(
         self,
         task_id: str,
@@ -292,7 +670,7 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
     ) -> None:
         """
         Simulate progress updates during transcription.
-        
+
         Whisper doesn't provide progress callbacks, so we estimate progress based on
         audio duration. Typical transcription speed is ~10-30x realtime for whisper-tiny,
         ~2-5x for larger models.
@@ -300,27 +678,27 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         # Estimate transcription time: assume ~5x realtime for whisper-tiny (conservative)
         # A 20-min (1200s) chunk might take ~240s = 4 min to transcribe
         estimated_time_seconds = audio_duration_seconds / 5.0
-        
+
         # Progress goes from 5% to 35% during transcription (30% range)
         start_progress = 5
         end_progress = 35
         progress_range = end_progress - start_progress
-        
+
         # Update every 2 seconds
         update_interval = 2.0
         elapsed = 0.0
-        
+
         while not stop_event.is_set():
             await asyncio.sleep(update_interval)
             elapsed += update_interval
-            
+
             # Calculate progress based on elapsed time vs estimated time
             # Cap at 95% of target to leave room for actual completion
             progress_fraction = min(elapsed / estimated_time_seconds, 0.95)
             new_progress = start_progress + (progress_range * progress_fraction)
-            
+
             task_progress[task_id].progress = new_progress
-            
+
             # Update message with elapsed time
             elapsed_min = int(elapsed // 60)
             elapsed_sec = int(elapsed % 60)
@@ -338,8 +716,15 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         language_preferences: dict[str, Any] | None = None,
         start_time: float = 0,
         end_time: float = 30,
+        srt_output: Path | None = None,
+        user_id: int | None = None,
     ) -> str:
-        """Transcribe the audio chunk to text"""
+        """
+        Transcribe the audio chunk to text (into srt_output, by default the video's .srt)
+
+        With a user_id, LANGPLUG_SUBTITLE_STREAMING_ENABLED and an engine that decodes
+        incrementally, segments are pushed to the user's WebSocket as they are decoded.
+        """
         task_progress[task_id].progress = 5
         target_language = language_preferences.get("target") if language_preferences else settings.default_language
         task_progress[task_id].current_step = "Transcribing audio..."
@@ -353,37 +738,37 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             raise ChunkTranscriptionError("Transcription service is not available. Please check server configuration.")
 
         try:
-            # Transcribe the audio chunk
-            if audio_file != video_file:  # We have an actual audio file
-                logger.info(f"Transcribing audio chunk: {audio_file}")
-                
+            # Transcribe the audio chunk (decoded samples, or an extracted audio file)
+            in_memory = not isinstance(audio_file, str | Path)
+            if in_memory or audio_file != video_file:
+                logger.info(f"Transcribing audio chunk: {'in-memory samples' if in_memory else audio_file}")
+
                 # Calculate audio duration for progress estimation
                 audio_duration = end_time - start_time
-                
-                # Start progress simulation in background
-                stop_progress = asyncio.Event()
-                progress_task = asyncio.create_task(
-                    self._simulate_transcription_progress(
-                        task_id, task_progress, audio_duration, stop_progress
-                    )
-                )
-                
-                try:
-                    # Run synchronous transcribe in executor to avoid blocking
-                    transcription_result = await asyncio.to_thread(
-                        transcription_service.transcribe, str(audio_file), language=target_language
-                    )
-                finally:
-                    # Stop progress simulation
-                    stop_progress.set()
-                    progress_task.cancel()
-                    try:
-                        await progress_task
-                    except asyncio.CancelledError:
-                        pass
-
-                # Extract transcribed segments from result
-                srt_output = video_file.with_suffix(".srt")
+                srt_output = srt_output or video_file.with_suffix(".srt")
+
+                # Keep the model resident while this chunk is transcribed
+                async with get_model_registry().async_lease(transcription_service):
+                    if user_id is not None and self._streams_segments(transcription_service):
+                        # Progress follows the decoded segments; queued behind other chunks, not batched
+                        transcription_result = await self._transcribe_streaming(
+                            transcription_service,
+                            audio_file if in_memory else str(audio_file),
+                            target_language,
+                            task_id,
+                            task_progress,
+                            duration=audio_duration,
+                            user_id=user_id,
+                        )
+                    else:
+                        transcription_result = await self._transcribe_with_estimated_progress(
+                            transcription_service,
+                            audio_file,
+                            target_language,
+                            task_id,
+                            task_progress,
+                            audio_duration=audio_duration,
+                        )
 
                 if hasattr(transcription_result, "segments") and transcription_result.segments:
                     # Create SRT from Whisper segments with proper timestamps
@@ -400,6 +785,8 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
                 else:
                     raise ChunkTranscriptionError("Transcription result has no usable text or segments")
 
+                self._store_cached_transcript(video_file, srt_output, start_time, end_time, target_language)
+
                 # Update progress to end of transcription phase
                 task_progress[task_id].progress = 35
                 task_progress[task_id].message = "Transcription complete"
@@ -422,6 +809,188 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             logger.error(f"Transcription error: {e}", exc_info=True)
             raise ChunkTranscriptionError(f"Chunk transcription failed: {e}") from e
 
+    async def _transcribe_with_estimated_progress(
+        self,
+        transcription_service: Any,
+        audio_file: "Path | np.ndarray",
+        language: str | None,
+        task_id: str,
+        task_progress: dict[str, Any],
+        *,
+        audio_duration: float,
+    ) -> TranscriptionResult:
+        """Transcribe the whole chunk in one call while simulating progress from the audio duration"""
+        stop_progress = asyncio.Event()
+        progress_task = asyncio.create_task(
+            self._simulate_transcription_progress(task_id, task_progress, audio_duration, stop_progress)
+        )
+
+        try:
+            if not isinstance(audio_file, str | Path):
+                return await self._transcribe_samples(
+                    transcription_service, audio_file, language, task_id, task_progress
+                )
+            # Run synchronous transcribe in executor to avoid blocking
+            return await asyncio.to_thread(transcription_service.transcribe, str(audio_file), language=language)
+        finally:
+            # Stop progress simulation
+            stop_progress.set()
+            progress_task.cancel()
+            try:
+                await progress_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _transcribe_samples(
+        self,
+        transcription_service: Any,
+        samples: "np.ndarray",
+        language: str | None,
+        task_id: str,
+        task_progress: dict[str, Any],
+    ) -> TranscriptionResult:
+        """Transcribe decoded chunk audio, sending only its speech islands to the model"""
+        prepared = await self._detect_speech(samples, task_id, task_progress)
+        if prepared is None:
+            return TranscriptionResult(full_text="", segments=[], language=language)
+        audio, speech = prepared
+
+        scheduler = get_transcription_scheduler(transcription_service)
+        if scheduler:
+            # Batched with concurrent chunk requests on the shared model
+            result = await scheduler.transcribe(audio, language=language)
+        else:
+            result = await asyncio.to_thread(transcription_service.transcribe, audio, language=language)
+
+        result.segments = [self._rebase_segment(segment, speech) for segment in result.segments]
+        return result
+
+    async def _detect_speech(
+        self, samples: "np.ndarray", task_id: str, task_progress: dict[str, Any]
+    ) -> "tuple[np.ndarray, SpeechDetectionResult | None] | None":
+        """
+        VAD pre-pass over decoded chunk audio
+
+        Returns:
+            (audio to transcribe, speech islands to map timestamps back with, or None if the audio
+            is transcribed as is), or None if the chunk contains no speech
+        """
+        if not settings.vad_prepass_enabled:
+            return samples, None
+
+        speech = await asyncio.to_thread(detect_speech, samples)
+        task_progress[task_id].speech_ratio = round(speech.speech_ratio, 3)
+        logger.info(f"[VAD] {speech.speech_ratio:.0%} speech in {len(speech.islands)} islands")
+        if not speech.islands:
+            return None
+        if speech.speech_ratio >= settings.vad_prepass_max_speech_ratio:
+            return samples, None  # little to skip, transcribe the chunk as is
+        return speech.compact(samples), speech
+
+    @staticmethod
+    def _rebase_segment(segment: TranscriptionSegment, speech: SpeechDetectionResult | None) -> TranscriptionSegment:
+        """Map a segment of compacted speech audio back onto the chunk timeline"""
+        if speech is None:
+            return segment
+        words = segment.words
+        if words is not None:
+            words = words.copy()
+            words["start"] = [speech.to_chunk_time(seconds) for seconds in words["start"]]
+            words["end"] = [speech.to_chunk_time(seconds, is_end=True) for seconds in words["end"]]
+        return replace(
+            segment,
+            start_time=speech.to_chunk_time(segment.start_time),
+            end_time=speech.to_chunk_time(segment.end_time, is_end=True),
+            words=words,
+        )
+
+    @staticmethod
+    def _streams_segments(transcription_service: Any) -> bool:
+        """Stream only engines that decode incrementally; for the rest streaming would only skip batching"""
+        return settings.subtitle_streaming_enabled and transcription_service.supports_streaming()
+
+    async def _transcribe_streaming(
+        self,
+        transcription_service: Any,
+        audio: Any,
+        language: str | None,
+        task_id: str,
+        task_progress: dict[str, Any],
+        *,
+        duration: float,
+        user_id: int,
+    ) -> TranscriptionResult:
+        """
+        Transcribe while pushing each decoded segment to the user
+
+        Progress follows the end time of the last decoded segment. The chunk SRT is written once
+        by the caller from the returned segments.
+        """
+        speech = None
+        if not isinstance(audio, str | Path):
+            prepared = await self._detect_speech(audio, task_id, task_progress)
+            if prepared is None:
+                return TranscriptionResult(full_text="", segments=[], language=language)
+            audio, speech = prepared
+
+        from api.websocket_manager import manager
+
+        segments: list[TranscriptionSegment] = []
+        async for decoded in self._decode_stream(transcription_service, audio, language):
+            segment = self._rebase_segment(decoded, speech)
+            segments.append(segment)
+
+            position = min(segment.end_time, duration)
+            task_progress[task_id].progress = 5 + 30 * (position / duration if duration else 1)
+            task_progress[task_id].message = (
+                f"Transcribing... {self._format_srt_timestamp(position)[:8]} "
+                f"of {self._format_srt_timestamp(duration)[:8]}"
+            )
+            await manager.send_user_message(
+                str(user_id),
+                {
+                    "type": "subtitle_segment",
+                    "task_id": task_id,
+                    "index": len(segments),
+                    "start_time": segment.start_time,
+                    "end_time": segment.end_time,
+                    "text": segment.text,
+                },
+            )
+
+        logger.info(f"Streamed {len(segments)} segments of {task_id} to user {user_id}")
+        return TranscriptionResult(
+            full_text=" ".join(segment.text for segment in segments), segments=segments, language=language
+        )
+
+    @staticmethod
+    async def _decode_stream(
+        transcription_service: Any, audio: Any, language: str | None
+    ) -> AsyncIterator[TranscriptionSegment]:
+        """Segments as they are decoded, taking a turn on the model through the scheduler if batching is on"""
+        scheduler = get_transcription_scheduler(transcription_service)
+        if scheduler:
+            async for segment in scheduler.transcribe_stream(audio, language=language):
+                yield segment
+            return
+
+        loop = asyncio.get_running_loop()
+        decoded: asyncio.Queue[TranscriptionSegment | None] = asyncio.Queue()
+
+        def decode() -> None:
+            try:
+                for segment in transcription_service.transcribe_stream(audio, language=language):
+                    loop.call_soon_threadsafe(decoded.put_nowait, segment)
+            finally:
+                loop.call_soon_threadsafe(decoded.put_nowait, None)
+
+        decoder = asyncio.ensure_future(asyncio.to_thread(decode))
+        try:
+            while (segment := await decoded.get()) is not None:
+                yield segment
+        finally:
+            await decoder  # re-raises decoding errors
+
     def _create_srt_from_segments(self, segments: list, output_path: Path) -> None:
         """
         Create SRT file from transcription segments
@@ -445,8 +1014,9 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             parser = SRTParser()
             srt_content = parser.segments_to_srt(srt_segments)
 
-            # Write to file
+            # Write to file, with the per-word timestamps in a sidecar next to it
             output_path.write_text(srt_content, encoding="utf-8")
+            write_word_sidecar(output_path, segments)
 
             logger.info(f"Created SRT file with {len(srt_segments)} segments: {output_path}")
 
@@ -470,6 +1040,7 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             # Write to file
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(srt_content)
+            sidecar_path(output_path).unlink(missing_ok=True)  # no word timings for this transcript
 
             logger.info(f"Created SRT file: {output_path}")
 
@@ -513,14 +1084,17 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         logger.info(f"No existing SRT found, will use: {default_srt}")
         return str(default_srt)
 
-    def cleanup_temp_audio_file(self, audio_file: Path, video_file: Path) -> None:
+    def cleanup_temp_audio_file(self, audio_file: "Path | np.ndarray", video_file: Path) -> None:
         """
         Clean up temporary audio file after transcription
 
         Args:
-            audio_file: Path to temporary audio file
+            audio_file: Path to temporary audio file (in-memory samples need no cleanup)
             video_file: Original video file (won't be deleted)
         """
+        if not isinstance(audio_file, Path):
+            return
+
         # Only delete if it's a generated audio file (not the original video)
         if audio_file != video_file and audio_file.exists():
             try:
@@ -6,7 +6,7 @@ This module coordinates translation services for different language pairs and bu
 
 Key Components:
     - ChunkTranslationService: Main translation coordination service
-    - Translation service factory and caching per language pair
+    - Translation service per language pair (factory-cached, residency managed by the model registry)
     - Batch translation with progress tracking
     - Segment overlap detection
 
@@ -34,14 +34,14 @@ Dependencies:
     - tqdm: Progress bar for translation batches
 
 Thread Safety:
-    No. Service caches translation models in instance dict (_translation_services).
-    Use separate instances per request or add locking for concurrent access.
+    Yes. Translation services are shared through TranslationServiceFactory; a model is leased
+    from the model registry while its batches run, so it is never unloaded mid-translation.
 
 Performance Notes:
-    - Translation service caching: O(1) lookup per language pair
-    - Translation: ~200ms per segment (model dependent)
-    - Batch processing: Yields to event loop every 5 segments
-    - Progress updates: Every segment (65% -> 95% range)
+    - Translation services: one instance per model process-wide, unloaded LRU under the memory budget
+    - Translation: segments grouped into token-budgeted translate_batch() calls
+    - Batch processing: Each batch runs in a worker thread via asyncio.to_thread
+    - Progress updates: Every batch (65% -> 95% range)
 
 Translation Models:
     Uses Helsinki-NLP OPUS-MT models: opus-mt-{source}-{target}
@@ -50,17 +50,27 @@ Translation Models:
 
 import asyncio
 import logging
+import math
 from typing import Any
 
 from tqdm import tqdm
 
 from services.interfaces.translation_interface import IChunkTranslationService
+from services.model_registry import get_model_registry
 from services.translationservice.factory import TranslationServiceFactory
 from services.translationservice.interface import ITranslationService
+from services.translationservice.translation_cache import TranslationCache, get_translation_cache
+from services.translationservice.translation_scheduler import LIVE
 from utils.srt_parser import SRTParser, SRTSegment
 
 logger = logging.getLogger(__name__)
 
+# Default batching limits for translate_batch() calls
+DEFAULT_BATCH_TOKEN_BUDGET = 1024
+DEFAULT_MAX_BATCH_SEGMENTS = 64
+# Average OPUS-MT subword tokens per whitespace-separated word (German/English)
+TOKENS_PER_WORD_ESTIMATE = 1.5
+
 
 class ChunkTranslationError(Exception):
     """Exception for chunk translation errors"""
@@ -76,7 +86,10 @@ class ChunkTranslationService(IChunkTranslationService):
     subtitle segments with progress tracking.
 
     Attributes:
-        _translation_services (dict): Cache of translation services keyed by (source, target, quality)
+        batch_token_budget (int): Approximate source tokens per translation batch
+        max_batch_segments (int): Maximum segments per translation batch
+        translation_cache (TranslationCache | None): Persistent translation memory consulted before the model
+        mode (str): Decoding mode passed to translate_batch() ('live' for chunk processing)
 
     Example:
         ```python
@@ -93,13 +106,31 @@ class ChunkTranslationService(IChunkTranslationService):
         ```
 
     Note:
-        Service instances are cached per language pair for performance.
+        Service instances are shared per model through TranslationServiceFactory.
         Implements IChunkTranslationService interface.
         Translates ALL segments, not just vocabulary segments (for complete subtitles).
     """
 
-    def __init__(self):
-        self._translation_services: dict[tuple[str, str, str], ITranslationService] = {}
+    def __init__(
+        self,
+        batch_token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+        max_batch_segments: int = DEFAULT_MAX_BATCH_SEGMENTS,
+        translation_cache: TranslationCache | None = None,
+        mode: str = LIVE,
+    ):
+        """
+        Initialize translation coordinator
+
+        Args:
+            batch_token_budget: Approximate source tokens per translate_batch() call
+            max_batch_segments: Maximum number of segments per translate_batch() call
+            translation_cache: Persistent translation memory (defaults to the shared cache)
+            mode: Decoding mode, 'live' (a user is waiting) or 'offline' (pre-processing)
+        """
+        self.batch_token_budget = batch_token_budget
+        self.max_batch_segments = max_batch_segments
+        self.translation_cache = translation_cache or get_translation_cache()
+        self.mode = mode
 
     def get_translation_service(
         self, source_lang: str, target_lang: str, quality: str = "standard"
@@ -113,23 +144,18 @@ class ChunkTranslationService(IChunkTranslationService):
             quality: Translation quality level
 
         Returns:
-            Translation service instance
+            Translation service instance (shared process-wide; the model loads on first lease)
         """
-        service_key = (source_lang, target_lang, quality)
+        # Calculate the correct OPUS model for this language pair
+        # OPUS models follow pattern: Helsinki-NLP/opus-mt-{source}-{target}
+        model_name = f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
 
-        if service_key not in self._translation_services:
-            # Calculate the correct OPUS model for this language pair
-            # OPUS models follow pattern: Helsinki-NLP/opus-mt-{source}-{target}
-            model_name = f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
+        logger.debug(f"Translation service: {source_lang} -> {target_lang} (model: {model_name}, {quality})")
 
-            logger.info(f"Creating translation service: {source_lang} -> {target_lang} (model: {model_name})")
-
-            self._translation_services[service_key] = TranslationServiceFactory.create_service(
-                service_name="opus",  # Use OPUS service type
-                model_name=model_name,  # Explicitly set model for language pair
-            )
-
-        return self._translation_services[service_key]
+        return TranslationServiceFactory.create_service(
+            service_name="opus",  # Use OPUS service type
+            model_name=model_name,  # Explicitly set model for language pair
+        )
 
     async def build_translation_segments(
         self,
@@ -219,6 +245,10 @@ class ChunkTranslationService(IChunkTranslationService):
         """
         Build translated text segments for all subtitle segments
 
+        Segments are grouped into token-budgeted batches and each batch is translated
+        with a single translate_batch() call in a worker thread, so the event loop stays
+        responsive while CTranslate2 uses its batching throughput.
+
         Args:
             task_id: Processing task ID
             task_progress: Progress tracking dictionary
@@ -237,52 +267,181 @@ class ChunkTranslationService(IChunkTranslationService):
         )
 
         translation_service = self.get_translation_service(source_lang, target_lang)
+        batches = self._plan_translation_batches(subtitle_segments)
+        total_segments = len(subtitle_segments)
 
-        async def translate_with_progress(task_id=None, task_progress_dict=None):
-            """Translate segments with progress tracking"""
-            translation_segments = []
-            batch_size = 5  # Process in small batches to yield to event loop
-
-            for i, segment in enumerate(tqdm(subtitle_segments, desc="Translating segments", disable=False)):
-                try:
-                    # Update progress every segment to ensure smooth updates (65% -> 95%)
-                    if task_id and task_progress_dict:
-                        # Map translation progress (0-100%) to overall range (65-95%)
-                        translation_pct = (i + 1) / len(subtitle_segments)
-                        progress = int(65 + (30 * translation_pct))
-                        task_progress_dict[task_id].progress = progress
-                        task_progress_dict[task_id].current_step = "Building translations..."
-                        task_progress_dict[task_id].message = f"Translating segment {i + 1}/{len(subtitle_segments)}"
-
-                    # Create translation segment
-                    translation_result = translation_service.translate(segment.text, source_lang, target_lang)
-
-                    translation_segment = SRTSegment(
-                        index=segment.index,
-                        start_time=segment.start_time,
-                        end_time=segment.end_time,
-                        text=translation_result.translated_text,
+        logger.info(
+            f"[TRANSLATION DEBUG] Translating {total_segments} segments in {len(batches)} batches "
+            f"(token budget {self.batch_token_budget}, max {self.max_batch_segments} segments/batch)"
+        )
+
+        translation_segments = []
+        translated_count = 0
+
+        async with get_model_registry().async_lease(translation_service):
+            for batch_number, batch in enumerate(tqdm(batches, desc="Translating batches", disable=False), start=1):
+                # Run the blocking model call off the event loop
+                batch_results = await asyncio.to_thread(
+                    self._translate_segment_batch, translation_service, batch, source_lang, target_lang
+                )
+                translation_segments.extend(batch_results)
+                translated_count += len(batch)
+
+                # Map translation progress (0-100%) to overall range (65-95%)
+                if task_id and task_progress:
+                    progress = task_progress[task_id]
+                    translation_pct = translated_count / total_segments
+                    progress.progress = int(65 + (30 * translation_pct))
+                    progress.current_step = "Building translations..."
+                    progress.message = (
+                        f"Translated {translated_count}/{total_segments} segments (batch {batch_number}/{len(batches)})"
                     )
 
-                    translation_segments.append(translation_segment)
+        # Update progress one final time before returning
+        if task_id and task_progress:
+            task_progress[task_id].progress = 95
+            task_progress[task_id].current_step = "Building translations..."
+            task_progress[task_id].message = "Translation completed"
+
+        return translation_segments
+
+    @staticmethod
+    def _estimate_token_count(text: str) -> int:
+        """
+        Estimate the number of subword tokens for a text without loading a tokenizer
+
+        Args:
+            text: Source text
+
+        Returns:
+            Approximate token count (including end-of-sentence token)
+        """
+        return math.ceil(len(text.split()) * TOKENS_PER_WORD_ESTIMATE) + 1
+
+    def _plan_translation_batches(self, subtitle_segments: list[SRTSegment]) -> list[list[SRTSegment]]:
+        """
+        Group segments into batches bounded by token budget and segment count
+
+        Segment order is preserved. A single segment larger than the budget gets its own batch.
+
+        Args:
+            subtitle_segments: List of subtitle segments to translate
+
+        Returns:
+            List of segment batches
+        """
+        batches: list[list[SRTSegment]] = []
+        current_batch: list[SRTSegment] = []
+        current_tokens = 0
+
+        for segment in subtitle_segments:
+            segment_tokens = self._estimate_token_count(segment.text)
+            over_budget = current_tokens + segment_tokens > self.batch_token_budget
+            if current_batch and (over_budget or len(current_batch) >= self.max_batch_segments):
+                batches.append(current_batch)
+                current_batch = []
+                current_tokens = 0
+
+            current_batch.append(segment)
+            current_tokens += segment_tokens
+
+        if current_batch:
+            batches.append(current_batch)
+
+        return batches
+
+    def _translate_segment_batch(
+        self,
+        translation_service: ITranslationService,
+        batch: list[SRTSegment],
+        source_lang: str,
+        target_lang: str,
+    ) -> list[SRTSegment]:
+        """
+        Translate one batch of segments (blocking, runs in a worker thread)
+
+        Cached translations are served from the translation memory; only misses reach the model.
+        Falls back to per-segment translation when the batch call fails, so a single
+        bad segment only drops itself instead of the whole batch.
+
+        Args:
+            translation_service: Translation service for the language pair
+            batch: Segments to translate
+            source_lang: Source language code
+            target_lang: Target language code
 
-                    # Yield to event loop every batch to allow FastAPI to respond to requests
-                    if (i + 1) % batch_size == 0:
-                        await asyncio.sleep(0.01)  # 10ms yield to event loop
+        Returns:
+            Translated segments for this batch
+        """
+        model_name = getattr(translation_service, "model_name", type(translation_service).__name__)
+        translations: dict[str, str] = {}
+        if self.translation_cache:
+            translations = self.translation_cache.get_many(
+                model_name, source_lang, target_lang, (segment.text for segment in batch)
+            )
+
+        missing_texts = list(dict.fromkeys(segment.text for segment in batch if segment.text not in translations))
+
+        if missing_texts:
+            try:
+                results = translation_service.translate_batch(missing_texts, source_lang, target_lang, mode=self.mode)
+                if len(results) != len(missing_texts):
+                    raise ChunkTranslationError(f"Expected {len(missing_texts)} translations, got {len(results)}")
+                new_translations = {
+                    text: result.translated_text for text, result in zip(missing_texts, results, strict=True)
+                }
+            except Exception as e:
+                logger.warning(f"Batch translation failed ({len(missing_texts)} texts), retrying per segment: {e}")
+                new_translations = self._translate_texts_individually(
+                    translation_service, missing_texts, source_lang, target_lang
+                )
+
+            translations.update(new_translations)
+            if self.translation_cache:
+                self.translation_cache.put_many(model_name, source_lang, target_lang, new_translations)
+
+        return [
+            SRTSegment(
+                index=segment.index,
+                start_time=segment.start_time,
+                end_time=segment.end_time,
+                text=translations[segment.text],
+            )
+            for segment in batch
+            if segment.text in translations
+        ]
 
-                except Exception as e:
-                    logger.error(f"Translation failed for segment {segment.index}: {e}")
-                    continue
+    def _translate_texts_individually(
+        self,
+        translation_service: ITranslationService,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+    ) -> dict[str, str]:
+        """
+        Translate texts one at a time, skipping texts that fail
 
-            # Update progress one final time before returning
-            if task_id and task_progress_dict:
-                task_progress_dict[task_id].progress = 95
-                task_progress_dict[task_id].current_step = "Building translations..."
-                task_progress_dict[task_id].message = "Translation completed"
+        Args:
+            translation_service: Translation service for the language pair
+            texts: Source texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Dictionary mapping successfully translated source texts to translations
+        """
+        translations = {}
+
+        for text in texts:
+            try:
+                translation_result = translation_service.translate(text, source_lang, target_lang)
+            except Exception as e:
+                logger.error(f"Translation failed for segment text '{text[:50]}': {e}")
+                continue
 
-            return translation_segments
+            translations[text] = translation_result.translated_text
 
-        return await translate_with_progress(task_id, task_progress)
+        return translations
 
     def segments_overlap(
         self, seg1_start: float, seg1_end: float, seg2_start: float, seg2_end: float, threshold: float = 0.5
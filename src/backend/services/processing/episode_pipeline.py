@@ -0,0 +1,352 @@
+"""
+Episode Pipeline
+
+Processes consecutive chunks of one video as a staged producer/consumer pipeline, so FFmpeg
+extraction, Whisper transcription and filtering/translation of different chunks overlap instead
+of running strictly one after another per chunk.
+
+Pipeline Stages:
+    1. Extract: restore a cached transcript or decode the chunk audio (FFmpeg, I/O bound)
+    2. Transcribe: speech-to-text for extracted audio (Whisper, in a worker thread)
+    3. Finalize: vocabulary filtering, filtered subtitles and translation (database + MT)
+
+The first chunk is the one the user is watching and is translated in live mode; the chunks after
+it are pre-processed without anyone waiting and use the wider offline beam
+(LANGPLUG_TRANSLATION_OFFLINE_BEAM_SIZE).
+
+When audio is decoded in memory (LANGPLUG_EPISODE_AUDIO_SPLIT_ENABLED), the first chunk to
+transcribe is decoded on its own so transcription starts at once; the chunks after it are decoded
+a queue's worth at a time with one FFmpeg run per window, instead of paying FFmpeg startup and
+seeking once per chunk. A window is only decoded when extraction reaches it, so the queues still
+bound how much audio is held in memory.
+
+Stages are connected by bounded asyncio queues (LANGPLUG_EPISODE_PIPELINE_QUEUE_SIZE). A full
+queue blocks the upstream stage, so extraction never runs more than a few chunks ahead of
+transcription and temporary audio files cannot pile up. While chunk N is being translated,
+chunk N+1 is transcribed and chunk N+2 extracted.
+
+Usage Example:
+    ```python
+    chunks = EpisodePipeline.plan_chunks(0.0, 3600.0, user.chunk_duration_minutes, user.id)
+    pipeline = EpisodePipeline(ChunkProcessingService(db_session))
+    await pipeline.run("/videos/series/episode.mp4", chunks, user.id, task_progress)
+    # task_progress[chunk.task_id] tracks each chunk like a single /chunk request
+    ```
+
+Thread Safety:
+    No. Each pipeline run should have its own ChunkProcessingService with a dedicated db_session
+    (only the finalize stage touches the database, so the session is never used concurrently).
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from core.config import settings
+from services.translationservice.translation_scheduler import OFFLINE
+
+from .chunk_processor import ChunkProcessingService
+from .chunk_transcription_service import ChunkTranscriptionError
+from .chunk_translation_service import ChunkTranslationService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_DURATION_MINUTES = 20
+
+
+@dataclass
+class EpisodeChunk:
+    """One chunk of an episode moving through the pipeline"""
+
+    task_id: str
+    start_time: float
+    end_time: float
+    srt_file: str | None = None
+    audio_file: Any = None  # decoded samples or temporary WAV path until transcribed
+
+
+class EpisodePipeline:
+    """
+    Staged extract -> transcribe -> finalize pipeline over consecutive chunks of one video.
+
+    Attributes:
+        chunk_processor (ChunkProcessingService): Provides the per-chunk processing steps
+        offline_translation_service (ChunkTranslationService): Translates the chunks after the watched one
+        queue_size (int): Capacity of the queues between stages
+        stage_seconds (dict[str, float]): Busy time per stage of the last run
+    """
+
+    def __init__(
+        self,
+        chunk_processor: ChunkProcessingService,
+        queue_size: int | None = None,
+        offline_translation_service: ChunkTranslationService | None = None,
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            chunk_processor: Chunk processing service (with its own db_session)
+            queue_size: Capacity of the inter-stage queues (defaults to settings)
+            offline_translation_service: Translation for pre-processed chunks (defaults to offline mode)
+        """
+        self.chunk_processor = chunk_processor
+        self.offline_translation_service = offline_translation_service or ChunkTranslationService(mode=OFFLINE)
+        self.queue_size = max(1, queue_size or settings.episode_pipeline_queue_size)
+        self.stage_seconds: dict[str, float] = {}
+
+    @staticmethod
+    def plan_chunks(
+        start_time: float, end_time: float, chunk_duration_minutes: int | None, user_id: Any
+    ) -> list[EpisodeChunk]:
+        """
+        Split [start_time, end_time) into consecutive chunks of the user's preferred length
+
+        Args:
+            start_time: First chunk start in seconds
+            end_time: Last chunk end in seconds
+            chunk_duration_minutes: User.chunk_duration_minutes (None uses the default of 20)
+            user_id: User ID (part of the task IDs)
+
+        Returns:
+            Chunks in playback order, each with its own progress task ID
+        """
+        chunk_seconds = (chunk_duration_minutes or DEFAULT_CHUNK_DURATION_MINUTES) * 60
+        timestamp = datetime.now().timestamp()
+
+        chunks = []
+        chunk_start = start_time
+        while chunk_start < end_time:
+            chunk_end = min(chunk_start + chunk_seconds, end_time)
+            task_id = f"chunk_{user_id}_{int(chunk_start)}_{int(chunk_end)}_{timestamp}"
+            chunks.append(EpisodeChunk(task_id=task_id, start_time=chunk_start, end_time=chunk_end))
+            chunk_start = chunk_end
+        return chunks
+
+    async def run(
+        self,
+        video_path: str,
+        chunks: list[EpisodeChunk],
+        user_id: int,
+        task_progress: dict[str, Any],
+        session_token: str | None = None,
+        is_reprocessing: bool = False,
+    ) -> None:
+        """
+        Process all chunks through the pipeline
+
+        A failing chunk is marked as failed in task_progress and skipped by later stages;
+        the remaining chunks continue.
+
+        Args:
+            video_path: Path to video file
+            chunks: Chunks from plan_chunks()
+            user_id: User ID requesting processing
+            task_progress: Progress tracking dictionary (one entry per chunk task ID)
+            session_token: Optional session token for authentication
+            is_reprocessing: True if reprocessing after vocabulary game (generates postgame subtitles)
+        """
+        utilities = self.chunk_processor.utilities
+        video_file = utilities.resolve_video_path(video_path)
+        for chunk in chunks:
+            utilities.initialize_progress(
+                chunk.task_id, task_progress, video_file, chunk.start_time, chunk.end_time, user_id
+            )
+
+        try:
+            user = await utilities.get_authenticated_user(user_id, session_token)
+            language_preferences = utilities.load_user_language_preferences(user)
+        except Exception as e:
+            for chunk in chunks:
+                utilities.handle_error(chunk.task_id, task_progress, e)
+            raise
+
+        self.stage_seconds = {"extract": 0.0, "transcribe": 0.0, "finalize": 0.0}
+        extracted: asyncio.Queue[EpisodeChunk | None] = asyncio.Queue(maxsize=self.queue_size)
+        transcribed: asyncio.Queue[EpisodeChunk | None] = asyncio.Queue(maxsize=self.queue_size)
+
+        started = time.perf_counter()
+        async with asyncio.TaskGroup() as group:
+            group.create_task(self._extract_stage(chunks, video_file, language_preferences, task_progress, extracted))
+            group.create_task(
+                self._transcribe_stage(video_file, language_preferences, task_progress, extracted, transcribed)
+            )
+            group.create_task(
+                self._finalize_stage(
+                    chunks[0].task_id if chunks else None,
+                    video_file,
+                    user,
+                    language_preferences,
+                    task_progress,
+                    transcribed,
+                    is_reprocessing,
+                )
+            )
+        elapsed = time.perf_counter() - started
+
+        busy = sum(self.stage_seconds.values())
+        logger.info(
+            f"[EPISODE PIPELINE] {len(chunks)} chunks of {video_file.name} in {elapsed:.1f}s "
+            f"(stage busy time {busy:.1f}s: "
+            + ", ".join(f"{stage} {seconds:.1f}s" for stage, seconds in self.stage_seconds.items())
+            + ")"
+        )
+
+    def _chunk_srt_path(self, video_file: Path, chunk: EpisodeChunk) -> Path:
+        """Chunk-specific SRT path, so chunks in flight never overwrite each other's transcript"""
+        return video_file.parent / f"{video_file.stem}_{int(chunk.start_time)}-{int(chunk.end_time)}s.srt"
+
+    def _fail_chunk(self, chunk: EpisodeChunk, video_file: Path, task_progress: dict[str, Any], error: Exception):
+        logger.error(f"[EPISODE PIPELINE] Chunk {chunk.task_id} failed: {error}", exc_info=True)
+        if chunk.audio_file is not None:
+            self.chunk_processor.transcription_service.cleanup_temp_audio_file(chunk.audio_file, video_file)
+        self.chunk_processor.utilities.handle_error(chunk.task_id, task_progress, error)
+
+    def _audio_split_enabled(self) -> bool:
+        transcription_service = self.chunk_processor.transcription_service
+        return settings.episode_audio_split_enabled and transcription_service.audio_streaming_supported()
+
+    async def _split_window_audio(
+        self, window: list[EpisodeChunk], video_file: Path, language_preferences: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Decode the audio of the chunks in a window that need transcription with one FFmpeg run
+
+        Returns:
+            Chunk task ID -> samples; empty when fewer than two chunks need decoding or the run
+            fails (chunks are then decoded one by one)
+        """
+        transcription_service = self.chunk_processor.transcription_service
+        pending = [
+            chunk
+            for chunk in window
+            if not transcription_service.has_cached_transcript(
+                video_file, language_preferences, chunk.start_time, chunk.end_time
+            )
+        ]
+        if len(pending) < 2:
+            return {}
+
+        try:
+            buffers = await transcription_service.split_episode_audio(
+                video_file, [(chunk.start_time, chunk.end_time) for chunk in pending]
+            )
+        except ChunkTranscriptionError as e:
+            logger.warning(f"[EPISODE PIPELINE] One-pass audio split failed, decoding per chunk: {e}")
+            return {}
+
+        return {chunk.task_id: samples for chunk, samples in zip(pending, buffers, strict=True)}
+
+    async def _extract_stage(
+        self,
+        chunks: list[EpisodeChunk],
+        video_file: Path,
+        language_preferences: dict[str, Any],
+        task_progress: dict[str, Any],
+        output: asyncio.Queue,
+    ) -> None:
+        split_audio = self._audio_split_enabled()
+        window_size = max(2, self.queue_size)
+        first_decoded = False  # the first chunk to transcribe never waits for a window decode
+        windowed: set[str] = set()
+        window_audio: dict[str, Any] = {}
+
+        for position, chunk in enumerate(chunks):
+            started = time.perf_counter()
+            try:
+                if split_audio and first_decoded and chunk.task_id not in windowed:
+                    window = chunks[position : position + window_size]
+                    windowed.update(windowed_chunk.task_id for windowed_chunk in window)
+                    window_audio.update(await self._split_window_audio(window, video_file, language_preferences))
+
+                chunk.srt_file, chunk.audio_file = await self.chunk_processor.prepare_chunk_audio(
+                    chunk.task_id,
+                    task_progress,
+                    video_file,
+                    language_preferences,
+                    chunk.start_time,
+                    chunk.end_time,
+                    srt_output=self._chunk_srt_path(video_file, chunk),
+                    audio=window_audio.pop(chunk.task_id, None),
+                )
+                first_decoded = first_decoded or not chunk.srt_file
+            except Exception as e:
+                self._fail_chunk(chunk, video_file, task_progress, e)
+                continue
+            finally:
+                self.stage_seconds["extract"] += time.perf_counter() - started
+
+            await output.put(chunk)  # blocks while transcription is behind
+
+        await output.put(None)
+
+    async def _transcribe_stage(
+        self,
+        video_file: Path,
+        language_preferences: dict[str, Any],
+        task_progress: dict[str, Any],
+        source: asyncio.Queue,
+        output: asyncio.Queue,
+    ) -> None:
+        transcription_service = self.chunk_processor.transcription_service
+        while (chunk := await source.get()) is not None:
+            if not chunk.srt_file:
+                started = time.perf_counter()
+                try:
+                    chunk.srt_file = await transcription_service.transcribe_chunk(
+                        chunk.task_id,
+                        task_progress,
+                        video_file,
+                        chunk.audio_file,
+                        language_preferences,
+                        chunk.start_time,
+                        chunk.end_time,
+                        srt_output=self._chunk_srt_path(video_file, chunk),
+                    )
+                except Exception as e:
+                    self._fail_chunk(chunk, video_file, task_progress, e)
+                    continue
+                finally:
+                    self.stage_seconds["transcribe"] += time.perf_counter() - started
+
+                transcription_service.cleanup_temp_audio_file(chunk.audio_file, video_file)
+                chunk.audio_file = None
+
+            await output.put(chunk)
+
+        await output.put(None)
+
+    async def _finalize_stage(
+        self,
+        watched_task_id: str | None,
+        video_file: Path,
+        user,
+        language_preferences: dict[str, Any],
+        task_progress: dict[str, Any],
+        source: asyncio.Queue,
+        is_reprocessing: bool,
+    ) -> None:
+        while (chunk := await source.get()) is not None:
+            started = time.perf_counter()
+            try:
+                await self.chunk_processor.finalize_chunk(
+                    chunk.task_id,
+                    task_progress,
+                    video_file,
+                    chunk.srt_file,
+                    user,
+                    language_preferences,
+                    is_reprocessing,
+                    translation_service=None if chunk.task_id == watched_task_id else self.offline_translation_service,
+                )
+            except Exception as e:
+                self._fail_chunk(chunk, video_file, task_progress, e)
+            finally:
+                self.stage_seconds["finalize"] += time.perf_counter() - started
+
+
+__all__ = ["EpisodeChunk", "EpisodePipeline"]
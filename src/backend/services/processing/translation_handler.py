@@ -10,6 +10,7 @@ from typing import Any
 
 from api.models.processing import ProcessingStatus
 from services.translationservice.interface import ITranslationService
+from services.translationservice.translation_cache import TranslationCache, get_translation_cache
 from utils.srt_parser import SRTParser, SRTSegment
 
 logger = logging.getLogger(__name__)
@@ -18,8 +19,9 @@ logger = logging.getLogger(__name__)
 class TranslationHandler:
     """Handles translation operations for subtitle processing"""
 
-    def __init__(self, translation_service: ITranslationService):
+    def __init__(self, translation_service: ITranslationService, translation_cache: TranslationCache | None = None):
         self.translation_service = translation_service
+        self.translation_cache = translation_cache or get_translation_cache()
 
     async def translate_subtitles(
         self,
@@ -127,9 +129,17 @@ class TranslationHandler:
         target_language: str,
         user_id: str | None = None,
     ) -> list[SRTSegment]:
-        """Translate all subtitle segments"""
+        """Translate all subtitle segments, serving repeated lines from the translation cache"""
         translated_segments = []
         total_segments = len(segments)
+        model_name = getattr(self.translation_service, "model_name", type(self.translation_service).__name__)
+
+        cached: dict[str, str] = {}
+        if self.translation_cache:
+            cached = self.translation_cache.get_many(
+                model_name, source_language, target_language, (segment.text for segment in segments)
+            )
+        new_translations: dict[str, str] = {}
 
         for i, segment in enumerate(segments):
             # Update progress (10% to 90% range)
@@ -138,17 +148,22 @@ class TranslationHandler:
             task_progress[task_id].current_step = "Translating..."
             task_progress[task_id].message = f"Translating segment {i + 1}/{total_segments}"
 
-            # Translate the text
-            translated_text = await self.translation_service.translate(
-                segment.text,
-                source_language=source_language,
-                target_language=target_language,
-                context={
-                    "user_id": user_id,
-                    "segment_index": segment.index,
-                    "timestamp": f"{segment.start_time}-{segment.end_time}",
-                },
-            )
+            # Translate the text (cache hits skip the model)
+            translated_text = cached.get(segment.text)
+            if translated_text is None:
+                translated_text = new_translations.get(segment.text)
+            if translated_text is None:
+                translated_text = await self.translation_service.translate(
+                    segment.text,
+                    source_language=source_language,
+                    target_language=target_language,
+                    context={
+                        "user_id": user_id,
+                        "segment_index": segment.index,
+                        "timestamp": f"{segment.start_time}-{segment.end_time}",
+                    },
+                )
+                new_translations[segment.text] = translated_text
 
             # Create translated segment
             translated_segment = SRTSegment(
@@ -156,6 +171,9 @@ class TranslationHandler:
             )
             translated_segments.append(translated_segment)
 
+        if self.translation_cache:
+            self.translation_cache.put_many(model_name, source_language, target_language, new_translations)
+
         return translated_segments
 
     async def _save_translated_subtitles(
@@ -0,0 +1,566 @@
+"""
+ASR Worker Pool
+
+Runs transcription in dedicated worker processes instead of threads of the API process. Each worker
+loads the model once through TranscriptionServiceFactory and keeps it for its lifetime (model
+affinity: one pool per transcription service). A crash or OOM kill of a worker fails only the job it
+was running; the pool starts a replacement and the API keeps serving.
+
+Jobs are dispatched to idle workers over a pipe per worker. Workers can be pinned to disjoint CPU
+sets with a fixed number of inference threads, and are restarted gracefully after a number of jobs to
+cap memory growth of long-lived model processes. When more jobs are queued than the pool accepts,
+is_saturated() tells the API to reject new processing requests (503 + Retry-After) instead of
+piling up work.
+
+Usage Example:
+    ```python
+    pool = ASRWorkerPool("faster-whisper-turbo", workers=2, cpu_threads=4, max_jobs_per_worker=100)
+    pool.start()
+    result = pool.call("transcribe_arrays", [samples], "de")[0]
+    pool.get_stats()  # workers, busy, queued, completed, failed, restarts
+    pool.shutdown()
+    ```
+
+Thread Safety:
+    Yes. submit()/call() can be used from any thread; a supervisor thread owns the worker pipes.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import TYPE_CHECKING, Any
+
+from core.config import settings
+
+from .interface import ITranscriptionService, TranscriptionResult
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Seconds clients should wait before retrying when the pool is saturated
+RETRY_AFTER_SECONDS = 30
+
+# Workers that die this many times in a row before reporting ready are not restarted
+MAX_FAILED_STARTS = 3
+
+_SUPERVISOR_POLL_SECONDS = 1.0
+_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+
+class ASRWorkerError(RuntimeError):
+    """Raised when a job fails inside a worker or its worker process dies"""
+
+
+def create_worker_service(service_name: str, **kwargs) -> ITranscriptionService:
+    """Default worker service factory: the cached instance from TranscriptionServiceFactory"""
+    from .factory import TranscriptionServiceFactory
+
+    return TranscriptionServiceFactory.create_service(service_name, **kwargs)
+
+
+def _worker_main(
+    conn: Connection,
+    *,
+    factory: Callable[..., ITranscriptionService],
+    service_name: str,
+    service_kwargs: dict[str, Any],
+    cpu_set: set[int] | None,
+    cpu_threads: int,
+    max_jobs: int,
+) -> None:
+    """Worker process: load the model once, then run jobs until told to stop or max_jobs is reached"""
+    if cpu_set and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpu_set)
+    if cpu_threads:
+        os.environ["OMP_NUM_THREADS"] = str(cpu_threads)  # before torch/CTranslate2 are imported
+
+    service = factory(service_name, **service_kwargs)
+    service.initialize()
+    conn.send(("ready",))
+
+    for _ in itertools.count() if not max_jobs else range(max_jobs):
+        try:
+            message = conn.recv()
+        except EOFError:
+            break
+        if message is None:
+            break
+
+        job_id, method, args = message
+        try:
+            conn.send(("result", job_id, True, getattr(service, method)(*args)))
+        except Exception as e:
+            conn.send(("result", job_id, False, f"{type(e).__name__}: {e}"))
+
+    service.cleanup()
+
+
+def plan_cpu_sets(workers: int, cpu_threads: int) -> list[set[int] | None]:
+    """
+    Split the CPUs this process may run on into one disjoint set per worker
+
+    Args:
+        workers: Number of worker processes
+        cpu_threads: Inference threads per worker (0 = no pinning)
+
+    Returns:
+        One CPU set per worker, or None entries when pinning is off or the host has too few cores
+    """
+    if cpu_threads <= 0 or not hasattr(os, "sched_getaffinity"):
+        return [None] * workers
+
+    cores = sorted(os.sched_getaffinity(0))
+    if workers * cpu_threads > len(cores):
+        logger.warning(
+            f"[ASR POOL] {workers} workers x {cpu_threads} threads exceed {len(cores)} available cores, not pinning"
+        )
+        return [None] * workers
+    return [set(cores[i * cpu_threads : (i + 1) * cpu_threads]) for i in range(workers)]
+
+
+@dataclass
+class _WorkerSlot:
+    index: int
+    process: multiprocessing.process.BaseProcess
+    conn: Connection
+    ready: bool = False
+    job_id: int | None = None
+    jobs_done: int = 0
+    closed: bool = False
+
+
+class ASRWorkerPool:
+    """
+    Bounded pool of transcription worker processes for one transcription service.
+
+    Attributes:
+        service_name (str): Transcription service every worker loads
+        workers (int): Number of worker processes
+        cpu_threads (int): Inference threads per worker, each pinned to its own cores (0 = service default)
+        max_jobs_per_worker (int): Jobs after which a worker is restarted (0 = never)
+        max_queue_size (int): Queued jobs at which the pool reports saturation
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        *,
+        workers: int = 2,
+        cpu_threads: int = 0,
+        max_jobs_per_worker: int = 100,
+        max_queue_size: int = 16,
+        factory: Callable[..., ITranscriptionService] = create_worker_service,
+    ):
+        """
+        Initialize pool (workers are started by start())
+
+        Args:
+            service_name: Transcription service name for TranscriptionServiceFactory
+            workers: Number of worker processes
+            cpu_threads: Inference threads per worker (0 = service default, no pinning)
+            max_jobs_per_worker: Restart a worker after this many jobs (0 = never)
+            max_queue_size: Queue length at which is_saturated() turns True
+            factory: Picklable callable creating the service inside a worker
+        """
+        self.service_name = service_name
+        self.workers = max(1, workers)
+        self.cpu_threads = max(0, cpu_threads)
+        self.max_jobs_per_worker = max(0, max_jobs_per_worker)
+        self.max_queue_size = max(1, max_queue_size)
+        self._factory = factory
+        self._ctx = multiprocessing.get_context("spawn")  # no forked copies of the API process or CUDA state
+        self._cpu_sets = plan_cpu_sets(self.workers, self.cpu_threads)
+
+        self._lock = threading.Lock()
+        self._slots: list[_WorkerSlot] = []
+        self._pending: deque[tuple[int, str, tuple]] = deque()
+        self._futures: dict[int, Future] = {}
+        self._job_ids = itertools.count(1)
+        self._supervisor: threading.Thread | None = None
+        self._wakeup_reader, self._wakeup_writer = self._ctx.Pipe(duplex=False)
+        self._stopping = False
+        self._broken: str | None = None
+        self._failed_starts = 0
+        self._completed = 0
+        self._failed = 0
+        self._restarts = 0
+
+    @property
+    def started(self) -> bool:
+        return self._supervisor is not None and not self._stopping
+
+    def start(self) -> None:
+        """Start the worker processes and the supervisor thread"""
+        with self._lock:
+            if self._supervisor is not None:
+                return
+            self._stopping = False
+            self._slots = [self._spawn(index) for index in range(self.workers)]
+            self._supervisor = threading.Thread(target=self._supervise, name="asr-pool-supervisor", daemon=True)
+            self._supervisor.start()
+
+        pinning = f", pinned to {self._cpu_sets}" if self._cpu_sets[0] else ""
+        logger.info(f"[ASR POOL] Started {self.workers} workers for {self.service_name}{pinning}")
+
+    def _spawn(self, index: int) -> _WorkerSlot:
+        parent_conn, child_conn = self._ctx.Pipe()
+        service_kwargs = {"cpu_threads": self.cpu_threads} if self.cpu_threads and self._accepts_cpu_threads() else {}
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            kwargs={
+                "factory": self._factory,
+                "service_name": self.service_name,
+                "service_kwargs": service_kwargs,
+                "cpu_set": self._cpu_sets[index],
+                "cpu_threads": self.cpu_threads,
+                "max_jobs": self.max_jobs_per_worker,
+            },
+            name=f"asr-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _WorkerSlot(index, process, parent_conn)
+
+    def _accepts_cpu_threads(self) -> bool:
+        return self.service_name.lower().startswith("faster-whisper")
+
+    def submit(self, method: str, *args: Any) -> Future:
+        """
+        Queue a call of an ITranscriptionService method on the next idle worker
+
+        Args:
+            method: Method name, e.g. 'transcribe' or 'transcribe_arrays'
+            *args: Picklable arguments (paths, NumPy arrays, language)
+
+        Returns:
+            Future resolving to the method's return value
+
+        Raises:
+            ASRWorkerError: If the pool was shut down or its workers cannot start
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._broken or self._stopping:
+                raise ASRWorkerError(self._broken or "ASR worker pool is shut down")
+            job_id = next(self._job_ids)
+            self._futures[job_id] = future
+            self._pending.append((job_id, method, args))
+        self._wake()
+        return future
+
+    def call(self, method: str, *args: Any) -> Any:
+        """Blocking submit(): run a method on a worker and return its result"""
+        if not self.started:
+            self.start()
+        return self.submit(method, *args).result()
+
+    def is_saturated(self) -> bool:
+        """True when the queue is full and new processing requests should be rejected"""
+        with self._lock:
+            return len(self._pending) >= self.max_queue_size
+
+    def _wake(self) -> None:
+        with self._lock:
+            if not self._stopping:
+                self._wakeup_writer.send(None)
+
+    def _supervise(self) -> None:
+        while True:
+            with self._lock:
+                if self._stopping:
+                    return
+                self._dispatch()
+                waitables = {slot.conn: slot for slot in self._slots if not slot.closed}
+                sentinels = {slot.process.sentinel: slot for slot in self._slots}
+
+            ready = wait([self._wakeup_reader, *waitables, *sentinels], timeout=_SUPERVISOR_POLL_SECONDS)
+
+            with self._lock:
+                if self._stopping:
+                    return
+                for obj in ready:
+                    if obj is self._wakeup_reader:
+                        while self._wakeup_reader.poll():
+                            self._wakeup_reader.recv()
+                    elif obj in waitables:
+                        self._receive(waitables[obj])
+                for slot in list(self._slots):
+                    if not slot.process.is_alive():
+                        self._replace(slot)
+
+    def _dispatch(self) -> None:
+        """Hand queued jobs to idle workers (caller holds the lock)"""
+        for slot in self._slots:
+            if not self._pending:
+                return
+            if slot.ready and slot.job_id is None and not slot.closed and not self._retiring(slot):
+                job_id, method, args = self._pending.popleft()
+                try:
+                    slot.conn.send((job_id, method, args))
+                except (OSError, ValueError):
+                    self._pending.appendleft((job_id, method, args))
+                    slot.closed = True
+                    continue
+                slot.job_id = job_id
+
+    def _retiring(self, slot: _WorkerSlot) -> bool:
+        """Worker has run its last job and is about to exit for a restart"""
+        return bool(self.max_jobs_per_worker) and slot.jobs_done >= self.max_jobs_per_worker
+
+    def _receive(self, slot: _WorkerSlot) -> None:
+        """Handle a message from a worker (caller holds the lock)"""
+        try:
+            message = slot.conn.recv()
+        except (EOFError, OSError):
+            slot.closed = True  # worker is exiting, handled once its sentinel fires
+            return
+
+        if message[0] == "ready":
+            slot.ready = True
+            self._failed_starts = 0
+            return
+
+        _, job_id, ok, payload = message
+        slot.job_id = None
+        slot.jobs_done += 1
+        future = self._futures.pop(job_id, None)
+        if ok:
+            self._completed += 1
+            if future:
+                future.set_result(payload)
+        else:
+            self._failed += 1
+            if future:
+                future.set_exception(ASRWorkerError(payload))
+
+    def _replace(self, slot: _WorkerSlot) -> None:
+        """Fail the job of a dead worker and start a new one in its place (caller holds the lock)"""
+        slot.process.join()
+        exit_code = slot.process.exitcode
+        slot.conn.close()
+
+        if slot.job_id is not None:
+            self._failed += 1
+            future = self._futures.pop(slot.job_id, None)
+            if future:
+                future.set_exception(ASRWorkerError(f"ASR worker {slot.index} died (exit code {exit_code})"))
+
+        if self._retiring(slot):
+            logger.info(f"[ASR POOL] Restarting worker {slot.index} after {slot.jobs_done} jobs")
+        elif not slot.ready:
+            self._failed_starts += 1
+            logger.error(f"[ASR POOL] Worker {slot.index} failed to start (exit code {exit_code})")
+        else:
+            logger.error(f"[ASR POOL] Worker {slot.index} died (exit code {exit_code}), restarting")
+
+        self._slots.remove(slot)
+        if self._failed_starts >= MAX_FAILED_STARTS:
+            self._mark_broken(f"ASR workers for {self.service_name} failed to start {self._failed_starts} times")
+            return
+
+        self._restarts += 1
+        self._slots.insert(slot.index, self._spawn(slot.index))
+
+    def _mark_broken(self, reason: str) -> None:
+        self._broken = reason
+        logger.error(f"[ASR POOL] {reason}, failing queued jobs")
+        while self._pending:
+            job_id, _, _ = self._pending.popleft()
+            future = self._futures.pop(job_id, None)
+            if future:
+                future.set_exception(ASRWorkerError(reason))
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Dictionary with worker, queue and job counters
+        """
+        with self._lock:
+            return {
+                "service": self.service_name,
+                "workers": len(self._slots),
+                "ready": sum(slot.ready for slot in self._slots),
+                "busy": sum(slot.job_id is not None for slot in self._slots),
+                "queued": len(self._pending),
+                "max_queue_size": self.max_queue_size,
+                "completed": self._completed,
+                "failed": self._failed,
+                "restarts": self._restarts,
+                "broken": self._broken,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the workers, failing queued and running jobs"""
+        with self._lock:
+            if self._stopping or self._supervisor is None:
+                return
+            self._stopping = True
+            supervisor = self._supervisor
+            slots, self._slots = self._slots, []
+            for future in self._futures.values():
+                future.set_exception(ASRWorkerError("ASR worker pool is shut down"))
+            self._futures.clear()
+            self._pending.clear()
+            self._wakeup_writer.send(None)
+
+        supervisor.join(timeout=_SUPERVISOR_POLL_SECONDS * 2)
+        for slot in slots:
+            try:
+                slot.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for slot in slots:
+            slot.process.join(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+            if slot.process.is_alive():
+                slot.process.terminate()
+                slot.process.join()
+            slot.conn.close()
+        logger.info(f"[ASR POOL] Stopped workers for {self.service_name}")
+
+
+class PooledTranscriptionService(ITranscriptionService):
+    """
+    ITranscriptionService that runs every transcription on an ASRWorkerPool.
+
+    Cheap methods (languages, capabilities, audio extraction) use an unloaded local instance
+    of the same service; the model itself is only loaded inside the workers.
+
+    Pooled transcription does not stream: a job's result crosses the worker pipe in one piece,
+    so transcribe_stream() yields the segments only once the whole clip is decoded and chunks
+    take the batched path even when the engine itself decodes incrementally.
+    """
+
+    def __init__(self, pool: ASRWorkerPool, local_service: ITranscriptionService):
+        self.pool = pool
+        self._local = local_service
+
+    def initialize(self) -> None:
+        self.pool.start()
+
+    def cleanup(self) -> None:
+        self.pool.shutdown()
+
+    @property
+    def service_name(self) -> str:
+        return f"{self._local.service_name} ({self.pool.workers} worker processes)"
+
+    @property
+    def is_initialized(self) -> bool:
+        return self.pool.started
+
+    @property
+    def model_info(self) -> dict[str, Any]:
+        return {**self._local.model_info, "worker_processes": self.pool.workers}
+
+    @property
+    def max_parallel_requests(self) -> int:
+        return self.pool.workers
+
+    def transcribe(self, audio_path: "str | np.ndarray", language: str | None = None) -> TranscriptionResult:
+        return self.pool.call("transcribe", audio_path, language)
+
+    def transcribe_with_timestamps(self, audio_path: str, language: str | None = None) -> TranscriptionResult:
+        return self.pool.call("transcribe_with_timestamps", audio_path, language)
+
+    def transcribe_batch(self, audio_paths: list[str], language: str | None = None) -> list[TranscriptionResult]:
+        return self.pool.call("transcribe_batch", audio_paths, language)
+
+    def transcribe_arrays(self, audios: list["np.ndarray"], language: str | None = None) -> list[TranscriptionResult]:
+        return self.pool.call("transcribe_arrays", audios, language)
+
+    def supports_streaming(self) -> bool:
+        return False
+
+    def supports_video(self) -> bool:
+        return self._local.supports_video()
+
+    def supports_array_input(self) -> bool:
+        return self._local.supports_array_input()
+
+    def extract_audio_from_video(self, video_path: str, output_path: str | None = None) -> str:
+        return self._local.extract_audio_from_video(video_path, output_path)
+
+    def get_supported_languages(self) -> list[str]:
+        return self._local.get_supported_languages()
+
+
+_pooled_services: dict[str, PooledTranscriptionService] = {}
+_pooled_services_lock = threading.Lock()
+
+
+def get_pooled_transcription_service(service_name: str) -> PooledTranscriptionService:
+    """
+    Get the process-pool backed transcription service for a model, starting its workers on first use
+
+    Args:
+        service_name: Transcription service name (LANGPLUG_TRANSCRIPTION_SERVICE)
+
+    Returns:
+        Shared PooledTranscriptionService for this model
+    """
+    with _pooled_services_lock:
+        service = _pooled_services.get(service_name)
+        if service is None:
+            pool = ASRWorkerPool(
+                service_name,
+                workers=settings.asr_worker_processes,
+                cpu_threads=settings.asr_worker_cpu_threads,
+                max_jobs_per_worker=settings.asr_worker_max_jobs,
+                max_queue_size=settings.asr_worker_max_queue,
+            )
+            local_service = create_worker_service(service_name)
+            service = PooledTranscriptionService(pool, local_service)
+            service.initialize()
+            if settings.subtitle_streaming_enabled and local_service.supports_streaming():
+                logger.info(f"[ASR POOL] {service_name} runs in worker processes, subtitles are not streamed")
+            _pooled_services[service_name] = service
+    return service
+
+
+def asr_pool_saturated() -> bool:
+    """True if any ASR worker pool has a full queue (new transcription work should be rejected)"""
+    with _pooled_services_lock:
+        services = list(_pooled_services.values())
+    return any(service.pool.is_saturated() for service in services)
+
+
+def get_asr_worker_pool_stats() -> dict[str, Any]:
+    """Get statistics of all ASR worker pools, keyed by service name"""
+    with _pooled_services_lock:
+        services = dict(_pooled_services)
+    return {name: service.pool.get_stats() for name, service in services.items()}
+
+
+def shutdown_asr_worker_pools() -> None:
+    """Stop all ASR worker processes"""
+    with _pooled_services_lock:
+        services = list(_pooled_services.values())
+        _pooled_services.clear()
+    for service in services:
+        service.cleanup()
+
+
+__all__ = [
+    "RETRY_AFTER_SECONDS",
+    "ASRWorkerError",
+    "ASRWorkerPool",
+    "PooledTranscriptionService",
+    "asr_pool_saturated",
+    "get_asr_worker_pool_stats",
+    "get_pooled_transcription_service",
+    "plan_cpu_sets",
+    "shutdown_asr_worker_pools",
+]
@@ -0,0 +1,185 @@
+"""
+Audio Track Cache
+
+Persistent store of whole-video audio tracks, decoded once to 16 kHz mono 16-bit PCM, so chunk
+extraction becomes a memory-mapped slice of a file instead of a new FFmpeg decode of the MP4.
+The cached track is shared by all chunks and all users of the same video.
+
+Entries are keyed on video file identity (resolved path, size, mtime); replacing the video file
+invalidates its track. Tracks are stored as headerless s16le files under settings.get_data_path()
+(about 1.8 MiB per minute of audio). The store is bounded by total size and evicts the least
+recently used tracks first.
+
+Usage Example:
+    ```python
+    cache = get_audio_track_cache()
+    if cache:
+        key = cache.make_key(Path("/videos/s01e01.mp4"))
+        async with cache.fill_lock(key):
+            if not cache.contains(key):
+                decode_track(video, cache.temp_path(key))  # FFmpeg: -f s16le -ar 16000 -ac 1
+                cache.commit(key, cache.temp_path(key))
+        samples = cache.read_slice(key, 1200.0, 2400.0)  # float32, or None if not cached
+    ```
+
+Thread Safety:
+    Yes. Tracks are written to a temporary file and moved into place atomically; readers map
+    the completed file read-only. fill_lock() serializes decodes of the same video on the event
+    loop and is dropped once no request waits for it.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from core.config import settings
+from services.disk_cache import FileCache, ProcessCache, video_key
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+class AudioTrackCache(FileCache):
+    """
+    Disk-backed, size-bounded LRU store of decoded audio tracks.
+
+    Attributes:
+        cache_dir (Path): Directory holding one .pcm file per cached video
+        max_bytes (int): Maximum total size of cached tracks before LRU eviction
+    """
+
+    suffix = ".pcm"
+    log_name = "AUDIO TRACK CACHE"
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 2048 * 1024 * 1024):
+        """
+        Open (or create) the audio track cache
+
+        Args:
+            cache_dir: Directory for cached tracks
+            max_bytes: Maximum total size of cached tracks in bytes
+        """
+        super().__init__(cache_dir)
+        self.max_bytes = max_bytes
+        self._fill_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+    @staticmethod
+    def make_key(video_file: Path) -> str:
+        """
+        Build the cache key for a video's audio track
+
+        Args:
+            video_file: Source video file (must exist)
+
+        Returns:
+            Hex digest identifying the track
+
+        Raises:
+            OSError: If the video file cannot be stat'ed
+        """
+        return video_key(video_file, str(SAMPLE_RATE))
+
+    def temp_path(self, key: str) -> Path:
+        """Path to decode a track into before commit()"""
+        entry = self._entry_path(key)
+        return entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    @asynccontextmanager
+    async def fill_lock(self, key: str) -> AsyncIterator[None]:
+        """Hold while a track is decoded, so concurrent chunk requests decode a video only once"""
+        lock, holders = self._fill_locks.get(key, (asyncio.Lock(), 0))
+        self._fill_locks[key] = (lock, holders + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, holders = self._fill_locks[key]
+            if holders == 1:
+                del self._fill_locks[key]  # last request for this video is done
+            else:
+                self._fill_locks[key] = (lock, holders - 1)
+
+    def commit(self, key: str, decoded_file: Path) -> None:
+        """
+        Move a fully decoded track into the cache and evict least recently used tracks if over capacity
+
+        Args:
+            key: Key from make_key()
+            decoded_file: Headerless 16 kHz mono s16le file (from temp_path())
+        """
+        decoded_file.replace(self._entry_path(key))
+
+        with self._lock:
+            self._evict_if_needed(keep=key)
+
+    def read_slice(self, key: str, start_time: float, end_time: float) -> "np.ndarray | None":
+        """
+        Read [start_time, end_time) of a cached track through a read-only memory map
+
+        Only the pages of the requested window are read from disk.
+
+        Args:
+            key: Key from make_key()
+            start_time: Window start in seconds
+            end_time: Window end in seconds
+
+        Returns:
+            Float32 samples in [-1, 1] (empty if the window is past the end of the track),
+            or None on a miss
+        """
+        import numpy as np
+
+        entry = self._entry_path(key)
+        try:
+            track = np.memmap(entry, dtype=np.int16, mode="r")
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except ValueError:
+            return np.zeros(0, dtype=np.float32)  # zero-length track cannot be mapped
+
+        first = max(0, round(start_time * SAMPLE_RATE))
+        last = min(len(track), round(end_time * SAMPLE_RATE))
+        samples = track[first:last].astype(np.float32) / 32768.0 if last > first else np.zeros(0, dtype=np.float32)
+        del track
+
+        self._count(hit=True)
+        return samples
+
+    def _over_capacity(self, entries: int, size_bytes: int) -> bool:
+        return size_bytes > self.max_bytes
+
+    def _capacity_stats(self, sizes: list[int]) -> dict[str, Any]:
+        return {"size_bytes": sum(sizes), "max_bytes": self.max_bytes}
+
+
+_audio_track_cache: ProcessCache[AudioTrackCache] = ProcessCache(
+    "AUDIO TRACK CACHE",
+    lambda: settings.audio_track_cache_enabled,
+    lambda: AudioTrackCache(
+        settings.get_data_path() / "audio_cache", max_bytes=settings.audio_track_cache_max_mb * 1024 * 1024
+    ),
+)
+
+
+def get_audio_track_cache() -> AudioTrackCache | None:
+    """
+    Get the process-wide audio track cache
+
+    Returns:
+        Shared AudioTrackCache, or None when disabled (LANGPLUG_AUDIO_TRACK_CACHE_ENABLED=false)
+    """
+    return _audio_track_cache.get()
+
+
+__all__ = ["AudioTrackCache", "get_audio_track_cache"]
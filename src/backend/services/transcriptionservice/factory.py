@@ -139,12 +139,13 @@ class TranscriptionServiceFactory:
         # Force faster-whisper-tiny in test/debug environment for speed
         if os.environ.get("TESTING") == "1" or os.environ.get("DEBUG") == "1":
             import logging
+
             logger = logging.getLogger(__name__)
-            
+
             if service_name != "faster-whisper-tiny":
                 logger.info(f"[TEST/DEBUG MODE] Overriding '{service_name}' with 'faster-whisper-tiny'")
             service_name = "faster-whisper-tiny"
-            
+
             # Ensure model_size matches
             if "model_size" in kwargs:
                 kwargs["model_size"] = "tiny"
@@ -180,8 +181,11 @@ class TranscriptionServiceFactory:
         # Create new instance
         instance = service_class(**config)
 
-        # Cache the instance
+        # Cache the instance; its model is loaded on first use and unloaded by the registry under memory pressure
         cls._instances[cache_key] = instance
+        from services.model_registry import get_model_registry
+
+        get_model_registry().register(cache_key, instance, kind="asr")
 
         return instance
 
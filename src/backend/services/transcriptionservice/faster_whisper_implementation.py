@@ -8,18 +8,31 @@ See: https://github.com/SYSTRAN/faster-whisper
 
 import logging
 import os
+from bisect import bisect_right
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .interface import ITranscriptionService, TranscriptionResult, TranscriptionSegment
+from .word_timings import word_timings
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_RATE = 16000
+DEFAULT_CPU_THREADS = 4
+
+# Real-time factors measured in this process, by (model, compute type, threads, workers); registry
+# reloads and new engine instances reuse them instead of transcribing the calibration clip again
+_calibrated_real_time_factors: dict[tuple[str, str, int, int], float] = {}
+
 
 class FasterWhisperTranscriptionService(ITranscriptionService):
     """
     Faster-Whisper implementation using CTranslate2.
-    
+
     Benefits over standard Whisper:
     - Up to 4x faster transcription
     - Lower memory usage
@@ -35,7 +48,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         # Standard faster-whisper models (auto-downloaded)
         "tiny",
         "tiny.en",
-        "base", 
+        "base",
         "base.en",
         "small",
         "small.en",
@@ -56,7 +69,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
     COMPUTE_TYPES = [
         "float32",
         "float16",  # GPU only, fastest
-        "int8",     # CPU/GPU, good balance
+        "int8",  # CPU/GPU, good balance
         "int8_float16",  # GPU only, best for large models
     ]
 
@@ -67,7 +80,8 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         compute_type: str | None = None,
         download_root: str | None = None,
         num_workers: int = 1,
-        cpu_threads: int = 4,
+        cpu_threads: int | None = None,
+        word_timestamps: bool | None = None,
     ):
         """
         Initialize Faster-Whisper transcription service.
@@ -78,20 +92,27 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             compute_type: Quantization type ('float16', 'int8', etc.)
             download_root: Directory to download model to
             num_workers: Number of workers for parallel processing
-            cpu_threads: Number of CPU threads to use
+            cpu_threads: Number of CPU threads to use (None = sized by the CPU profile on CPU, else 4)
+            word_timestamps: Align per-word timestamps while decoding (None = from settings)
         """
         # Map turbo alias
         if model_size == "turbo":
             model_size = "large-v3-turbo"
-            
+
         self.model_size = model_size
         self.device = device or "auto"
         self.download_root = download_root
         self.num_workers = num_workers
         self.cpu_threads = cpu_threads
+        if word_timestamps is None:
+            from core.config import settings
+
+            word_timestamps = settings.transcription_word_timestamps
+        self.word_timestamps = word_timestamps
         self._model = None
         self._batched_model = None
-        
+        self.real_time_factor: float | None = None
+
         # Auto-select compute type based on device
         if compute_type:
             self.compute_type = compute_type
@@ -106,30 +127,32 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             try:
                 from faster_whisper import WhisperModel
             except ImportError as e:
-                raise ImportError(
-                    "faster-whisper is not installed. Install it with: "
-                    "pip install faster-whisper"
-                ) from e
+                raise ImportError("faster-whisper is not installed. Install it with: pip install faster-whisper") from e
 
             from core.gpu_utils import check_cuda_availability
 
             # Check CUDA availability
             cuda_available = check_cuda_availability("Faster-Whisper")
-            
+
             # Determine device
             if self.device == "auto":
                 device = "cuda" if cuda_available else "cpu"
             else:
                 device = self.device
-                
+
             # Adjust compute type for CPU
             if device == "cpu" and self.compute_type in ("float16", "int8_float16"):
                 logger.warning(
-                    f"[FASTER-WHISPER] Compute type '{self.compute_type}' not supported on CPU, "
-                    "falling back to 'int8'"
+                    f"[FASTER-WHISPER] Compute type '{self.compute_type}' not supported on CPU, falling back to 'int8'"
                 )
                 self.compute_type = "int8"
 
+            if self.cpu_threads is None:
+                from core.cpu_profile import cpu_profile_enabled, get_cpu_thread_plan
+
+                use_plan = device == "cpu" and cpu_profile_enabled()
+                self.cpu_threads = get_cpu_thread_plan().asr_threads if use_plan else DEFAULT_CPU_THREADS
+
             logger.info(f"[FASTER-WHISPER] Loading model '{self.model_size}' on {device}")
             logger.info(f"[FASTER-WHISPER] Compute type: {self.compute_type}")
             logger.info(f"[FASTER-WHISPER] CPU threads: {self.cpu_threads}")
@@ -148,54 +171,61 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
                 logger.error(f"[FASTER-WHISPER] Failed to load model: {e}")
                 raise
 
-    def transcribe(self, audio_path: str, language: str | None = None) -> TranscriptionResult:
+            if device == "cpu":
+                self._calibrate()
+
+    def _calibrate(self) -> None:
+        """Measure the real-time factor of the loaded model on the synthetic calibration clip, once per process"""
+        from core.config import settings
+        from core.cpu_profile import measure_real_time_factor
+
+        if not settings.cpu_profile_calibrate:
+            return
+
+        key = (self.model_size, self.compute_type, self.cpu_threads, self.num_workers)
+        if key in _calibrated_real_time_factors:
+            self.real_time_factor = _calibrated_real_time_factors[key]
+            return
+
+        def run(clip: "np.ndarray") -> None:
+            segments, _ = self._model.transcribe(clip, language="en", beam_size=1, vad_filter=False)
+            for _ in segments:  # segments are decoded lazily
+                pass
+
+        try:
+            self.real_time_factor = measure_real_time_factor(run)
+        except Exception as e:
+            logger.warning(f"[FASTER-WHISPER] CPU calibration failed: {e}")
+            return
+        _calibrated_real_time_factors[key] = self.real_time_factor
+        logger.info(
+            f"[FASTER-WHISPER] CPU calibration: {self.compute_type}, {self.cpu_threads} threads, "
+            f"{self.num_workers} workers, real-time factor {self.real_time_factor:.2f}"
+        )
+
+    def transcribe(self, audio_path: "str | np.ndarray", language: str | None = None) -> TranscriptionResult:
         """
         Transcribe an audio file using Faster-Whisper.
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or 16 kHz mono float32 samples decoded in memory
             language: Optional language hint (e.g., 'en', 'de')
 
         Returns:
             TranscriptionResult with transcription
         """
-        self.initialize()
-
-        logger.info(f"[FASTER-WHISPER] Transcribing: {audio_path}")
-        
-        # Transcribe with VAD filter for better results
-        segments_generator, info = self._model.transcribe(
-            audio_path,
-            language=language,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-                speech_pad_ms=200,
-            ),
-        )
+        segments_generator, info = self._start_transcription(audio_path, language)
 
         # Collect segments (this triggers the actual transcription)
         segments = []
         full_text_parts = []
-        
+
         for seg in segments_generator:
-            segments.append(
-                TranscriptionSegment(
-                    start_time=seg.start,
-                    end_time=seg.end,
-                    text=seg.text.strip(),
-                    confidence=seg.avg_logprob if hasattr(seg, 'avg_logprob') else None,
-                    metadata={
-                        "id": seg.id if hasattr(seg, 'id') else None,
-                        "no_speech_prob": seg.no_speech_prob if hasattr(seg, 'no_speech_prob') else None,
-                    },
-                )
-            )
+            segments.append(self._to_segment(seg))
             full_text_parts.append(seg.text)
 
         full_text = "".join(full_text_parts).strip()
-        
+
         logger.info(
             f"[FASTER-WHISPER] Transcription complete: {len(segments)} segments, "
             f"{len(full_text)} chars, language: {info.language}"
@@ -205,7 +235,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             full_text=full_text,
             segments=segments,
             language=info.language,
-            duration=info.duration if hasattr(info, 'duration') else (segments[-1].end_time if segments else 0),
+            duration=info.duration if hasattr(info, "duration") else (segments[-1].end_time if segments else 0),
             metadata={
                 "model": self.model_size,
                 "compute_type": self.compute_type,
@@ -213,9 +243,62 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             },
         )
 
+    def transcribe_stream(
+        self, audio_path: "str | np.ndarray", language: str | None = None
+    ) -> Iterator[TranscriptionSegment]:
+        """
+        Transcribe and yield each segment as soon as the decoder produces it
+
+        Args:
+            audio_path: Path to audio file, or 16 kHz mono float32 samples decoded in memory
+            language: Optional language hint (e.g., 'en', 'de')
+
+        Yields:
+            TranscriptionSegment in timeline order
+        """
+        segments_generator, _ = self._start_transcription(audio_path, language)
+        for seg in segments_generator:
+            yield self._to_segment(seg)
+
+    def _start_transcription(self, audio_path: "str | np.ndarray", language: str | None) -> tuple[Iterator, Any]:
+        """Start decoding; segments are produced lazily by the returned generator"""
+        self.initialize()
+
+        if isinstance(audio_path, str | Path):
+            logger.info(f"[FASTER-WHISPER] Transcribing: {audio_path}")
+        else:
+            logger.info(f"[FASTER-WHISPER] Transcribing in-memory audio: {len(audio_path) / SAMPLE_RATE:.1f}s")
+
+        # Transcribe with VAD filter for better results
+        return self._model.transcribe(
+            audio_path,
+            language=language,
+            beam_size=5,
+            word_timestamps=self.word_timestamps,
+            vad_filter=True,
+            vad_parameters=dict(
+                min_silence_duration_ms=500,
+                speech_pad_ms=200,
+            ),
+        )
+
+    @staticmethod
+    def _to_segment(seg: Any) -> TranscriptionSegment:
+        return TranscriptionSegment(
+            start_time=seg.start,
+            end_time=seg.end,
+            text=seg.text.strip(),
+            confidence=seg.avg_logprob if hasattr(seg, "avg_logprob") else None,
+            metadata={
+                "id": seg.id if hasattr(seg, "id") else None,
+                "no_speech_prob": seg.no_speech_prob if hasattr(seg, "no_speech_prob") else None,
+            },
+            words=word_timings(seg.words) if getattr(seg, "words", None) else None,
+        )
+
     def transcribe_batched(
-        self, 
-        audio_path: str, 
+        self,
+        audio_path: str,
         language: str | None = None,
         batch_size: int = 16,
     ) -> TranscriptionResult:
@@ -253,14 +336,14 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         # Collect segments
         segments = []
         full_text_parts = []
-        
+
         for seg in segments_generator:
             segments.append(
                 TranscriptionSegment(
                     start_time=seg.start,
                     end_time=seg.end,
                     text=seg.text.strip(),
-                    metadata={"id": seg.id if hasattr(seg, 'id') else None},
+                    metadata={"id": seg.id if hasattr(seg, "id") else None},
                 )
             )
             full_text_parts.append(seg.text)
@@ -284,35 +367,237 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         return self.transcribe(audio_path, language)
 
     def transcribe_batch(self, audio_paths: list[str], language: str | None = None) -> list[TranscriptionResult]:
-        """Transcribe multiple audio files"""
-        results = []
-        for audio_path in audio_paths:
-            result = self.transcribe(audio_path, language)
-            results.append(result)
-        return results
+        """Transcribe multiple audio files with one batched inference pass"""
+        from faster_whisper import decode_audio
+
+        audios = [decode_audio(audio_path, sampling_rate=SAMPLE_RATE) for audio_path in audio_paths]
+        return self.transcribe_arrays(audios, language)
+
+    def transcribe_arrays(
+        self, audios: list["np.ndarray"], language: str | None = None, batch_size: int | None = None
+    ) -> list[TranscriptionResult]:
+        """
+        Transcribe several in-memory clips with one BatchedInferencePipeline pass.
+
+        Each clip is split into <= 30 s speech windows by VAD (same settings as transcribe()).
+        The windows of all clips are decoded together in batches with timestamp tokens, so a
+        window yields sentence-level segments like transcribe() instead of one 30 s segment,
+        and the resulting segments are mapped back to their clip.
+
+        Args:
+            audios: 16 kHz mono float32 sample arrays
+            language: Language hint shared by all clips
+            batch_size: Speech windows per inference batch (defaults to settings)
+
+        Returns:
+            One TranscriptionResult per clip, in order
+        """
+        if len(audios) < 2:
+            return [self.transcribe(audio, language) for audio in audios]
+
+        self.initialize()
+
+        try:
+            import numpy as np
+            from faster_whisper import BatchedInferencePipeline
+            from faster_whisper.vad import VadOptions, get_speech_timestamps, merge_segments
+        except ImportError:
+            logger.warning("[FASTER-WHISPER] BatchedInferencePipeline not available, transcribing clips one by one")
+            return [self.transcribe(audio, language) for audio in audios]
+
+        if batch_size is None:
+            from core.config import settings
+
+            batch_size = settings.transcription_inference_batch_size
+
+        if self._batched_model is None:
+            self._batched_model = BatchedInferencePipeline(model=self._model)
+
+        vad_options = VadOptions(
+            min_silence_duration_ms=500,
+            speech_pad_ms=200,
+            max_speech_duration_s=self._model.feature_extractor.chunk_length,
+        )
+
+        # Concatenate the clips; VAD windows never cross a clip boundary
+        offsets = []
+        clip_timestamps = []
+        position = 0
+        for audio in audios:
+            offsets.append(position)
+            for window in merge_segments(get_speech_timestamps(audio, vad_options), vad_options):
+                start, end = position + window["start"], position + window["end"]
+                clip_timestamps.append({"start": start / SAMPLE_RATE, "end": end / SAMPLE_RATE})
+            position += len(audio)
+
+        clip_segments: list[list[TranscriptionSegment]] = [[] for _ in audios]
+        detected_language = language
+        if clip_timestamps:
+            segments_generator, info = self._batched_model.transcribe(
+                np.concatenate(audios),
+                language=language,
+                batch_size=batch_size,
+                word_timestamps=self.word_timestamps,
+                vad_filter=False,
+                clip_timestamps=clip_timestamps,
+                without_timestamps=False,
+            )
+            detected_language = info.language
+
+            for seg in segments_generator:
+                index = bisect_right(offsets, round(seg.start * SAMPLE_RATE)) - 1
+                offset = offsets[index] / SAMPLE_RATE
+                words = word_timings(seg.words) if getattr(seg, "words", None) else None
+                if words is not None:
+                    words["start"] -= offset
+                    words["end"] -= offset
+                clip_segments[index].append(
+                    TranscriptionSegment(
+                        start_time=seg.start - offset,
+                        end_time=min(seg.end - offset, len(audios[index]) / SAMPLE_RATE),
+                        text=seg.text.strip(),
+                        confidence=getattr(seg, "avg_logprob", None),
+                        metadata={"no_speech_prob": getattr(seg, "no_speech_prob", None)},
+                        words=words,
+                    )
+                )
+
+        logger.info(
+            f"[FASTER-WHISPER] Batched {len(audios)} clips ({len(clip_timestamps)} speech windows, "
+            f"batch_size={batch_size})"
+        )
+
+        return [
+            TranscriptionResult(
+                full_text=" ".join(segment.text for segment in segments).strip(),
+                segments=segments,
+                language=detected_language,
+                duration=len(audio) / SAMPLE_RATE,
+                metadata={"model": self.model_size, "compute_type": self.compute_type, "batched": True},
+            )
+            for audio, segments in zip(audios, clip_segments, strict=True)
+        ]
 
     def supports_video(self) -> bool:
         """Faster-Whisper supports video through audio extraction"""
         return True
 
+    def supports_array_input(self) -> bool:
+        """Faster-Whisper accepts 16 kHz float32 samples and skips its own audio decoding"""
+        return True
+
+    def supports_streaming(self) -> bool:
+        """Faster-Whisper decodes segments lazily, so transcribe_stream() yields them as they are ready"""
+        return True
+
     def extract_audio_from_video(self, video_path: str, output_path: str | None = None) -> str:
         """Extract audio from video file"""
         from services.media import extract_audio_from_video
+
         return extract_audio_from_video(video_path, output_path, sample_rate=16000)
 
     def get_supported_languages(self) -> list[str]:
         """Get list of supported language codes (same as Whisper - 99 languages)"""
         return [
-            "en", "zh", "de", "es", "ru", "ko", "fr", "ja", "pt", "tr",
-            "pl", "ca", "nl", "ar", "sv", "it", "id", "hi", "fi", "vi",
-            "he", "uk", "el", "ms", "cs", "ro", "da", "hu", "ta", "no",
-            "th", "ur", "hr", "bg", "lt", "la", "mi", "ml", "cy", "sk",
-            "te", "fa", "lv", "bn", "sr", "az", "sl", "kn", "et", "mk",
-            "br", "eu", "is", "hy", "ne", "mn", "bs", "kk", "sq", "sw",
-            "gl", "mr", "pa", "si", "km", "sn", "yo", "so", "af", "oc",
-            "ka", "be", "tg", "sd", "gu", "am", "yi", "lo", "uz", "fo",
-            "ht", "ps", "tk", "nn", "mt", "sa", "lb", "my", "bo", "tl",
-            "mg", "as", "tt", "haw", "ln", "ha", "ba", "jw", "su",
+            "en",
+            "zh",
+            "de",
+            "es",
+            "ru",
+            "ko",
+            "fr",
+            "ja",
+            "pt",
+            "tr",
+            "pl",
+            "ca",
+            "nl",
+            "ar",
+            "sv",
+            "it",
+            "id",
+            "hi",
+            "fi",
+            "vi",
+            "he",
+            "uk",
+            "el",
+            "ms",
+            "cs",
+            "ro",
+            "da",
+            "hu",
+            "ta",
+            "no",
+            "th",
+            "ur",
+            "hr",
+            "bg",
+            "lt",
+            "la",
+            "mi",
+            "ml",
+            "cy",
+            "sk",
+            "te",
+            "fa",
+            "lv",
+            "bn",
+            "sr",
+            "az",
+            "sl",
+            "kn",
+            "et",
+            "mk",
+            "br",
+            "eu",
+            "is",
+            "hy",
+            "ne",
+            "mn",
+            "bs",
+            "kk",
+            "sq",
+            "sw",
+            "gl",
+            "mr",
+            "pa",
+            "si",
+            "km",
+            "sn",
+            "yo",
+            "so",
+            "af",
+            "oc",
+            "ka",
+            "be",
+            "tg",
+            "sd",
+            "gu",
+            "am",
+            "yi",
+            "lo",
+            "uz",
+            "fo",
+            "ht",
+            "ps",
+            "tk",
+            "nn",
+            "mt",
+            "sa",
+            "lb",
+            "my",
+            "bo",
+            "tl",
+            "mg",
+            "as",
+            "tt",
+            "haw",
+            "ln",
+            "ha",
+            "ba",
+            "jw",
+            "su",
         ]
 
     @property
@@ -325,6 +610,8 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             "device": self.device,
             "backend": "CTranslate2",
             "loaded": self._model is not None,
+            "cpu_threads": self.cpu_threads,
+            "real_time_factor": self.real_time_factor,
         }
 
     @property
@@ -345,13 +632,14 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         if self._batched_model is not None:
             del self._batched_model
             self._batched_model = None
-            
+
         # Clear CUDA cache if available
         try:
             import torch
+
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
         except ImportError:
             pass
-        
+
         logger.info("[FASTER-WHISPER] Model cleaned up")
@@ -4,15 +4,24 @@ Defines the contract that all transcription services must implement
 """
 
 from abc import abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from services.base_service import IAIService
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 @dataclass
 class TranscriptionSegment:
-    """A segment of transcribed text with timing"""
+    """
+    A segment of transcribed text with timing
+
+    words holds per-word timestamps (word_timings.WORD_TIMING_FIELDS record array) if the
+    engine aligned them while decoding.
+    """
 
     start_time: float
     end_time: float
@@ -20,6 +29,7 @@ class TranscriptionSegment:
     confidence: float | None = None
     speaker: str | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    words: "np.ndarray | None" = None
 
 
 @dataclass
@@ -91,6 +101,63 @@ class ITranscriptionService(IAIService):
         """
         pass
 
+    def supports_array_input(self) -> bool:
+        """
+        Check if transcribe() accepts in-memory audio instead of a file path
+
+        Returns:
+            True if a 16 kHz mono float32 NumPy array can be passed as audio_path
+        """
+        return False
+
+    def transcribe_arrays(self, audios: list["np.ndarray"], language: str | None = None) -> list[TranscriptionResult]:
+        """
+        Transcribe several in-memory clips in one call (requires supports_array_input())
+
+        Engines with batched inference override this to run all clips through the model together;
+        the default transcribes them one after another.
+
+        Args:
+            audios: 16 kHz mono float32 sample arrays
+            language: Language hint shared by all clips
+
+        Returns:
+            One TranscriptionResult per clip, in order
+        """
+        return [self.transcribe(audio, language) for audio in audios]
+
+    def transcribe_stream(
+        self, audio_path: "str | np.ndarray", language: str | None = None
+    ) -> Iterator[TranscriptionSegment]:
+        """
+        Transcribe and yield segments while decoding is still running
+
+        Engines that decode incrementally override this; the default yields the segments of
+        transcribe() once the whole audio is done.
+
+        Args:
+            audio_path: Path to the audio file, or in-memory samples (see supports_array_input())
+            language: Optional language hint
+
+        Yields:
+            TranscriptionSegment in timeline order
+        """
+        yield from self.transcribe(audio_path, language).segments
+
+    def supports_streaming(self) -> bool:
+        """
+        Check if transcribe_stream() yields segments while decoding is still running
+
+        Returns:
+            True if the engine decodes incrementally in this process
+        """
+        return False
+
+    @property
+    def max_parallel_requests(self) -> int:
+        """Number of transcribe calls the service can run at the same time (e.g. worker processes)"""
+        return 1
+
     @abstractmethod
     def extract_audio_from_video(self, video_path: str, output_path: str | None = None) -> str:
         """
@@ -0,0 +1,147 @@
+"""
+Speech Detection - VAD pre-pass over decoded chunk audio
+
+TV episodes contain long stretches of music, silence and other non-speech. Instead of feeding the
+whole chunk to the ASR model, a voice activity detection pass over the decoded 16 kHz samples
+finds speech islands; only those are concatenated and transcribed, and segment timestamps are
+re-based from the compacted audio onto the chunk timeline.
+
+Detection uses the Silero VAD (ONNX, CPU) bundled with faster-whisper, which tells speech from
+music. Only faster-whisper accepts in-memory audio, so the pre-pass never runs without it.
+
+Usage Example:
+    ```python
+    speech = detect_speech(samples)
+    print(f"{speech.speech_ratio:.0%} speech in {len(speech.islands)} islands")
+    result = transcribe(speech.compact(samples))
+    chunk_start = speech.to_chunk_time(result.segments[0].start_time)
+    ```
+"""
+
+import logging
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# Same smoothing as the VAD filter inside FasterWhisperTranscriptionService.transcribe()
+MIN_SILENCE_MS = 500
+SPEECH_PAD_MS = 200
+
+
+@dataclass(frozen=True)
+class SpeechIsland:
+    """Contiguous speech region, in samples of the chunk audio"""
+
+    start: int
+    end: int
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+
+@dataclass
+class SpeechDetectionResult:
+    """
+    Speech islands of one chunk and the mapping from compacted audio back to chunk time.
+
+    Attributes:
+        islands (list[SpeechIsland]): Speech regions in chunk order, non-overlapping
+        total_samples (int): Length of the analyzed chunk audio
+    """
+
+    islands: list[SpeechIsland]
+    total_samples: int
+    _compact_starts: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._compact_starts = []
+        position = 0
+        for island in self.islands:
+            self._compact_starts.append(position)
+            position += len(island)
+
+    @property
+    def speech_samples(self) -> int:
+        return sum(len(island) for island in self.islands)
+
+    @property
+    def speech_ratio(self) -> float:
+        """Fraction of the chunk that is speech (0.0-1.0)"""
+        return self.speech_samples / self.total_samples if self.total_samples else 0.0
+
+    def compact(self, samples: "np.ndarray") -> "np.ndarray":
+        """Concatenate the speech islands of the chunk audio"""
+        import numpy as np
+
+        return np.concatenate([samples[island.start : island.end] for island in self.islands])
+
+    def to_chunk_time(self, seconds: float, is_end: bool = False) -> float:
+        """
+        Map a timestamp in the compacted audio onto the chunk timeline
+
+        Args:
+            seconds: Timestamp in the audio returned by compact()
+            is_end: Map a boundary between two islands to the end of the earlier island
+                (segment end) instead of the start of the later one (segment start)
+
+        Returns:
+            Timestamp in seconds from the start of the chunk
+        """
+        if not self.islands:
+            return seconds
+
+        position = max(0, round(seconds * SAMPLE_RATE))
+        find = bisect_left if is_end else bisect_right
+        index = max(0, find(self._compact_starts, position) - 1)
+        island = self.islands[index]
+        offset = min(position - self._compact_starts[index], len(island))
+        return (island.start + offset) / SAMPLE_RATE
+
+
+def _merge_islands(regions: list[tuple[int, int]], total_samples: int) -> list[SpeechIsland]:
+    """Pad speech regions and merge those separated by less than MIN_SILENCE_MS"""
+    pad = SPEECH_PAD_MS * SAMPLE_RATE // 1000
+    min_gap = MIN_SILENCE_MS * SAMPLE_RATE // 1000
+
+    islands: list[SpeechIsland] = []
+    for region_start, region_end in sorted(regions):
+        start, end = max(0, region_start - pad), min(total_samples, region_end + pad)
+        if islands and start - islands[-1].end < min_gap:
+            islands[-1] = SpeechIsland(islands[-1].start, max(islands[-1].end, end))
+        else:
+            islands.append(SpeechIsland(start, end))
+    return islands
+
+
+def _silero_regions(samples: "np.ndarray") -> list[tuple[int, int]]:
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    options = VadOptions(min_silence_duration_ms=MIN_SILENCE_MS, speech_pad_ms=0)
+    return [(region["start"], region["end"]) for region in get_speech_timestamps(samples, options)]
+
+
+def detect_speech(samples: "np.ndarray") -> SpeechDetectionResult:
+    """
+    Find the speech islands of decoded chunk audio
+
+    Args:
+        samples: 16 kHz mono float32 samples
+
+    Returns:
+        SpeechDetectionResult with padded, merged islands
+
+    Raises:
+        ImportError: If faster-whisper is not installed
+    """
+    regions = _silero_regions(samples)
+    return SpeechDetectionResult(_merge_islands(regions, len(samples)), len(samples))
+
+
+__all__ = ["SpeechDetectionResult", "SpeechIsland", "detect_speech"]
@@ -0,0 +1,169 @@
+"""
+Transcript Cache
+
+Persistent store of chunk transcripts so reprocessing a chunk (postgame) or opening the same
+chunk for a second user skips FFmpeg audio extraction and Whisper transcription entirely.
+
+Entries are keyed on video file identity (resolved path, size, mtime), the chunk time window,
+the transcription model and the transcription language. Replacing the video file changes its
+size/mtime and therefore invalidates all of its entries. Transcripts are stored as SRT files
+under settings.get_data_path(), each with its word timing sidecar if there is one; the store
+is bounded by entry count and evicts the least recently used transcripts first.
+
+Usage Example:
+    ```python
+    cache = get_transcript_cache()
+    if cache:
+        key = cache.make_key(Path("/videos/s01e01.mp4"), 0.0, 1200.0, "faster-whisper-turbo", "de")
+        srt_content = cache.get(key)
+        if srt_content is None:
+            srt_content = transcribe(...)
+            cache.put(key, srt_content)
+    ```
+
+Thread Safety:
+    Yes. Writes go to a temporary file and are moved into place atomically (see FileCache).
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from core.config import settings
+from services.disk_cache import FileCache, ProcessCache, video_key
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptCache(FileCache):
+    """
+    Disk-backed LRU store of chunk transcripts (SRT content).
+
+    Attributes:
+        cache_dir (Path): Directory holding one SRT file per cached chunk
+        max_entries (int): Maximum number of cached transcripts before LRU eviction
+    """
+
+    suffix = ".srt"
+    log_name = "TRANSCRIPT CACHE"
+
+    def __init__(self, cache_dir: Path, max_entries: int = 2000):
+        """
+        Open (or create) the transcript cache
+
+        Args:
+            cache_dir: Directory for cached transcripts
+            max_entries: Maximum number of cached transcripts
+        """
+        super().__init__(cache_dir)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def make_key(video_file: Path, start_time: float, end_time: float, model_name: str, language: str) -> str:
+        """
+        Build the cache key for a chunk transcript
+
+        Args:
+            video_file: Source video file (must exist)
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+            model_name: Transcription model identifier
+            language: Transcription language code
+
+        Returns:
+            Hex digest identifying the transcript
+
+        Raises:
+            OSError: If the video file cannot be stat'ed
+        """
+        return video_key(video_file, f"{float(start_time):.3f}", f"{float(end_time):.3f}", model_name, language)
+
+    def _word_timings_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.words.npy"
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached transcript
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            SRT content, or None on a miss
+        """
+        entry = self._entry_path(key)
+        try:
+            content = entry.read_text(encoding="utf-8")
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return content
+
+    def get_word_timings(self, key: str) -> bytes | None:
+        """
+        Look up the word timing sidecar stored with a transcript
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Sidecar content, or None if the transcript was stored without one
+        """
+        try:
+            return self._word_timings_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, srt_content: str, word_timings: bytes | None = None) -> None:
+        """
+        Store a transcript and evict least recently used entries if over capacity
+
+        Args:
+            key: Key from make_key()
+            srt_content: SRT content to cache
+            word_timings: Word timing sidecar content of the transcript
+        """
+        if word_timings is None:
+            self._word_timings_path(key).unlink(missing_ok=True)
+        else:
+            self._write_atomic(self._word_timings_path(key), word_timings)
+        self._write_atomic(self._entry_path(key), srt_content.encode("utf-8"))
+
+        with self._lock:
+            self._evict_if_needed()
+
+    def _over_capacity(self, entries: int, size_bytes: int) -> bool:
+        return entries > self.max_entries
+
+    def _remove_entry(self, entry: Path) -> None:
+        entry.unlink(missing_ok=True)
+        self._word_timings_path(entry.stem).unlink(missing_ok=True)
+
+    def _capacity_stats(self, sizes: list[int]) -> dict[str, Any]:
+        return {"max_entries": self.max_entries}
+
+
+_transcript_cache: ProcessCache[TranscriptCache] = ProcessCache(
+    "TRANSCRIPT CACHE",
+    lambda: settings.transcript_cache_enabled,
+    lambda: TranscriptCache(
+        settings.get_data_path() / "transcript_cache", max_entries=settings.transcript_cache_max_entries
+    ),
+)
+
+
+def get_transcript_cache() -> TranscriptCache | None:
+    """
+    Get the process-wide transcript cache
+
+    Returns:
+        Shared TranscriptCache, or None when disabled (LANGPLUG_TRANSCRIPT_CACHE_ENABLED=false)
+    """
+    return _transcript_cache.get()
+
+
+__all__ = ["TranscriptCache", "get_transcript_cache"]
@@ -0,0 +1,289 @@
+"""
+Transcription Scheduler
+
+Sits in front of the factory-cached transcription service. Without it, every chunk request runs
+transcribe() on the shared model in its own worker thread, so concurrent users serialize on one
+model and each request pays for a separate, mostly under-filled inference pass.
+
+The scheduler collects in-memory audio from concurrent requests for a short window
+(LANGPLUG_TRANSCRIPTION_BATCH_WINDOW_MS), groups it by language and hands each group to
+ITranscriptionService.transcribe_arrays() in one call; faster-whisper runs the whole group through
+BatchedInferencePipeline. Each caller awaits its own future and gets back its own result.
+Streamed requests (transcribe_stream) queue the same way but run alone, so they take their turn
+on the model instead of decoding next to the batches.
+
+Usage Example:
+    ```python
+    scheduler = get_transcription_scheduler(transcription_service)
+    result = await scheduler.transcribe(samples, language="de")  # float32 16 kHz samples
+    async for segment in scheduler.transcribe_stream(samples, language="de"):
+        ...
+    scheduler.get_stats()  # latency and batch-size histograms
+    ```
+
+Thread Safety:
+    Use from one event loop. Inference runs in a worker thread, one batch at a time.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from core.config import settings
+from core.histogram import Histogram
+
+from .interface import ITranscriptionService, TranscriptionResult, TranscriptionSegment
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS_SECONDS = (1, 5, 15, 30, 60, 120, 300, 600)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32)
+
+
+@dataclass
+class _Request:
+    audio: "str | np.ndarray"
+    language: str | None
+    future: asyncio.Future
+    segments: "asyncio.Queue[TranscriptionSegment | None] | None" = None  # set for streamed requests
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class TranscriptionScheduler:
+    """
+    Micro-batching front end for one transcription service instance.
+
+    Attributes:
+        service (ITranscriptionService): Shared transcription service (model loaded once)
+        batch_window (float): Seconds to wait for more requests after the first one arrives
+        max_batch_size (int): Maximum number of requests per inference call
+        latency_histogram (Histogram): Seconds from submit to result, per request
+        batch_size_histogram (Histogram): Requests per inference call
+    """
+
+    def __init__(
+        self,
+        service: ITranscriptionService,
+        batch_window_ms: int = 50,
+        max_batch_size: int = 8,
+        max_concurrent_batches: int = 1,
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            service: Transcription service to run batches on
+            batch_window_ms: Collection window after the first queued request
+            max_batch_size: Maximum number of requests per inference call
+            max_concurrent_batches: Batches in flight at once (one per ASR worker process)
+        """
+        self.service = service
+        self.batch_window = max(0, batch_window_ms) / 1000
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
+        self.latency_histogram = Histogram(LATENCY_BUCKETS_SECONDS)
+        self.batch_size_histogram = Histogram(BATCH_SIZE_BUCKETS)
+        self._queue: asyncio.Queue[_Request] | None = None
+        self._worker: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def transcribe(self, audio: "np.ndarray", language: str | None = None) -> TranscriptionResult:
+        """
+        Queue in-memory audio for the next batch and wait for its result
+
+        Args:
+            audio: 16 kHz mono float32 samples
+            language: Language hint (requests are only batched with the same language)
+
+        Returns:
+            TranscriptionResult for this audio
+        """
+        self._ensure_worker()
+        request = _Request(audio, language, asyncio.get_running_loop().create_future())
+        await self._queue.put(request)
+        return await request.future
+
+    async def transcribe_stream(
+        self, audio: "str | np.ndarray", language: str | None = None
+    ) -> AsyncIterator[TranscriptionSegment]:
+        """
+        Queue audio for a turn of its own on the model and yield its segments as they are decoded
+
+        Args:
+            audio: 16 kHz mono float32 samples or an audio file path
+            language: Language hint
+
+        Yields:
+            TranscriptionSegment in timeline order
+        """
+        self._ensure_worker()
+        request = _Request(audio, language, asyncio.get_running_loop().create_future(), segments=asyncio.Queue())
+        await self._queue.put(request)
+        while (segment := await request.segments.get()) is not None:
+            yield segment
+        await request.future  # re-raises decoding errors
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        slots = asyncio.Semaphore(self.max_concurrent_batches)
+        while True:
+            # Wait for a free slot first, so requests arriving meanwhile join the next batch
+            await slots.acquire()
+            groups = self._group_by_language(await self._collect_batch())
+            if not groups:
+                slots.release()
+            for index, requests in enumerate(groups):
+                if index:
+                    await slots.acquire()
+                task = asyncio.create_task(self._run_batch(requests))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+                task.add_done_callback(lambda _: slots.release())
+
+    async def _collect_batch(self) -> list[_Request]:
+        """Wait for a first request, then gather more until the window closes or the batch is full"""
+        batch = [await self._queue.get()]
+        deadline = time.perf_counter() + self.batch_window
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+
+        return [request for request in batch if not request.future.done()]  # drop cancelled callers
+
+    @staticmethod
+    def _group_by_language(batch: list[_Request]) -> list[list[_Request]]:
+        """Requests with the same language hint share a batch; auto-detect and streamed requests run alone"""
+        groups: dict[str, list[_Request]] = {}
+        singles = []
+        for request in batch:
+            if request.language and request.segments is None:
+                groups.setdefault(request.language, []).append(request)
+            else:
+                singles.append([request])
+        return [*groups.values(), *singles]
+
+    async def _run_batch(self, requests: list[_Request]) -> None:
+        if requests[0].segments is not None:
+            await self._run_stream(requests[0])
+            return
+
+        language = requests[0].language
+        try:
+            results = await asyncio.to_thread(
+                self.service.transcribe_arrays, [request.audio for request in requests], language
+            )
+            if len(results) != len(requests):
+                raise RuntimeError(f"Expected {len(requests)} transcription results, got {len(results)}")
+        except Exception as e:
+            logger.error(f"[TRANSCRIPTION SCHEDULER] Batch of {len(requests)} failed: {e}")
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        self.batch_size_histogram.observe(len(requests))
+        finished = time.perf_counter()
+        for request, result in zip(requests, results, strict=True):
+            self.latency_histogram.observe(finished - request.enqueued_at)
+            if not request.future.done():
+                request.future.set_result(result)
+
+        if len(requests) > 1:
+            logger.info(
+                f"[TRANSCRIPTION SCHEDULER] Transcribed {len(requests)} concurrent chunks ({language}) in one batch"
+            )
+
+    async def _run_stream(self, request: _Request) -> None:
+        loop = asyncio.get_running_loop()
+
+        def decode() -> None:
+            for segment in self.service.transcribe_stream(request.audio, language=request.language):
+                loop.call_soon_threadsafe(request.segments.put_nowait, segment)
+
+        try:
+            await asyncio.to_thread(decode)
+        except Exception as e:
+            logger.error(f"[TRANSCRIPTION SCHEDULER] Streamed request failed: {e}")
+            if not request.future.done():
+                request.future.set_exception(e)
+        else:
+            self.batch_size_histogram.observe(1)
+            self.latency_histogram.observe(time.perf_counter() - request.enqueued_at)
+            if not request.future.done():
+                request.future.set_result(None)
+        finally:
+            request.segments.put_nowait(None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth and latency / batch-size histograms"""
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "latency_seconds": self.latency_histogram.snapshot(),
+            "batch_size": self.batch_size_histogram.snapshot(),
+        }
+
+
+_schedulers: dict[int, TranscriptionScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_transcription_scheduler(service: ITranscriptionService) -> TranscriptionScheduler | None:
+    """
+    Get the scheduler for a (factory-cached) transcription service
+
+    Args:
+        service: Transcription service instance
+
+    Returns:
+        Shared TranscriptionScheduler, or None when batching is disabled
+        (LANGPLUG_TRANSCRIPTION_BATCHING_ENABLED=false)
+    """
+    if not settings.transcription_batching_enabled:
+        return None
+
+    with _schedulers_lock:
+        scheduler = _schedulers.get(id(service))
+        if scheduler is None or scheduler.service is not service:
+            scheduler = TranscriptionScheduler(
+                service,
+                batch_window_ms=settings.transcription_batch_window_ms,
+                max_batch_size=settings.transcription_max_batch_size,
+                max_concurrent_batches=service.max_parallel_requests,
+            )
+            _schedulers[id(service)] = scheduler
+    return scheduler
+
+
+def get_transcription_scheduler_stats() -> dict[str, Any]:
+    """Get statistics of all active schedulers, keyed by model name"""
+    with _schedulers_lock:
+        schedulers = list(_schedulers.values())
+    return {scheduler.service.model_info.get("name", "unknown"): scheduler.get_stats() for scheduler in schedulers}
+
+
+__all__ = [
+    "TranscriptionScheduler",
+    "get_transcription_scheduler",
+    "get_transcription_scheduler_stats",
+]
@@ -0,0 +1,147 @@
+"""
+Word Timings - per-word ASR timestamps and their binary SRT sidecar
+
+faster-whisper aligns every word while decoding (word_timestamps=True). Each TranscriptionSegment
+carries them as a compact NumPy record array (start/end in seconds, character span in the segment
+text). When a chunk SRT is written, the word timings of all cues go into a sidecar next to it
+(video.srt -> video.words.npy), so subtitle filtering can time FilteredWords from the audio
+instead of spreading each cue's duration evenly over its words.
+
+Usage Example:
+    ```python
+    segment.words = word_timings(seg.words)  # faster-whisper Word objects
+    write_word_sidecar(Path("episode.srt"), segments)
+    cues = read_word_sidecar(Path("episode.srt"))  # {cue index: word timing array}
+    ```
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .interface import TranscriptionSegment
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_SUFFIX = ".words.npy"
+
+# One row per ASR word; character offsets index the stripped segment (cue) text
+WORD_TIMING_FIELDS = [("start", "<f4"), ("end", "<f4"), ("char_start", "<u2"), ("char_end", "<u2")]
+
+# Sidecar rows additionally carry the 1-based SRT cue index
+SIDECAR_FIELDS = [("cue", "<u4"), *WORD_TIMING_FIELDS]
+
+_MAX_CHAR_OFFSET = 0xFFFF
+
+
+def word_timings(words: Iterable[Any]) -> "np.ndarray":
+    """
+    Build the word timing array of one segment
+
+    Args:
+        words: faster-whisper Word objects (word, start, end); their text concatenates to the
+            segment text before stripping
+
+    Returns:
+        Record array with WORD_TIMING_FIELDS, one row per non-blank word
+    """
+    import numpy as np
+
+    words = list(words)
+    raw_text = "".join(word.word for word in words)
+    position = -(len(raw_text) - len(raw_text.lstrip()))  # offsets into the stripped text
+
+    rows = []
+    for word in words:
+        text = word.word
+        start = position + len(text) - len(text.lstrip())
+        position += len(text)
+        if text.strip():
+            end = position - (len(text) - len(text.rstrip()))
+            rows.append((word.start, word.end, min(start, _MAX_CHAR_OFFSET), min(end, _MAX_CHAR_OFFSET)))
+    return np.array(rows, dtype=WORD_TIMING_FIELDS)
+
+
+def sidecar_path(srt_path: Path) -> Path:
+    """Word timing sidecar of an SRT file"""
+    return Path(srt_path).with_suffix(SIDECAR_SUFFIX)
+
+
+def write_word_sidecar(srt_path: Path, segments: Sequence["TranscriptionSegment"]) -> Path | None:
+    """
+    Write the word timings of the segments (cue i = segments[i - 1]) next to their SRT file
+
+    Args:
+        srt_path: SRT file the segments were written to
+        segments: Segments in cue order
+
+    Returns:
+        Sidecar path, or None if no segment has word timings (a stale sidecar is removed)
+    """
+    import numpy as np
+
+    path = sidecar_path(srt_path)
+    parts = []
+    for cue, segment in enumerate(segments, start=1):
+        if segment.words is None or not len(segment.words):
+            continue
+        rows = np.empty(len(segment.words), dtype=SIDECAR_FIELDS)
+        rows["cue"] = cue
+        for name, _ in WORD_TIMING_FIELDS:
+            rows[name] = segment.words[name]
+        parts.append(rows)
+
+    if not parts:
+        path.unlink(missing_ok=True)
+        return None
+
+    with open(path, "wb") as f:
+        np.save(f, np.concatenate(parts), allow_pickle=False)
+    return path
+
+
+def read_word_sidecar(srt_path: Path) -> dict[int, "np.ndarray"]:
+    """
+    Load the word timings of an SRT file
+
+    Args:
+        srt_path: SRT file
+
+    Returns:
+        Word timing arrays keyed by 1-based cue index (empty without a readable sidecar)
+    """
+    import numpy as np
+
+    path = sidecar_path(srt_path)
+    if not path.exists():
+        return {}
+
+    try:
+        rows = np.load(path, allow_pickle=False)
+        if rows.dtype != np.dtype(SIDECAR_FIELDS):
+            raise ValueError(f"unexpected dtype {rows.dtype}")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable word timing sidecar {path}: {e}")
+        return {}
+
+    timings = rows[[name for name, _ in WORD_TIMING_FIELDS]]
+    cues, starts = np.unique(rows["cue"], return_index=True)
+    bounds = [*starts[1:], len(rows)]
+    return {
+        int(cue): np.array(timings[start:end], dtype=WORD_TIMING_FIELDS)
+        for cue, start, end in zip(cues, starts, bounds, strict=True)
+    }
+
+
+__all__ = [
+    "SIDECAR_SUFFIX",
+    "WORD_TIMING_FIELDS",
+    "read_word_sidecar",
+    "sidecar_path",
+    "word_timings",
+    "write_word_sidecar",
+]
@@ -0,0 +1,160 @@
+"""
+CTranslate2 Model Artifacts - persistent, versioned store of converted OPUS-MT models
+
+OpusCT2TranslationService needs each HuggingFace checkpoint converted to the CTranslate2 format.
+Converting on first use stalls the first request per language pair, and a conversion in the
+system temp directory is lost on container restart. Converted models are kept here instead,
+together with their tokenizer files, so loading needs neither the network nor the HuggingFace
+cache. Prepare them offline with scripts/setup/prepare_models.py.
+
+Layout:
+    <LANGPLUG_CT2_MODEL_DIR>/v<ARTIFACT_VERSION>/<model name>-<quantization>/
+        model.bin, shared_vocabulary / source & target vocabularies, tokenizer files,
+        langplug_artifact.json (source model, quantization, ctranslate2 version)
+
+ARTIFACT_VERSION is bumped when the conversion changes, so stale artifacts are never loaded.
+
+Usage Example:
+    ```python
+    path = ensure_ct2_model("Helsinki-NLP/opus-mt-de-es", quantization="int8")
+    results = prepare_ct2_models(opus_model_names(), quantization="int8")
+    ```
+"""
+
+import json
+import logging
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_VERSION = 1
+MANIFEST_FILE = "langplug_artifact.json"
+
+
+def ct2_model_root() -> Path:
+    """Directory holding the converted models of the current ARTIFACT_VERSION"""
+    base = (
+        Path(settings.ct2_model_dir) if settings.ct2_model_dir else settings.get_data_path() / "models" / "ctranslate2"
+    )
+    return base / f"v{ARTIFACT_VERSION}"
+
+
+def ct2_artifact_dir(model_name: str, quantization: str) -> Path:
+    """Artifact directory of one model and quantization"""
+    return ct2_model_root() / f"{model_name.replace('/', '--')}-{quantization}"
+
+
+def is_prepared(artifact_dir: Path) -> bool:
+    """True if the artifact directory holds a complete conversion"""
+    return (artifact_dir / "model.bin").exists() and (artifact_dir / MANIFEST_FILE).exists()
+
+
+def convert_ct2_model(model_name: str, quantization: str, force: bool = False) -> Path:
+    """
+    Convert a HuggingFace OPUS-MT checkpoint into the artifact store
+
+    The conversion is written to a temporary directory next to its destination and moved into
+    place, so concurrent or interrupted conversions never leave a half-written artifact.
+
+    Args:
+        model_name: HuggingFace model name (e.g. 'Helsinki-NLP/opus-mt-de-es')
+        quantization: CTranslate2 weight quantization ('int8', 'float16', 'int8_float16', ...)
+        force: Convert again even if the artifact exists
+
+    Returns:
+        Artifact directory
+    """
+    import ctranslate2
+    from transformers import AutoTokenizer
+
+    artifact_dir = ct2_artifact_dir(model_name, quantization)
+    if is_prepared(artifact_dir) and not force:
+        return artifact_dir
+
+    artifact_dir.parent.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    logger.info(f"[CT2 ARTIFACTS] Converting {model_name} ({quantization}) -> {artifact_dir}")
+
+    staging = Path(tempfile.mkdtemp(prefix=f".{artifact_dir.name}.", dir=artifact_dir.parent))
+    try:
+        converter = ctranslate2.converters.TransformersConverter(model_name)
+        converter.convert(str(staging), quantization=quantization, force=True)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(str(staging))
+        manifest = {
+            "model_name": model_name,
+            "quantization": quantization,
+            "artifact_version": ARTIFACT_VERSION,
+            "ctranslate2_version": ctranslate2.__version__,
+        }
+        (staging / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+        shutil.rmtree(artifact_dir, ignore_errors=True)
+        staging.rename(artifact_dir)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    logger.info(f"[CT2 ARTIFACTS] Converted {model_name} in {time.perf_counter() - started:.1f}s")
+    return artifact_dir
+
+
+def ensure_ct2_model(model_name: str, quantization: str) -> Path:
+    """Artifact directory of a model, converting it first if it was not prepared"""
+    artifact_dir = ct2_artifact_dir(model_name, quantization)
+    if is_prepared(artifact_dir):
+        return artifact_dir
+    logger.warning(f"[CT2 ARTIFACTS] {model_name} ({quantization}) was not prepared, converting on first use")
+    return convert_ct2_model(model_name, quantization)
+
+
+def opus_model_names() -> list[str]:
+    """HuggingFace names of all OPUS-MT models the application may load"""
+    from core.language_preferences import OPUS_MODEL_MAP
+
+    from .factory import TranslationServiceFactory
+
+    names = dict.fromkeys(OPUS_MODEL_MAP.values())
+    for config in TranslationServiceFactory._default_configs.values():
+        model_name = config.get("model_name", "")
+        if model_name.startswith("Helsinki-NLP/opus-mt-"):
+            names[model_name] = None
+    return list(names)
+
+
+def prepare_ct2_models(model_names: list[str], quantization: str, force: bool = False) -> dict[str, str | None]:
+    """
+    Convert several models into the artifact store
+
+    Args:
+        model_names: HuggingFace model names
+        quantization: CTranslate2 weight quantization
+        force: Convert again even if the artifacts exist
+
+    Returns:
+        Error message per model name (None for models that are ready)
+    """
+    errors: dict[str, str | None] = {}
+    for model_name in model_names:
+        try:
+            convert_ct2_model(model_name, quantization, force=force)
+            errors[model_name] = None
+        except Exception as e:
+            logger.error(f"[CT2 ARTIFACTS] Failed to prepare {model_name}: {e}")
+            errors[model_name] = str(e)
+    return errors
+
+
+__all__ = [
+    "ARTIFACT_VERSION",
+    "convert_ct2_model",
+    "ct2_artifact_dir",
+    "ct2_model_root",
+    "ensure_ct2_model",
+    "is_prepared",
+    "opus_model_names",
+    "prepare_ct2_models",
+]
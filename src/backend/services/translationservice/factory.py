@@ -162,8 +162,11 @@ class TranslationServiceFactory:
         service_class = cls._services[service_name]
         instance = service_class(**filtered_config)
 
-        # Cache the instance
+        # Cache the instance; its model is loaded on first use and unloaded by the registry under memory pressure
         cls._instances[cache_key] = instance
+        from services.model_registry import get_model_registry
+
+        get_model_registry().register(cache_key, instance, kind="translation")
 
         return instance
 
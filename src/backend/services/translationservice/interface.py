@@ -44,7 +44,9 @@ class ITranslationService(IAIService):
         pass
 
     @abstractmethod
-    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[TranslationResult]:
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str, *, mode: str = "live"
+    ) -> list[TranslationResult]:
         """
         Translate multiple texts in batch
 
@@ -52,6 +54,8 @@ class ITranslationService(IAIService):
             texts: List of texts to translate
             source_lang: Source language code
             target_lang: Target language code
+            mode: Request class, 'live' (a user is waiting) or 'offline' (pre-processing);
+                implementations without a speed/quality trade-off ignore it
 
         Returns:
             List of TranslationResult objects
@@ -11,20 +11,21 @@ See: https://github.com/OpenNMT/CTranslate2
 """
 
 import logging
-import os
-import tempfile
-from pathlib import Path
+import time
 from typing import Any
 
 from .interface import ITranslationService, TranslationResult
+from .translation_scheduler import LIVE, beam_size_for, length_buckets, translation_mode_stats
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_INTRA_THREADS = 4
+
 
 class OpusCT2TranslationService(ITranslationService):
     """
     CTranslate2-optimized OPUS-MT implementation.
-    
+
     Benefits over standard Transformers:
     - Up to 9x faster translation on GPU
     - Up to 4.7x faster translation on CPU
@@ -43,7 +44,7 @@ class OpusCT2TranslationService(ITranslationService):
         device: str | None = None,
         compute_type: str | None = None,
         inter_threads: int = 1,
-        intra_threads: int = 4,
+        intra_threads: int | None = None,
     ):
         """
         Initialize CTranslate2 OPUS-MT translation service.
@@ -53,14 +54,14 @@ class OpusCT2TranslationService(ITranslationService):
             device: Device to use ('cuda', 'cpu', or 'auto')
             compute_type: Quantization type ('float16', 'int8', 'int8_float16', etc.)
             inter_threads: Number of workers for parallel translations
-            intra_threads: Number of threads per worker (CPU only)
+            intra_threads: Number of threads per worker (CPU only; None = sized by the CPU profile, else 4)
         """
         self.model_name = model_name
         self.device = device or "auto"
         self._compute_type = compute_type
         self.inter_threads = inter_threads
         self.intra_threads = intra_threads
-        
+
         self._translator = None
         self._tokenizer = None
         self._model_path = None
@@ -76,59 +77,33 @@ class OpusCT2TranslationService(ITranslationService):
         return "int8"  # Best for CPU
 
     def _get_or_convert_model(self) -> str:
-        """Get converted CTranslate2 model path, converting if needed."""
-        import ctranslate2
-        
-        # Cache directory for converted models
-        cache_dir = Path(tempfile.gettempdir()) / "ctranslate2_models"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Model-specific cache path
-        model_safe_name = self.model_name.replace("/", "_").replace("-", "_")
-        model_dir = cache_dir / f"{model_safe_name}_ct2"
-        
-        if model_dir.exists() and (model_dir / "model.bin").exists():
-            logger.info(f"[OPUS-CT2] Using cached model: {model_dir}")
-            return str(model_dir)
-        
-        logger.info(f"[OPUS-CT2] Converting model to CTranslate2 format...")
-        logger.info(f"[OPUS-CT2] Source: {self.model_name}")
-        logger.info(f"[OPUS-CT2] Target: {model_dir}")
-        
-        # Convert the model
-        try:
-            ct2_converter = ctranslate2.converters.TransformersConverter(self.model_name)
-            ct2_converter.convert(
-                str(model_dir),
-                quantization="float16",  # Convert with FP16 for smaller size
-                force=True,
-            )
-            logger.info(f"[OPUS-CT2] Model converted successfully")
-        except Exception as e:
-            logger.error(f"[OPUS-CT2] Conversion failed: {e}")
-            raise
-        
+        """Get the converted CTranslate2 model path from the artifact store, converting if needed."""
+        from core.config import settings
+
+        from .ct2_artifacts import ensure_ct2_model
+
+        model_dir = ensure_ct2_model(self.model_name, settings.ct2_quantization)
+        logger.info(f"[OPUS-CT2] Using converted model: {model_dir}")
         return str(model_dir)
 
     def initialize(self) -> None:
         """Initialize the CTranslate2 translator"""
         if self._translator is not None:
             return
-            
+
         try:
             import ctranslate2
             from transformers import AutoTokenizer
         except ImportError as e:
             raise ImportError(
-                "ctranslate2 or transformers not installed. Install with: "
-                "pip install ctranslate2 transformers"
+                "ctranslate2 or transformers not installed. Install with: pip install ctranslate2 transformers"
             ) from e
 
         from core.gpu_utils import check_cuda_availability
 
         # Check CUDA availability
         cuda_available = check_cuda_availability("OPUS-CT2")
-        
+
         # Determine device
         if self.device == "auto":
             self.device = "cuda" if cuda_available else "cpu"
@@ -142,20 +117,27 @@ class OpusCT2TranslationService(ITranslationService):
             logger.warning(f"[OPUS-CT2] {compute_type} not supported on CPU, using int8")
             compute_type = "int8"
 
+        if self.intra_threads is None:
+            from core.cpu_profile import cpu_profile_enabled, get_cpu_thread_plan
+
+            use_plan = self.device == "cpu" and cpu_profile_enabled()
+            planned = get_cpu_thread_plan().translation_threads if use_plan else 0
+            self.intra_threads = planned or DEFAULT_INTRA_THREADS
+
         logger.info(f"[OPUS-CT2] Loading model: {self.model_name}")
-        logger.info(f"[OPUS-CT2] Device: {self.device}, Compute type: {compute_type}")
+        logger.info(f"[OPUS-CT2] Device: {self.device}, Compute type: {compute_type}, Threads: {self.intra_threads}")
 
         # Get or convert the model
         model_path = self._get_or_convert_model()
         self._model_path = model_path
 
-        # Load tokenizer from original model
-        logger.info(f"[OPUS-CT2] Loading tokenizer from {self.model_name}")
-        self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        # Load tokenizer saved with the converted model (no HuggingFace download)
+        logger.info(f"[OPUS-CT2] Loading tokenizer from {model_path}")
+        self._tokenizer = AutoTokenizer.from_pretrained(model_path)
 
         # Create CTranslate2 translator
         device_index = 0 if self.device == "cuda" else -1
-        
+
         self._translator = ctranslate2.Translator(
             model_path,
             device=self.device,
@@ -168,6 +150,7 @@ class OpusCT2TranslationService(ITranslationService):
         logger.info(f"[OPUS-CT2] Model loaded successfully")
         if self.device == "cuda":
             import torch
+
             logger.info(f"[OPUS-CT2] GPU: {torch.cuda.get_device_name(0)}")
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
@@ -176,52 +159,74 @@ class OpusCT2TranslationService(ITranslationService):
         return results[0]
 
     def translate_batch(
-        self, 
-        texts: list[str], 
-        source_lang: str, 
+        self,
+        texts: list[str],
+        source_lang: str,
         target_lang: str,
-        beam_size: int = 2,
+        *,
+        mode: str = LIVE,
+        beam_size: int | None = None,
         max_batch_size: int = 64,
     ) -> list[TranslationResult]:
         """
         Translate multiple texts in batch.
-        
+
+        Texts are decoded in length buckets (similar lengths share a batch, so little padding is
+        decoded) and returned in their original order.
+
         Args:
             texts: List of texts to translate
             source_lang: Source language code
             target_lang: Target language code
-            beam_size: Beam search size (higher = better quality, slower)
-            max_batch_size: Maximum batch size for parallel processing
+            mode: 'live' (a user is waiting; greedy by default) or 'offline' (wider beam)
+            beam_size: Beam search size overriding the mode's (higher = better quality, slower)
+            max_batch_size: Maximum texts per decoder call
+
+        Raises:
+            ValueError: If the mode is unknown (also when beam_size is given)
         """
+        mode_beam_size = beam_size_for(mode)  # validates the mode before any decoding
         if not self.is_initialized:
             self.initialize()
 
-        # Tokenize using the proper method for Marian models
-        # Convert text to token IDs, then to token strings for CTranslate2
-        tokenized = []
-        for text in texts:
-            tokens = self._tokenizer.encode(text, add_special_tokens=True)
-            token_strs = self._tokenizer.convert_ids_to_tokens(tokens)
-            tokenized.append(token_strs)
-
-        # Translate with CTranslate2
-        results = self._translator.translate_batch(
-            tokenized,
+        beam_size = beam_size or mode_beam_size
+        tokenized = self._encode_batch(texts)
+        lengths = [len(tokens) for tokens in tokenized]
+        buckets = length_buckets(lengths, max_batch_size)
+
+        # Translate with CTranslate2, one call per length bucket
+        started = time.perf_counter()
+        hypotheses: list[list[str]] = [[] for _ in texts]
+        log_prob = 0.0
+        for bucket in buckets:
+            results = self._translator.translate_batch(
+                [tokenized[i] for i in bucket],
+                beam_size=beam_size,
+                max_batch_size=max_batch_size,
+                return_scores=True,
+                normalize_scores=True,
+                max_decoding_length=256,
+            )
+            for position, result in zip(bucket, results, strict=True):
+                hypotheses[position] = result.hypotheses[0]
+                log_prob += result.scores[0] * len(result.hypotheses[0])
+
+        translation_mode_stats.record(
+            mode,
             beam_size=beam_size,
-            max_batch_size=max_batch_size,
-            return_scores=False,
-            max_decoding_length=256,
+            batches=len(buckets),
+            source_lengths=lengths,
+            padded_tokens=sum(len(bucket) * max(lengths[i] for i in bucket) for bucket in buckets),
+            target_tokens=sum(len(tokens) for tokens in hypotheses),
+            log_prob=log_prob,
+            seconds=time.perf_counter() - started,
         )
 
-        # Decode and create results
+        translated_texts = self._decode_batch(hypotheses)
+
+        # Create results
         translation_results = []
-        for text, result in zip(texts, results, strict=False):
-            # Decode tokens back to text
-            translated_tokens = result.hypotheses[0]
-            # Convert tokens to IDs then decode
-            token_ids = self._tokenizer.convert_tokens_to_ids(translated_tokens)
-            translated_text = self._tokenizer.decode(token_ids, skip_special_tokens=True)
-            
+        for text, translated_text in zip(texts, translated_texts, strict=False):
             translation_results.append(
                 TranslationResult(
                     original_text=text,
@@ -233,12 +238,41 @@ class OpusCT2TranslationService(ITranslationService):
                         "service": "OPUS-CT2",
                         "device": self.device,
                         "compute_type": self.compute_type,
+                        "mode": mode,
+                        "beam_size": beam_size,
                     },
                 )
             )
 
         return translation_results
 
+    def _encode_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        Tokenize texts into source pieces for CTranslate2 (one call for the whole batch).
+
+        Marian tokenizers expose their SentencePiece models; encoding with them directly skips
+        the per-text id round trip of the HuggingFace tokenizer. Pieces missing from the
+        vocabulary are mapped to <unk> by CTranslate2, as encode() would. Texts with a target
+        language code (">>es<<", multilingual models) go through the tokenizer, which handles it.
+        """
+        spm_source = getattr(self._tokenizer, "spm_source", None)
+        if spm_source is not None and not any(text.startswith(">>") for text in texts):
+            eos = self._tokenizer.eos_token
+            return [[*pieces, eos] for pieces in spm_source.encode(texts, out_type=str)]
+
+        encoded = self._tokenizer(texts, add_special_tokens=True)["input_ids"]
+        return [self._tokenizer.convert_ids_to_tokens(ids) for ids in encoded]
+
+    def _decode_batch(self, hypotheses: list[list[str]]) -> list[str]:
+        """Detokenize target pieces from CTranslate2 into texts (one call for the whole batch)."""
+        spm_target = getattr(self._tokenizer, "spm_target", None)
+        if spm_target is not None:
+            special = set(self._tokenizer.all_special_tokens)
+            return spm_target.decode([[piece for piece in pieces if piece not in special] for pieces in hypotheses])
+
+        token_ids = [self._tokenizer.convert_tokens_to_ids(pieces) for pieces in hypotheses]
+        return self._tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+
     def get_supported_languages(self) -> dict[str, str]:
         """Get dictionary of supported languages"""
         return {
@@ -266,6 +300,7 @@ class OpusCT2TranslationService(ITranslationService):
         # Clear CUDA cache
         try:
             import torch
+
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
         except ImportError:
@@ -286,10 +321,16 @@ class OpusCT2TranslationService(ITranslationService):
     @property
     def model_info(self) -> dict[str, Any]:
         """Get information about the loaded model"""
-        return {
+        from .translation_cache import get_translation_cache
+
+        info = {
             "name": self.model_name,
             "device": self.device,
             "compute_type": self.compute_type,
             "backend": "CTranslate2",
             "loaded": self._translator is not None,
         }
+        cache = get_translation_cache()
+        if cache:
+            info["translation_cache"] = cache.get_stats(self.model_name)
+        return info
@@ -101,8 +101,10 @@ class OpusTranslationService(ITranslationService):
             metadata={"model": self.model_name, "service": "OPUS-MT"},
         )
 
-    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[TranslationResult]:
-        """Translate multiple texts in batch"""
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str, *, mode: str = "live"
+    ) -> list[TranslationResult]:
+        """Translate multiple texts in batch (the pipeline's generation settings apply in every mode)"""
         if not self.is_initialized:
             self.initialize()
 
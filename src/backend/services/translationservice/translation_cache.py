@@ -0,0 +1,282 @@
+"""
+Translation Cache (Translation Memory)
+
+Persistent, content-addressed cache of subtitle translations. The same episodes are
+processed repeatedly by different users with the same language pair, so identical
+subtitle lines are translated once per model and served from disk afterwards.
+
+Entries are keyed on (model name, source language, target language, normalized text hash)
+and stored in a SQLite file under settings.get_data_path(). The cache is bounded by entry
+count and evicts the least recently used entries first. Lookups only read: the last-used
+times of hits are kept in memory and written in one batch with the next put_many (ahead of
+eviction), every _TOUCH_FLUSH_THRESHOLD hits and on close; a crashed process loses only recency.
+
+Usage Example:
+    ```python
+    cache = get_translation_cache()
+    if cache:
+        cached = cache.get_many("Helsinki-NLP/opus-mt-de-en", "de", "en", ["Hallo Welt"])
+        # cached: {"Hallo Welt": "Hello world"} on a hit, {} on a miss
+        cache.put_many("Helsinki-NLP/opus-mt-de-en", "de", "en", {"Guten Tag": "Good day"})
+    ```
+
+Thread Safety:
+    Yes. One SQLite connection guarded by a lock; safe to call from asyncio.to_thread workers.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from core.config import settings
+from services.disk_cache import ProcessCache, content_key, hit_ratio
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_MAX_PARAMS = 500
+
+# Pending last-used updates written in one batch
+_TOUCH_FLUSH_THRESHOLD = 1000
+
+
+class TranslationCache:
+    """
+    Disk-backed LRU translation memory.
+
+    Attributes:
+        db_path (Path): SQLite database file
+        max_entries (int): Maximum number of cached translations before LRU eviction
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = 200_000):
+        """
+        Open (or create) the translation cache
+
+        Args:
+            db_path: SQLite database file path
+            max_entries: Maximum number of cached translations
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+        self._pending_touches: dict[str, float] = {}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                cache_key TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations (last_used)")
+        self._conn.commit()
+        self._entry_count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+        logger.info(f"[TRANSLATION CACHE] Opened {self.db_path} ({self._entry_count} entries)")
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text for cache keys (Unicode NFC, collapsed whitespace)"""
+        return _WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+    @classmethod
+    def make_key(cls, model_name: str, source_lang: str, target_lang: str, text: str) -> str:
+        """Build the content-addressed cache key for a text"""
+        return content_key(model_name, source_lang, target_lang, cls.normalize_text(text))
+
+    def get_many(self, model_name: str, source_lang: str, target_lang: str, texts: Iterable[str]) -> dict[str, str]:
+        """
+        Look up cached translations
+
+        Args:
+            model_name: Translation model name
+            source_lang: Source language code
+            target_lang: Target language code
+            texts: Source texts
+
+        Returns:
+            Dictionary mapping each cached source text to its translation (misses are omitted)
+        """
+        keys_by_text = {text: self.make_key(model_name, source_lang, target_lang, text) for text in texts}
+        if not keys_by_text:
+            return {}
+
+        keys = list(set(keys_by_text.values()))
+        found: dict[str, str] = {}
+
+        with self._lock:
+            for i in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                chunk = keys[i : i + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT cache_key, translated_text FROM translations WHERE cache_key IN ({placeholders})",  # nosec B608
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+
+            now = time.time()
+            self._pending_touches.update(dict.fromkeys(found, now))
+            if len(self._pending_touches) >= _TOUCH_FLUSH_THRESHOLD:
+                self._flush_touches()
+                self._conn.commit()
+
+            result = {text: found[key] for text, key in keys_by_text.items() if key in found}
+            stats = self._stats.setdefault(model_name, {"hits": 0, "misses": 0})
+            stats["hits"] += len(result)
+            stats["misses"] += len(keys_by_text) - len(result)
+
+        return result
+
+    def put_many(self, model_name: str, source_lang: str, target_lang: str, translations: dict[str, str]) -> None:
+        """
+        Store translations and evict least recently used entries if over capacity
+
+        Args:
+            model_name: Translation model name
+            source_lang: Source language code
+            target_lang: Target language code
+            translations: Dictionary mapping source text to translated text
+        """
+        if not translations:
+            return
+
+        now = time.time()
+        rows = [
+            (
+                self.make_key(model_name, source_lang, target_lang, text),
+                model_name,
+                source_lang,
+                target_lang,
+                translated,
+                now,
+            )
+            for text, translated in translations.items()
+        ]
+
+        with self._lock:
+            self._flush_touches()  # before the upsert, which stamps the stored rows with now
+            self._conn.executemany(
+                """
+                INSERT INTO translations (cache_key, model_name, source_lang, target_lang, translated_text, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    translated_text = excluded.translated_text,
+                    last_used = excluded.last_used
+                """,
+                rows,
+            )
+            self._entry_count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def _flush_touches(self) -> None:
+        """Write the pending last-used times of cache hits (caller holds the lock and commits)"""
+        if not self._pending_touches:
+            return
+
+        self._conn.executemany(
+            "UPDATE translations SET last_used = ? WHERE cache_key = ?",
+            [(last_used, key) for key, last_used in self._pending_touches.items()],
+        )
+        self._pending_touches.clear()
+
+    def _evict_if_needed(self) -> None:
+        """Delete least recently used entries until the cache is within max_entries"""
+        overflow = self._entry_count - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._conn.execute(
+            """
+            DELETE FROM translations WHERE cache_key IN (
+                SELECT cache_key FROM translations ORDER BY last_used ASC LIMIT ?
+            )
+            """,
+            (overflow,),
+        )
+        self._entry_count -= overflow
+        logger.info(f"[TRANSLATION CACHE] Evicted {overflow} least recently used entries")
+
+    def get_stats(self, model_name: str | None = None) -> dict[str, Any]:
+        """
+        Get cache hit/miss counters
+
+        Args:
+            model_name: Restrict counters to one model (all models if None)
+
+        Returns:
+            Dictionary with hits, misses, hit ratio and current entry count
+        """
+        with self._lock:
+            if model_name is not None:
+                counters = self._stats.get(model_name, {"hits": 0, "misses": 0})
+                hits, misses = counters["hits"], counters["misses"]
+            else:
+                hits = sum(s["hits"] for s in self._stats.values())
+                misses = sum(s["misses"] for s in self._stats.values())
+            entries = self._entry_count
+
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hit_ratio(hits, misses),
+            "entries": entries,
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached translations and reset counters"""
+        with self._lock:
+            self._conn.execute("DELETE FROM translations")
+            self._conn.commit()
+            self._entry_count = 0
+            self._pending_touches.clear()
+            self._stats.clear()
+
+    def close(self) -> None:
+        """Write pending last-used times and close the underlying database connection"""
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+
+_translation_cache: ProcessCache[TranslationCache] = ProcessCache(
+    "TRANSLATION CACHE",
+    lambda: settings.translation_cache_enabled,
+    lambda: TranslationCache(
+        settings.get_data_path() / "translation_cache" / "translations.sqlite3",
+        max_entries=settings.translation_cache_max_entries,
+    ),
+)
+
+
+def get_translation_cache() -> TranslationCache | None:
+    """
+    Get the process-wide translation cache
+
+    Returns:
+        Shared TranslationCache, or None when disabled (LANGPLUG_TRANSLATION_CACHE_ENABLED=false)
+    """
+    return _translation_cache.get()
+
+
+__all__ = ["TranslationCache", "get_translation_cache"]
@@ -0,0 +1,181 @@
+"""
+Translation Scheduler - decoding modes and length-bucketed batching for subtitle MT
+
+Subtitle lines range from one word to two full sentences. Translated in submission order, every
+batch is padded to its longest line, so most of the decoder's work is spent on padding. The
+scheduler sorts a request's texts by token length, cuts the sorted list into buckets bounded by
+their padded size, and returns the bucket positions so results can be put back in order.
+
+Beam size follows the request class:
+    live       chunk processing a user is waiting for (LANGPLUG_TRANSLATION_LIVE_BEAM_SIZE, greedy)
+    offline    pre-processing without a waiting user (LANGPLUG_TRANSLATION_OFFLINE_BEAM_SIZE)
+
+Per-mode throughput, padding and mean token log-probability (the quality side of the trade-off)
+are reported as `translation_modes` by /readiness.
+
+Usage Example:
+    ```python
+    for bucket in length_buckets([len(tokens) for tokens in tokenized], max_batch_size=64):
+        results = translator.translate_batch([tokenized[i] for i in bucket], beam_size=beam_size_for(LIVE))
+    translation_mode_stats.snapshot()
+    ```
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+from core.config import settings
+
+LIVE = "live"
+OFFLINE = "offline"
+TRANSLATION_MODES = (LIVE, OFFLINE)
+
+# Upper bound of padded source tokens (texts x longest text) per decoder call
+DEFAULT_MAX_BATCH_TOKENS = 4096
+
+
+def beam_size_for(mode: str) -> int:
+    """
+    Beam size of a decoding mode
+
+    Args:
+        mode: 'live' or 'offline'
+
+    Returns:
+        Configured beam size (1 = greedy decoding)
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode == LIVE:
+        return max(1, settings.translation_live_beam_size)
+    if mode == OFFLINE:
+        return max(1, settings.translation_offline_beam_size)
+    raise ValueError(f"Unknown translation mode '{mode}' (expected one of {', '.join(TRANSLATION_MODES)})")
+
+
+def length_buckets(
+    lengths: list[int], max_batch_size: int, max_batch_tokens: int = DEFAULT_MAX_BATCH_TOKENS
+) -> list[list[int]]:
+    """
+    Group text positions into batches of similar length
+
+    Positions are sorted by length; a bucket closes when one more text would exceed
+    max_batch_size texts or max_batch_tokens padded tokens. A single text longer than the token
+    bound gets its own bucket.
+
+    Args:
+        lengths: Token length of each text
+        max_batch_size: Maximum texts per bucket
+        max_batch_tokens: Maximum padded tokens (texts x longest text) per bucket
+
+    Returns:
+        Buckets of original positions, shortest texts first
+    """
+    buckets: list[list[int]] = []
+    current: list[int] = []
+    for position in sorted(range(len(lengths)), key=lengths.__getitem__):
+        # Sorted ascending, so the text being added is the longest of the bucket
+        padded = (len(current) + 1) * lengths[position]
+        if current and (len(current) >= max_batch_size or padded > max_batch_tokens):
+            buckets.append(current)
+            current = []
+        current.append(position)
+    if current:
+        buckets.append(current)
+    return buckets
+
+
+@dataclass
+class _ModeCounters:
+    beam_size: int = 0
+    requests: int = 0
+    batches: int = 0
+    texts: int = 0
+    source_tokens: int = 0
+    padded_tokens: int = 0
+    target_tokens: int = 0
+    log_prob: float = 0.0
+    seconds: float = 0.0
+
+
+class TranslationModeStats:
+    """Process-wide speed and quality counters per decoding mode"""
+
+    def __init__(self):
+        self._counters = {mode: _ModeCounters() for mode in TRANSLATION_MODES}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        mode: str,
+        *,
+        beam_size: int,
+        batches: int,
+        source_lengths: list[int],
+        padded_tokens: int,
+        target_tokens: int,
+        log_prob: float,
+        seconds: float,
+    ) -> None:
+        """
+        Record one translate_batch() request
+
+        Args:
+            mode: Decoding mode of the request
+            beam_size: Beam size used
+            batches: Decoder calls (length buckets)
+            source_lengths: Source token length of each text
+            padded_tokens: Source tokens including padding, over all buckets
+            target_tokens: Generated tokens
+            log_prob: Summed log-probability of the generated hypotheses
+            seconds: Decoding time
+        """
+        with self._lock:
+            counters = self._counters[mode]
+            counters.beam_size = beam_size
+            counters.requests += 1
+            counters.batches += batches
+            counters.texts += len(source_lengths)
+            counters.source_tokens += sum(source_lengths)
+            counters.padded_tokens += padded_tokens
+            counters.target_tokens += target_tokens
+            counters.log_prob += log_prob
+            counters.seconds += seconds
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Throughput, padding share and mean token log-probability per mode"""
+        with self._lock:
+            return {
+                mode: {
+                    "beam_size": counters.beam_size or beam_size_for(mode),
+                    "requests": counters.requests,
+                    "batches": counters.batches,
+                    "texts": counters.texts,
+                    "target_tokens_per_second": round(counters.target_tokens / counters.seconds, 1)
+                    if counters.seconds
+                    else 0.0,
+                    "padding_ratio": round(1 - counters.source_tokens / counters.padded_tokens, 3)
+                    if counters.padded_tokens
+                    else 0.0,
+                    "mean_token_log_prob": round(counters.log_prob / counters.target_tokens, 4)
+                    if counters.target_tokens
+                    else 0.0,
+                }
+                for mode, counters in self._counters.items()
+            }
+
+
+translation_mode_stats = TranslationModeStats()
+
+
+__all__ = [
+    "LIVE",
+    "OFFLINE",
+    "TRANSLATION_MODES",
+    "TranslationModeStats",
+    "beam_size_for",
+    "length_buckets",
+    "translation_mode_stats",
+]
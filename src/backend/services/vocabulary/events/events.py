@@ -5,6 +5,7 @@ Events represent things that have happened in the vocabulary domain.
 Moved from domains/vocabulary/events.py to eliminate unused DDD layer.
 """
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -141,11 +142,16 @@ class ProgressUpdatedEvent(DomainEvent):
 
 
 class EventBus:
-    """Simple event bus for domain events"""
+    """Simple event bus for domain events
 
-    def __init__(self):
+    Keeps only the most recent events for get_events(), so publishing on request paths does not
+    grow memory without bound.
+    """
+
+    def __init__(self, max_retained_events: int = 1000):
         self._handlers = {}
-        self._events = []
+        self._events: deque[DomainEvent] = deque(maxlen=max_retained_events)
+        self.published = 0
 
     def register_handler(self, event_type: EventType, handler):
         """Register an event handler"""
@@ -156,6 +162,7 @@ class EventBus:
     def publish(self, event: DomainEvent):
         """Publish a domain event"""
         self._events.append(event)
+        self.published += 1
 
         # Call handlers for this event type
         handlers = self._handlers.get(event.event_type, [])
@@ -169,8 +176,8 @@ class EventBus:
                 logging.error(f"Error handling event {event.event_type}: {e}")
 
     def get_events(self) -> list:
-        """Get all published events"""
-        return self._events.copy()
+        """Get the most recently published events (up to max_retained_events)"""
+        return list(self._events)
 
     def clear_events(self):
         """Clear all events"""
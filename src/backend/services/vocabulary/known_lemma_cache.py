@@ -0,0 +1,259 @@
+"""
+Known Lemma Cache - shared per-user sets of known lemmas
+
+Subtitle filtering needs the lemmas a user knows for every chunk, filter request and refilter.
+Loading them means a SELECT DISTINCT over user_vocabulary_progress each time, and power users
+know tens of thousands of lemmas. The cache keeps one UserKnowledge per (user, language): a
+bitset over the language's vocabulary index plus the few known lemmas outside it, so a power
+user costs a few KiB instead of a set of tens of thousands of strings.
+
+Entries are never mutated. VocabularyProgressService and the progress routes publish a
+ProgressUpdatedEvent after committing; its metadata ({"language", "lemmas", "is_known"}, or
+{"language", "known_lemmas", "unknown_lemmas"} for a batch of mixed decisions) patches the
+cached entry into a new UserKnowledge, and events without lemmas drop the user's entries. A
+load that overlaps a change is not stored, so the cache never goes back to a state before the
+change. Entries built over an index that has since been rebuilt are re-projected on access.
+
+Events only reach the cache of the process that published them. With several workers (e.g.
+``uvicorn --workers 4``) a change made through one worker reaches the others when their entry
+expires, so ``ttl_seconds`` bounds how long another worker can filter with a pre-change set.
+
+Usage Example:
+    ```python
+    known = await get_user_knowledge(user_id, "de")  # or known_lemma_cache.get(user_id, "de", loader)
+    publish_event(ProgressUpdatedEvent(user_id=7, metadata={"language": "de", "lemmas": ["haus"], "is_known": True}))
+    known_lemma_cache.get_stats()  # hits, misses, hit rate, entries, memory
+    ```
+
+Thread Safety:
+    Use from one event loop (the event bus calls handlers synchronously on the publisher's loop).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from core.config import settings
+from services.vocabulary.events import DomainEvent, EventBus, EventType, get_event_bus
+from services.vocabulary.user_knowledge import UserKnowledge, load_user_knowledge
+from services.vocabulary.vocabulary_index import VocabularyIndex, vocabulary_index_registry
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+KnowledgeLoader = Callable[[VocabularyIndex | None], Awaitable[UserKnowledge | Iterable[str]]]
+
+
+class KnownLemmaCache:
+    """
+    LRU cache of UserKnowledge (known-lemma bitsets) per user and language.
+
+    Attributes:
+        max_entries (int): Cached (user, language) sets before the least recently used is dropped
+        ttl_seconds (float): Seconds a loaded set is served before it is reloaded from the database
+        hits (int): Lookups served from the cache
+        misses (int): Lookups that loaded from the database
+        patches (int): Cached sets updated in place from progress events
+        invalidations (int): Cached sets dropped by progress events
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 60.0):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Cached (user, language) sets before the least recently used is dropped
+            ttl_seconds: Seconds a loaded set is served before it is reloaded from the database
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.patches = 0
+        self.invalidations = 0
+        self._sets: OrderedDict[CacheKey, UserKnowledge] = OrderedDict()
+        self._expires: dict[CacheKey, float] = {}
+        self._loads: dict[CacheKey, object] = {}  # token per key with a load in flight
+        self._registered_buses: set[int] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Switched by LANGPLUG_KNOWN_LEMMA_CACHE_ENABLED"""
+        return settings.known_lemma_cache_enabled
+
+    @staticmethod
+    def _key(user_id: int | str, language: str) -> CacheKey:
+        return str(user_id), language
+
+    async def get(self, user_id: int | str, language: str, loader: KnowledgeLoader) -> UserKnowledge:
+        """
+        Get the known lemmas of a user, loading them on a miss
+
+        Args:
+            user_id: User ID
+            language: Language code
+            loader: Coroutine function taking the current vocabulary index (None when disabled)
+                and returning the user's UserKnowledge or known lemmas from the database
+
+        Returns:
+            UserKnowledge (a read-only set of lowercase lemmas)
+        """
+        index = await vocabulary_index_registry.get(language)
+        if not self.enabled:
+            return self._freeze(await loader(index), index)
+
+        self.register_event_handlers()
+        key = self._key(user_id, language)
+        cached = self._sets.get(key)
+        if cached is not None and self._expires[key] <= time.monotonic():
+            # Changes made through other worker processes publish no event here
+            self._drop(key)
+            cached = None
+        if cached is not None:
+            self._sets.move_to_end(key)
+            self.hits += 1
+            if cached.index is not index:
+                cached = self._sets[key] = cached.rebase(index)
+            return cached
+
+        self.misses += 1
+        token = self._loads.setdefault(key, object())
+        try:
+            lemmas = self._freeze(await loader(index), index)
+        finally:
+            # A progress event while loading removes the token; only a load that still holds it stores
+            unchanged = self._loads.get(key) is token
+            if unchanged:
+                del self._loads[key]
+
+        if unchanged:
+            self._sets[key] = lemmas
+            self._sets.move_to_end(key)
+            self._expires[key] = time.monotonic() + self.ttl_seconds
+            while len(self._sets) > self.max_entries:
+                self._drop(next(iter(self._sets)))
+        return lemmas
+
+    @staticmethod
+    def _freeze(lemmas: UserKnowledge | Iterable[str], index: VocabularyIndex | None) -> UserKnowledge:
+        if isinstance(lemmas, UserKnowledge):
+            return lemmas.rebase(index)
+        return UserKnowledge.from_lemmas(lemmas, index)
+
+    def _drop(self, key: CacheKey) -> None:
+        del self._sets[key]
+        del self._expires[key]
+
+    def _cancel_load(self, key: CacheKey) -> None:
+        self._loads.pop(key, None)
+
+    def patch(self, user_id: int | str, language: str, lemmas: Iterable[str], is_known: bool) -> None:
+        """
+        Apply a committed known/unknown change to a cached entry
+
+        Args:
+            user_id: User ID
+            language: Language code
+            lemmas: Lemmas whose status changed
+            is_known: New status
+        """
+        key = self._key(user_id, language)
+        self._cancel_load(key)
+        cached = self._sets.get(key)
+        if cached is None:
+            return
+
+        self._sets[key] = cached.with_lemmas(lemmas, is_known)
+        self.patches += 1
+
+    def invalidate(self, user_id: int | str, language: str | None = None) -> None:
+        """
+        Drop a user's cached sets
+
+        Args:
+            user_id: User ID
+            language: Language code, or None for all languages
+        """
+        user_key = str(user_id)
+        keys = [key for key in {*self._sets, *self._loads} if key[0] == user_key and language in (None, key[1])]
+        for key in keys:
+            self._cancel_load(key)
+            if key in self._sets:
+                self._drop(key)
+                self.invalidations += 1
+
+    def handle_progress_updated(self, event: DomainEvent) -> None:
+        """EventBus handler: patch the user's set, or drop it when the event names no lemmas"""
+        if event.user_id is None:
+            return
+
+        metadata = event.metadata or {}
+        language = metadata.get("language")
+        lemmas = metadata.get("lemmas")
+        if language is not None and lemmas is not None and "is_known" in metadata:
+            self.patch(event.user_id, language, lemmas, bool(metadata["is_known"]))
+        elif language is not None and "known_lemmas" in metadata and "unknown_lemmas" in metadata:
+            self.patch(event.user_id, language, metadata["known_lemmas"], True)
+            self.patch(event.user_id, language, metadata["unknown_lemmas"], False)
+        else:
+            self.invalidate(event.user_id, language)
+
+    def register_event_handlers(self, event_bus: EventBus | None = None) -> None:
+        """Subscribe to ProgressUpdatedEvent (idempotent per event bus)"""
+        event_bus = event_bus or get_event_bus()
+        if id(event_bus) in self._registered_buses:
+            return
+
+        event_bus.register_handler(EventType.PROGRESS_UPDATED, self.handle_progress_updated)
+        self._registered_buses.add(id(event_bus))
+
+    def memory_bytes(self) -> int:
+        """Approximate memory of the cached bitsets and leftover lemma sets"""
+        return sum(knowledge.memory_bytes() for knowledge in self._sets.values())
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit rate, patch/invalidation counters, size and memory"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "patches": self.patches,
+            "invalidations": self.invalidations,
+            "entries": len(self._sets),
+            "lemmas": sum(len(lemmas) for lemmas in self._sets.values()),
+            "memory_bytes": self.memory_bytes(),
+        }
+
+    def clear(self) -> None:
+        """Drop all cached sets"""
+        self._sets.clear()
+        self._expires.clear()
+        self._loads.clear()
+
+
+# Global cache instance
+known_lemma_cache = KnownLemmaCache(
+    max_entries=settings.known_lemma_cache_max_users, ttl_seconds=settings.known_lemma_cache_ttl_seconds
+)
+
+
+async def get_user_knowledge(user_id: int | str, language: str) -> UserKnowledge:
+    """
+    Get a user's known lemmas through the shared cache
+
+    Args:
+        user_id: User ID
+        language: Language code
+
+    Returns:
+        UserKnowledge over the current vocabulary index of the language
+    """
+    return await known_lemma_cache.get(user_id, language, lambda index: load_user_knowledge(user_id, language, index))
+
+
+__all__ = ["KnownLemmaCache", "get_user_knowledge", "known_lemma_cache"]
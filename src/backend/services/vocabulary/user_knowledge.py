@@ -0,0 +1,262 @@
+"""
+User Knowledge - a user's known lemmas as a bitset over the vocabulary index
+
+The vocabulary index numbers its records densely, so "which vocabulary words does this user
+know" fits in one Python int with a bit per record (about 6 KiB for 50k words). Membership is
+a bit test, and the questions subtitle filtering, statistics and games ask become bitwise
+operations on the index's level masks:
+
+    is "haus" known          knowledge.bits >> index.lemma_record("haus") & 1
+    known at level B1        (knowledge.bits & index.level_mask(["B1"])).bit_count()
+    unknown at A1/A2         index.level_mask(["A1", "A2"]) & ~knowledge.bits
+
+All records of a known lemma are set, so every stored word form of it counts as known. Known
+lemmas that are not in the index (user-marked words without a vocabulary row) are kept in a
+small frozenset next to the bitset.
+
+Snapshots are persisted in user_vocabulary_knowledge, keyed by the index fingerprint and a
+stamp of the user's user_vocabulary_progress rows (row count, known count, known-id checksum
+and latest updated_at). Every progress write sets updated_at, so flipping one word and back, or
+swapping which ids are known, still changes the stamp. A cold load first reads the stamp with
+one aggregate query and only falls back to reading every known lemma when the snapshot is
+missing or stale.
+
+Usage Example:
+    ```python
+    knowledge = await get_user_knowledge(user_id, "de")  # cached, see known_lemma_cache
+    "haus" in knowledge
+    knowledge.level_coverage()  # {"A1": {"total": 800, "known": 640}, ...}
+    ```
+"""
+
+import logging
+import sys
+from collections.abc import Iterable, Set
+from itertools import islice
+
+from sqlalchemy import case, func, select
+
+from database.models import UserVocabularyKnowledge, UserVocabularyProgress
+from services.vocabulary.vocabulary_index import VocabularyIndex, records_in
+
+logger = logging.getLogger(__name__)
+
+
+class UserKnowledge(Set):
+    """
+    Immutable set of lowercase lemmas a user knows, stored as an index bitset plus leftovers.
+
+    Behaves as a read-only set of strings (membership, iteration, len, == with frozensets).
+
+    Attributes:
+        index (VocabularyIndex | None): Index the bit positions refer to (None: everything in extra)
+        bits (int): Bit n set if record n of the index is known
+        extra (frozenset[str]): Known lemmas that are not in the index
+    """
+
+    __slots__ = ("bits", "extra", "index")
+
+    def __init__(self, index: VocabularyIndex | None, bits: int = 0, extra: frozenset[str] = frozenset()):
+        self.index = index
+        self.bits = bits
+        self.extra = extra
+
+    @classmethod
+    def from_lemmas(cls, lemmas: Iterable[str], index: VocabularyIndex | None) -> "UserKnowledge":
+        """
+        Build from known lemmas
+
+        Args:
+            lemmas: Known lemmas (any case)
+            index: Vocabulary index of the language, or None when the index is disabled
+
+        Returns:
+            UserKnowledge
+        """
+        keys = {sys.intern(lemma.lower()) for lemma in lemmas}
+        if index is None:
+            return cls(None, 0, frozenset(keys))
+
+        extra = frozenset(key for key in keys if index.lemma_record(key) is None)
+        return cls(index, index.lemma_mask(keys - extra), extra)
+
+    @classmethod
+    def from_blob(cls, index: VocabularyIndex, blob: bytes, extra_lemmas: str) -> "UserKnowledge":
+        """Restore a snapshot written by to_blob()"""
+        extra = frozenset(sys.intern(lemma) for lemma in extra_lemmas.split("\n") if lemma)
+        return cls(index, int.from_bytes(blob, "little"), extra)
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[str]) -> frozenset[str]:
+        # Set operators (|, &, -) return plain frozensets
+        return frozenset(it)
+
+    def to_blob(self) -> bytes:
+        """Bitset as little-endian bytes, one bit per index record"""
+        size = len(self.index) if self.index is not None else 0
+        return self.bits.to_bytes((size + 7) // 8, "little")
+
+    def __contains__(self, lemma: object) -> bool:
+        if not isinstance(lemma, str):
+            return False
+        key = lemma.lower()
+        if self.index is not None:
+            record = self.index.lemma_record(key)
+            if record is not None:
+                return bool(self.bits >> record & 1)
+        return key in self.extra
+
+    def __len__(self) -> int:
+        known_lemmas = (self.bits & self.index.lemma_head_mask).bit_count() if self.index is not None else 0
+        return known_lemmas + len(self.extra)
+
+    def __iter__(self):
+        if self.index is not None:
+            yield from self.index.lemmas_in(self.bits)
+        yield from self.extra
+
+    def __repr__(self) -> str:
+        return f"UserKnowledge(known={len(self)}, extra={len(self.extra)})"
+
+    def with_lemmas(self, lemmas: Iterable[str], is_known: bool) -> "UserKnowledge":
+        """
+        Return a copy with lemmas marked known or unknown
+
+        Args:
+            lemmas: Lemmas whose status changed (any case)
+            is_known: New status
+
+        Returns:
+            New UserKnowledge
+        """
+        keys = {sys.intern(lemma.lower()) for lemma in lemmas}
+        mask = 0
+        if self.index is not None:
+            mask = self.index.lemma_mask(keys)
+            keys = {key for key in keys if self.index.lemma_record(key) is None}
+
+        if is_known:
+            return UserKnowledge(self.index, self.bits | mask, self.extra | keys)
+        return UserKnowledge(self.index, self.bits & ~mask, self.extra - keys)
+
+    def rebase(self, index: VocabularyIndex | None) -> "UserKnowledge":
+        """Re-project onto another index (e.g. after a vocabulary rebuild)"""
+        if index is self.index:
+            return self
+        return UserKnowledge.from_lemmas(self, index)
+
+    def level_coverage(self) -> dict[str, dict[str, int]]:
+        """
+        Vocabulary words and known words per difficulty level (one popcount per level)
+
+        Returns:
+            {level: {"total": records, "known": known records}}, empty when the index is disabled
+        """
+        if self.index is None:
+            return {}
+        return {
+            level: {"total": mask.bit_count(), "known": (self.bits & mask).bit_count()}
+            for level, mask in self.index.level_masks.items()
+        }
+
+    def unknown_records(self, levels: Iterable[str], limit: int) -> list[int]:
+        """
+        Index records at the given levels the user does not know, in vocabulary id order
+
+        Args:
+            levels: CEFR levels
+            limit: Maximum records
+
+        Returns:
+            Record numbers (look them up with index.record_info)
+        """
+        if self.index is None:
+            return []
+        return list(islice(records_in(self.index.level_mask(levels) & ~self.bits), limit))
+
+    def memory_bytes(self) -> int:
+        """Approximate memory of the bitset and the leftover set (lemma strings are interned)"""
+        return sys.getsizeof(self.bits) + sys.getsizeof(self.extra)
+
+
+async def _progress_stamp(session, user_id: int, language: str) -> str:
+    """Cheap fingerprint of a user's progress rows: counts, known-id checksum and latest change"""
+    known_id = case((UserVocabularyProgress.is_known, UserVocabularyProgress.id), else_=0)
+    result = await session.execute(
+        select(
+            func.count(UserVocabularyProgress.id),
+            func.count(UserVocabularyProgress.id).filter(UserVocabularyProgress.is_known),
+            func.coalesce(func.sum(known_id), 0),
+            func.max(UserVocabularyProgress.updated_at),
+        ).where(UserVocabularyProgress.user_id == user_id, UserVocabularyProgress.language == language)
+    )
+    count, known_count, id_sum, updated_at = result.one()
+    return f"{count}:{known_count}:{id_sum}:{updated_at or ''}"
+
+
+async def load_user_knowledge(
+    user_id: int | str, language: str, index: VocabularyIndex | None, session_factory=None
+) -> UserKnowledge:
+    """
+    Load a user's knowledge, from the persisted snapshot when it is still current
+
+    Args:
+        user_id: User ID
+        language: Language code
+        index: Current vocabulary index of the language (None: plain lemma set, no snapshot)
+        session_factory: Async session factory (defaults to AsyncSessionLocal)
+
+    Returns:
+        UserKnowledge over the given index
+    """
+    if session_factory is None:
+        from core.database import AsyncSessionLocal
+
+        session_factory = AsyncSessionLocal
+
+    user_id = int(user_id)
+    async with session_factory() as session:
+        if index is not None:
+            stamp = await _progress_stamp(session, user_id, language)
+            snapshot = await session.get(UserVocabularyKnowledge, (user_id, language))
+            if (
+                snapshot is not None
+                and snapshot.index_fingerprint == index.fingerprint
+                and snapshot.progress_stamp == stamp
+            ):
+                logger.debug(f"Restored knowledge snapshot of user {user_id} ({language})")
+                return UserKnowledge.from_blob(index, snapshot.known_bits, snapshot.extra_lemmas)
+
+        result = await session.execute(
+            select(UserVocabularyProgress.lemma)
+            .where(
+                UserVocabularyProgress.user_id == user_id,
+                UserVocabularyProgress.language == language,
+                UserVocabularyProgress.is_known,
+            )
+            .distinct()
+        )
+        knowledge = UserKnowledge.from_lemmas(result.scalars().all(), index)
+        logger.debug(f"Loaded {len(knowledge)} known lemmas for user {user_id} ({language})")
+
+        if index is not None:
+            try:
+                await session.merge(
+                    UserVocabularyKnowledge(
+                        user_id=user_id,
+                        language=language,
+                        index_fingerprint=index.fingerprint,
+                        progress_stamp=stamp,
+                        known_bits=knowledge.to_blob(),
+                        extra_lemmas="\n".join(sorted(knowledge.extra)),
+                    )
+                )
+                await session.commit()
+            except Exception as e:
+                # The snapshot only saves the next cold load; the knowledge itself is complete
+                await session.rollback()
+                logger.warning(f"Failed to store knowledge snapshot of user {user_id} ({language}): {e}")
+        return knowledge
+
+
+__all__ = ["UserKnowledge", "load_user_knowledge"]
@@ -0,0 +1,153 @@
+"""
+Vocabulary Batch Progress - set-based writes to user_vocabulary_progress
+
+VocabularyProgressService marks one word per call: a lookup, an upsert, a commit and an event.
+The vocabulary game ends with dozens of swipes at once, so this module resolves a whole batch of
+decisions in bulk and writes them with one INSERT ... ON CONFLICT statement, one commit and one
+ProgressUpdatedEvent. It also holds the dialect switch the set-based progress upserts share.
+
+Usage Example:
+    ```python
+    result = await mark_words_known(None, user_id=123, decisions=[("Haus", True)], language="de", db=db)
+    stmt = dialect_insert(db)(UserVocabularyProgress).values(rows)
+    ```
+"""
+
+import logging
+from typing import Any
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import UserVocabularyProgress
+from services.vocabulary.events import ProgressUpdatedEvent, publish_event
+from services.vocabulary.vocabulary_index import vocabulary_index_registry
+
+logger = logging.getLogger(__name__)
+
+
+def dialect_insert(db: AsyncSession):
+    """INSERT construct with ON CONFLICT support for the session's database (SQLite or PostgreSQL)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    raise NotImplementedError(f"Progress upserts are not supported on {dialect}")
+
+
+async def _resolve_words(
+    query_service, words: list[str], language: str, db: AsyncSession
+) -> tuple[dict[str, str], dict[str, dict[str, Any]]]:
+    """
+    Lemmatize words and look them up, in the vocabulary index first and then with one bulk query
+
+    Returns:
+        (spaCy lemma per word, word info per word in the shape of get_word_info)
+    """
+    lemmas = {word: query_service.lemmatization_service.lemmatize(word) for word in words}
+
+    word_infos: dict[str, dict[str, Any]] = {}
+    index = await vocabulary_index_registry.get(language)
+    if index is not None:
+        for word, lemma in lemmas.items():
+            info = index.lookup(word, lemma)
+            if info is not None:
+                word_infos[word] = info
+
+    unresolved = [(word, lemma) for word, lemma in lemmas.items() if word not in word_infos]
+    if unresolved:
+        word_infos.update(await query_service.get_words_info(unresolved, language, db))
+    return lemmas, word_infos
+
+
+def _progress_upsert(db: AsyncSession, rows: list[dict[str, Any]]):
+    """
+    Multi-row upsert with mark_word_known's update rules: confidence moves by one within 0..5
+    and the review is counted
+    """
+    confidence = UserVocabularyProgress.confidence_level
+    stmt = dialect_insert(db)(UserVocabularyProgress).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            UserVocabularyProgress.user_id,
+            UserVocabularyProgress.lemma,
+            UserVocabularyProgress.language,
+        ],
+        set_={
+            "is_known": stmt.excluded.is_known,
+            "confidence_level": case(
+                (stmt.excluded.is_known, case((confidence < 5, confidence + 1), else_=5)),
+                else_=case((confidence > 0, confidence - 1), else_=0),
+            ),
+            "review_count": UserVocabularyProgress.review_count + 1,
+            "updated_at": func.now(),
+        },
+    )
+
+
+async def mark_words_known(
+    query_service, user_id: int, decisions: list[tuple[str, bool]], language: str, db: AsyncSession
+) -> dict[str, Any]:
+    """
+    Mark many words as known or unknown for a user, e.g. the swipes of one game
+
+    Lemmas are chosen like mark_word_known: the vocabulary lemma for words in the vocabulary,
+    the spaCy lemma otherwise, so both paths write the same progress row. A lemma decided more
+    than once takes the last decision.
+
+    Args:
+        query_service: VocabularyQueryService, or None for the default instance
+        user_id: User ID
+        decisions: (word or lemma, is_known) pairs in the order they were made
+        language: Language code
+        db: Database session
+
+    Returns:
+        Dictionary with success, language, updated_count and one result per decision
+    """
+    if query_service is None:
+        from .vocabulary_query_service import get_vocabulary_query_service
+
+        query_service = get_vocabulary_query_service()
+
+    words = list(dict.fromkeys(word for word, _ in decisions))
+    lemmas, word_infos = await _resolve_words(query_service, words, language, db)
+
+    rows: dict[str, dict[str, Any]] = {}
+    results = []
+    for word, is_known in decisions:
+        info = word_infos[word]
+        found = bool(info.get("found"))
+        lemma = info["lemma"] if found else lemmas[word]
+        rows[lemma] = {
+            "user_id": user_id,
+            "vocabulary_id": info["id"] if found else None,
+            "lemma": lemma,
+            "language": language,
+            "is_known": is_known,
+            "confidence_level": 1 if is_known else 0,
+            "review_count": 1,
+        }
+        level = info["difficulty_level"] if found else "unknown"
+        results.append({"word": word, "lemma": lemma, "level": level, "is_known": is_known})
+
+    if not rows:
+        return {"success": True, "language": language, "updated_count": 0, "results": []}
+
+    await db.execute(_progress_upsert(db, list(rows.values())))
+    await db.commit()  # One commit for the whole batch
+
+    known = sorted(lemma for lemma, row in rows.items() if row["is_known"])
+    unknown = sorted(lemma for lemma, row in rows.items() if not row["is_known"])
+    publish_event(
+        ProgressUpdatedEvent(
+            user_id=user_id,
+            metadata={"language": language, "known_lemmas": known, "unknown_lemmas": unknown},
+            action="mark_known_batch",
+        )
+    )
+    logger.debug(f"Marked {len(rows)} lemmas for user {user_id} in one batch ({len(known)} known)")
+
+    return {"success": True, "language": language, "updated_count": len(rows), "results": results}
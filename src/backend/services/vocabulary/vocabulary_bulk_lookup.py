@@ -0,0 +1,138 @@
+"""
+Vocabulary Bulk Lookup - set-based reads of vocabulary_words
+
+VocabularyQueryService.get_word_info resolves one word with one query. Subtitle chunks and game
+batches need hundreds of words at once, so this module resolves a whole set of (word, lemma)
+pairs with a few chunked IN (...) queries on lower(lemma) and lower(word), which are covered by
+the idx_vocabulary_lang_lower_* expression indexes: by lemma first, then by surface form. It
+is the database counterpart of VocabularyIndex.lookup and produces the same word info shape, so
+callers do not care which of the two answered. It only reads; tracking the words that were not
+found (UnknownWord upserts) stays with the query service, which owns that side effect.
+
+Usage Example:
+    ```python
+    found, missing = await lookup_words({"läuft": "laufen", "Haus": "haus"}, "de", db)
+    info = found.get("läuft") or format_unknown_word_info("läuft", "laufen", "de")
+    ```
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import VocabularyWord
+
+# Keep IN (...) lists well below SQLite's bound-parameter limit
+BULK_LOOKUP_CHUNK_SIZE = 500
+
+
+def chunked(values: list, size: int = BULK_LOOKUP_CHUNK_SIZE) -> Iterator[list]:
+    """Split values into lists small enough for one IN (...) list or multi-row VALUES"""
+    for i in range(0, len(values), size):
+        yield values[i : i + size]
+
+
+def format_word_info(word: str, vocab_word: VocabularyWord) -> dict[str, Any]:
+    """Format word info for a word found in the vocabulary database"""
+    return {
+        "id": vocab_word.id,
+        "word": word,
+        "lemma": vocab_word.lemma,
+        "found_word": vocab_word.word,
+        "language": vocab_word.language,
+        "difficulty_level": vocab_word.difficulty_level,
+        "part_of_speech": vocab_word.part_of_speech,
+        "gender": vocab_word.gender,
+        "translation_en": vocab_word.translation_en,
+        "pronunciation": vocab_word.pronunciation,
+        "notes": vocab_word.notes,
+        "found": True,
+    }
+
+
+def format_unknown_word_info(word: str, lemma: str, language: str) -> dict[str, Any]:
+    """Format word info for a word missing from the vocabulary database"""
+    return {
+        "word": word,
+        "lemma": lemma,
+        "language": language,
+        "found": False,
+        "message": "Word not in vocabulary database",
+    }
+
+
+def _ascii_lower(value: str) -> str:
+    return "".join(char.lower() if char.isascii() else char for char in value)
+
+
+def _lowered_forms(value: str) -> set[str]:
+    """
+    What lower() may return for stored spellings of a value
+
+    PostgreSQL folds the whole string; SQLite's lower() only folds ASCII letters, so a stored
+    "Über" or "ÄRA" keeps its capital umlaut there.
+    """
+    return {value.lower(), _ascii_lower(value.capitalize()), _ascii_lower(value.upper())}
+
+
+async def _fetch_case_insensitive(
+    db: AsyncSession, column, values: set[str], language: str
+) -> dict[str, VocabularyWord]:
+    """
+    Fetch vocabulary rows whose column equals any value, ignoring case ("usa" finds "USA",
+    "iphone" finds "iPhone")
+
+    Returns:
+        Dictionary mapping lowercased column value to the first matching row (by id)
+    """
+    lowered = sorted({form for value in values for form in _lowered_forms(value)})
+    rows: dict[str, VocabularyWord] = {}
+
+    for chunk in chunked(lowered):
+        stmt = (
+            select(VocabularyWord)
+            .where(VocabularyWord.language == language, func.lower(column).in_(chunk))
+            .order_by(VocabularyWord.id)
+        )
+        for vocab_word in (await db.execute(stmt)).scalars():
+            rows.setdefault(getattr(vocab_word, column.key).lower(), vocab_word)
+
+    return rows
+
+
+async def lookup_words(
+    lemmas: dict[str, str], language: str, db: AsyncSession
+) -> tuple[dict[str, dict[str, Any]], set[str]]:
+    """
+    Look up many words in vocabulary_words
+
+    Matching ignores case on both sides: lower(column) IN (lowered values), served by the
+    idx_vocabulary_lang_lower_lemma / idx_vocabulary_lang_lower_word expression indexes.
+
+    Args:
+        lemmas: Lowercase lemma per distinct word
+        language: Language code
+        db: Database session
+
+    Returns:
+        (word info per found word, words not in the vocabulary)
+    """
+    if not lemmas:
+        return {}, set()
+
+    by_lemma = await _fetch_case_insensitive(db, VocabularyWord.lemma, set(lemmas.values()), language)
+
+    unresolved = {word for word, lemma in lemmas.items() if lemma not in by_lemma}
+    by_word = await _fetch_case_insensitive(db, VocabularyWord.word, unresolved, language) if unresolved else {}
+
+    found: dict[str, dict[str, Any]] = {}
+    for word, lemma in lemmas.items():
+        vocab_word = by_lemma.get(lemma) or by_word.get(word.lower())
+        if vocab_word:
+            found[word] = format_word_info(word, vocab_word)
+    return found, set(lemmas) - set(found)
+
+
+__all__ = ["BULK_LOOKUP_CHUNK_SIZE", "chunked", "format_unknown_word_info", "format_word_info", "lookup_words"]
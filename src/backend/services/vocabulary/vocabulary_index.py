@@ -0,0 +1,468 @@
+"""
+Vocabulary Index - In-process, read-only vocabulary lookup
+
+Subtitle filtering needs difficulty/POS/translation for every token of a chunk. Instead of
+querying vocabulary_words per word (or per chunk), the whole table for a language is loaded
+once into a compact immutable index and filtering becomes a pure in-memory lookup.
+
+Storage layout (per language):
+    - lemma map / surface-form map: interned lowercase string -> record number
+    - per-record arrays: vocabulary id, difficulty id, POS id, translation offset, next record
+      with the same lemma
+    - small interned tables for difficulty levels and parts of speech
+    - all translations concatenated into one string, sliced by offset
+    - one bitmask (Python int, bit = record number) per difficulty level
+
+Record numbers are dense, so sets of records - the records of a CEFR level, or the words a user
+knows (UserKnowledge) - are stored as int bitsets and combined with &, | and int.bit_count().
+
+Indexes are never mutated. VocabularyAddedEvent marks the language stale; the registry
+rebuilds in the background and swaps the new index in, so readers always see a complete index.
+
+Usage Example:
+    ```python
+    index = await vocabulary_index_registry.get("de")
+    if index:
+        info = index.lookup("läuft", lemma="laufen")
+        # {"lemma": "laufen", "difficulty_level": "A2", "found": True, ...} or None
+    ```
+
+Thread Safety:
+    Reads yes (immutable). Builds run on the event loop and are serialized per language.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sys
+import time
+from array import array
+from collections.abc import Iterable, Iterator
+from functools import cached_property
+from typing import Any
+
+from sqlalchemy import select
+
+from core.config import settings
+from database.models import VocabularyWord
+from services.vocabulary.events import DomainEvent, EventBus, EventType, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+# Difficulty table starts in CEFR order so difficulty ids double as ranks
+_CEFR_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+
+# (id, word, lemma, difficulty_level, part_of_speech, translation_en)
+VocabularyRow = tuple[int, str, str, str, str | None, str | None]
+
+
+def records_mask(records: Iterable[int], size: int) -> int:
+    """
+    Build a record bitset
+
+    Args:
+        records: Record numbers to set
+        size: Number of records in the index
+
+    Returns:
+        Bitset with bit n set for every record n
+    """
+    mask = bytearray((size + 7) // 8)
+    for record in records:
+        mask[record >> 3] |= 1 << (record & 7)
+    return int.from_bytes(mask, "little")
+
+
+def records_in(mask: int) -> Iterator[int]:
+    """Record numbers of the set bits of a bitset, in ascending order"""
+    for byte_index, byte in enumerate(mask.to_bytes((mask.bit_length() + 7) // 8, "little")):
+        if byte:
+            base = byte_index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    yield base + bit
+
+
+class VocabularyIndex:
+    """
+    Immutable lemma/surface-form index over vocabulary_words for one language.
+
+    Attributes:
+        language (str): Language code
+        build_seconds (float): Time spent building the index (including the database read)
+    """
+
+    def __init__(self, language: str, rows: Iterable[VocabularyRow], build_seconds: float | None = None):
+        """
+        Build the index from vocabulary rows
+
+        Args:
+            language: Language code
+            rows: Vocabulary rows ordered by id (first row wins for duplicate lemmas/words)
+            build_seconds: Externally measured build time (defaults to the in-memory build time)
+        """
+        started = time.perf_counter()
+
+        self.language = language
+        self._vocabulary_ids = array("q")
+        self._difficulty_ids = array("B")
+        self._pos_ids = array("H")
+        self._translation_offsets = array("I", [0])
+        self._next_lemma_records = array("i")
+        self._lemmas: list[str] = []
+        self._lemma_keys: list[str] = []
+        self._words: list[str] = []
+        self._lemma_records: dict[str, int] = {}
+        self._word_records: dict[str, int] = {}
+
+        difficulties: dict[str, int] = {level: i for i, level in enumerate(_CEFR_LEVELS)}
+        last_lemma_records: dict[str, int] = {}
+        parts_of_speech: dict[str | None, int] = {None: 0}
+        translations: list[str] = []
+        offset = 0
+
+        for vocabulary_id, word, lemma, difficulty_level, part_of_speech, translation in rows:
+            record = len(self._vocabulary_ids)
+
+            self._vocabulary_ids.append(vocabulary_id)
+            self._difficulty_ids.append(difficulties.setdefault(difficulty_level, len(difficulties)))
+            self._pos_ids.append(parts_of_speech.setdefault(part_of_speech, len(parts_of_speech)))
+            translations.append(translation or "")
+            offset += len(translations[-1])
+            self._translation_offsets.append(offset)
+            self._lemmas.append(sys.intern(lemma))
+            self._words.append(sys.intern(word))
+
+            lemma_key = sys.intern(lemma.lower())
+            self._lemma_keys.append(lemma_key)
+            self._lemma_records.setdefault(lemma_key, record)
+            self._word_records.setdefault(sys.intern(word.lower()), record)
+
+            # Chain the records of a lemma so all of them can be set in a bitset
+            self._next_lemma_records.append(-1)
+            previous = last_lemma_records.get(lemma_key)
+            if previous is not None:
+                self._next_lemma_records[previous] = record
+            last_lemma_records[lemma_key] = record
+
+        self._difficulty_table = tuple(difficulties)
+        self._pos_table = tuple(parts_of_speech)
+        self._translations = "".join(translations)
+
+        size = len(self._vocabulary_ids)
+        level_records: list[list[int]] = [[] for _ in self._difficulty_table]
+        for record, difficulty_id in enumerate(self._difficulty_ids):
+            level_records[difficulty_id].append(record)
+        self._level_masks = {
+            level: records_mask(records, size)
+            for level, records in zip(self._difficulty_table, level_records, strict=True)
+            if records
+        }
+        # One record per lemma, so popcounts over it count lemmas rather than surface forms
+        self.lemma_head_mask = records_mask(self._lemma_records.values(), size)
+
+        self.build_seconds = build_seconds if build_seconds is not None else time.perf_counter() - started
+        self.built_at = time.time()
+
+    def __len__(self) -> int:
+        return len(self._vocabulary_ids)
+
+    def _find_record(self, word: str, lemma: str | None) -> int | None:
+        if lemma:
+            record = self._lemma_records.get(lemma.lower())
+            if record is not None:
+                return record
+
+        word = word.lower()
+        record = self._word_records.get(word)
+        if record is None and not lemma:
+            record = self._lemma_records.get(word)
+        return record
+
+    def lookup(self, word: str, lemma: str | None = None) -> dict[str, Any] | None:
+        """
+        Look up a word, by lemma first and then by surface form
+
+        Args:
+            word: Word as it appears in the subtitle
+            lemma: Lemma from spaCy (optional)
+
+        Returns:
+            Word info in the shape returned by VocabularyQueryService.get_word_info, or None if unknown
+        """
+        record = self._find_record(word, lemma)
+        if record is None:
+            return None
+
+        return {"word": word, **self.record_info(record), "found": True}
+
+    def record_info(self, record: int) -> dict[str, Any]:
+        """
+        Get the stored fields of a record
+
+        Args:
+            record: Record number
+
+        Returns:
+            Vocabulary id, lemma, stored word form, difficulty, POS and translation
+        """
+        start, end = self._translation_offsets[record], self._translation_offsets[record + 1]
+        return {
+            "id": self._vocabulary_ids[record],
+            "lemma": self._lemmas[record],
+            "found_word": self._words[record],
+            "language": self.language,
+            "difficulty_level": self._difficulty_table[self._difficulty_ids[record]],
+            "part_of_speech": self._pos_table[self._pos_ids[record]],
+            "translation_en": self._translations[start:end] or None,
+        }
+
+    def lemma_record(self, lemma_key: str) -> int | None:
+        """First record of a lowercase lemma, or None if the lemma is not in the index"""
+        return self._lemma_records.get(lemma_key)
+
+    def lemma_mask(self, lemma_keys: Iterable[str]) -> int:
+        """
+        Bitset of all records (every stored word form) of the given lemmas
+
+        Args:
+            lemma_keys: Lowercase lemmas; lemmas not in the index are ignored
+
+        Returns:
+            Record bitset
+        """
+        records: list[int] = []
+        for lemma_key in lemma_keys:
+            record = self._lemma_records.get(lemma_key, -1)
+            while record >= 0:
+                records.append(record)
+                record = self._next_lemma_records[record]
+        return records_mask(records, len(self))
+
+    def lemmas_in(self, mask: int) -> list[str]:
+        """Distinct lowercase lemmas of the records in a bitset"""
+        return [self._lemma_keys[record] for record in records_in(mask & self.lemma_head_mask)]
+
+    def level_mask(self, levels: Iterable[str]) -> int:
+        """
+        Bitset of the records at the given difficulty levels
+
+        Args:
+            levels: CEFR levels (unknown levels are ignored)
+
+        Returns:
+            Record bitset
+        """
+        mask = 0
+        for level in levels:
+            mask |= self._level_masks.get(level, 0)
+        return mask
+
+    @property
+    def level_masks(self) -> dict[str, int]:
+        """Record bitset per difficulty level"""
+        return self._level_masks
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Hash of the record layout; bitsets are only valid for an index with the same fingerprint"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.language.encode())
+        digest.update(self._vocabulary_ids.tobytes())
+        digest.update("\0".join(self._lemma_keys).encode())
+        return digest.hexdigest()
+
+    def memory_bytes(self) -> int:
+        """Approximate memory footprint of the index structures in bytes"""
+        containers = (
+            self._vocabulary_ids,
+            self._difficulty_ids,
+            self._pos_ids,
+            self._translation_offsets,
+            self._next_lemma_records,
+            self._lemmas,
+            self._lemma_keys,
+            self._words,
+            self._lemma_records,
+            self._word_records,
+            self._translations,
+            self.lemma_head_mask,
+            *self._level_masks.values(),
+        )
+        strings = set(self._lemmas) | set(self._words) | self._lemma_records.keys() | self._word_records.keys()
+        return sum(sys.getsizeof(c) for c in containers) + sum(sys.getsizeof(s) for s in strings)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get size, memory footprint and build time"""
+        return {
+            "language": self.language,
+            "entries": len(self),
+            "lemmas": len(self._lemma_records),
+            "surface_forms": len(self._word_records),
+            "memory_bytes": self.memory_bytes(),
+            "build_seconds": round(self.build_seconds, 4),
+            "built_at": self.built_at,
+        }
+
+    @classmethod
+    async def load(cls, language: str, session_factory=None) -> "VocabularyIndex":
+        """
+        Build the index for a language from vocabulary_words
+
+        Args:
+            language: Language code
+            session_factory: Async session factory (defaults to AsyncSessionLocal)
+
+        Returns:
+            Newly built VocabularyIndex
+        """
+        if session_factory is None:
+            from core.database import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+
+        started = time.perf_counter()
+        async with session_factory() as session:
+            result = await session.execute(
+                select(
+                    VocabularyWord.id,
+                    VocabularyWord.word,
+                    VocabularyWord.lemma,
+                    VocabularyWord.difficulty_level,
+                    VocabularyWord.part_of_speech,
+                    VocabularyWord.translation_en,
+                )
+                .where(VocabularyWord.language == language)
+                .order_by(VocabularyWord.id)
+            )
+            rows = result.all()
+
+        index = cls(language, rows)
+        index.build_seconds = time.perf_counter() - started
+        return index
+
+
+class VocabularyIndexRegistry:
+    """
+    Process-wide holder of one VocabularyIndex per language, rebuilt on VocabularyAddedEvent.
+    """
+
+    def __init__(self, session_factory=None):
+        """
+        Initialize registry
+
+        Args:
+            session_factory: Async session factory used for builds (defaults to AsyncSessionLocal)
+        """
+        self._session_factory = session_factory
+        self._indexes: dict[str, VocabularyIndex] = {}
+        self._stale: set[str] = set()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._registered_buses: set[int] = set()
+        self._rebuild_tasks: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Switched by LANGPLUG_VOCABULARY_INDEX_ENABLED"""
+        return settings.vocabulary_index_enabled
+
+    async def get(self, language: str) -> VocabularyIndex | None:
+        """
+        Get the index for a language, building it on first use or after invalidation
+
+        Args:
+            language: Language code
+
+        Returns:
+            VocabularyIndex, or None when the index is disabled
+        """
+        if not self.enabled:
+            return None
+
+        self.register_event_handlers()
+
+        index = self._indexes.get(language)
+        if index is not None and language not in self._stale:
+            return index
+
+        return await self.rebuild(language)
+
+    async def rebuild(self, language: str) -> VocabularyIndex:
+        """
+        Build a fresh index for a language and swap it in
+
+        Args:
+            language: Language code
+
+        Returns:
+            The new VocabularyIndex
+        """
+        lock = self._locks.setdefault(language, asyncio.Lock())
+        async with lock:
+            index = self._indexes.get(language)
+            if index is not None and language not in self._stale:
+                return index  # another caller rebuilt it while we waited
+
+            self._stale.discard(language)
+            index = await VocabularyIndex.load(language, self._session_factory)
+            self._indexes[language] = index
+
+        stats = index.get_stats()
+        logger.info(
+            f"[VOCABULARY INDEX] Built '{language}' index: {stats['entries']} entries, "
+            f"{stats['memory_bytes'] / 1024 / 1024:.1f} MiB, {stats['build_seconds'] * 1000:.0f} ms"
+        )
+        return index
+
+    def invalidate(self, language: str | None = None) -> None:
+        """
+        Mark one language (or all) stale; the next get() rebuilds
+
+        Args:
+            language: Language code, or None for all languages
+        """
+        self._stale.update([language] if language else self._indexes.keys())
+
+    def handle_vocabulary_added(self, event: DomainEvent) -> None:
+        """EventBus handler: invalidate the affected language and rebuild in the background"""
+        vocabulary_word = getattr(event, "vocabulary_word", None)
+        language = getattr(vocabulary_word, "language", None) or (event.metadata or {}).get("language")
+        self.invalidate(language)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop (sync caller) - rebuild lazily on next get()
+
+        for stale_language in list(self._stale & self._indexes.keys()):
+            task = loop.create_task(self.rebuild(stale_language))
+            self._rebuild_tasks.add(task)  # keep a reference until the rebuild finishes
+            task.add_done_callback(self._rebuild_tasks.discard)
+
+    def register_event_handlers(self, event_bus: EventBus | None = None) -> None:
+        """Subscribe to VocabularyAddedEvent (idempotent per event bus)"""
+        event_bus = event_bus or get_event_bus()
+        if id(event_bus) in self._registered_buses:
+            return
+
+        event_bus.register_handler(EventType.VOCABULARY_ADDED, self.handle_vocabulary_added)
+        self._registered_buses.add(id(event_bus))
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-language index statistics"""
+        return {
+            language: {**index.get_stats(), "stale": language in self._stale}
+            for language, index in self._indexes.items()
+        }
+
+    def clear(self) -> None:
+        """Drop all indexes"""
+        self._indexes.clear()
+        self._stale.clear()
+
+
+# Global registry instance
+vocabulary_index_registry = VocabularyIndexRegistry()
+
+
+__all__ = ["VocabularyIndex", "VocabularyIndexRegistry", "records_in", "records_mask", "vocabulary_index_registry"]
@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import AsyncSessionLocal
 from database.models import VocabularyWord
+from services.vocabulary.events import ProgressUpdatedEvent, VocabularyAddedEvent, publish_event
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +92,10 @@ class VocabularyPreloadService:
 
                     await session.commit()
                     logger.info(f"Batch inserted {loaded_count} words for level {level}")
+                    if loaded_count:
+                        publish_event(
+                            VocabularyAddedEvent(metadata={"language": "de", "level": level}, source="import")
+                        )
                 except Exception as e:
                     await session.rollback()
                     logger.error(f"Failed to batch insert words for level {level}: {e}")
@@ -260,6 +265,13 @@ class VocabularyPreloadService:
                     await session.execute(delete_stmt)
 
                 await session.commit()
+                publish_event(
+                    ProgressUpdatedEvent(
+                        user_id=user_id,
+                        metadata={"language": vocab_word.language, "lemmas": [vocab_word.lemma], "is_known": known},
+                        action="mark_known",
+                    )
+                )
                 return True
         except Exception as e:
             logger.error(f"Error marking word '{word}' as {'known' if known else 'unknown'}: {e}")
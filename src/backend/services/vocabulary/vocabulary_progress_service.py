@@ -23,6 +23,14 @@ Usage Example:
         db=db_session
     )
 
+    # Mark the swipes of a vocabulary game in one transaction
+    await vocabulary_progress_service.mark_words_known(
+        user_id=123,
+        decisions=[("Haus", True), ("laufen", False)],
+        language="de",
+        db=db_session
+    )
+
     # Mark entire level as known
     await vocabulary_progress_service.bulk_mark_level(
         db=db_session,
@@ -46,18 +54,25 @@ Thread Safety:
 
 Performance Notes:
     - Single word updates: O(1) with index on (user_id, vocabulary_id)
-    - Bulk level updates: O(n) where n = words in level
-    - Statistics: O(1) with proper indexes on joins
+    - Batched word updates: one multi-row INSERT ... ON CONFLICT statement and one commit
+    - Bulk level updates: one INSERT ... SELECT ... ON CONFLICT statement, no ORM objects
+    - Statistics: popcounts over the user's knowledge bitset when the vocabulary index is
+      enabled, otherwise O(1) with proper indexes on joins
     - Uses transactional boundaries to ensure data consistency
 """
 
 import logging
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import UserVocabularyProgress, VocabularyWord
+from services.vocabulary.events import ProgressUpdatedEvent, publish_event
+from services.vocabulary.known_lemma_cache import get_user_knowledge
+from services.vocabulary.user_knowledge import UserKnowledge
+from services.vocabulary.vocabulary_batch_progress import dialect_insert, mark_words_known
+from services.vocabulary.vocabulary_index import vocabulary_index_registry
 
 logger = logging.getLogger(__name__)
 
@@ -182,81 +197,95 @@ class VocabularyProgressService:
         }
 
         await db.commit()  # Explicitly commit to persist changes
+        publish_event(
+            ProgressUpdatedEvent(
+                user_id=user_id,
+                metadata={"language": language, "lemmas": [lemma], "is_known": is_known},
+                action="mark_known",
+            )
+        )
 
         return result_data
 
+    async def mark_words_known(
+        self, user_id: int, decisions: list[tuple[str, bool]], language: str, db: AsyncSession
+    ) -> dict[str, Any]:
+        """Mark many words as known or unknown in one upsert and one commit (see vocabulary_batch_progress)"""
+        return await mark_words_known(self.query_service, user_id, decisions, language, db)
+
     async def bulk_mark_level(
         self, db: AsyncSession, user_id: int, language: str, level: str, is_known: bool
     ) -> dict[str, Any]:
         """
         Mark all words of a level as known or unknown
+
+        Runs as one INSERT ... SELECT ... ON CONFLICT (user_id, lemma, language) DO UPDATE, so
+        neither the level's words nor the user's progress rows are loaded into the session.
         Transaction management handled by FastAPI session dependency
         """
-        # Get all words for the level
-        stmt = select(VocabularyWord.id, VocabularyWord.lemma).where(
-            and_(VocabularyWord.language == language, VocabularyWord.difficulty_level == level)
+        insert = dialect_insert(db)
+        confidence_level = 3 if is_known else 0
+
+        # One row per lemma (a lemma may have several word forms at the level); ON CONFLICT may
+        # not touch the same progress row twice in one statement
+        level_lemmas = (
+            select(
+                literal(user_id),
+                func.min(VocabularyWord.id),
+                VocabularyWord.lemma,
+                VocabularyWord.language,
+                literal(is_known),
+                literal(confidence_level),
+                literal(0),
+            )
+            .where(and_(VocabularyWord.language == language, VocabularyWord.difficulty_level == level))
+            .group_by(VocabularyWord.lemma, VocabularyWord.language)
         )
+        stmt = insert(UserVocabularyProgress).from_select(
+            ["user_id", "vocabulary_id", "lemma", "language", "is_known", "confidence_level", "review_count"],
+            level_lemmas,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                UserVocabularyProgress.user_id,
+                UserVocabularyProgress.lemma,
+                UserVocabularyProgress.language,
+            ],
+            set_={
+                "is_known": stmt.excluded.is_known,
+                "confidence_level": stmt.excluded.confidence_level,
+                "updated_at": func.now(),
+            },
+        ).returning(UserVocabularyProgress.lemma)
+
         result = await db.execute(stmt)
-        words = result.all()
+        lemmas = result.scalars().all()
 
-        if not words:
+        if not lemmas:
             return {"success": True, "level": level, "language": language, "updated_count": 0, "is_known": is_known}
 
-        vocab_ids = [vocab_id for vocab_id, _ in words]
-        lemmas = [lemma for _, lemma in words]
-
-        # Bulk get existing progress by lemma (matches unique constraint)
-        existing_progress_stmt = select(UserVocabularyProgress).where(
-            and_(
-                UserVocabularyProgress.user_id == user_id,
-                UserVocabularyProgress.lemma.in_(lemmas),
-                UserVocabularyProgress.language == language,
+        await db.commit()  # Explicitly commit to persist all changes
+        publish_event(
+            ProgressUpdatedEvent(
+                user_id=user_id,
+                metadata={"language": language, "lemmas": sorted(lemmas), "is_known": is_known},
+                action="bulk_mark_level",
             )
         )
-        existing_result = await db.execute(existing_progress_stmt)
-        existing_progress = {p.lemma: p for p in existing_result.scalars()}
-
-        # Update or create progress records (deduplicate by lemma to handle duplicate words)
-        new_progress_records = []
-        processed_lemmas = set()  # Track lemmas we've already processed in this batch
-
-        for vocab_id, lemma in words:
-            if lemma in existing_progress:
-                # Update existing progress record
-                progress = existing_progress[lemma]
-                progress.is_known = is_known
-                progress.confidence_level = 3 if is_known else 0
-                processed_lemmas.add(lemma)
-            elif lemma not in processed_lemmas:
-                # Create new progress record (only once per unique lemma)
-                new_progress_records.append(
-                    UserVocabularyProgress(
-                        user_id=user_id,
-                        vocabulary_id=vocab_id,
-                        lemma=lemma,
-                        language=language,
-                        is_known=is_known,
-                        confidence_level=3 if is_known else 0,
-                        review_count=0,
-                    )
-                )
-                processed_lemmas.add(lemma)
-
-        if new_progress_records:
-            db.add_all(new_progress_records)
-
-        await db.commit()  # Explicitly commit to persist all changes
 
         return {
             "success": True,
             "level": level,
             "language": language,
-            "updated_count": len(words),
+            "updated_count": len(lemmas),
             "is_known": is_known,
         }
 
     async def get_user_vocabulary_stats(self, user_id: int, language: str, db: AsyncSession) -> dict[str, Any]:
         """Get vocabulary statistics for a user"""
+        if await vocabulary_index_registry.get(language) is not None:
+            return self._stats_from_knowledge(await get_user_knowledge(user_id, language), language)
+
         # Total words in language
         total_stmt = select(func.count(VocabularyWord.id)).where(VocabularyWord.language == language)
         total_result = await db.execute(total_stmt)
@@ -310,6 +339,24 @@ class VocabularyProgressService:
             "language": language,
         }
 
+    @staticmethod
+    def _stats_from_knowledge(knowledge: UserKnowledge, language: str) -> dict[str, Any]:
+        """Build the statistics from one popcount pass over the user's knowledge bitset"""
+        total_words = len(knowledge.index)
+        known_words = len(knowledge)
+        words_by_level = {
+            level: {**coverage, "percentage": round(coverage["known"] / coverage["total"] * 100, 1)}
+            for level, coverage in knowledge.level_coverage().items()
+        }
+
+        return {
+            "total_words": total_words,
+            "total_known": known_words,
+            "percentage_known": round(known_words / total_words * 100, 1) if total_words > 0 else 0,
+            "words_by_level": words_by_level,
+            "language": language,
+        }
+
 
 # Test-aware singleton pattern
 def get_vocabulary_progress_service() -> VocabularyProgressService:
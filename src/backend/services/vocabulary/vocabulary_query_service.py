@@ -3,13 +3,22 @@ Vocabulary Query Service - Handles vocabulary lookups and searches
 """
 
 import logging
+from collections import Counter
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import UnknownWord, UserVocabularyProgress, VocabularyWord
 from services.lemmatization_service import get_lemmatization_service
+from services.vocabulary.vocabulary_bulk_lookup import (
+    chunked,
+    format_unknown_word_info,
+    format_word_info,
+    lookup_words,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -175,6 +184,97 @@ class VocabularyQueryService:
             # Log the error but don't rollback - let the decorator handle it
             logger.warning(f"Failed to track unknown word '{word}': {e}")
 
+    async def _track_unknown_words(self, unknown_words: dict[str, tuple[str, int]], language: str, db: AsyncSession):
+        """
+        Track many words not in vocabulary database with one upsert
+
+        Args:
+            unknown_words: Mapping of word to (lemma, occurrence count)
+            language: Language code
+            db: Database session
+
+        Note:
+            Like _track_unknown_word, this flushes and leaves the commit to the caller.
+        """
+        if not unknown_words:
+            return
+
+        rows = [
+            {"word": word, "lemma": lemma, "language": language, "frequency_count": count}
+            for word, (lemma, count) in unknown_words.items()
+        ]
+
+        try:
+            dialect = db.get_bind().dialect.name
+            insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialect)
+
+            if insert is None:
+                for word, (lemma, count) in unknown_words.items():
+                    for _ in range(count):
+                        await self._track_unknown_word(word, lemma, language, db)
+                return
+
+            for chunk in chunked(rows):
+                stmt = insert(UnknownWord).values(chunk)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[UnknownWord.word, UnknownWord.language],
+                    set_={
+                        "frequency_count": UnknownWord.frequency_count + stmt.excluded.frequency_count,
+                        "last_encountered": func.now(),
+                    },
+                )
+                await db.execute(stmt)
+
+            await db.flush()
+        except Exception as e:
+            logger.warning(f"Failed to track {len(rows)} unknown words: {e}")
+
+    async def get_words_info(
+        self, words: Iterable[tuple[str, str | None]], language: str, db: AsyncSession
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get vocabulary information for many words with a few IN (...) queries
+
+        The lookup itself is vocabulary_bulk_lookup.lookup_words; this adds lemmatization and
+        tracks unknown words with a single aggregated upsert.
+
+        Args:
+            words: (word, lemma) pairs, one per occurrence; lemma None means lemmatize here
+            language: Language code
+            db: Database session
+
+        Returns:
+            Dictionary mapping each distinct word to the same info get_word_info() returns
+        """
+        occurrences: Counter[str] = Counter()
+        lemmas: dict[str, str] = {}
+        for word, lemma in words:
+            occurrences[word] += 1
+            if word not in lemmas:
+                lemmas[word] = (lemma or self.lemmatization_service.lemmatize(word)).lower()
+
+        if not occurrences:
+            return {}
+
+        found, missing = await lookup_words(lemmas, language, db)
+
+        word_infos: dict[str, dict[str, Any]] = {}
+        unknown_words: dict[str, tuple[str, int]] = {}
+        for word, count in occurrences.items():
+            if word in missing:
+                word_infos[word] = format_unknown_word_info(word, lemmas[word], language)
+                unknown_words[word] = (lemmas[word], count)
+            else:
+                word_infos[word] = found[word]
+
+        await self._track_unknown_words(unknown_words, language, db)
+
+        logger.debug(
+            f"[VOCAB QUERY] Resolved {len(word_infos)} distinct words "
+            f"({len(word_infos) - len(unknown_words)} found, {len(unknown_words)} unknown)"
+        )
+        return word_infos
+
     async def get_word_info(self, word: str, language: str, db: AsyncSession) -> dict[str, Any] | None:
         """Get vocabulary information for a word"""
         # First try lemmatization
@@ -199,31 +299,12 @@ class VocabularyQueryService:
         vocab_word = result.scalar_one_or_none()
 
         if vocab_word:
-            return {
-                "id": vocab_word.id,
-                "word": word,
-                "lemma": vocab_word.lemma,
-                "found_word": vocab_word.word,
-                "language": vocab_word.language,
-                "difficulty_level": vocab_word.difficulty_level,
-                "part_of_speech": vocab_word.part_of_speech,
-                "gender": vocab_word.gender,
-                "translation_en": vocab_word.translation_en,
-                "pronunciation": vocab_word.pronunciation,
-                "notes": vocab_word.notes,
-                "found": True,
-            }
+            return format_word_info(word, vocab_word)
 
         # Word not found - track it
         await self._track_unknown_word(word, lemma, language, db)
 
-        return {
-            "word": word,
-            "lemma": lemma,
-            "language": language,
-            "found": False,
-            "message": "Word not in vocabulary database",
-        }
+        return format_unknown_word_info(word, lemma, language)
 
     async def get_vocabulary_library(
         self,
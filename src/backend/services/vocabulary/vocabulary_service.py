@@ -57,6 +57,7 @@ Architecture Note:
 
 import logging
 import re
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -121,6 +122,12 @@ class VocabularyService:
         """Get vocabulary information for a word"""
         return await self.query_service.get_word_info(word, language, db)
 
+    async def get_words_info(
+        self, words: Iterable[tuple[str, str | None]], language: str, db: AsyncSession
+    ) -> dict[str, dict[str, Any]]:
+        """Get vocabulary information for many (word, lemma) pairs - delegates to query service"""
+        return await self.query_service.get_words_info(words, language, db)
+
     async def get_vocabulary_library(
         self,
         db: AsyncSession,
@@ -147,6 +154,12 @@ class VocabularyService:
         """Mark a word as known or unknown for a user"""
         return await self.progress_service.mark_word_known(user_id, word, language, is_known, db)
 
+    async def mark_words_known(
+        self, user_id: int, decisions: list[tuple[str, bool]], language: str, db: AsyncSession
+    ) -> dict[str, Any]:
+        """Mark many words as known or unknown for a user in one transaction"""
+        return await self.progress_service.mark_words_known(user_id, decisions, language, db)
+
     async def bulk_mark_level(
         self, db: AsyncSession, user_id: int, language: str, level: str, is_known: bool
     ) -> dict[str, Any]:
@@ -181,7 +194,7 @@ class VocabularyService:
         limit: int = DEFAULT_VOCAB_EXTRACT_LIMIT,
     ) -> list[dict[str, Any]]:
         """Extract blocking words from SRT content for vocabulary learning.
-        
+
         Args:
             db: Database session
             srt_content: Raw SRT subtitle content
@@ -189,7 +202,7 @@ class VocabularyService:
             video_path: Path to the video file
             language: ISO 639-1 language code (default: 'de' for German)
             limit: Maximum number of words to return
-            
+
         Returns:
             List of vocabulary word dictionaries with word info
         """
@@ -203,20 +216,13 @@ class VocabularyService:
             raw_words = self._extract_words_from_text(full_text, language)
 
             # Filter out stopwords and short words using centralized config
-            filtered_words = [
-                word.lower()
-                for word in raw_words
-                if len(word) >= MIN_WORD_LENGTH
-            ]
+            filtered_words = [word.lower() for word in raw_words if len(word) >= MIN_WORD_LENGTH]
             filtered_words = filter_stopwords(filtered_words, language)
 
             # Get unique words and create vocabulary entries
             unique_words = list(set(filtered_words))[:limit]
 
-            blocking_words = [
-                self._create_vocabulary_entry(word, language)
-                for word in unique_words
-            ]
+            blocking_words = [self._create_vocabulary_entry(word, language) for word in unique_words]
 
             logger.info(f"Extracted {len(blocking_words)} blocking words from SRT content")
             return blocking_words
@@ -268,8 +274,6 @@ class VocabularyService:
         }
 
 
-def get_vocabulary_service(
-    query_service, progress_service, stats_service
-) -> VocabularyService:
+def get_vocabulary_service(query_service, progress_service, stats_service) -> VocabularyService:
     """Factory function with dependency injection"""
     return VocabularyService(query_service, progress_service, stats_service)
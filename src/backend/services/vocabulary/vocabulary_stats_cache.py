@@ -0,0 +1,180 @@
+"""
+Vocabulary Stats Cache - short-lived per-user vocabulary statistics
+
+The vocabulary dashboard asks for the same per-level statistics on every load, and each answer
+is an aggregate over vocabulary_words and user_vocabulary_progress. The cache keeps each result
+for a few seconds per (user, query) so page reloads and parallel widgets share one aggregate.
+
+WordLearnedEvent, WordForgottenEvent and ProgressUpdatedEvent drop the user's entries, and
+VocabularyAddedEvent drops all entries, so a user sees their own changes immediately. The TTL
+only bounds staleness for changes that publish no event. A load that overlaps an event is not
+stored.
+
+Usage Example:
+    ```python
+    stats = await vocabulary_stats_cache.get(user_id, ("levels", "de", "en"), load_stats)
+    vocabulary_stats_cache.get_stats()  # hits, misses, hit rate, entries
+    ```
+
+Thread Safety:
+    Use from one event loop (the event bus calls handlers synchronously on the publisher's loop).
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from core.config import settings
+from services.vocabulary.events import DomainEvent, EventBus, EventType, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+CacheKey = tuple[str, tuple]
+
+_USER_EVENTS = (EventType.WORD_LEARNED, EventType.WORD_FORGOTTEN, EventType.PROGRESS_UPDATED)
+
+
+class VocabularyStatsCache:
+    """
+    TTL cache of vocabulary statistics per user, invalidated by progress events.
+
+    Cached values are shared between callers and must be treated as read-only.
+
+    Attributes:
+        ttl_seconds (float): Seconds a result is served before it is recomputed
+        max_entries (int): Cached results before the least recently used is dropped
+        hits (int): Lookups served from the cache
+        misses (int): Lookups that ran the query
+        invalidations (int): Cached results dropped by events
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 5000):
+        """
+        Initialize cache
+
+        Args:
+            ttl_seconds: Seconds a result is served before it is recomputed
+            max_entries: Cached results before the least recently used is dropped
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._loads: dict[CacheKey, object] = {}  # token per key with a load in flight
+        self._registered_buses: set[int] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Switched by LANGPLUG_VOCABULARY_STATS_CACHE_ENABLED"""
+        return settings.vocabulary_stats_cache_enabled
+
+    async def get(self, user_id: int | str, key: tuple, loader: Callable[[], Awaitable[T]]) -> T:
+        """
+        Get a user's statistics, running the query on a miss or after the TTL
+
+        Args:
+            user_id: User ID
+            key: Query name and arguments, e.g. ("levels", "de", "en")
+            loader: Coroutine function computing the statistics
+
+        Returns:
+            Cached or freshly computed statistics
+        """
+        if not self.enabled:
+            return await loader()
+
+        self.register_event_handlers()
+        user_key = str(user_id)
+        cache_key = (user_key, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        token = self._loads.setdefault(cache_key, object())
+        try:
+            value = await loader()
+        finally:
+            # An event for this user while loading removes the token; only a load that still holds it stores
+            unchanged = self._loads.get(cache_key) is token
+            if unchanged:
+                del self._loads[cache_key]
+
+        if unchanged:
+            self._entries[cache_key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, user_id: int | str | None = None) -> None:
+        """
+        Drop cached statistics
+
+        Args:
+            user_id: User ID, or None for all users
+        """
+        if user_id is None:
+            self._loads.clear()
+            keys = list(self._entries)
+        else:
+            user_key = str(user_id)
+            for load_key in [key for key in self._loads if key[0] == user_key]:
+                del self._loads[load_key]
+            keys = [key for key in self._entries if key[0] == user_key]
+
+        for key in keys:
+            del self._entries[key]
+        self.invalidations += len(keys)
+
+    def handle_user_event(self, event: DomainEvent) -> None:
+        """EventBus handler: drop the statistics of the user the event belongs to"""
+        if event.user_id is not None:
+            self.invalidate(event.user_id)
+
+    def handle_vocabulary_added(self, event: DomainEvent) -> None:
+        """EventBus handler: new vocabulary changes every user's totals"""
+        self.invalidate()
+
+    def register_event_handlers(self, event_bus: EventBus | None = None) -> None:
+        """Subscribe to progress and vocabulary events (idempotent per event bus)"""
+        event_bus = event_bus or get_event_bus()
+        if id(event_bus) in self._registered_buses:
+            return
+
+        for event_type in _USER_EVENTS:
+            event_bus.register_handler(event_type, self.handle_user_event)
+        event_bus.register_handler(EventType.VOCABULARY_ADDED, self.handle_vocabulary_added)
+        self._registered_buses.add(id(event_bus))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit rate, invalidation counter and size"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        """Drop all cached statistics"""
+        self._entries.clear()
+        self._loads.clear()
+
+
+# Global cache instance
+vocabulary_stats_cache = VocabularyStatsCache(ttl_seconds=settings.vocabulary_stats_cache_ttl_seconds)
+
+
+__all__ = ["VocabularyStatsCache", "vocabulary_stats_cache"]
@@ -1,15 +1,20 @@
 """
 Vocabulary Stats Service - Handles vocabulary statistics and analytics
+
+Per-level statistics come from one query (per-level word totals and the user's known words
+grouped by difficulty_level, combined with UNION ALL) and are cached briefly per user in
+vocabulary_stats_cache, which progress events invalidate.
 """
 
 import logging
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, literal, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.database import AsyncSessionLocal
 from core.enums import CEFRLevel
 from database.models import UserVocabularyProgress, VocabularyWord
+from services.vocabulary.vocabulary_stats_cache import vocabulary_stats_cache
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +26,72 @@ class VocabularyStatsService:
         self, db_session: AsyncSession, user_id: int, target_language: str, translation_language: str = "en"
     ):
         """Get vocabulary statistics by level with injected database session"""
-        return await self._get_vocabulary_stats_with_session(db_session, user_id, target_language, translation_language)
+        return await vocabulary_stats_cache.get(
+            user_id,
+            ("levels", target_language, translation_language),
+            lambda: self._get_vocabulary_stats_with_session(db_session, user_id, target_language, translation_language),
+        )
+
+    async def _level_counts(
+        self, db_session, user_id: int | str, language: str | None
+    ) -> tuple[dict[str, tuple[int, int]], int]:
+        """
+        Count vocabulary words and the user's known words per difficulty level in one query
+
+        Args:
+            db_session: Database session
+            user_id: User ID
+            language: Language code, or None for all languages
+
+        Returns:
+            ({level: (total words, known words)}, known words without a vocabulary entry)
+        """
+        known_progress = [UserVocabularyProgress.user_id == user_id, UserVocabularyProgress.is_known]
+        vocabulary_filter = []
+        if language is not None:
+            known_progress.append(UserVocabularyProgress.language == language)
+            vocabulary_filter.append(VocabularyWord.language == language)
+
+        # Three grouped branches in one round trip. The user's known rows drive their own join, so the
+        # query reads the user's progress rather than probing progress for every vocabulary word.
+        totals_stmt = (
+            select(
+                VocabularyWord.difficulty_level.label("level"),
+                func.count(VocabularyWord.id).label("total"),
+                literal(0).label("known"),
+            )
+            .where(*vocabulary_filter)
+            .group_by(VocabularyWord.difficulty_level)
+        )
+        known_stmt = (
+            select(
+                VocabularyWord.difficulty_level.label("level"),
+                literal(0).label("total"),
+                func.count(UserVocabularyProgress.id).label("known"),
+            )
+            .select_from(UserVocabularyProgress)
+            .join(VocabularyWord, VocabularyWord.id == UserVocabularyProgress.vocabulary_id)
+            .where(*known_progress, *vocabulary_filter)
+            .group_by(VocabularyWord.difficulty_level)
+        )
+        # Known words that are not in the vocabulary (vocabulary_id IS NULL) come back as a level NULL row
+        unlisted_stmt = select(
+            null().label("level"),
+            literal(0).label("total"),
+            func.count(UserVocabularyProgress.id).label("known"),
+        ).where(*known_progress, UserVocabularyProgress.vocabulary_id.is_(None))
+
+        result = await db_session.execute(union_all(totals_stmt, known_stmt, unlisted_stmt))
+
+        levels: dict[str, tuple[int, int]] = {}
+        unlisted_known = 0
+        for level, total, known in result.all():
+            if level is None:
+                unlisted_known += known or 0
+            else:
+                level_total, level_known = levels.get(level, (0, 0))
+                levels[level] = (level_total + (total or 0), level_known + (known or 0))
+        return levels, unlisted_known
 
     async def _get_vocabulary_stats_with_session(
         self, db_session, user_id: str, target_language: str, native_language: str = "en"
@@ -29,66 +99,19 @@ class VocabularyStatsService:
         """New implementation for comprehensive tests - uses injected session and returns VocabularyStats object"""
         from api.models.vocabulary import VocabularyStats
 
+        levels, unlisted_known = await self._level_counts(db_session, user_id, target_language)
+
         levels_dict = {}
         total_words_all = 0
         total_known_all = 0
-
         for level in CEFRLevel.all_levels():
-            # Execute database query
-            total_stmt = select(func.count(VocabularyWord.id)).where(
-                and_(VocabularyWord.language == target_language, VocabularyWord.difficulty_level == level)
-            )
-            total_result = await db_session.execute(total_stmt)
-
-            # Handle mock vs real database - if it's a mock, scalar() might return the configured value
-            total_words_raw = total_result.scalar()
-            # Check if it's a mock coroutine that wasn't awaited
-            if hasattr(total_words_raw, "__await__"):
-                total_words = 0  # Default for mock
-            else:
-                total_words = total_words_raw or 0
-
-            # Count known words at this level for user
-            known_stmt = (
-                select(func.count(UserVocabularyProgress.id))
-                .where(
-                    and_(
-                        UserVocabularyProgress.user_id == user_id,
-                        UserVocabularyProgress.language == target_language,
-                        UserVocabularyProgress.is_known,
-                    )
-                )
-                .join(VocabularyWord, VocabularyWord.id == UserVocabularyProgress.vocabulary_id)
-                .where(VocabularyWord.difficulty_level == level)
-            )
-
-            known_result = await db_session.execute(known_stmt)
-
-            known_words_raw = known_result.scalar()
-            # Check if it's a mock coroutine that wasn't awaited
-            if hasattr(known_words_raw, "__await__"):
-                known_words = 0  # Default for mock
-            else:
-                known_words = known_words_raw or 0
-
+            total_words, known_words = levels.get(level, (0, 0))
             levels_dict[level] = {"total_words": total_words, "user_known": known_words}
-
             total_words_all += total_words
             total_known_all += known_words
 
-        # Count unknown words marked as known (vocabulary_id IS NULL)
-        # These don't belong to any CEFR level but should be included in total_known
-        unknown_words_stmt = select(func.count(UserVocabularyProgress.id)).where(
-            and_(
-                UserVocabularyProgress.user_id == user_id,
-                UserVocabularyProgress.language == target_language,
-                UserVocabularyProgress.is_known,
-                UserVocabularyProgress.vocabulary_id.is_(None),  # Words not in vocabulary database
-            )
-        )
-        unknown_words_result = await db_session.execute(unknown_words_stmt)
-        unknown_words_count = unknown_words_result.scalar() or 0
-        total_known_all += unknown_words_count
+        # Unknown words marked as known don't belong to any CEFR level but count towards total_known
+        total_known_all += unlisted_known
 
         return VocabularyStats(
             levels=levels_dict,
@@ -100,35 +123,20 @@ class VocabularyStatsService:
 
     async def get_user_progress_summary(self, db_session, user_id: str):
         """Get user's overall progress summary"""
-        # Total vocabulary words
-        total_stmt = select(func.count(VocabularyWord.id))
-        total_result = await db_session.execute(total_stmt)
-        total_words = total_result.scalar() or 0
-
-        # Total known words for user
-        known_stmt = select(func.count(UserVocabularyProgress.id)).where(
-            and_(UserVocabularyProgress.user_id == user_id, UserVocabularyProgress.is_known)
+        return await vocabulary_stats_cache.get(
+            user_id, ("summary",), lambda: self._get_user_progress_summary(db_session, user_id)
         )
-        known_result = await db_session.execute(known_stmt)
-        known_words = known_result.scalar() or 0
 
-        # Progress by level
-        levels_progress = []
-        for level in CEFRLevel.all_levels():
-            level_total_stmt = select(func.count(VocabularyWord.id)).where(VocabularyWord.difficulty_level == level)
-            level_total_result = await db_session.execute(level_total_stmt)
-            level_total = level_total_result.scalar() or 0
-
-            level_known_stmt = (
-                select(func.count(UserVocabularyProgress.id))
-                .where(and_(UserVocabularyProgress.user_id == user_id, UserVocabularyProgress.is_known))
-                .join(VocabularyWord, VocabularyWord.id == UserVocabularyProgress.vocabulary_id)
-                .where(VocabularyWord.difficulty_level == level)
-            )
+    async def _get_user_progress_summary(self, db_session, user_id: str):
+        """Compute the progress summary over all languages"""
+        levels, unlisted_known = await self._level_counts(db_session, user_id, None)
 
-            level_known_result = await db_session.execute(level_known_stmt)
-            level_known = level_known_result.scalar() or 0
+        total_words = sum(total for total, _ in levels.values())
+        known_words = sum(known for _, known in levels.values()) + unlisted_known
 
+        levels_progress = []
+        for level in CEFRLevel.all_levels():
+            level_total, level_known = levels.get(level, (0, 0))
             levels_progress.append(
                 {
                     "level": level,
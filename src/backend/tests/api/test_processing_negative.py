@@ -67,3 +67,21 @@ async def test_WhenFilterSubtitlesMissingFile_ThenReturns422(async_client, url_b
         )
 
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_WhenASRWorkerQueueFull_ThenReturns503WithRetryAfter(async_client, url_builder):
+    """Backpressure: a saturated ASR worker pool rejects new chunk processing."""
+    helper = AsyncAuthHelper(async_client)
+    _user, _token, headers = await helper.create_authenticated_user()
+
+    with patch("services.transcriptionservice.asr_worker_pool.asr_pool_saturated", return_value=True):
+        response = await async_client.post(
+            url_builder.url_for("process_chunk"),
+            json={"video_path": "series/video.mp4", "start_time": 0, "end_time": 60},
+            headers=headers,
+        )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "30"
@@ -145,6 +145,69 @@ async def test_When_mark_known_called_with_empty_lemma_Then_returns_validation_e
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_When_mark_known_batch_called_Then_returns_result_per_decision(async_client, url_builder):
+    """Happy path: batch mark-known stores all decisions of a game in one request."""
+    headers = await _auth(async_client)
+
+    response = await async_client.post(
+        url_builder.url_for("mark_words_known_batch"),
+        json={
+            "language": "de",
+            "decisions": [{"lemma": "Haus", "known": True}, {"lemma": "gehen", "known": False}],
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+    payload = response.json()
+    assert payload["success"] is True
+    assert payload["updated_count"] == 2
+    assert [item["known"] for item in payload["results"]] == [True, False]
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_When_caches_enabled_and_batch_marked_Then_stats_reflect_decisions(
+    async_client, url_builder, seeded_vocabulary, vocabulary_caches
+):
+    """Happy path: cached statistics are dropped when a batch of decisions is stored."""
+    from services.vocabulary.vocabulary_stats_cache import vocabulary_stats_cache
+
+    headers = await _auth(async_client)
+    stats_url = url_builder.url_for("get_vocabulary_stats")
+
+    before = await async_client.get(stats_url, headers=headers)
+    assert (await async_client.get(stats_url, headers=headers)).json() == before.json()
+    assert vocabulary_stats_cache.hits == 1
+
+    response = await async_client.post(
+        url_builder.url_for("mark_words_known_batch"),
+        json={"language": "de", "decisions": [{"lemma": "hallo", "known": True}, {"lemma": "ich", "known": True}]},
+        headers=headers,
+    )
+    assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
+
+    after = await async_client.get(stats_url, headers=headers)
+    assert after.json()["total_known"] == before.json()["total_known"] + 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_When_mark_known_batch_called_without_decisions_Then_returns_validation_error(async_client, url_builder):
+    """Invalid input: batch mark-known requires at least one decision."""
+    headers = await _auth(async_client)
+
+    response = await async_client.post(
+        url_builder.url_for("mark_words_known_batch"),
+        json={"language": "de", "decisions": []},
+        headers=headers,
+    )
+
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 @pytest.mark.timeout(30)
 async def test_When_bulk_mark_called_with_target_language_Then_succeeds(async_client, url_builder):
@@ -266,9 +329,7 @@ async def test_When_stats_called_without_auth_Then_returns_unauthorized(async_cl
 @pytest.mark.timeout(30)
 async def test_When_mark_known_called_without_auth_Then_returns_unauthorized(async_client, url_builder):
     """Security: mark-known endpoint requires authentication."""
-    response = await async_client.post(
-        url_builder.url_for("mark_word_known"), json={"lemma": "test", "known": True}
-    )
+    response = await async_client.post(url_builder.url_for("mark_word_known"), json={"lemma": "test", "known": True})
     assert response.status_code == 401, f"Expected 401 (not authenticated), got {response.status_code}: {response.text}"
 
 
@@ -414,8 +414,6 @@ def vocabulary_level_response() -> dict:
     }
 
 
-
-
 # --- Service Fixtures ---
 @pytest.fixture
 def vocabulary_service(app: FastAPI) -> "services.vocabulary.vocabulary_service.VocabularyService":
@@ -483,6 +481,36 @@ def db_session_override(app: FastAPI, isolated_db_session: AsyncSession):
             app.dependency_overrides.pop(core_db.get_async_session, None)
 
 
+@pytest.fixture
+def vocabulary_caches(app: FastAPI, monkeypatch):
+    """
+    Switch on the vocabulary index, known-lemma cache and stats cache for one test.
+
+    pytest.ini turns them off for the suite; this fixture enables them, points their loaders
+    at the test database and empties them before and after the test.
+    """
+    import importlib
+
+    from core.config import settings
+    from services.vocabulary.known_lemma_cache import known_lemma_cache
+    from services.vocabulary.vocabulary_index import vocabulary_index_registry
+    from services.vocabulary.vocabulary_stats_cache import vocabulary_stats_cache
+
+    # The loaders import AsyncSessionLocal from the package; `import core.database` would
+    # return the core.database.database submodule that core/__init__.py re-exports
+    core_db = importlib.import_module("core.database")
+    monkeypatch.setattr(core_db, "AsyncSessionLocal", app.state._test_session_factory)
+    for name in ("vocabulary_index_enabled", "known_lemma_cache_enabled", "vocabulary_stats_cache_enabled"):
+        monkeypatch.setattr(settings, name, True)
+
+    caches = (vocabulary_index_registry, known_lemma_cache, vocabulary_stats_cache)
+    for cache in caches:
+        cache.clear()
+    yield caches
+    for cache in caches:
+        cache.clear()
+
+
 # --- Test State Monitoring and Pollution Detection ---
 @pytest.fixture(autouse=True)
 def test_pollution_detector():
@@ -6,7 +6,7 @@ Tests actual service methods with database interactions
 import pytest
 from sqlalchemy import and_, select
 
-from database.models import User, UserVocabularyProgress, VocabularyWord
+from database.models import UnknownWord, User, UserVocabularyProgress, VocabularyWord
 from services.vocabulary.vocabulary_service import VocabularyService
 
 
@@ -26,7 +26,7 @@ class TestVocabularyServiceDatabaseIntegration:
         from services.vocabulary.vocabulary_query_service import get_vocabulary_query_service
         from services.vocabulary.vocabulary_progress_service import get_vocabulary_progress_service
         from services.vocabulary.vocabulary_stats_service import get_vocabulary_stats_service
-        
+
         query_service = get_vocabulary_query_service()
         progress_service = get_vocabulary_progress_service()
         stats_service = get_vocabulary_stats_service()
@@ -135,10 +135,7 @@ class TestVocabularyServiceDatabaseIntegration:
 
         # Verify database state - word should be marked with vocabulary_id=NULL
         stmt = select(UserVocabularyProgress).where(
-            and_(
-                UserVocabularyProgress.user_id == test_user.id,
-                UserVocabularyProgress.lemma == result["lemma"]
-            )
+            and_(UserVocabularyProgress.user_id == test_user.id, UserVocabularyProgress.lemma == result["lemma"])
         )
         db_result = await db_session.execute(stmt)
         progress = db_result.scalar_one()
@@ -177,6 +174,52 @@ class TestVocabularyServiceDatabaseIntegration:
         # Both should find the same word
         assert result1["lemma"] == result2["lemma"]
 
+    async def test_get_words_info_bulk(self, vocabulary_service, db_session, test_vocabulary):
+        """Test resolving a whole chunk of words at once"""
+        # Act - "haus" via lemma (case-insensitive), "läuft" via the supplied lemma, "xyzzy" unknown
+        result = await vocabulary_service.get_words_info(
+            [("haus", "haus"), ("läuft", "laufen"), ("xyzzy", "xyzzy"), ("haus", "haus")], "de", db_session
+        )
+
+        # Assert - one entry per distinct word, same shape as get_word_info
+        assert set(result) == {"haus", "läuft", "xyzzy"}
+        assert result["haus"]["found"] is True
+        assert result["haus"]["found_word"] == "das Haus"
+        assert result["läuft"]["lemma"] == "laufen"
+        assert result["läuft"]["difficulty_level"] == "A2"
+        assert result["xyzzy"]["found"] is False
+        assert result["xyzzy"]["message"] == "Word not in vocabulary database"
+
+    async def test_get_words_info_ignores_case_of_stored_words(self, vocabulary_service, db_session):
+        """Test all-caps, camel-case and umlaut-capitalized vocabulary is found from lowercase subtitle words"""
+        for lemma in ("USA", "iPhone", "Übung"):
+            db_session.add(VocabularyWord(lemma=lemma, word=lemma, language="de", difficulty_level="B1"))
+        await db_session.commit()
+
+        # Act
+        result = await vocabulary_service.get_words_info(
+            [("usa", "usa"), ("iphone", "iphone"), ("übung", "übung")], "de", db_session
+        )
+
+        # Assert - all found, none tracked as unknown
+        assert {word: info["lemma"] for word, info in result.items()} == {
+            "usa": "USA",
+            "iphone": "iPhone",
+            "übung": "Übung",
+        }
+        assert (await db_session.execute(select(UnknownWord))).scalars().all() == []
+
+    async def test_get_words_info_aggregates_unknown_words(self, vocabulary_service, db_session, test_vocabulary):
+        """Test unknown words are tracked with occurrence counts in one upsert"""
+        # Act - two chunks, the unknown word occurs twice in the first
+        await vocabulary_service.get_words_info([("xyzzy", None), ("xyzzy", None)], "de", db_session)
+        await vocabulary_service.get_words_info([("xyzzy", None)], "de", db_session)
+
+        # Assert
+        stmt = select(UnknownWord).where(and_(UnknownWord.word == "xyzzy", UnknownWord.language == "de"))
+        unknown = (await db_session.execute(stmt)).scalar_one()
+        assert unknown.frequency_count == 3
+
     async def test_multiple_users_independent_progress(self, vocabulary_service, db_session, test_vocabulary):
         """Test that multiple users have independent progress"""
         # Create two users
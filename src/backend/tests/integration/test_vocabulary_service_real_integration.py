@@ -3,11 +3,14 @@ Integration tests for VocabularyService with real database operations
 Tests actual service boundaries without excessive mocking
 """
 
+from unittest.mock import patch
+
 import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from database.models import Base, VocabularyWord
+from database.models import Base, UserVocabularyProgress, VocabularyWord
 from services.vocabulary.vocabulary_query_service import get_vocabulary_query_service
 from services.vocabulary.vocabulary_progress_service import get_vocabulary_progress_service
 from services.vocabulary.vocabulary_stats_service import get_vocabulary_stats_service
@@ -92,10 +95,10 @@ class TestVocabularyServiceRealIntegration:
     async def test_get_word_info_with_real_db(self, test_db_session, sample_vocabulary):
         """VocabularyService.get_word_info should query real database"""
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         # Test with existing word
         result = await service.get_word_info("Haus", "de", test_db_session)
@@ -110,10 +113,10 @@ class TestVocabularyServiceRealIntegration:
     async def test_get_word_info_not_found(self, test_db_session, sample_vocabulary):
         """VocabularyService.get_word_info should return not found for missing words"""
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         result = await service.get_word_info("nonexistent", "de", test_db_session)
 
@@ -127,10 +130,10 @@ class TestVocabularyServiceRealIntegration:
         This reproduces the bug we just fixed
         """
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         # This was failing before: missing 'db' parameter
         # Correct call signature: word, language, db
@@ -144,10 +147,10 @@ class TestVocabularyServiceRealIntegration:
     async def test_get_vocabulary_library_with_real_db(self, test_db_session, sample_vocabulary):
         """VocabularyService.get_vocabulary_library should query real database"""
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         result = await service.get_vocabulary_library(db=test_db_session, language="de", level="A1", limit=10)
 
@@ -161,10 +164,10 @@ class TestVocabularyServiceRealIntegration:
         """VocabularyService should be instantiated as object, not used as class"""
         # This was the bug: passing VocabularyService instead of VocabularyService()
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         # Should be an instance, not a class
         assert not isinstance(service, type)
@@ -183,10 +186,10 @@ class TestVocabularyServiceSubtitleProcessorScenario:
         """
         # Create service (was incorrectly stored as class)
         vocab_service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )  # Fixed: instantiate it
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )  # Fixed: instantiate it
 
         # Simulate processing a word from subtitle
         word_text = "haus"
@@ -202,10 +205,10 @@ class TestVocabularyServiceSubtitleProcessorScenario:
     async def test_multiple_word_lookups_same_session(self, test_db_session, sample_vocabulary):
         """Service should handle multiple lookups in same session efficiently"""
         vocab_service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
         words_to_lookup = ["haus", "gehen", "schwierig"]
 
         results = []
@@ -225,10 +228,10 @@ class TestVocabularyServiceIntegrationBoundaries:
     async def test_service_query_delegation(self, test_db_session, sample_vocabulary):
         """VocabularyService should properly delegate to query_service"""
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         # Service should have query_service
         assert hasattr(service, "query_service")
@@ -242,10 +245,10 @@ class TestVocabularyServiceIntegrationBoundaries:
     async def test_service_handles_different_languages(self, test_db_session):
         """Service should handle queries for different languages"""
         service = VocabularyService(
-        query_service=get_vocabulary_query_service(),
-        progress_service=get_vocabulary_progress_service(),
-        stats_service=get_vocabulary_stats_service()
-    )
+            query_service=get_vocabulary_query_service(),
+            progress_service=get_vocabulary_progress_service(),
+            stats_service=get_vocabulary_stats_service(),
+        )
 
         # Add words in different languages
         words = [
@@ -263,3 +266,147 @@ class TestVocabularyServiceIntegrationBoundaries:
             result = await service.get_word_info(word, lang, test_db_session)
             assert result["found"] is True
             assert result["word"].lower() == word.lower()
+
+
+class TestBulkMarkLevelRealIntegration:
+    """Test the set-based bulk_mark_level upsert against SQLite"""
+
+    async def _progress(self, session: AsyncSession) -> dict[str, tuple]:
+        result = await session.execute(
+            select(
+                UserVocabularyProgress.lemma,
+                UserVocabularyProgress.vocabulary_id,
+                UserVocabularyProgress.is_known,
+                UserVocabularyProgress.confidence_level,
+                UserVocabularyProgress.review_count,
+            ).where(UserVocabularyProgress.user_id == 1)
+        )
+        return {lemma: rest for lemma, *rest in result.all()}
+
+    @pytest.mark.asyncio
+    async def test_creates_progress_for_every_lemma_of_level(self, test_db_session, sample_vocabulary):
+        """Words of the level get progress rows, other levels are untouched"""
+        result = await get_vocabulary_progress_service().bulk_mark_level(test_db_session, 1, "de", "A1", True)
+
+        assert result["updated_count"] == 2
+        assert await self._progress(test_db_session) == {
+            "haus": [sample_vocabulary[0].id, True, 3, 0],
+            "gehen": [sample_vocabulary[1].id, True, 3, 0],
+        }
+
+    @pytest.mark.asyncio
+    async def test_updates_existing_progress_in_place(self, test_db_session, sample_vocabulary):
+        """Existing rows keep their review count; duplicate word forms of a lemma produce one row"""
+        test_db_session.add(VocabularyWord(word="Häuser", lemma="haus", language="de", difficulty_level="A1"))
+        test_db_session.add(
+            UserVocabularyProgress(
+                user_id=1,
+                vocabulary_id=sample_vocabulary[1].id,
+                lemma="gehen",
+                language="de",
+                is_known=True,
+                confidence_level=5,
+                review_count=4,
+            )
+        )
+        await test_db_session.commit()
+
+        result = await get_vocabulary_progress_service().bulk_mark_level(test_db_session, 1, "de", "A1", False)
+
+        assert result["updated_count"] == 2
+        assert await self._progress(test_db_session) == {
+            "haus": [sample_vocabulary[0].id, False, 0, 0],
+            "gehen": [sample_vocabulary[1].id, False, 0, 4],
+        }
+
+    @pytest.mark.asyncio
+    async def test_empty_level(self, test_db_session, sample_vocabulary):
+        """A level without words changes nothing"""
+        result = await get_vocabulary_progress_service().bulk_mark_level(test_db_session, 1, "de", "C2", True)
+
+        assert result["updated_count"] == 0
+        assert await self._progress(test_db_session) == {}
+
+
+class TestMarkWordsKnownRealIntegration:
+    """Test the batched mark_words_known upsert against SQLite"""
+
+    async def _progress(self, session: AsyncSession) -> dict[str, list]:
+        result = await session.execute(
+            select(
+                UserVocabularyProgress.lemma,
+                UserVocabularyProgress.vocabulary_id,
+                UserVocabularyProgress.is_known,
+                UserVocabularyProgress.confidence_level,
+                UserVocabularyProgress.review_count,
+            ).where(UserVocabularyProgress.user_id == 1)
+        )
+        return {lemma: rest for lemma, *rest in result.all()}
+
+    @pytest.mark.asyncio
+    async def test_new_and_existing_progress_in_one_commit(self, test_db_session, sample_vocabulary):
+        """New rows start like mark_word_known; existing rows move confidence by one and count the review"""
+        test_db_session.add(
+            UserVocabularyProgress(
+                user_id=1,
+                vocabulary_id=sample_vocabulary[1].id,
+                lemma="gehen",
+                language="de",
+                is_known=True,
+                confidence_level=5,
+                review_count=4,
+            )
+        )
+        await test_db_session.commit()
+
+        with patch.object(test_db_session, "commit", wraps=test_db_session.commit) as commit:
+            result = await get_vocabulary_progress_service().mark_words_known(
+                1, [("Haus", True), ("gehen", False), ("schwierig", False)], "de", test_db_session
+            )
+
+        assert commit.await_count == 1
+        assert result["updated_count"] == 3
+        assert [item["level"] for item in result["results"]] == ["A1", "A1", "B2"]
+        assert await self._progress(test_db_session) == {
+            "haus": [sample_vocabulary[0].id, True, 1, 1],
+            "gehen": [sample_vocabulary[1].id, False, 4, 5],
+            "schwierig": [sample_vocabulary[2].id, False, 0, 1],
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_words_and_repeated_lemmas(self, test_db_session, sample_vocabulary):
+        """Words outside the vocabulary are stored by lemma; the last decision for a lemma wins"""
+        result = await get_vocabulary_progress_service().mark_words_known(
+            1, [("haus", True), ("Quatschwort", True), ("Haus", False)], "de", test_db_session
+        )
+
+        assert result["updated_count"] == 2
+        assert result["results"][1]["level"] == "unknown"
+        progress = await self._progress(test_db_session)
+        assert progress["haus"] == [sample_vocabulary[0].id, False, 0, 1]
+        assert progress[result["results"][1]["lemma"]] == [None, True, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_single_and_batch_marking_share_the_progress_row(self, test_db_session, sample_vocabulary):
+        """A word outside the vocabulary gets the same lemma from mark_word_known and the batch"""
+        service = get_vocabulary_progress_service()
+        single = await service.mark_word_known(1, "Fernweh", "de", True, test_db_session)
+        batch = await service.mark_words_known(1, [("Fernweh", False)], "de", test_db_session)
+
+        assert batch["results"][0]["lemma"] == single["lemma"]
+        assert await self._progress(test_db_session) == {single["lemma"]: [None, False, 0, 2]}
+
+    @pytest.mark.asyncio
+    async def test_publishes_one_aggregated_event(self, test_db_session, sample_vocabulary):
+        """The whole batch publishes a single ProgressUpdatedEvent"""
+        with patch("services.vocabulary.vocabulary_batch_progress.publish_event") as publish:
+            await get_vocabulary_progress_service().mark_words_known(
+                1, [("Haus", True), ("gehen", False)], "de", test_db_session
+            )
+
+        publish.assert_called_once()
+        assert publish.call_args.args[0].metadata == {
+            "language": "de",
+            "known_lemmas": ["haus"],
+            "unknown_lemmas": ["gehen"],
+        }
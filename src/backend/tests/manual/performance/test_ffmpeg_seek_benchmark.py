@@ -0,0 +1,115 @@
+"""Benchmark chunk audio extraction on a synthetic 45-minute episode.
+
+Compares the old output-side seek (``-i video -ss start``), which decodes the episode from the
+beginning up to the chunk, with input-side seeking, and per-chunk extraction with the one-pass
+episode split. Run with ``-s`` to see the timings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from services.processing.chunk_transcription_service import (
+    PCM_PIPE_ARGS,
+    SAMPLE_RATE,
+    ChunkTranscriptionService,
+)
+
+# Mark as manual test
+pytestmark = [
+    pytest.mark.manual,
+    pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="FFmpeg not installed"),
+]
+
+EPISODE_SECONDS = 45 * 60
+CHUNK_SECONDS = 5 * 60
+WINDOWS = [(float(start), float(start + CHUNK_SECONDS)) for start in range(0, EPISODE_SECONDS, CHUNK_SECONDS)]
+
+
+@pytest.fixture(scope="module")
+def synthetic_episode(tmp_path_factory) -> Path:
+    """45-minute test pattern with an AAC tone, muxed like a typical episode (MP4, sparse keyframes)"""
+    episode = tmp_path_factory.mktemp("benchmark") / "episode.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-nostdin",
+            "-y",
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc=size=160x120:rate=5:duration={EPISODE_SECONDS}",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=440:sample_rate=48000:duration={EPISODE_SECONDS}",
+            "-c:v",
+            "mpeg4",
+            "-g",
+            "250",
+            "-c:a",
+            "aac",
+            "-shortest",
+            str(episode),
+        ],
+        check=True,
+        capture_output=True,
+        timeout=900,
+    )
+    return episode
+
+
+def _decode_output_side_seek(episode: Path, start_time: float, end_time: float) -> int:
+    """Previous extraction command: -ss after -i decodes everything before start_time"""
+    cmd = ["ffmpeg", "-nostdin", "-i", str(episode), "-ss", str(start_time), "-t", str(end_time - start_time)]
+    result = subprocess.run([*cmd, *PCM_PIPE_ARGS], check=True, capture_output=True, timeout=600)
+    return len(result.stdout) // 2
+
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+@pytest.mark.timeout(1800)
+def test_input_side_seek_faster_for_late_chunk(synthetic_episode) -> None:
+    """The last chunk no longer pays for decoding the 40 minutes before it."""
+    service = ChunkTranscriptionService()
+    start_time, end_time = WINDOWS[-1]
+
+    old_samples, old_seconds = _timed(_decode_output_side_seek, synthetic_episode, start_time, end_time)
+    new_pcm, new_seconds = _timed(asyncio.run, service._decode_pcm(synthetic_episode, start_time, end_time))
+
+    print(f"\nLast chunk: output-side seek {old_seconds:.2f}s, input-side seek {new_seconds:.2f}s")
+    assert abs(len(new_pcm) - old_samples) <= SAMPLE_RATE // 100  # same window within 10 ms
+    assert new_seconds < old_seconds
+
+
+@pytest.mark.timeout(3600)
+def test_one_pass_split_faster_than_per_chunk_extraction(synthetic_episode) -> None:
+    """One FFmpeg run for the whole episode beats one run per chunk."""
+    service = ChunkTranscriptionService()
+
+    _, old_seconds = _timed(lambda: [_decode_output_side_seek(synthetic_episode, *w) for w in WINDOWS])
+
+    async def per_chunk():
+        return [await service._decode_pcm(synthetic_episode, *window) for window in WINDOWS]
+
+    per_chunk_pcm, per_chunk_seconds = _timed(asyncio.run, per_chunk())
+    buffers, split_seconds = _timed(asyncio.run, service.split_episode_audio(synthetic_episode, WINDOWS))
+
+    print(
+        f"\n{len(WINDOWS)} chunks: output-side seek {old_seconds:.2f}s, "
+        f"input-side seek {per_chunk_seconds:.2f}s, one-pass split {split_seconds:.2f}s"
+    )
+    assert all(abs(len(samples) - CHUNK_SECONDS * SAMPLE_RATE) <= SAMPLE_RATE // 100 for samples in buffers)
+    assert sum(len(pcm) for pcm in per_chunk_pcm) == pytest.approx(EPISODE_SECONDS * SAMPLE_RATE, rel=0.001)
+    assert per_chunk_seconds < old_seconds
+    assert split_seconds < old_seconds
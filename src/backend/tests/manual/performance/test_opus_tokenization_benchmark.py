@@ -0,0 +1,77 @@
+"""Benchmark OPUS-MT tokenization around CTranslate2 on a subtitle-sized batch.
+
+Compares the old per-text loop (``encode`` + ``convert_ids_to_tokens``, then
+``convert_tokens_to_ids`` + ``decode`` per hypothesis) with the batched SentencePiece path of
+OpusCT2TranslationService. Only the tokenizer is loaded; the target side reuses the source
+pieces as stand-in hypotheses. Run with ``-s`` to see tokens/sec.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService
+
+# Mark as manual test
+pytestmark = pytest.mark.manual
+
+MODEL_NAME = "Helsinki-NLP/opus-mt-de-en"
+BATCH_SIZE = 512
+SENTENCES = [
+    "Ich habe dir doch gesagt, dass wir heute Abend nicht ausgehen können.",
+    "Warum bist du so spät nach Hause gekommen?",
+    "Das ist die beste Idee, die ich seit Langem gehört habe!",
+    "Wir sehen uns morgen früh am Bahnhof.",
+]
+
+
+@pytest.fixture(scope="module")
+def service() -> OpusCT2TranslationService:
+    transformers = pytest.importorskip("transformers")
+    pytest.importorskip("sentencepiece")
+    service = OpusCT2TranslationService(model_name=MODEL_NAME)
+    service._tokenizer = transformers.AutoTokenizer.from_pretrained(MODEL_NAME)
+    return service
+
+
+def _encode_per_text(tokenizer, texts: list[str]) -> list[list[str]]:
+    return [tokenizer.convert_ids_to_tokens(tokenizer.encode(text, add_special_tokens=True)) for text in texts]
+
+
+def _decode_per_text(tokenizer, hypotheses: list[list[str]]) -> list[str]:
+    return [
+        tokenizer.decode(tokenizer.convert_tokens_to_ids(pieces), skip_special_tokens=True) for pieces in hypotheses
+    ]
+
+
+def _tokens_per_second(func, *args, tokens: int, repeats: int = 5) -> tuple[object, float]:
+    started = time.perf_counter()
+    for _ in range(repeats):
+        result = func(*args)
+    return result, tokens * repeats / (time.perf_counter() - started)
+
+
+@pytest.mark.timeout(600)
+def test_batched_tokenization_faster_than_per_text_loop(service) -> None:
+    """Batched encode/decode produce the same pieces and texts in less time."""
+    tokenizer = service._tokenizer
+    texts = [SENTENCES[i % len(SENTENCES)] for i in range(BATCH_SIZE)]
+    pieces = _encode_per_text(tokenizer, texts)
+    tokens = sum(len(row) for row in pieces)
+    hypotheses = [row[:-1] for row in pieces]  # CTranslate2 hypotheses carry no </s>
+
+    old_pieces, old_encode = _tokens_per_second(_encode_per_text, tokenizer, texts, tokens=tokens)
+    new_pieces, new_encode = _tokens_per_second(service._encode_batch, texts, tokens=tokens)
+    old_texts, old_decode = _tokens_per_second(_decode_per_text, tokenizer, hypotheses, tokens=tokens)
+    new_texts, new_decode = _tokens_per_second(service._decode_batch, hypotheses, tokens=tokens)
+
+    print(
+        f"\n{BATCH_SIZE} texts, {tokens} tokens: encode {old_encode:,.0f} -> {new_encode:,.0f} tokens/s, "
+        f"decode {old_decode:,.0f} -> {new_decode:,.0f} tokens/s"
+    )
+    assert new_pieces == old_pieces
+    assert new_encode > old_encode
+    assert new_decode > old_decode
+    assert len(new_texts) == len(old_texts)
@@ -0,0 +1,153 @@
+"""Benchmark the vocabulary dashboard statistics on a seeded 10k-word, 1k-user database.
+
+Compares the old per-level loop (a total and a known COUNT per CEFR level plus one for known
+words without a vocabulary entry, 13 round trips) with the grouped query of
+VocabularyStatsService, and with the stats cache serving repeated dashboard loads. Uses an
+in-memory SQLite database. Run with ``-s`` to see the latencies.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from unittest.mock import PropertyMock, patch
+
+import pytest
+from sqlalchemy import and_, func, insert, select
+
+from core.database import Base
+from core.enums import CEFRLevel
+from database.models import User, UserVocabularyProgress, VocabularyWord
+from services.vocabulary.vocabulary_stats_cache import VocabularyStatsCache, vocabulary_stats_cache
+from services.vocabulary.vocabulary_stats_service import VocabularyStatsService
+
+# Mark as manual test
+pytestmark = pytest.mark.manual
+
+WORDS = 10_000
+USERS = 1_000
+MAX_KNOWN_PER_USER = 600
+SAMPLED_USERS = 100
+
+
+async def _seeded_engine():
+    """In-memory database with WORDS German words, USERS users and their progress rows"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(0)
+    levels = CEFRLevel.all_levels()
+    words = [
+        {"word": f"wort{i}", "lemma": f"wort{i}", "language": "de", "difficulty_level": levels[i % len(levels)]}
+        for i in range(WORDS)
+    ]
+    users = [{"email": f"user{i}@example.com", "username": f"user{i}", "hashed_password": "x"} for i in range(USERS)]
+    progress = []
+    for user_id in range(1, USERS + 1):
+        for vocabulary_id in rng.sample(range(1, WORDS + 1), rng.randrange(MAX_KNOWN_PER_USER)):
+            progress.append(
+                {
+                    "user_id": user_id,
+                    "vocabulary_id": vocabulary_id,
+                    "lemma": f"wort{vocabulary_id - 1}",
+                    "language": "de",
+                    "is_known": rng.random() < 0.8,
+                }
+            )
+        progress.append(
+            {"user_id": user_id, "vocabulary_id": None, "lemma": f"eigen{user_id}", "language": "de", "is_known": True}
+        )
+
+    async with engine.begin() as connection:
+        await connection.execute(insert(VocabularyWord), words)
+        await connection.execute(insert(User), users)
+        await connection.execute(insert(UserVocabularyProgress), progress)
+    return engine
+
+
+async def _per_level_stats(session, user_id: int, language: str) -> tuple[dict[str, dict[str, int]], int]:
+    """The old implementation: two COUNT queries per level plus the unlisted known words"""
+    levels = {}
+    total_known = 0
+    for level in CEFRLevel.all_levels():
+        total = await session.scalar(
+            select(func.count(VocabularyWord.id)).where(
+                and_(VocabularyWord.language == language, VocabularyWord.difficulty_level == level)
+            )
+        )
+        known = await session.scalar(
+            select(func.count(UserVocabularyProgress.id))
+            .where(
+                and_(
+                    UserVocabularyProgress.user_id == user_id,
+                    UserVocabularyProgress.language == language,
+                    UserVocabularyProgress.is_known,
+                )
+            )
+            .join(VocabularyWord, VocabularyWord.id == UserVocabularyProgress.vocabulary_id)
+            .where(VocabularyWord.difficulty_level == level)
+        )
+        levels[level] = {"total_words": total or 0, "user_known": known or 0}
+        total_known += known or 0
+
+    total_known += await session.scalar(
+        select(func.count(UserVocabularyProgress.id)).where(
+            and_(
+                UserVocabularyProgress.user_id == user_id,
+                UserVocabularyProgress.language == language,
+                UserVocabularyProgress.is_known,
+                UserVocabularyProgress.vocabulary_id.is_(None),
+            )
+        )
+    )
+    return levels, total_known
+
+
+async def _milliseconds_per_load(load, user_ids: list[int]) -> float:
+    started = time.perf_counter()
+    for user_id in user_ids:
+        await load(user_id)
+    return (time.perf_counter() - started) * 1000 / len(user_ids)
+
+
+@pytest.mark.timeout(600)
+async def test_grouped_stats_faster_than_per_level_counts() -> None:
+    """The grouped query returns the same numbers in less time; cached reloads are faster still."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    engine = await _seeded_engine()
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    service = VocabularyStatsService()
+    user_ids = random.Random(1).sample(range(1, USERS + 1), SAMPLED_USERS)
+
+    async with session_factory() as session:
+        for user_id in user_ids[:10]:
+            levels, total_known = await _per_level_stats(session, user_id, "de")
+            stats = await service._get_vocabulary_stats_with_session(session, user_id, "de", "en")
+            assert stats.levels == levels
+            assert stats.total_known == total_known
+
+        old = await _milliseconds_per_load(lambda user_id: _per_level_stats(session, user_id, "de"), user_ids)
+        new = await _milliseconds_per_load(
+            lambda user_id: service._get_vocabulary_stats_with_session(session, user_id, "de", "en"), user_ids
+        )
+
+        vocabulary_stats_cache.clear()
+        with patch.object(VocabularyStatsCache, "enabled", new_callable=PropertyMock, return_value=True):
+            await _milliseconds_per_load(lambda user_id: service.get_vocabulary_stats(session, user_id, "de"), user_ids)
+            cached = await _milliseconds_per_load(
+                lambda user_id: service.get_vocabulary_stats(session, user_id, "de"), user_ids
+            )
+        vocabulary_stats_cache.clear()
+    await engine.dispose()
+
+    print(
+        f"\n{WORDS} words, {USERS} users: dashboard stats {old:.2f} ms (per-level counts) -> "
+        f"{new:.2f} ms (grouped query) -> {cached:.3f} ms (cached)"
+    )
+    assert new < old
+    assert cached < new
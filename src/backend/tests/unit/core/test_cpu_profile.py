@@ -0,0 +1,114 @@
+"""
+Unit tests for the CPU performance profile
+Tests splitting cores between ASR and translation threads and the calibration clip
+"""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from core.cpu_profile import (
+    CPUThreadPlan,
+    measure_real_time_factor,
+    plan_cpu_threads,
+    synthetic_calibration_clip,
+)
+from services.transcriptionservice.faster_whisper_implementation import FasterWhisperTranscriptionService
+
+
+class TestPlanCpuThreads:
+    """Test core budgeting"""
+
+    def test_single_asr_process(self):
+        assert plan_cpu_threads(8) == CPUThreadPlan(
+            cores=8, asr_processes=1, asr_threads=5, translation_models=1, translation_threads=2
+        )
+
+    def test_asr_processes_share_asr_cores(self):
+        plan = plan_cpu_threads(16, asr_processes=3, translation_models=2)
+
+        assert plan.asr_threads == 3
+        assert plan.translation_threads == 2
+        assert plan.asr_processes * plan.asr_threads + plan.translation_models * plan.translation_threads <= 15
+
+    def test_all_cores_to_asr_without_translation(self):
+        plan = plan_cpu_threads(8, translation_models=0)
+
+        assert (plan.asr_threads, plan.translation_threads) == (7, 0)
+
+    @pytest.mark.parametrize("cores", [1, 2])
+    def test_small_hosts_get_at_least_one_thread(self, cores):
+        plan = plan_cpu_threads(cores, asr_processes=4, translation_models=2)
+
+        assert plan.asr_threads >= 1
+        assert plan.translation_threads >= 1
+
+
+class TestCalibration:
+    """Test the synthetic clip and real-time factor measurement"""
+
+    def test_clip_is_16khz_float32(self):
+        clip = synthetic_calibration_clip(2.0)
+
+        assert clip.dtype == np.float32
+        assert len(clip) == 32000
+        assert np.abs(clip).max() <= 1.0
+
+    def test_real_time_factor(self):
+        transcribe = Mock()
+
+        with patch("core.cpu_profile.time.perf_counter", side_effect=[10.0, 15.0]):
+            rtf = measure_real_time_factor(transcribe, seconds=10.0)
+
+        assert rtf == 0.5
+        assert len(transcribe.call_args.args[0]) == 160000
+
+
+class TestFasterWhisperThreadSizing:
+    """Test the ASR engine picks up the plan on CPU"""
+
+    def test_cpu_threads_from_plan(self):
+        engine = FasterWhisperTranscriptionService(model_size="tiny", device="cpu")
+        fake_faster_whisper = Mock()
+        plan = plan_cpu_threads(12)
+
+        with (
+            patch.dict("sys.modules", {"faster_whisper": fake_faster_whisper}),
+            patch("core.gpu_utils.check_cuda_availability", return_value=False),
+            patch("core.cpu_profile.get_cpu_thread_plan", return_value=plan),
+            patch.object(engine, "_calibrate"),
+        ):
+            engine.initialize()
+
+        assert fake_faster_whisper.WhisperModel.call_args.kwargs["cpu_threads"] == plan.asr_threads
+
+    def test_explicit_cpu_threads_win(self):
+        engine = FasterWhisperTranscriptionService(model_size="tiny", device="cpu", cpu_threads=2)
+        fake_faster_whisper = Mock()
+
+        with (
+            patch.dict("sys.modules", {"faster_whisper": fake_faster_whisper}),
+            patch("core.gpu_utils.check_cuda_availability", return_value=False),
+            patch.object(engine, "_calibrate"),
+        ):
+            engine.initialize()
+
+        assert fake_faster_whisper.WhisperModel.call_args.kwargs["cpu_threads"] == 2
+
+    def test_calibration_runs_once_per_model_configuration(self):
+        fake_faster_whisper = Mock()
+        fake_faster_whisper.WhisperModel.return_value.transcribe.return_value = ([], None)
+
+        with (
+            patch.dict("sys.modules", {"faster_whisper": fake_faster_whisper}),
+            patch.dict("services.transcriptionservice.faster_whisper_implementation._calibrated_real_time_factors"),
+            patch("core.gpu_utils.check_cuda_availability", return_value=False),
+            patch("core.config.settings.cpu_profile_calibrate", True),
+        ):
+            for _ in range(2):  # e.g. a registry reload
+                engine = FasterWhisperTranscriptionService(model_size="tiny", device="cpu", cpu_threads=2)
+                engine.initialize()
+
+        assert fake_faster_whisper.WhisperModel.return_value.transcribe.call_count == 1
+        assert engine.real_time_factor is not None
@@ -0,0 +1,14 @@
+"""
+Unit tests for Histogram
+Tests cumulative bucket counts
+"""
+
+from core.histogram import Histogram
+
+
+def test_snapshot():
+    histogram = Histogram((1, 5))
+    for value in (0.5, 3, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.snapshot() == {"buckets": {"1": 1, "5": 3, "+Inf": 4}, "count": 4, "sum": 16.5, "mean": 4.125}
@@ -52,7 +52,7 @@ class TestProcessChunk:
         service.utilities.complete_processing = Mock()
         service.utilities.cleanup_old_chunk_files = Mock()
 
-        service.transcription_service.extract_audio_chunk = AsyncMock(return_value="/temp/audio.wav")
+        service.transcription_service.load_chunk_audio = AsyncMock(return_value=Path("/temp/audio.wav"))
         service.transcription_service.transcribe_chunk = AsyncMock(return_value="/temp/subtitles.srt")
         service.transcription_service.find_matching_srt_file = Mock(return_value="/temp/subtitles.srt")
         service.transcription_service.cleanup_temp_audio_file = Mock()
@@ -78,6 +78,40 @@ class TestProcessChunk:
         service.utilities.complete_processing.assert_called_once()
         service.transcription_service.cleanup_temp_audio_file.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_chunk_cached_transcript_skips_extraction(self, service, task_progress):
+        """Test a cached transcript skips ffmpeg and Whisper"""
+        service.utilities.resolve_video_path = Mock(return_value=Path("/resolved/video.mp4"))
+        service.utilities.initialize_progress = Mock()
+        service.utilities.get_authenticated_user = AsyncMock(return_value=Mock(id=1))
+        service.utilities.load_user_language_preferences = Mock(return_value={"level": "A1", "target": "de"})
+        service.utilities.complete_processing = Mock()
+        service.utilities.cleanup_old_chunk_files = Mock()
+
+        service.transcription_service.load_cached_transcript = Mock(return_value="/resolved/video.srt")
+        service.transcription_service.load_chunk_audio = AsyncMock()
+        service.transcription_service.transcribe_chunk = AsyncMock()
+        service.transcription_service.cleanup_temp_audio_file = Mock()
+
+        service._filter_vocabulary = AsyncMock(return_value=[])
+        service._generate_filtered_subtitles = AsyncMock(return_value="/resolved/video_postgame.srt")
+        service.translation_service.build_translation_segments = AsyncMock(return_value=[])
+
+        await service.process_chunk(
+            video_path="/path/to/video.mp4",
+            start_time=0.0,
+            end_time=10.0,
+            user_id=1,
+            task_id="test_task_123",
+            task_progress=task_progress,
+            is_reprocessing=True,
+        )
+
+        service.transcription_service.load_chunk_audio.assert_not_called()
+        service.transcription_service.transcribe_chunk.assert_not_called()
+        service._filter_vocabulary.assert_called_once()
+        assert service._filter_vocabulary.call_args.args[2] == "/resolved/video.srt"
+
     @pytest.mark.asyncio
     async def test_process_chunk_error_cleanup(self, service, task_progress):
         """Test cleanup on error"""
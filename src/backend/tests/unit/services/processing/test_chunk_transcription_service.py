@@ -6,10 +6,19 @@ Tests audio extraction and transcription for video chunks
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
-from services.processing.chunk_transcription_service import ChunkTranscriptionError, ChunkTranscriptionService
+from services.processing.chunk_transcription_service import (
+    ChunkTranscriptionError,
+    ChunkTranscriptionService,
+    ffmpeg_seek_args,
+)
+from services.transcriptionservice.audio_track_cache import AudioTrackCache
 from services.transcriptionservice.interface import TranscriptionResult, TranscriptionSegment
+from services.transcriptionservice.speech_detection import SpeechDetectionResult, SpeechIsland
+from services.transcriptionservice.transcript_cache import TranscriptCache
+from services.transcriptionservice.word_timings import WORD_TIMING_FIELDS
 
 
 class TestChunkTranscriptionServiceInitialization:
@@ -402,6 +411,386 @@ class TestTranscribeChunk:
                     )
 
 
+class TestInMemoryAudio:
+    """Test FFmpeg PCM decoding straight into a NumPy buffer"""
+
+    @pytest.fixture
+    def service(self):
+        return ChunkTranscriptionService()
+
+    @pytest.fixture
+    def task_progress(self):
+        return {"test_task": Mock(progress=0, current_step="", message="")}
+
+    @pytest.mark.asyncio
+    async def test_decode_audio_chunk_returns_float32_samples(self, service, task_progress, tmp_path):
+        """Test s16le PCM from ffmpeg stdout becomes float32 samples without a temp file"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+        mock_process = Mock(returncode=0)
+        mock_process.communicate = AsyncMock(return_value=(pcm, b""))
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            samples = await service.decode_audio_chunk("test_task", task_progress, video_file, 0.0, 10.0)
+
+        assert samples.dtype == np.float32
+        assert samples.tolist() == [0.0, 0.5, -1.0]
+        assert mock_exec.call_args.args[-1] == "pipe:1"
+        assert list(tmp_path.iterdir()) == [video_file]
+
+    @pytest.mark.asyncio
+    async def test_decode_audio_chunk_empty_output(self, service, task_progress, tmp_path):
+        """Test a segment without audio is an error"""
+        mock_process = Mock(returncode=0)
+        mock_process.communicate = AsyncMock(return_value=(b"", b""))
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            with pytest.raises(ChunkTranscriptionError, match="no audio"):
+                await service.decode_audio_chunk("test_task", task_progress, tmp_path / "video.mp4", 0.0, 10.0)
+
+    @pytest.mark.asyncio
+    async def test_load_chunk_audio_falls_back_to_wav(self, service, task_progress, tmp_path):
+        """Test a failed in-memory decode falls back to WAV extraction"""
+        wav_file = tmp_path / "video_chunk_0.0s_10.0s.wav"
+        service.audio_streaming_supported = Mock(return_value=True)
+        service.decode_audio_chunk = AsyncMock(side_effect=ChunkTranscriptionError("decode failed"))
+        service.extract_audio_chunk = AsyncMock(return_value=wav_file)
+
+        audio = await service.load_chunk_audio("test_task", task_progress, tmp_path / "video.mp4", 0.0, 10.0)
+
+        assert audio == wav_file
+
+    @pytest.mark.asyncio
+    async def test_load_chunk_audio_uses_wav_without_array_support(self, service, task_progress, tmp_path):
+        """Test engines that only accept paths keep the WAV mode"""
+        service.decode_audio_chunk = AsyncMock()
+        service.extract_audio_chunk = AsyncMock(return_value=tmp_path / "audio.wav")
+        path_only_engine = Mock()
+        path_only_engine.supports_array_input.return_value = False
+
+        with patch("core.dependencies.get_transcription_service", return_value=path_only_engine):
+            await service.load_chunk_audio("test_task", task_progress, tmp_path / "video.mp4", 0.0, 10.0)
+
+        service.decode_audio_chunk.assert_not_called()
+        service.extract_audio_chunk.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunk_passes_samples_directly(self, service, task_progress, tmp_path):
+        """Test decoded samples go to the engine through the batching scheduler and need no cleanup"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        samples = np.zeros(16000, dtype=np.float32)
+        mock_engine = Mock(max_parallel_requests=1)
+        mock_result = TranscriptionResult(
+            full_text="Hallo.", segments=[TranscriptionSegment(start_time=0.0, end_time=1.0, text="Hallo.")]
+        )
+
+        with (
+            patch("core.dependencies.get_transcription_service", return_value=mock_engine),
+            patch("services.processing.chunk_transcription_service.settings.vad_prepass_enabled", False),
+        ):
+            with patch("asyncio.to_thread", return_value=[mock_result]) as mock_to_thread:
+                srt_file = await service.transcribe_chunk(
+                    "test_task", task_progress, video_file, samples, {"target": "de"}, 0.0, 1.0
+                )
+
+        assert mock_to_thread.call_args.args[0] == mock_engine.transcribe_arrays
+        assert mock_to_thread.call_args.args[1][0] is samples
+        assert "Hallo." in Path(srt_file).read_text(encoding="utf-8")
+        service.cleanup_temp_audio_file(samples, video_file)  # no-op for in-memory audio
+
+    @pytest.mark.asyncio
+    async def test_vad_prepass_sends_only_speech_and_rebases_timestamps(self, service, task_progress):
+        """Test only speech islands reach the engine and segments land on the chunk timeline"""
+        samples = np.arange(10 * 16000, dtype=np.float32)
+        speech = SpeechDetectionResult(
+            [SpeechIsland(2 * 16000, 3 * 16000), SpeechIsland(6 * 16000, 8 * 16000)], len(samples)
+        )
+        mock_engine = Mock()
+        mock_engine.transcribe.return_value = TranscriptionResult(
+            full_text="Hallo Welt",
+            segments=[
+                TranscriptionSegment(
+                    start_time=0.5,
+                    end_time=1.0,
+                    text="Hallo",
+                    words=np.array([(0.5, 1.0, 0, 5)], dtype=WORD_TIMING_FIELDS),
+                ),
+                TranscriptionSegment(start_time=1.0, end_time=2.5, text="Welt"),
+            ],
+        )
+
+        with (
+            patch("services.processing.chunk_transcription_service.detect_speech", return_value=speech),
+            patch("services.processing.chunk_transcription_service.get_transcription_scheduler", return_value=None),
+        ):
+            result = await service._transcribe_samples(mock_engine, samples, "de", "test_task", task_progress)
+
+        sent = mock_engine.transcribe.call_args.args[0]
+        np.testing.assert_array_equal(sent, np.concatenate([samples[32000:48000], samples[96000:128000]]))
+        assert [(s.start_time, s.end_time) for s in result.segments] == [(2.5, 3.0), (6.0, 7.5)]
+        assert result.segments[0].words[["start", "end"]].tolist() == [(2.5, 3.0)]
+        assert task_progress["test_task"].speech_ratio == 0.3
+
+    @pytest.mark.asyncio
+    async def test_vad_prepass_skips_engine_without_speech(self, service, task_progress):
+        """Test a chunk of silence is not transcribed at all"""
+        mock_engine = Mock()
+        samples = np.zeros(5 * 16000, dtype=np.float32)
+
+        with patch(
+            "services.processing.chunk_transcription_service.detect_speech",
+            return_value=SpeechDetectionResult([], len(samples)),
+        ):
+            result = await service._transcribe_samples(mock_engine, samples, "de", "test_task", task_progress)
+
+        mock_engine.transcribe.assert_not_called()
+        assert result.segments == []
+        assert task_progress["test_task"].speech_ratio == 0.0
+
+    @pytest.mark.asyncio
+    async def test_streaming_pushes_cues_to_the_user(self, service, task_progress, tmp_path):
+        """Test each decoded segment is pushed over the WebSocket and drives progress, and the SRT is written once"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        progress_seen = []
+        mock_engine = Mock(max_parallel_requests=1)  # queued through the transcription scheduler
+
+        def transcribe_stream(audio, language):
+            yield TranscriptionSegment(start_time=0.0, end_time=5.0, text="Hallo.")
+            yield TranscriptionSegment(start_time=6.0, end_time=10.0, text="Wie geht's?")
+
+        async def send_user_message(user_id, message):
+            progress_seen.append(task_progress["test_task"].progress)
+
+        mock_engine.transcribe_stream.side_effect = transcribe_stream
+        service._create_srt_from_segments = Mock(wraps=service._create_srt_from_segments)
+
+        with (
+            patch("core.dependencies.get_transcription_service", return_value=mock_engine),
+            patch("services.processing.chunk_transcription_service.settings.vad_prepass_enabled", False),
+            patch("api.websocket_manager.manager.send_user_message", side_effect=send_user_message) as mock_send,
+        ):
+            srt_file = await service.transcribe_chunk(
+                "test_task",
+                task_progress,
+                video_file,
+                np.zeros(20 * 16000, dtype=np.float32),
+                {"target": "de"},
+                0.0,
+                20.0,
+                user_id=7,
+            )
+
+        messages = [call.args for call in mock_send.call_args_list]
+        assert [(user_id, message["index"], message["text"]) for user_id, message in messages] == [
+            ("7", 1, "Hallo."),
+            ("7", 2, "Wie geht's?"),
+        ]
+        assert messages[1][1]["type"] == "subtitle_segment"
+        assert progress_seen == [12.5, 20.0]
+        service._create_srt_from_segments.assert_called_once()
+        content = Path(srt_file).read_text(encoding="utf-8")
+        assert "00:00:06,000 --> 00:00:10,000" in content
+        assert "Wie geht's?" in content
+        mock_engine.transcribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_engine_without_incremental_decoding_is_batched(self, service, task_progress, tmp_path):
+        """Test streaming is skipped when it would only bypass the scheduler (e.g. the ASR worker pool)"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        mock_engine = Mock()
+        mock_engine.supports_streaming.return_value = False
+        scheduler = Mock()
+        scheduler.transcribe = AsyncMock(return_value=TranscriptionResult(full_text="Hallo.", segments=[]))
+
+        with (
+            patch("core.dependencies.get_transcription_service", return_value=mock_engine),
+            patch("services.processing.chunk_transcription_service.settings.vad_prepass_enabled", False),
+            patch(
+                "services.processing.chunk_transcription_service.get_transcription_scheduler", return_value=scheduler
+            ),
+        ):
+            await service.transcribe_chunk(
+                "test_task",
+                task_progress,
+                video_file,
+                np.zeros(16000, dtype=np.float32),
+                {"target": "de"},
+                0.0,
+                1.0,
+                user_id=7,
+            )
+
+        scheduler.transcribe.assert_awaited_once()
+        mock_engine.transcribe_stream.assert_not_called()
+
+
+class TestFfmpegSeeking:
+    """Test input-side seeking and the one-pass episode split"""
+
+    @pytest.fixture
+    def service(self):
+        return ChunkTranscriptionService()
+
+    def test_seek_args_seek_input_before_preroll(self):
+        """Test the input is seeked to just before the chunk and the rest is decoded exactly"""
+        input_args, output_args = ffmpeg_seek_args(2400.0, 600.0)
+
+        assert input_args == ["-ss", "2395.000"]
+        assert output_args == ["-ss", "5.000", "-t", "600.000"]
+
+    def test_seek_args_at_episode_start(self):
+        """Test chunks within the preroll need no input seek"""
+        assert ffmpeg_seek_args(0.0, 30.0) == ([], ["-t", "30.000"])
+        assert ffmpeg_seek_args(2.0, 30.0) == ([], ["-ss", "2.000", "-t", "30.000"])
+
+    @pytest.mark.asyncio
+    async def test_extract_audio_chunk_seeks_before_input(self, service, tmp_path):
+        """Test -ss comes before -i so ffmpeg does not decode the episode up to the chunk"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        audio_output = tmp_path / "video_chunk_1200.0s_1800.0s.wav"
+
+        async def fake_ffmpeg(*cmd, **kwargs):
+            audio_output.write_bytes(b"\0" * 1024 * 1024)
+            process = Mock(returncode=0)
+            process.communicate = AsyncMock(return_value=(b"", b""))
+            return process
+
+        task_progress = {"test_task": Mock(progress=0, current_step="", message="")}
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_ffmpeg) as mock_exec:
+            await service.extract_audio_chunk("test_task", task_progress, video_file, 1200.0, 1800.0)
+
+        cmd = list(mock_exec.call_args.args)
+        assert cmd.index("-ss") < cmd.index("-i")
+        assert cmd[cmd.index("-ss") + 1] == "1195.000"
+
+    @pytest.mark.asyncio
+    async def test_split_episode_audio_slices_one_decode(self, service, tmp_path):
+        """Test one ffmpeg run is split into per-chunk buffers at the window boundaries"""
+        pcm = np.arange(3 * 16000, dtype=np.int16).tobytes()  # 3s of audio from t=10s
+        mock_process = Mock(returncode=0)
+        mock_process.communicate = AsyncMock(return_value=(pcm, b""))
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            buffers = await service.split_episode_audio(
+                tmp_path / "video.mp4", [(10.0, 11.0), (11.0, 13.0), (13.0, 14.0)]
+            )
+
+        mock_exec.assert_called_once()
+        assert len(buffers[0]) == 16000
+        assert len(buffers[1]) == 32000
+        assert buffers[1][0] == np.float32(16000 / 32768.0)
+        assert buffers[2] is None  # window past the end of the audio
+
+
+class TestAudioTrackCacheReuse:
+    """Test chunks served from the video's cached audio track"""
+
+    @pytest.mark.asyncio
+    async def test_track_decoded_once_for_all_chunks(self, tmp_path):
+        """Test the first chunk decodes the whole track and later chunks are slices of it"""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"video-bytes")
+        service = ChunkTranscriptionService(audio_track_cache=AudioTrackCache(tmp_path / "audio_cache"))
+        task_progress = {"test_task": Mock(progress=0, current_step="", message="")}
+
+        async def fake_ffmpeg(cmd, video):
+            np.ones(4 * 16000, dtype=np.int16).tofile(cmd[-1])  # 4s track
+            return 0, b"", b""
+
+        service._run_ffmpeg = AsyncMock(side_effect=fake_ffmpeg)
+
+        first = await service.decode_audio_chunk("test_task", task_progress, video_file, 0.0, 2.0)
+        second = await service.decode_audio_chunk("test_task", task_progress, video_file, 2.0, 4.0)
+
+        service._run_ffmpeg.assert_awaited_once()
+        assert "-ss" not in service._run_ffmpeg.await_args.args[0]
+        assert len(first) == len(second) == 32000
+
+    @pytest.mark.asyncio
+    async def test_failed_track_decode_falls_back_to_chunk_decode(self, tmp_path):
+        """Test a failed whole-track decode still yields the chunk"""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"video-bytes")
+        cache = AudioTrackCache(tmp_path / "audio_cache")
+        service = ChunkTranscriptionService(audio_track_cache=cache)
+        task_progress = {"test_task": Mock(progress=0, current_step="", message="")}
+        service._run_ffmpeg = AsyncMock(
+            side_effect=[(1, b"", b"disk full"), (0, np.ones(16000, dtype=np.int16).tobytes(), b"")]
+        )
+
+        samples = await service.decode_audio_chunk("test_task", task_progress, video_file, 0.0, 1.0)
+
+        assert len(samples) == 16000
+        assert cache.get_stats()["entries"] == 0
+        assert list(cache.cache_dir.iterdir()) == []
+
+
+class TestTranscriptCache:
+    """Test transcript reuse across chunk reprocessing"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return TranscriptCache(tmp_path / "transcript_cache")
+
+    @pytest.fixture
+    def service(self, cache):
+        return ChunkTranscriptionService(transcript_cache=cache)
+
+    def test_load_cached_transcript_miss(self, service, tmp_path):
+        """Test a miss returns None without touching progress"""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"video")
+        task_progress = {"test_task": Mock(progress=0, current_step="", message="")}
+
+        result = service.load_cached_transcript("test_task", task_progress, video_file, {"target": "de"}, 0.0, 30.0)
+
+        assert result is None
+        assert task_progress["test_task"].progress == 0
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunk_populates_cache(self, service, cache, tmp_path):
+        """Test a transcribed chunk is restored from cache on the next request"""
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"video")
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+        task_progress = {"test_task": Mock(progress=0, current_step="", message="")}
+        mock_result = TranscriptionResult(
+            full_text="Hallo Welt.",
+            segments=[TranscriptionSegment(start_time=0.0, end_time=2.0, text="Hallo Welt.")],
+            language="de",
+        )
+
+        with patch("core.dependencies.get_transcription_service", return_value=Mock()):
+            with patch("asyncio.to_thread", return_value=mock_result):
+                await service.transcribe_chunk(
+                    "test_task", task_progress, video_file, audio_file, {"target": "de"}, 0.0, 30.0
+                )
+
+        video_file.with_suffix(".srt").unlink()
+        result = service.load_cached_transcript("test_task", task_progress, video_file, {"target": "de"}, 0.0, 30.0)
+
+        assert result == str(video_file.with_suffix(".srt"))
+        assert "Hallo Welt." in Path(result).read_text(encoding="utf-8")
+        assert task_progress["test_task"].progress == 35
+        assert cache.get_stats()["hits"] == 1
+
+        # A different window or language is a different transcript
+        other_window = service.load_cached_transcript(
+            "test_task", task_progress, video_file, {"target": "de"}, 30.0, 60.0
+        )
+        other_language = service.load_cached_transcript(
+            "test_task", task_progress, video_file, {"target": "en"}, 0.0, 30.0
+        )
+        assert other_window is None
+        assert other_language is None
+
+
 class TestProgressSimulation:
     """Test progress simulation during transcription"""
 
@@ -417,15 +806,15 @@ class TestProgressSimulation:
         task_id = "test_task"
         task_progress = {task_id: Mock(progress=5, current_step="", message="")}
         stop_event = asyncio.Event()
-        
+
         # Start progress simulation for a 60-second audio (estimated ~12s transcription)
         progress_task = asyncio.create_task(
             service._simulate_transcription_progress(task_id, task_progress, 60.0, stop_event)
         )
-        
+
         # Wait a bit for progress to update
         await asyncio.sleep(2.5)
-        
+
         # Stop simulation
         stop_event.set()
         progress_task.cancel()
@@ -433,7 +822,7 @@ class TestProgressSimulation:
             await progress_task
         except asyncio.CancelledError:
             pass
-        
+
         # Progress should have increased from initial 5%
         assert task_progress[task_id].progress > 5, "Progress should increase during transcription"
         # Progress should be less than 35% (end of transcription phase)
@@ -449,15 +838,15 @@ class TestProgressSimulation:
         task_id = "test_task"
         task_progress = {task_id: Mock(progress=5, current_step="", message="")}
         stop_event = asyncio.Event()
-        
+
         # Start progress simulation for very short audio (2s -> estimated 0.4s transcription)
         progress_task = asyncio.create_task(
             service._simulate_transcription_progress(task_id, task_progress, 2.0, stop_event)
         )
-        
+
         # Wait longer than estimated time
         await asyncio.sleep(5.0)
-        
+
         # Stop simulation
         stop_event.set()
         progress_task.cancel()
@@ -465,6 +854,6 @@ class TestProgressSimulation:
             await progress_task
         except asyncio.CancelledError:
             pass
-        
+
         # Progress should not exceed ~33.5% (5% + 0.95 * 30% = 33.5%)
         assert task_progress[task_id].progress <= 34, "Progress should cap at ~95% of target range"
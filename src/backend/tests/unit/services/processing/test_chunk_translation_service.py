@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from services.processing.chunk_translation_service import ChunkTranslationService
+from services.translationservice.translation_cache import TranslationCache
 from utils.srt_parser import SRTSegment
 
 
@@ -26,10 +27,11 @@ class TestChunkTranslationServiceInitialization:
     """Test service initialization"""
 
     def test_initialization(self):
-        """Test service initializes with empty cache"""
+        """Test service initializes with default batching limits"""
         service = ChunkTranslationService()
 
-        assert service._translation_services == {}
+        assert service.batch_token_budget > 0
+        assert service.max_batch_segments > 0
 
 
 class TestGetTranslationService:
@@ -54,19 +56,19 @@ class TestGetTranslationService:
             assert "service_name" in call_kwargs
             assert "model_name" in call_kwargs
 
-    def test_get_translation_service_caches(self, service):
-        """Test translation service is cached"""
+    def test_get_translation_service_shares_factory_instance(self, service):
+        """Test the process-wide factory instance is used, not a per-service copy"""
         with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
             mock_service = Mock()
             MockFactory.create_service.return_value = mock_service
 
-            # First call creates service
             result1 = service.get_translation_service("de", "en", "standard")
-            # Second call uses cached service
-            result2 = service.get_translation_service("de", "en", "standard")
+            result2 = ChunkTranslationService().get_translation_service("de", "en", "standard")
 
-            assert result1 == result2
-            assert MockFactory.create_service.call_count == 1
+            assert result1 is result2 is mock_service
+            assert {call.kwargs["model_name"] for call in MockFactory.create_service.call_args_list} == {
+                "Helsinki-NLP/opus-mt-de-en"
+            }
 
     def test_get_translation_service_different_pairs(self, service):
         """Test different language pairs create separate services"""
@@ -172,12 +174,10 @@ class TestBuildTranslationSegments:
 
         # Mock the translation service to avoid slow transformers import
         from services.translationservice.interface import TranslationResult
+
         mock_translation_service = Mock()
         mock_translation_service.translate.return_value = TranslationResult(
-            original_text="Other text",
-            translated_text="Translated text",
-            source_language="en",
-            target_language="de"
+            original_text="Other text", translated_text="Translated text", source_language="en", target_language="de"
         )
 
         with patch("services.processing.chunk_translation_service.SRTParser") as MockParser:
@@ -358,6 +358,116 @@ class TestBuildTranslationTexts:
         assert final_progress > initial_progress
 
 
+class TestBatchedTranslation:
+    """Test token-budgeted batch translation"""
+
+    @pytest.fixture
+    def task_progress(self):
+        return {"test_task": Mock(progress=0, current_step="", message="")}
+
+    @staticmethod
+    def _segments(count: int, text: str = "Hallo Welt") -> list[SRTSegment]:
+        return [SRTSegment(i, "00:00:00,000", "00:00:02,000", text) for i in range(1, count + 1)]
+
+    def test_plan_batches_respects_segment_limit(self):
+        """Test batches are split at max_batch_segments"""
+        service = ChunkTranslationService(batch_token_budget=10_000, max_batch_segments=4)
+
+        batches = service._plan_translation_batches(self._segments(10))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+
+    def test_plan_batches_respects_token_budget(self):
+        """Test batches are split when the token budget would be exceeded"""
+        service = ChunkTranslationService(batch_token_budget=10, max_batch_segments=100)
+
+        # "Hallo Welt" is estimated at 4 tokens, so two segments fit in a budget of 10
+        batches = service._plan_translation_batches(self._segments(5))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_plan_batches_oversized_segment_gets_own_batch(self):
+        """Test a segment larger than the budget is still translated"""
+        service = ChunkTranslationService(batch_token_budget=5, max_batch_segments=100)
+        segments = [*self._segments(1), SRTSegment(2, "00:00:02,000", "00:00:04,000", "ein sehr langer Satz " * 5)]
+
+        batches = service._plan_translation_batches(segments)
+
+        assert [len(batch) for batch in batches] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_build_translation_texts_uses_translate_batch(self, task_progress):
+        """Test segments are translated with one translate_batch call per batch"""
+        service = ChunkTranslationService(max_batch_segments=2)
+        segments = self._segments(3)
+
+        mock_translation_service = Mock()
+        mock_translation_service.translate_batch.side_effect = lambda texts, src, tgt, mode: [
+            Mock(translated_text=f"{text} ({tgt})") for text in texts
+        ]
+        service.get_translation_service = Mock(return_value=mock_translation_service)
+
+        result = await service._build_translation_texts(
+            task_id="test_task",
+            task_progress=task_progress,
+            subtitle_segments=segments,
+            language_preferences={"target": "de", "native": "en"},
+        )
+
+        assert mock_translation_service.translate_batch.call_count == 2
+        mock_translation_service.translate.assert_not_called()
+        assert [seg.index for seg in result] == [1, 2, 3]
+        assert all(seg.text == "Hallo Welt (en)" for seg in result)
+        assert task_progress["test_task"].progress == 95
+
+    @pytest.mark.asyncio
+    async def test_build_translation_texts_falls_back_on_batch_failure(self, task_progress):
+        """Test a failing batch is retried segment by segment"""
+        service = ChunkTranslationService()
+        segments = [*self._segments(1), SRTSegment(2, "00:00:02,000", "00:00:04,000", "Guten Tag")]
+
+        mock_translation_service = Mock()
+        mock_translation_service.translate_batch.side_effect = RuntimeError("batch failed")
+        mock_translation_service.translate.return_value = Mock(translated_text="Hello World")
+        service.get_translation_service = Mock(return_value=mock_translation_service)
+
+        result = await service._build_translation_texts(
+            task_id="test_task",
+            task_progress=task_progress,
+            subtitle_segments=segments,
+            language_preferences={"target": "de", "native": "en"},
+        )
+
+        assert len(result) == 2
+        assert mock_translation_service.translate.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_build_translation_texts_serves_cached_segments(self, task_progress, tmp_path):
+        """Test cached lines skip the model and new lines are written to the cache"""
+        cache = TranslationCache(tmp_path / "translations.sqlite3")
+        cache.put_many("opus-de-en", "de", "en", {"Hallo Welt": "Hello world"})
+        service = ChunkTranslationService(translation_cache=cache)
+        segments = [*self._segments(2), SRTSegment(3, "00:00:04,000", "00:00:06,000", "Guten Tag")]
+
+        mock_translation_service = Mock(model_name="opus-de-en")
+        mock_translation_service.translate_batch.side_effect = lambda texts, src, tgt, mode: [
+            Mock(translated_text="Good day") for _ in texts
+        ]
+        service.get_translation_service = Mock(return_value=mock_translation_service)
+
+        result = await service._build_translation_texts(
+            task_id="test_task",
+            task_progress=task_progress,
+            subtitle_segments=segments,
+            language_preferences={"target": "de", "native": "en"},
+        )
+
+        mock_translation_service.translate_batch.assert_called_once_with(["Guten Tag"], "de", "en", mode="live")
+        assert [seg.text for seg in result] == ["Hello world", "Hello world", "Good day"]
+        assert cache.get_many("opus-de-en", "de", "en", ["Guten Tag"]) == {"Guten Tag": "Good day"}
+        cache.close()
+
+
 class TestSegmentsOverlap:
     """Test time segment overlap detection"""
 
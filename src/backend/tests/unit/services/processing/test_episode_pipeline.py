@@ -0,0 +1,225 @@
+"""
+Test suite for EpisodePipeline
+Tests chunk planning, stage overlap across chunks and per-chunk failure isolation
+"""
+
+import asyncio
+from collections import defaultdict
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from services.processing.chunk_processor import ChunkProcessingService
+from services.processing.chunk_transcription_service import ChunkTranscriptionError
+from services.processing.chunk_translation_service import ChunkTranslationService
+from services.processing.episode_pipeline import EpisodePipeline
+from services.translationservice.translation_scheduler import LIVE, OFFLINE
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    return tmp_path / "episode.mp4"
+
+
+@pytest.fixture
+def chunk_processor(video_file):
+    """Chunk processor whose stage methods are mocked"""
+    processor = ChunkProcessingService(
+        db_session=Mock(),
+        transcription_service=Mock(),
+        translation_service=Mock(),
+        utilities=Mock(),
+        vocabulary_filter=Mock(),
+        subtitle_generator=Mock(),
+        translation_manager=Mock(),
+    )
+    processor.utilities.resolve_video_path = Mock(return_value=video_file)
+    processor.utilities.get_authenticated_user = AsyncMock(return_value=Mock(id=1))
+    processor.utilities.load_user_language_preferences = Mock(return_value={"target": "de"})
+    processor.prepare_chunk_audio = AsyncMock(
+        side_effect=lambda task_id, *args, **kwargs: (None, video_file.with_name(f"{task_id}.wav"))
+    )
+    processor.transcription_service.audio_streaming_supported = Mock(return_value=False)
+    processor.transcription_service.transcribe_chunk = AsyncMock(
+        side_effect=lambda task_id, *args, srt_output, **kwargs: str(srt_output)
+    )
+    processor.finalize_chunk = AsyncMock()
+    return processor
+
+
+class TestPlanChunks:
+    """Test splitting a range by the user's chunk duration"""
+
+    def test_splits_by_chunk_duration(self):
+        chunks = EpisodePipeline.plan_chunks(0.0, 1500.0, 10, user_id=7)
+
+        assert [(c.start_time, c.end_time) for c in chunks] == [(0.0, 600.0), (600.0, 1200.0), (1200.0, 1500.0)]
+        assert chunks[1].task_id.startswith("chunk_7_600_1200_")
+
+    def test_default_duration(self):
+        chunks = EpisodePipeline.plan_chunks(0.0, 1500.0, None, user_id=7)
+
+        assert [(c.start_time, c.end_time) for c in chunks] == [(0.0, 1200.0), (1200.0, 1500.0)]
+
+
+class TestPipelineRun:
+    """Test staged processing across chunks"""
+
+    @pytest.mark.asyncio
+    async def test_next_chunk_extracted_while_previous_finalizes(self, chunk_processor, video_file):
+        """Chunk 0 cannot finish until chunk 1 has been extracted - deadlocks if stages run sequentially"""
+        chunks = EpisodePipeline.plan_chunks(0.0, 1800.0, 10, user_id=1)
+        second_extracted = asyncio.Event()
+
+        async def prepare(task_id, *args, **kwargs):
+            if task_id == chunks[1].task_id:
+                second_extracted.set()
+            return None, video_file.with_name(f"{task_id}.wav")
+
+        async def finalize(task_id, *args, **kwargs):
+            if task_id == chunks[0].task_id:
+                await second_extracted.wait()
+
+        chunk_processor.prepare_chunk_audio = AsyncMock(side_effect=prepare)
+        chunk_processor.finalize_chunk = AsyncMock(side_effect=finalize)
+
+        pipeline = EpisodePipeline(chunk_processor, queue_size=1)
+        await asyncio.wait_for(pipeline.run(str(video_file), chunks, 1, {}), timeout=5)
+
+        assert chunk_processor.finalize_chunk.await_count == 3
+        finalized_srts = [call.args[3] for call in chunk_processor.finalize_chunk.await_args_list]
+        assert finalized_srts == [
+            str(video_file.with_name("episode_0-600s.srt")),
+            str(video_file.with_name("episode_600-1200s.srt")),
+            str(video_file.with_name("episode_1200-1800s.srt")),
+        ]
+        assert chunk_processor.transcription_service.cleanup_temp_audio_file.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_transcript_skips_transcription(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 600.0, 10, user_id=1)
+        chunk_processor.prepare_chunk_audio = AsyncMock(
+            return_value=(str(video_file.with_name("episode_0-600s.srt")), video_file)
+        )
+
+        await EpisodePipeline(chunk_processor, queue_size=1).run(str(video_file), chunks, 1, {})
+
+        chunk_processor.transcription_service.transcribe_chunk.assert_not_called()
+        chunk_processor.finalize_chunk.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_does_not_stop_pipeline(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 1800.0, 10, user_id=1)
+        error = RuntimeError("whisper crashed")
+
+        async def transcribe(task_id, *args, srt_output, **kwargs):
+            if task_id == chunks[1].task_id:
+                raise error
+            return str(srt_output)
+
+        chunk_processor.transcription_service.transcribe_chunk = AsyncMock(side_effect=transcribe)
+        task_progress = {}
+
+        await EpisodePipeline(chunk_processor, queue_size=1).run(str(video_file), chunks, 1, task_progress)
+
+        chunk_processor.utilities.handle_error.assert_called_once_with(chunks[1].task_id, task_progress, error)
+        finalized = [call.args[0] for call in chunk_processor.finalize_chunk.await_args_list]
+        assert finalized == [chunks[0].task_id, chunks[2].task_id]
+
+
+class TestTranslationModes:
+    """Test the watched chunk is translated live and the chunks after it offline"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_after_the_watched_one_are_translated_offline(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 1800.0, 10, user_id=1)
+
+        def transcribe(task_id, *args, srt_output, **kwargs):
+            srt_output.write_text("1\n00:00:01,000 --> 00:00:02,000\nHallo Welt\n", encoding="utf-8")
+            return str(srt_output)
+
+        chunk_processor.transcription_service.transcribe_chunk = AsyncMock(side_effect=transcribe)
+        chunk_processor.vocabulary_filter.filter_vocabulary_from_srt = AsyncMock(return_value=[{"word": "welt"}])
+        chunk_processor.subtitle_generator.generate_filtered_subtitles = AsyncMock(return_value=None)
+        chunk_processor.finalize_chunk = ChunkProcessingService.finalize_chunk.__get__(chunk_processor)
+        chunk_processor.translation_service = ChunkTranslationService()
+        translator = Mock()
+        translator.translate_batch.side_effect = lambda texts, src, tgt, mode: [
+            Mock(translated_text="Hello world") for _ in texts
+        ]
+        task_progress = defaultdict(Mock)  # initialize_progress is mocked
+
+        with patch.object(ChunkTranslationService, "get_translation_service", return_value=translator):
+            await EpisodePipeline(chunk_processor, queue_size=1).run(str(video_file), chunks, 1, task_progress)
+
+        modes = [call.kwargs["mode"] for call in translator.translate_batch.call_args_list]
+        assert modes == [LIVE, OFFLINE, OFFLINE]
+
+
+class TestEpisodeAudioSplit:
+    """Test decoding the audio of consecutive chunks with one FFmpeg run per window"""
+
+    @staticmethod
+    def _split_service(chunk_processor):
+        service = chunk_processor.transcription_service
+        service.audio_streaming_supported.return_value = True
+        service.has_cached_transcript = Mock(return_value=False)
+        service.split_episode_audio = AsyncMock(
+            side_effect=lambda video, windows: [f"samples_{int(start)}" for start, _ in windows]
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_decoded_alone_and_rest_in_windows(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 3000.0, 10, user_id=1)
+        service = self._split_service(chunk_processor)
+
+        await EpisodePipeline(chunk_processor, queue_size=2).run(str(video_file), chunks, 1, {})
+
+        windows = [call.args[1] for call in service.split_episode_audio.await_args_list]
+        assert windows == [[(600.0, 1200.0), (1200.0, 1800.0)], [(1800.0, 2400.0), (2400.0, 3000.0)]]
+        passed_audio = [call.kwargs["audio"] for call in chunk_processor.prepare_chunk_audio.await_args_list]
+        assert passed_audio == [None, "samples_600", "samples_1200", "samples_1800", "samples_2400"]
+
+    @pytest.mark.asyncio
+    async def test_window_decoded_only_when_extraction_reaches_it(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 7200.0, 10, user_id=1)
+        service = self._split_service(chunk_processor)
+        release = asyncio.Event()
+
+        async def finalize(task_id, *args, **kwargs):
+            await release.wait()
+
+        chunk_processor.finalize_chunk = AsyncMock(side_effect=finalize)
+        run = asyncio.create_task(EpisodePipeline(chunk_processor, queue_size=2).run(str(video_file), chunks, 1, {}))
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+        # Finalize holds chunk 0 and the queues are full, so extraction stops after seven chunks
+        assert chunk_processor.prepare_chunk_audio.await_count == 7
+        assert service.split_episode_audio.await_count == 3
+        release.set()
+        await asyncio.wait_for(run, timeout=5)
+        assert service.split_episode_audio.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_cached_chunks_are_not_decoded(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 2400.0, 10, user_id=1)
+        service = self._split_service(chunk_processor)
+        service.has_cached_transcript.side_effect = lambda video, prefs, start, end: start == 1200.0
+
+        await EpisodePipeline(chunk_processor, queue_size=2).run(str(video_file), chunks, 1, {})
+
+        service.split_episode_audio.assert_not_awaited()  # only one chunk of the window needs audio
+
+    @pytest.mark.asyncio
+    async def test_failed_split_falls_back_to_per_chunk_decoding(self, chunk_processor, video_file):
+        chunks = EpisodePipeline.plan_chunks(0.0, 1800.0, 10, user_id=1)
+        service = self._split_service(chunk_processor)
+        service.split_episode_audio.side_effect = ChunkTranscriptionError("ffmpeg failed")
+
+        await EpisodePipeline(chunk_processor, queue_size=1).run(str(video_file), chunks, 1, {})
+
+        passed_audio = [call.kwargs["audio"] for call in chunk_processor.prepare_chunk_audio.await_args_list]
+        assert passed_audio == [None, None, None]
+        assert chunk_processor.finalize_chunk.await_count == 3
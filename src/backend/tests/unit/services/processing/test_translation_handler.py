@@ -0,0 +1,33 @@
+"""
+Unit tests for TranslationHandler
+Tests that cached translations, including empty ones, skip the translation model
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.processing.translation_handler import TranslationHandler
+from utils.srt_parser import SRTSegment
+
+
+@pytest.mark.asyncio
+async def test_cached_empty_translation_is_a_hit():
+    translation_service = MagicMock()
+    translation_service.translate = AsyncMock(return_value="Good day")
+    translation_cache = MagicMock()
+    translation_cache.get_many.return_value = {"♪": ""}
+    handler = TranslationHandler(translation_service, translation_cache)
+    segments = [
+        SRTSegment(index=1, start_time=0.0, end_time=1.0, text="♪"),
+        SRTSegment(index=2, start_time=1.0, end_time=2.0, text="Guten Tag"),
+    ]
+
+    translated = await handler._translate_segments(segments, {"task": SimpleNamespace()}, "task", "de", "en")
+
+    assert [segment.text for segment in translated] == ["", "Good day"]
+    translation_service.translate.assert_awaited_once()
+    translation_cache.put_many.assert_called_once_with(
+        translation_service.model_name, "de", "en", {"Guten Tag": "Good day"}
+    )
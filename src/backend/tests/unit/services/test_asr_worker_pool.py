@@ -0,0 +1,131 @@
+"""
+Unit tests for ASRWorkerPool
+Tests job dispatch to worker processes, crash isolation, recycling and CPU pinning plans
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.transcriptionservice.asr_worker_pool import (
+    ASRWorkerError,
+    ASRWorkerPool,
+    PooledTranscriptionService,
+    plan_cpu_sets,
+)
+from services.transcriptionservice.interface import TranscriptionResult
+
+
+class _EchoService:
+    """Stand-in model loaded in the worker process (module level so spawned workers can import it)"""
+
+    def initialize(self):
+        pass
+
+    def cleanup(self):
+        pass
+
+    def transcribe(self, audio_path, language=None):
+        if audio_path == "crash":
+            os._exit(3)
+        if audio_path == "fail":
+            raise ValueError("unreadable audio")
+        return TranscriptionResult(full_text=f"{audio_path}:{language}:{os.getpid()}", segments=[])
+
+
+def _echo_factory(service_name, **kwargs):
+    return _EchoService()
+
+
+@pytest.fixture
+def pool():
+    pool = ASRWorkerPool("echo", workers=1, max_jobs_per_worker=0, factory=_echo_factory)
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.timeout(60)
+class TestASRWorkerPool:
+    """Test jobs running in spawned worker processes"""
+
+    def test_runs_job_in_worker_process(self, pool):
+        result = pool.call("transcribe", "a.wav", "de")
+
+        text, language, pid = result.full_text.split(":")
+        assert (text, language) == ("a.wav", "de")
+        assert int(pid) != os.getpid()
+        assert pool.get_stats()["completed"] == 1
+
+    def test_job_error_is_raised_to_caller(self, pool):
+        with pytest.raises(ASRWorkerError, match="ValueError: unreadable audio"):
+            pool.call("transcribe", "fail", "de")
+
+        assert pool.call("transcribe", "b.wav", "de").full_text.startswith("b.wav")
+
+    def test_worker_crash_fails_only_its_job(self, pool):
+        with pytest.raises(ASRWorkerError, match="died"):
+            pool.call("transcribe", "crash", "de")
+
+        assert pool.call("transcribe", "c.wav", "de").full_text.startswith("c.wav")
+        assert pool.get_stats()["restarts"] == 1
+
+    def test_worker_restarted_after_max_jobs(self):
+        pool = ASRWorkerPool("echo", workers=1, max_jobs_per_worker=2, factory=_echo_factory)
+        try:
+            pids = {pool.call("transcribe", f"{i}.wav", "de").full_text.split(":")[2] for i in range(3)}
+        finally:
+            pool.shutdown()
+
+        assert len(pids) == 2
+
+    def test_saturation(self):
+        pool = ASRWorkerPool("echo", workers=1, max_queue_size=2, factory=_echo_factory)  # not started
+        pool._supervisor = Mock()  # accept jobs without dispatching them
+
+        pool.submit("transcribe", "a.wav", "de")
+        assert not pool.is_saturated()
+        pool.submit("transcribe", "b.wav", "de")
+        assert pool.is_saturated()
+
+
+class TestPlanCpuSets:
+    """Test disjoint per-worker core sets"""
+
+    @pytest.fixture(autouse=True)
+    def eight_cores(self):
+        with patch("os.sched_getaffinity", return_value=set(range(8)), create=True):
+            yield
+
+    def test_disjoint_sets(self):
+        assert plan_cpu_sets(2, 4) == [{0, 1, 2, 3}, {4, 5, 6, 7}]
+
+    def test_no_pinning_when_oversubscribed(self):
+        assert plan_cpu_sets(3, 4) == [None, None, None]
+
+    def test_no_pinning_without_thread_count(self):
+        assert plan_cpu_sets(2, 0) == [None, None]
+
+
+class TestPooledTranscriptionService:
+    """Test the ITranscriptionService facade"""
+
+    def test_transcription_runs_on_pool_and_metadata_stays_local(self):
+        pool = Mock(workers=3)
+        local = Mock(model_info={"name": "faster-whisper-tiny"})
+        service = PooledTranscriptionService(pool, local)
+
+        service.transcribe_arrays(["samples"], "de")
+
+        pool.call.assert_called_once_with("transcribe_arrays", ["samples"], "de")
+        assert service.model_info == {"name": "faster-whisper-tiny", "worker_processes": 3}
+        assert service.max_parallel_requests == 3
+        local.transcribe_arrays.assert_not_called()
+
+    def test_does_not_stream_even_if_engine_does(self):
+        local = Mock()
+        local.supports_streaming.return_value = True
+        service = PooledTranscriptionService(Mock(workers=2), local)
+
+        assert service.supports_streaming() is False
@@ -0,0 +1,119 @@
+"""
+Unit tests for AudioTrackCache
+Tests video identity keys, memory-mapped slices and size-bounded LRU eviction
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+from services.transcriptionservice.audio_track_cache import SAMPLE_RATE, AudioTrackCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AudioTrackCache(tmp_path / "audio_cache", max_bytes=5 * SAMPLE_RATE * 2)  # 5s of audio
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    video = tmp_path / "episode.mp4"
+    video.write_bytes(b"video-bytes")
+    return video
+
+
+def _store_track(cache: AudioTrackCache, key: str, seconds: int) -> np.ndarray:
+    """Commit a track whose sample values encode their own index"""
+    pcm = (np.arange(seconds * SAMPLE_RATE) % 30000).astype(np.int16)
+    decoded = cache.temp_path(key)
+    pcm.tofile(decoded)
+    cache.commit(key, decoded)
+    return pcm
+
+
+class TestAudioTrackCacheKeys:
+    """Test cache key identity"""
+
+    def test_key_stable_for_same_video(self, video_file):
+        assert AudioTrackCache.make_key(video_file) == AudioTrackCache.make_key(video_file)
+
+
+class TestAudioTrackCacheFillLock:
+    """Test serialized decodes per video"""
+
+    @pytest.mark.asyncio
+    async def test_lock_is_dropped_after_the_last_fill(self, cache):
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fill():
+            async with cache.fill_lock("abc"):
+                entered.set()
+                await release.wait()
+
+        first = asyncio.create_task(fill())
+        await entered.wait()
+        second = asyncio.create_task(fill())
+        await asyncio.sleep(0)
+        assert len(cache._fill_locks) == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+
+        assert cache._fill_locks == {}
+
+
+class TestAudioTrackCacheSlices:
+    """Test reading chunk windows from a cached track"""
+
+    def test_miss(self, cache):
+        assert cache.read_slice("abc", 0.0, 1.0) is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_slice_matches_track_window(self, cache):
+        pcm = _store_track(cache, "abc", seconds=3)
+
+        samples = cache.read_slice("abc", 1.0, 2.5)
+
+        assert samples.dtype == np.float32
+        assert len(samples) == int(1.5 * SAMPLE_RATE)
+        np.testing.assert_array_equal(samples, pcm[SAMPLE_RATE : int(2.5 * SAMPLE_RATE)] / np.float32(32768.0))
+        assert cache.get_stats()["hits"] == 1
+
+    def test_slice_past_end_is_empty(self, cache):
+        _store_track(cache, "abc", seconds=1)
+
+        assert len(cache.read_slice("abc", 0.5, 10.0)) == SAMPLE_RATE // 2
+        assert len(cache.read_slice("abc", 5.0, 10.0)) == 0
+
+
+class TestAudioTrackCacheEviction:
+    """Test size-bounded eviction"""
+
+    def test_evicts_least_recently_used_over_max_bytes(self, cache):
+        _store_track(cache, "first", seconds=2)
+        _store_track(cache, "second", seconds=2)
+        # Age the entries explicitly so the test does not depend on timestamp resolution
+        os.utime(cache.cache_dir / "first.pcm", (1_000, 1_000))
+        os.utime(cache.cache_dir / "second.pcm", (2_000, 2_000))
+
+        _store_track(cache, "third", seconds=2)
+
+        assert not cache.contains("first")
+        assert cache.contains("second")
+        assert cache.contains("third")
+        assert cache.get_stats()["size_bytes"] == 4 * SAMPLE_RATE * 2
+
+    def test_keeps_newest_track_even_if_too_large(self, cache):
+        _store_track(cache, "long", seconds=10)
+
+        assert cache.contains("long")
+
+    def test_clear(self, cache):
+        _store_track(cache, "abc", seconds=1)
+
+        cache.clear()
+
+        assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,102 @@
+"""
+Unit tests for the CTranslate2 model artifact store
+Tests the versioned layout, atomic conversion and batch preparation
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.translationservice import ct2_artifacts
+from services.translationservice.ct2_artifacts import (
+    ARTIFACT_VERSION,
+    convert_ct2_model,
+    ct2_artifact_dir,
+    ensure_ct2_model,
+    is_prepared,
+    prepare_ct2_models,
+)
+
+
+class _FakeConverter:
+    conversions = 0
+    fail = False
+
+    def __init__(self, model_name: str):
+        self.model_name = model_name
+
+    def convert(self, output_dir: str, quantization: str, force: bool) -> None:
+        _FakeConverter.conversions += 1
+        if _FakeConverter.fail:
+            raise RuntimeError("conversion failed")
+        (Path(output_dir) / "model.bin").write_bytes(b"weights")
+
+
+class _FakeTokenizer:
+    def save_pretrained(self, output_dir: str) -> None:
+        (Path(output_dir) / "tokenizer_config.json").write_text("{}")
+
+
+@pytest.fixture(autouse=True)
+def artifact_store(tmp_path, monkeypatch):
+    _FakeConverter.conversions = 0
+    _FakeConverter.fail = False
+    ctranslate2 = SimpleNamespace(__version__="4.0.0", converters=SimpleNamespace(TransformersConverter=_FakeConverter))
+    transformers = SimpleNamespace(AutoTokenizer=SimpleNamespace(from_pretrained=lambda name: _FakeTokenizer()))
+    monkeypatch.setitem(sys.modules, "ctranslate2", ctranslate2)
+    monkeypatch.setitem(sys.modules, "transformers", transformers)
+    with patch.object(ct2_artifacts.settings, "ct2_model_dir", str(tmp_path)):
+        yield tmp_path
+
+
+class TestArtifactStore:
+    """Test conversion into the versioned store"""
+
+    def test_artifact_dir_is_versioned_per_quantization(self, artifact_store):
+        path = ct2_artifact_dir("Helsinki-NLP/opus-mt-de-es", "int8")
+
+        assert path == artifact_store / f"v{ARTIFACT_VERSION}" / "Helsinki-NLP--opus-mt-de-es-int8"
+
+    def test_convert_writes_model_tokenizer_and_manifest(self):
+        path = convert_ct2_model("Helsinki-NLP/opus-mt-de-es", "int8")
+
+        assert is_prepared(path)
+        assert (path / "tokenizer_config.json").exists()
+        assert '"quantization": "int8"' in (path / ct2_artifacts.MANIFEST_FILE).read_text()
+
+    def test_prepared_model_is_not_converted_again(self):
+        convert_ct2_model("Helsinki-NLP/opus-mt-de-es", "int8")
+        ensure_ct2_model("Helsinki-NLP/opus-mt-de-es", "int8")
+        convert_ct2_model("Helsinki-NLP/opus-mt-de-es", "int8")
+
+        assert _FakeConverter.conversions == 1
+
+    def test_failed_conversion_leaves_no_partial_artifact(self, artifact_store):
+        _FakeConverter.fail = True
+
+        with pytest.raises(RuntimeError):
+            convert_ct2_model("Helsinki-NLP/opus-mt-de-es", "int8")
+
+        assert list((artifact_store / f"v{ARTIFACT_VERSION}").iterdir()) == []
+
+    def test_prepare_reports_errors_per_model(self):
+        def convert(model_name, quantization, force=False):
+            if model_name.endswith("es-de"):
+                raise RuntimeError("not found")
+            return ct2_artifact_dir(model_name, quantization)
+
+        with patch.object(ct2_artifacts, "convert_ct2_model", side_effect=convert):
+            errors = prepare_ct2_models(["Helsinki-NLP/opus-mt-de-es", "Helsinki-NLP/opus-mt-es-de"], "int8")
+
+        assert errors == {"Helsinki-NLP/opus-mt-de-es": None, "Helsinki-NLP/opus-mt-es-de": "not found"}
+
+    def test_opus_model_names_cover_language_pair_map(self):
+        from core.language_preferences import OPUS_MODEL_MAP
+
+        names = ct2_artifacts.opus_model_names()
+
+        assert set(OPUS_MODEL_MAP.values()) <= set(names)
+        assert len(names) == len(set(names))
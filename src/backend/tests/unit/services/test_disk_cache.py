@@ -0,0 +1,59 @@
+"""
+Unit tests for the shared disk cache helpers
+Tests video identity keys and the process-wide cache holder
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from services.disk_cache import ProcessCache, video_key
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    video = tmp_path / "episode.mp4"
+    video.write_bytes(b"video-bytes")
+    return video
+
+
+class TestVideoKey:
+    """Test cache keys bound to a video file"""
+
+    def test_key_changes_with_parts(self, video_file):
+        assert video_key(video_file, "0.000") == video_key(video_file, "0.000")
+        assert video_key(video_file, "0.000") != video_key(video_file, "30.000")
+
+    def test_key_changes_when_video_replaced(self, video_file):
+        base = video_key(video_file)
+
+        video_file.write_bytes(b"re-encoded video bytes")
+
+        assert video_key(video_file) != base
+
+    def test_key_requires_existing_video(self, tmp_path):
+        with pytest.raises(OSError):
+            video_key(tmp_path / "missing.mp4")
+
+
+class TestProcessCache:
+    """Test the lazily opened process-wide instance"""
+
+    def test_opened_once(self):
+        factory = Mock(return_value=object())
+        holder = ProcessCache("TEST CACHE", lambda: True, factory)
+
+        assert holder.get() is holder.get()
+        assert factory.call_count == 1
+
+    def test_disabled_cache_is_not_opened(self):
+        factory = Mock()
+        holder = ProcessCache("TEST CACHE", lambda: False, factory)
+
+        assert holder.get() is None
+        factory.assert_not_called()
+
+    def test_cache_that_fails_to_open_is_skipped(self):
+        holder = ProcessCache("TEST CACHE", lambda: True, Mock(side_effect=OSError("read-only")))
+
+        assert holder.get() is None
@@ -0,0 +1,119 @@
+"""
+Unit tests for KnownLemmaCache
+Tests hits and misses, event-driven patching and invalidation, and LRU bounds
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from services.vocabulary.events import EventBus, ProgressUpdatedEvent
+from services.vocabulary.known_lemma_cache import KnownLemmaCache
+
+
+@pytest.fixture
+def cache():
+    with patch.object(KnownLemmaCache, "enabled", new_callable=PropertyMock, return_value=True):
+        cache = KnownLemmaCache(max_entries=2)
+        cache.register_event_handlers(EventBus())  # keep the global bus out of the tests
+        yield cache
+
+
+def _progress_event(user_id, **metadata):
+    return ProgressUpdatedEvent(user_id=user_id, metadata=metadata)
+
+
+@pytest.mark.asyncio
+async def test_progress_events_patch_cached_set(cache):
+    bus = EventBus()
+    cache.register_event_handlers(bus)
+    await cache.get(1, "de", AsyncMock(return_value=["haus"]))
+
+    bus.publish(_progress_event(1, language="de", lemmas=["Laufen", "gehen"], is_known=True))
+    bus.publish(_progress_event(1, language="de", lemmas=["haus"], is_known=False))
+
+    assert await cache.get(1, "de", AsyncMock(return_value=[])) == frozenset({"laufen", "gehen"})
+    assert cache.patches == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_event_patches_known_and_unknown_lemmas(cache):
+    await cache.get(1, "de", AsyncMock(return_value=["haus"]))
+
+    cache.handle_progress_updated(_progress_event(1, language="de", known_lemmas=["laufen"], unknown_lemmas=["haus"]))
+
+    assert await cache.get(1, "de", AsyncMock(return_value=[])) == frozenset({"laufen"})
+
+
+@pytest.mark.asyncio
+async def test_event_without_lemmas_invalidates_user(cache):
+    await cache.get(1, "de", AsyncMock(return_value=["haus"]))
+    await cache.get(2, "de", AsyncMock(return_value=["haus"]))
+
+    cache.handle_progress_updated(_progress_event(1))
+
+    assert cache.get_stats()["entries"] == 1
+    assert await cache.get(1, "de", AsyncMock(return_value=["neu"])) == frozenset({"neu"})
+
+
+@pytest.mark.asyncio
+async def test_load_overlapping_a_change_is_not_stored(cache):
+    release = asyncio.Event()
+
+    async def slow_loader(index):
+        await release.wait()
+        return ["haus"]
+
+    pending = asyncio.create_task(cache.get(1, "de", slow_loader))
+    await asyncio.sleep(0)
+    cache.patch(1, "de", ["laufen"], is_known=True)
+    release.set()
+
+    assert await pending == frozenset({"haus"})
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_set_is_reloaded(cache):
+    """Changes made through another worker process only arrive by reloading"""
+    cache.ttl_seconds = 0
+    loader = AsyncMock(return_value=["haus"])
+
+    await cache.get(1, "de", loader)
+    await cache.get(1, "de", loader)
+
+    assert loader.await_count == 2
+    assert cache.get_stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_set_is_dropped(cache):
+    for user_id in (1, 2, 3):
+        await cache.get(user_id, "de", AsyncMock(return_value=["haus"]))
+
+    loader = AsyncMock(return_value=["haus"])
+    await cache.get(1, "de", loader)
+
+    assert loader.await_count == 1
+    assert cache.get_stats()["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_state_of_dropped_users_is_not_kept(cache):
+    for user_id in range(10):
+        await cache.get(user_id, "de", AsyncMock(return_value=["haus"]))
+        cache.patch(user_id, "de", ["laufen"], is_known=True)
+    cache.invalidate(0)
+
+    assert cache.get_stats()["entries"] == 2
+    assert not cache._loads
+
+
+def test_event_bus_retains_only_recent_events():
+    bus = EventBus(max_retained_events=2)
+    for user_id in (1, 2, 3):
+        bus.publish(_progress_event(user_id))
+
+    assert [event.user_id for event in bus.get_events()] == [2, 3]
+    assert bus.published == 3
@@ -0,0 +1,145 @@
+"""
+Unit tests for ModelRegistry
+Tests LRU unloading under the memory budget, lease pinning and load metrics
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from services.model_registry import ModelRegistry
+
+
+class _Host:
+    """Fake process memory that grows while models load"""
+
+    rss_mb = 0.0
+
+
+class _FakeModelService:
+    def __init__(self, size_mb: float):
+        self.size_mb = size_mb
+        self.initialize_calls = 0
+        self.cleanup_calls = 0
+        self._loaded = False
+
+    def initialize(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            self.initialize_calls += 1
+            _Host.rss_mb += self.size_mb
+
+    def cleanup(self) -> None:
+        if self._loaded:
+            self._loaded = False
+            self.cleanup_calls += 1
+            _Host.rss_mb -= self.size_mb
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._loaded
+
+
+@pytest.fixture(autouse=True)
+def fake_rss():
+    _Host.rss_mb = 0.0
+    with patch("services.model_registry._rss_mb", side_effect=lambda: _Host.rss_mb):
+        yield
+
+
+def _registry(budget_mb: float, **sizes: float) -> tuple[ModelRegistry, dict[str, _FakeModelService]]:
+    registry = ModelRegistry(budget_mb)
+    services = {key: _FakeModelService(size) for key, size in sizes.items()}
+    for key, service in services.items():
+        registry.register(key, service, kind="translation")
+    return registry, services
+
+
+class TestResidency:
+    """Test loading on lease and LRU eviction"""
+
+    def test_lease_loads_and_measures_model(self):
+        registry, services = _registry(1000, de_en=300)
+
+        with registry.lease(services["de_en"]):
+            assert services["de_en"].is_initialized
+
+        stats = registry.get_stats()
+        assert (stats["loads"], stats["resident_mb"]) == (1, 300)
+        assert stats["load_latency_seconds"]["count"] == 1
+        assert stats["models"][0]["leases"] == 0
+
+    def test_least_recently_used_idle_model_is_evicted(self):
+        registry, services = _registry(700, de_en=300, de_es=300, de_fr=300)
+
+        for key in ("de_en", "de_es"):
+            with registry.lease(services[key]):
+                pass
+        with registry.lease(services["de_en"]):  # de_es is now least recently used
+            pass
+        with registry.lease(services["de_fr"]):
+            pass
+
+        assert [key for key, service in services.items() if service.is_initialized] == ["de_en", "de_fr"]
+        assert registry.get_stats()["evictions"] == 1
+        assert registry.resident_mb() == 600
+
+    def test_model_in_use_is_never_evicted(self):
+        registry, services = _registry(500, de_en=300, de_es=300)
+
+        with registry.lease(services["de_en"]):
+            with registry.lease(services["de_es"]):
+                # Over budget, but both are leased
+                assert services["de_en"].is_initialized and services["de_es"].is_initialized
+
+            # de_es is idle again while de_en is still leased
+            assert services["de_en"].is_initialized
+            assert services["de_es"].cleanup_calls == 1
+
+    def test_evicted_model_reloads_on_next_lease(self):
+        registry, services = _registry(400, de_en=300, de_es=300)
+
+        for key in ("de_en", "de_es", "de_en"):
+            with registry.lease(services[key]):
+                assert services[key].is_initialized
+
+        assert services["de_en"].initialize_calls == 2
+        assert registry.get_stats()["loads"] == 3
+
+    def test_unregistered_service_passes_through(self):
+        registry = ModelRegistry(100)
+        service = _FakeModelService(300)
+
+        with registry.lease(service):
+            pass
+
+        assert service.initialize_calls == 0
+        assert registry.get_stats()["models"] == []
+
+    def test_failed_load_releases_lease(self):
+        registry, services = _registry(1000, de_en=300)
+        services["de_en"].initialize = lambda: (_ for _ in ()).throw(ImportError("ctranslate2"))
+
+        with pytest.raises(ImportError):
+            with registry.lease(services["de_en"]):
+                pass
+
+        assert registry.get_stats()["models"][0]["leases"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_lease_loads_in_worker_thread(self):
+        registry, services = _registry(1000, de_en=300)
+        loader_threads = []
+        initialize = services["de_en"].initialize
+
+        def record_thread():
+            loader_threads.append(threading.current_thread())
+            initialize()
+
+        services["de_en"].initialize = record_thread
+
+        async with registry.async_lease(services["de_en"]):
+            assert registry.get_stats()["models"][0]["leases"] == 1
+
+        assert loader_threads and loader_threads[0] is not threading.main_thread()
@@ -0,0 +1,65 @@
+"""
+Unit tests for ModelWarmPool
+Tests target parsing, loading through the model registry and per-target status
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from services.model_registry import ModelRegistry
+from services.model_warmup import ModelWarmPool, parse_warmup_targets
+
+
+class _FakeModelService:
+    model_name = "fake-model"
+
+    def __init__(self):
+        self._loaded = False
+
+    def initialize(self) -> None:
+        self._loaded = True
+
+    def cleanup(self) -> None:
+        self._loaded = False
+
+    @property
+    def is_initialized(self) -> bool:
+        return self._loaded
+
+
+def test_parse_warmup_targets_normalizes_and_deduplicates():
+    assert parse_warmup_targets(" ASR, de-es,,de-es ,translation") == ["asr", "de-es", "translation"]
+    assert parse_warmup_targets("") == []
+
+
+@pytest.mark.asyncio
+async def test_warm_loads_targets_and_reports_status():
+    registry = ModelRegistry(memory_budget_mb=10_000)
+    services = {"asr": _FakeModelService(), "de-es": _FakeModelService()}
+    for key, service in services.items():
+        registry.register(key, service, kind="translation")
+
+    def resolve(target):
+        if target == "xx":
+            raise ValueError("unknown target")
+        return services[target]
+
+    warm_pool = ModelWarmPool(["asr", "de-es", "xx"], workers=2)
+    assert warm_pool.get_status()["de-es"]["state"] == "pending"
+
+    with (
+        patch("services.model_warmup._resolve_service", side_effect=resolve),
+        patch("services.model_registry.get_model_registry", return_value=registry),
+        patch("services.model_registry._rss_mb", return_value=0.0),
+    ):
+        await warm_pool.warm()
+
+    status = warm_pool.get_status()
+    assert all(service.is_initialized for service in services.values())
+    assert status["asr"]["kind"] == "asr"
+    assert status["de-es"]["state"] == "ready"
+    assert status["de-es"]["model"] == "fake-model"
+    assert status["xx"]["state"] == "failed"
+    assert status["xx"]["error"] == "unknown target"
+    assert registry.loads == 2
@@ -0,0 +1,65 @@
+"""
+Unit tests for OpusCT2TranslationService batch tokenization
+Tests that whole batches are encoded and decoded in one SentencePiece call
+"""
+
+from unittest.mock import MagicMock
+
+from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService
+
+
+class _FakeSentencePiece:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, out_type):
+        self.calls.append(texts)
+        return [["▁" + word for word in text.split()] for text in texts]
+
+    def decode(self, pieces):
+        self.calls.append(pieces)
+        return [" ".join(piece.lstrip("▁") for piece in row) for row in pieces]
+
+
+class _FakeMarianTokenizer:
+    eos_token = "</s>"
+    all_special_tokens = ["</s>", "<unk>", "<pad>"]
+
+    def __init__(self):
+        self.spm_source = _FakeSentencePiece()
+        self.spm_target = _FakeSentencePiece()
+
+
+def _service(tokenizer) -> OpusCT2TranslationService:
+    service = OpusCT2TranslationService()
+    service._tokenizer = tokenizer
+    return service
+
+
+def test_encode_batch_uses_one_sentencepiece_call_and_appends_eos():
+    tokenizer = _FakeMarianTokenizer()
+
+    pieces = _service(tokenizer)._encode_batch(["guten Tag", "hallo"])
+
+    assert pieces == [["▁guten", "▁Tag", "</s>"], ["▁hallo", "</s>"]]
+    assert tokenizer.spm_source.calls == [["guten Tag", "hallo"]]
+
+
+def test_decode_batch_drops_special_tokens():
+    tokenizer = _FakeMarianTokenizer()
+
+    texts = _service(tokenizer)._decode_batch([["▁good", "▁day", "</s>"], ["<pad>", "▁hello"]])
+
+    assert texts == ["good day", "hello"]
+    assert len(tokenizer.spm_target.calls) == 1
+
+
+def test_language_code_texts_use_the_tokenizer():
+    tokenizer = MagicMock(spec=["__call__", "convert_ids_to_tokens", "spm_source"])
+    tokenizer.return_value = {"input_ids": [[5, 0]]}
+    tokenizer.convert_ids_to_tokens.return_value = [">>es<<", "</s>"]
+
+    pieces = _service(tokenizer)._encode_batch([">>es<< hola"])
+
+    assert pieces == [[">>es<<", "</s>"]]
+    tokenizer.spm_source.encode.assert_not_called()
@@ -0,0 +1,83 @@
+"""
+Unit tests for the VAD pre-pass
+Tests speech island detection, compaction and mapping back onto the chunk timeline
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from services.transcriptionservice.speech_detection import (
+    SAMPLE_RATE,
+    SpeechDetectionResult,
+    SpeechIsland,
+    detect_speech,
+)
+
+
+@pytest.fixture
+def speech():
+    return SpeechDetectionResult(
+        [SpeechIsland(1 * SAMPLE_RATE, 2 * SAMPLE_RATE), SpeechIsland(5 * SAMPLE_RATE, 7 * SAMPLE_RATE)],
+        total_samples=10 * SAMPLE_RATE,
+    )
+
+
+class TestSpeechDetectionResult:
+    """Test compaction and timestamp mapping"""
+
+    def test_speech_ratio(self, speech):
+        assert speech.speech_ratio == pytest.approx(0.3)
+
+    def test_compact_concatenates_islands(self, speech):
+        samples = np.arange(10 * SAMPLE_RATE, dtype=np.float32)
+
+        compacted = speech.compact(samples)
+
+        assert len(compacted) == 3 * SAMPLE_RATE
+        assert compacted[0] == SAMPLE_RATE
+        assert compacted[SAMPLE_RATE] == 5 * SAMPLE_RATE
+
+    def test_to_chunk_time(self, speech):
+        assert speech.to_chunk_time(0.5) == 1.5
+        assert speech.to_chunk_time(2.5) == 6.5
+
+    def test_island_boundary_depends_on_segment_edge(self, speech):
+        assert speech.to_chunk_time(1.0) == 5.0
+        assert speech.to_chunk_time(1.0, is_end=True) == 2.0
+
+    def test_time_past_last_island_is_clamped(self, speech):
+        assert speech.to_chunk_time(4.0, is_end=True) == 7.0
+
+
+class TestDetectSpeech:
+    """Test padding and merging of the Silero speech regions"""
+
+    @staticmethod
+    def _detect(regions, seconds=12.0):
+        samples = np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+        in_samples = [(int(start * SAMPLE_RATE), int(end * SAMPLE_RATE)) for start, end in regions]
+        with patch("services.transcriptionservice.speech_detection._silero_regions", return_value=in_samples):
+            return detect_speech(samples)
+
+    def test_regions_are_padded(self):
+        result = self._detect([(3.0, 5.0), (9.0, 10.0)])
+
+        assert result.islands == [
+            SpeechIsland(int(2.8 * SAMPLE_RATE), int(5.2 * SAMPLE_RATE)),
+            SpeechIsland(int(8.8 * SAMPLE_RATE), int(10.2 * SAMPLE_RATE)),
+        ]
+        assert result.speech_ratio == pytest.approx(3.8 / 12)
+
+    def test_short_pauses_are_merged(self):
+        assert len(self._detect([(1.0, 2.0), (2.3, 3.3)]).islands) == 1
+
+    def test_padding_stays_inside_the_chunk(self):
+        assert self._detect([(0.0, 12.0)]).speech_ratio == 1.0
+
+    def test_silence_has_no_islands(self):
+        result = self._detect([])
+
+        assert result.islands == []
+        assert result.speech_ratio == 0.0
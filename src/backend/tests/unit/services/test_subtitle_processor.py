@@ -0,0 +1,115 @@
+"""
+Unit tests for SubtitleProcessor
+Tests that spaCy runs once per chunk and its per-token tags drive WordFilter
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.filterservice.interface import FilteredSubtitle, FilteredWord, WordStatus
+from services.filterservice.subtitle_processing.subtitle_processor import SubtitleProcessor
+from services.lemma_resolver import TokenAnalysis
+from services.vocabulary.vocabulary_index import VocabularyIndex
+
+MODULE = "services.filterservice.subtitle_processing"
+
+
+def _subtitle(text: str) -> FilteredSubtitle:
+    words = [
+        FilteredWord(text=word, start_time=0.0, end_time=1.0, status=WordStatus.ACTIVE) for word in text.lower().split()
+    ]
+    return FilteredSubtitle(original_text=text, start_time=0.0, end_time=1.0, words=words)
+
+
+@pytest.fixture
+def vocab_service():
+    service = AsyncMock()
+    service.get_words_info.side_effect = lambda words, language, db: {
+        word: {"word": word, "lemma": lemma or word, "difficulty_level": "C1", "found": True} for word, lemma in words
+    }
+    return service
+
+
+@pytest.fixture
+def index_registry():
+    registry = AsyncMock()
+    registry.get.return_value = None  # index disabled: every word goes to the vocabulary service
+    return registry
+
+
+class TestSentenceLevelAnalysis:
+    """Test the single nlp.pipe() pass over all subtitle texts"""
+
+    @pytest.mark.asyncio
+    async def test_uses_sentence_tags_instead_of_per_word_spacy(self, vocab_service, index_registry):
+        """Lemma and proper-name flags come from the chunk-level pass"""
+        subtitles = [_subtitle("Anna läuft schnell"), _subtitle("Wir laufen")]
+        analyses = [
+            [
+                TokenAnalysis("anna", "anna", "PROPN", True),
+                TokenAnalysis("läuft", "laufen", "VERB", False),
+                TokenAnalysis("schnell", "schnell", "ADV", False),
+            ],
+            [TokenAnalysis("wir", "wir", "PRON", False), TokenAnalysis("laufen", "laufen", "VERB", False)],
+        ]
+
+        with (
+            patch(f"{MODULE}.subtitle_processor.analyze_texts", return_value=analyses) as mock_analyze,
+            patch(f"{MODULE}.word_filter.is_proper_name") as mock_is_proper_name,
+            patch(f"{MODULE}.word_filter.lemmatize_word") as mock_lemmatize,
+        ):
+            processor = SubtitleProcessor(index_registry=index_registry)
+            await processor.process_subtitles(subtitles, {"laufen"}, "A1", "de", vocab_service, db=None)
+
+        mock_analyze.assert_called_once_with(["Anna läuft schnell", "Wir laufen"], "de")
+        vocab_service.get_words_info.assert_awaited_once()
+        vocab_service.get_word_info.assert_not_called()
+        mock_is_proper_name.assert_not_called()
+        mock_lemmatize.assert_not_called()
+
+        anna, laeuft, schnell = subtitles[0].words
+        assert anna.status == WordStatus.FILTERED_OTHER
+        assert laeuft.metadata["lemma"] == "laufen"
+        assert laeuft.status == WordStatus.FILTERED_KNOWN
+        assert schnell.status == WordStatus.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_word_analysis(self, vocab_service, index_registry):
+        """Words are analyzed individually when the chunk-level pass fails"""
+        subtitles = [_subtitle("Schöne Welt")]
+
+        with (
+            patch(f"{MODULE}.subtitle_processor.analyze_texts", side_effect=RuntimeError("model missing")),
+            patch(f"{MODULE}.word_filter.is_proper_name", return_value=False),
+            patch(f"{MODULE}.word_filter.lemmatize_word", side_effect=lambda word, language: word) as mock_lemmatize,
+        ):
+            processor = SubtitleProcessor(index_registry=index_registry)
+            result = await processor.process_subtitles(subtitles, set(), "A1", "de", vocab_service, db=None)
+
+        assert mock_lemmatize.call_count == 2
+        assert result.statistics["active_words"] == 2
+
+
+class TestVocabularyIndexLookup:
+    """Test word info resolution against the in-memory vocabulary index"""
+
+    @pytest.mark.asyncio
+    async def test_only_index_misses_hit_the_database(self, vocab_service, index_registry):
+        """Indexed words never reach the vocabulary service; unknown words still do"""
+        index_registry.get.return_value = VocabularyIndex("de", [(7, "Haus", "Haus", "A1", "NOUN", "house")])
+        subtitles = [_subtitle("Haus Zauberwort")]
+
+        with (
+            patch(f"{MODULE}.subtitle_processor.analyze_texts", side_effect=RuntimeError("model missing")),
+            patch(f"{MODULE}.word_filter.is_proper_name", return_value=False),
+            patch(f"{MODULE}.word_filter.lemmatize_word", side_effect=lambda word, language: word),
+        ):
+            processor = SubtitleProcessor(index_registry=index_registry)
+            result = await processor.process_subtitles(subtitles, set(), "A2", "de", vocab_service, db=None)
+
+        vocab_service.get_words_info.assert_awaited_once_with([("zauberwort", None)], "de", None)
+        haus, zauberwort = subtitles[0].words
+        assert haus.status == WordStatus.FILTERED_AT_LEVEL
+        assert zauberwort.status == WordStatus.ACTIVE
+        assert result.statistics["active_words"] == 1
@@ -0,0 +1,88 @@
+"""
+Unit tests for TranscriptCache
+Tests video identity keys, LRU eviction and hit/miss stats
+"""
+
+import os
+
+import pytest
+
+from services.transcriptionservice.transcript_cache import TranscriptCache
+
+MODEL = "faster-whisper-turbo"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranscriptCache(tmp_path / "transcript_cache", max_entries=2)
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    video = tmp_path / "episode.mp4"
+    video.write_bytes(b"video-bytes")
+    return video
+
+
+class TestTranscriptCacheKeys:
+    """Test cache key identity"""
+
+    def test_key_stable_for_same_chunk(self, video_file):
+        assert TranscriptCache.make_key(video_file, 0.0, 30.0, MODEL, "de") == TranscriptCache.make_key(
+            video_file, 0, 30, MODEL, "de"
+        )
+
+    def test_key_changes_with_window_model_and_language(self, video_file):
+        base = TranscriptCache.make_key(video_file, 0.0, 30.0, MODEL, "de")
+
+        assert TranscriptCache.make_key(video_file, 0.0, 60.0, MODEL, "de") != base
+        assert TranscriptCache.make_key(video_file, 0.0, 30.0, "whisper-tiny", "de") != base
+        assert TranscriptCache.make_key(video_file, 0.0, 30.0, MODEL, "en") != base
+
+
+class TestTranscriptCacheStorage:
+    """Test get/put, eviction and stats"""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get("abc") is None
+
+        cache.put("abc", "1\n00:00:00,000 --> 00:00:02,000\nHallo\n\n")
+
+        assert cache.get("abc") == "1\n00:00:00,000 --> 00:00:02,000\nHallo\n\n"
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.put("first", "a")
+        cache.put("second", "b")
+        # Age the entries explicitly so the test does not depend on timestamp resolution
+        os.utime(cache.cache_dir / "first.srt", (1_000, 1_000))
+        os.utime(cache.cache_dir / "second.srt", (2_000, 2_000))
+
+        cache.put("third", "c")
+
+        assert cache.get("first") is None
+        assert cache.get("second") == "b"
+        assert cache.get("third") == "c"
+        assert cache.get_stats()["entries"] == 2
+
+    def test_word_timings_are_stored_and_evicted_with_the_transcript(self, cache):
+        cache.put("first", "a", word_timings=b"npy")
+        cache.put("second", "b")
+        os.utime(cache.cache_dir / "first.srt", (1_000, 1_000))
+        os.utime(cache.cache_dir / "second.srt", (2_000, 2_000))
+
+        assert cache.get_word_timings("first") == b"npy"
+        assert cache.get_word_timings("second") is None
+
+        cache.put("third", "c")
+
+        assert cache.get_word_timings("first") is None
+        assert not (cache.cache_dir / "first.words.npy").exists()
+
+    def test_clear(self, cache):
+        cache.put("abc", "a")
+
+        cache.clear()
+
+        assert cache.get_stats() == {"hits": 0, "misses": 0, "hit_ratio": 0.0, "entries": 0, "max_entries": 2}
@@ -0,0 +1,197 @@
+"""
+Unit tests for TranscriptionScheduler
+Tests micro-batching of concurrent requests, per-caller results and histograms
+"""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+
+from services.transcriptionservice.faster_whisper_implementation import FasterWhisperTranscriptionService
+from services.transcriptionservice.interface import TranscriptionResult, TranscriptionSegment
+from services.transcriptionservice.transcription_scheduler import TranscriptionScheduler
+
+
+def _result(text: str) -> TranscriptionResult:
+    return TranscriptionResult(full_text=text, segments=[])
+
+
+@pytest.fixture
+def service():
+    engine = Mock()
+    engine.transcribe_arrays.side_effect = lambda audios, language: [_result(f"{language}:{len(a)}") for a in audios]
+    return engine
+
+
+class TestScheduling:
+    """Test batching of concurrent requests"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self, service):
+        scheduler = TranscriptionScheduler(service, batch_window_ms=50, max_batch_size=8)
+
+        results = await asyncio.gather(
+            *(scheduler.transcribe(np.zeros(n, dtype=np.float32), language="de") for n in (1, 2, 3))
+        )
+
+        service.transcribe_arrays.assert_called_once()
+        assert [r.full_text for r in results] == ["de:1", "de:2", "de:3"]
+        assert scheduler.get_stats()["batch_size"]["buckets"]["4"] == 1
+        assert scheduler.get_stats()["latency_seconds"]["count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_languages_are_batched_separately(self, service):
+        scheduler = TranscriptionScheduler(service, batch_window_ms=50)
+
+        results = await asyncio.gather(
+            scheduler.transcribe(np.zeros(1, dtype=np.float32), language="de"),
+            scheduler.transcribe(np.zeros(2, dtype=np.float32), language="en"),
+            scheduler.transcribe(np.zeros(3, dtype=np.float32), language="de"),
+        )
+
+        assert [r.full_text for r in results] == ["de:1", "en:2", "de:3"]
+        batches = [(call.args[1], len(call.args[0])) for call in service.transcribe_arrays.call_args_list]
+        assert sorted(batches) == [("de", 2), ("en", 1)]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size(self, service):
+        scheduler = TranscriptionScheduler(service, batch_window_ms=50, max_batch_size=2)
+
+        await asyncio.gather(*(scheduler.transcribe(np.zeros(1, dtype=np.float32), language="de") for _ in range(3)))
+
+        assert [len(call.args[0]) for call in service.transcribe_arrays.call_args_list] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_every_caller_and_scheduler_keeps_running(self, service):
+        scheduler = TranscriptionScheduler(service, batch_window_ms=10)
+        service.transcribe_arrays.side_effect = [RuntimeError("CUDA out of memory"), [_result("ok")]]
+
+        outcomes = await asyncio.gather(
+            scheduler.transcribe(np.zeros(1, dtype=np.float32), language="de"),
+            scheduler.transcribe(np.zeros(1, dtype=np.float32), language="de"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+        assert (await scheduler.transcribe(np.zeros(1, dtype=np.float32), language="de")).full_text == "ok"
+
+
+class TestStreaming:
+    """Test streamed requests taking their turn on the model"""
+
+    @pytest.mark.asyncio
+    async def test_streamed_request_runs_alone_and_yields_segments(self, service):
+        scheduler = TranscriptionScheduler(service, batch_window_ms=50)
+        segments = [TranscriptionSegment(start_time=0.0, end_time=1.0, text="Hallo")]
+        service.transcribe_stream.return_value = iter(segments)
+
+        async def stream():
+            return [segment async for segment in scheduler.transcribe_stream(np.zeros(2, dtype=np.float32), "de")]
+
+        streamed, batched = await asyncio.gather(
+            stream(), scheduler.transcribe(np.zeros(1, dtype=np.float32), language="de")
+        )
+
+        assert streamed == segments
+        assert batched.full_text == "de:1"
+        assert [len(call.args[0]) for call in service.transcribe_arrays.call_args_list] == [1]
+        assert scheduler.get_stats()["batch_size"]["count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_streamed_request_failure_is_raised(self, service):
+        scheduler = TranscriptionScheduler(service, batch_window_ms=10)
+        service.transcribe_stream.side_effect = RuntimeError("CUDA out of memory")
+
+        with pytest.raises(RuntimeError):
+            async for _ in scheduler.transcribe_stream(np.zeros(1, dtype=np.float32), "de"):
+                pass
+
+
+class TestFasterWhisperTranscribeArrays:
+    """Test one BatchedInferencePipeline pass over several clips"""
+
+    def test_segments_are_mapped_back_to_their_clip(self):
+        engine = FasterWhisperTranscriptionService(model_size="tiny")
+        engine._model = Mock(feature_extractor=SimpleNamespace(chunk_length=30))
+        pipeline = Mock()
+        pipeline.transcribe.return_value = (
+            iter(
+                [
+                    SimpleNamespace(start=0.0, end=2.0, text=" Hallo"),
+                    SimpleNamespace(start=5.5, end=7.0, text=" Welt"),
+                ]
+            ),
+            SimpleNamespace(language="de"),
+        )
+        fake_faster_whisper = MagicMock(BatchedInferencePipeline=Mock(return_value=pipeline))
+        fake_vad = MagicMock(
+            get_speech_timestamps=Mock(side_effect=lambda audio, options: [{"start": 0, "end": len(audio)}]),
+            merge_segments=Mock(side_effect=lambda speech, options: speech),
+        )
+        audios = [np.zeros(5 * 16000, dtype=np.float32), np.zeros(3 * 16000, dtype=np.float32)]
+
+        with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper, "faster_whisper.vad": fake_vad}):
+            results = engine.transcribe_arrays(audios, language="de", batch_size=4)
+
+        kwargs = pipeline.transcribe.call_args.kwargs
+        assert kwargs["clip_timestamps"] == [{"start": 0.0, "end": 5.0}, {"start": 5.0, "end": 8.0}]
+        assert kwargs["vad_filter"] is False
+        assert kwargs["without_timestamps"] is False
+        assert len(pipeline.transcribe.call_args.args[0]) == 8 * 16000
+        assert [r.full_text for r in results] == ["Hallo", "Welt"]
+        assert (results[1].segments[0].start_time, results[1].segments[0].end_time) == (0.5, 2.0)
+
+    def test_window_yields_sentence_level_segments(self):
+        """A 30 s speech window decoded with timestamps comes back as several cues, not one"""
+        engine = FasterWhisperTranscriptionService(model_size="tiny")
+        engine._model = Mock(feature_extractor=SimpleNamespace(chunk_length=30))
+        pipeline = Mock()
+        pipeline.transcribe.side_effect = lambda audio, without_timestamps=True, **kwargs: (
+            iter(
+                [SimpleNamespace(start=0.0, end=30.0, text=" Hallo. Wie geht's? Gut.")]
+                if without_timestamps
+                else [
+                    SimpleNamespace(start=0.0, end=2.0, text=" Hallo."),
+                    SimpleNamespace(start=12.0, end=14.0, text=" Wie geht's?"),
+                    SimpleNamespace(start=25.0, end=26.0, text=" Gut."),
+                ]
+            ),
+            SimpleNamespace(language="de"),
+        )
+        fake_faster_whisper = MagicMock(BatchedInferencePipeline=Mock(return_value=pipeline))
+        fake_vad = MagicMock(
+            get_speech_timestamps=Mock(side_effect=lambda audio, options: [{"start": 0, "end": len(audio)}]),
+            merge_segments=Mock(side_effect=lambda speech, options: speech),
+        )
+        audios = [np.zeros(30 * 16000, dtype=np.float32), np.zeros(5 * 16000, dtype=np.float32)]
+
+        with patch.dict(sys.modules, {"faster_whisper": fake_faster_whisper, "faster_whisper.vad": fake_vad}):
+            results = engine.transcribe_arrays(audios, language="de", batch_size=4)
+
+        assert [segment.text for segment in results[0].segments] == ["Hallo.", "Wie geht's?", "Gut."]
+
+
+class TestFasterWhisperTranscribeStream:
+    """Test segments are handed out while the decoder is still running"""
+
+    def test_segments_are_yielded_as_decoded(self):
+        engine = FasterWhisperTranscriptionService(model_size="tiny")
+        decoded = []
+
+        def decoder():
+            for start, text in ((0.0, " Hallo"), (2.0, " Welt")):
+                decoded.append(text)
+                yield SimpleNamespace(start=start, end=start + 1.5, text=text)
+
+        engine._model = Mock()
+        engine._model.transcribe.return_value = (decoder(), SimpleNamespace(language="de"))
+
+        stream = engine.transcribe_stream(np.zeros(16000, dtype=np.float32), language="de")
+        first = next(stream)
+
+        assert (first.text, decoded) == ("Hallo", [" Hallo"])
+        assert [segment.text for segment in stream] == ["Welt"]
@@ -0,0 +1,108 @@
+"""
+Unit tests for TranslationCache
+Tests content-addressed lookup, text normalization, LRU eviction and hit/miss stats
+"""
+
+import sqlite3
+
+import pytest
+
+from services.translationservice.translation_cache import TranslationCache
+
+MODEL = "Helsinki-NLP/opus-mt-de-en"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = TranslationCache(tmp_path / "translations.sqlite3", max_entries=3)
+    yield cache
+    cache.close()
+
+
+class TestTranslationCacheLookup:
+    """Test get_many/put_many round trips"""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get_many(MODEL, "de", "en", ["Hallo Welt"]) == {}
+
+        cache.put_many(MODEL, "de", "en", {"Hallo Welt": "Hello world"})
+
+        assert cache.get_many(MODEL, "de", "en", ["Hallo Welt"]) == {"Hallo Welt": "Hello world"}
+
+    def test_whitespace_and_unicode_normalized(self, cache):
+        cache.put_many(MODEL, "de", "en", {"Schöne  Grüße\n": "Kind regards"})
+
+        # Decomposed umlauts and collapsed whitespace map to the same key
+        variant = "Schöne Grüße"
+        assert cache.get_many(MODEL, "de", "en", [variant]) == {variant: "Kind regards"}
+
+    def test_keys_scoped_by_model_and_language_pair(self, cache):
+        cache.put_many(MODEL, "de", "en", {"Hallo": "Hello"})
+
+        assert cache.get_many("other-model", "de", "en", ["Hallo"]) == {}
+        assert cache.get_many(MODEL, "de", "es", ["Hallo"]) == {}
+
+    def test_persists_across_instances(self, tmp_path):
+        db_path = tmp_path / "translations.sqlite3"
+        first = TranslationCache(db_path)
+        first.put_many(MODEL, "de", "en", {"Danke": "Thanks"})
+        first.close()
+
+        second = TranslationCache(db_path)
+        try:
+            assert second.get_many(MODEL, "de", "en", ["Danke"]) == {"Danke": "Thanks"}
+        finally:
+            second.close()
+
+
+class TestTranslationCacheEviction:
+    """Test LRU bound"""
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.put_many(MODEL, "de", "en", {"a": "A"})
+        cache.put_many(MODEL, "de", "en", {"b": "B"})
+        cache.put_many(MODEL, "de", "en", {"c": "C"})
+        cache.get_many(MODEL, "de", "en", ["a"])  # touch "a" so "b" is the oldest
+
+        cache.put_many(MODEL, "de", "en", {"d": "D"})
+
+        assert cache.get_many(MODEL, "de", "en", ["a", "b", "c", "d"]) == {"a": "A", "c": "C", "d": "D"}
+        assert cache.get_stats()["entries"] == 3
+
+    def test_lookups_defer_recency_writes_until_close(self, tmp_path):
+        db_path = tmp_path / "translations.sqlite3"
+        cache = TranslationCache(db_path)
+        cache.put_many(MODEL, "de", "en", {"a": "A"})
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("UPDATE translations SET last_used = 0")
+
+        cache.get_many(MODEL, "de", "en", ["a"])
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT last_used FROM translations").fetchone()[0] == 0
+
+        cache.close()
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT last_used FROM translations").fetchone()[0] > 0
+
+
+class TestTranslationCacheStats:
+    """Test hit/miss counters"""
+
+    def test_stats_per_model(self, cache):
+        cache.put_many(MODEL, "de", "en", {"Hallo": "Hello"})
+        cache.get_many(MODEL, "de", "en", ["Hallo", "Tschüss"])
+
+        stats = cache.get_stats(MODEL)
+
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == 0.5
+        assert cache.get_stats("other-model")["hits"] == 0
+
+    def test_clear_resets(self, cache):
+        cache.put_many(MODEL, "de", "en", {"Hallo": "Hello"})
+        cache.get_many(MODEL, "de", "en", ["Hallo"])
+
+        cache.clear()
+
+        assert cache.get_stats() == {"hits": 0, "misses": 0, "hit_ratio": 0.0, "entries": 0, "max_entries": 3}
@@ -0,0 +1,108 @@
+"""
+Unit tests for the translation scheduler
+Tests length bucketing, order restoration and per-mode beam sizes and statistics
+"""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService
+from services.translationservice.translation_scheduler import (
+    LIVE,
+    OFFLINE,
+    TranslationModeStats,
+    beam_size_for,
+    length_buckets,
+)
+
+
+class TestLengthBuckets:
+    """Test grouping of texts by token length"""
+
+    def test_buckets_sort_by_length_and_cover_every_position(self):
+        buckets = length_buckets([9, 2, 5, 2, 30, 6], max_batch_size=2)
+
+        assert buckets == [[1, 3], [2, 5], [0, 4]]
+
+    def test_padded_token_bound_closes_bucket(self):
+        buckets = length_buckets([10, 10, 10, 40], max_batch_size=64, max_batch_tokens=60)
+
+        assert buckets == [[0, 1, 2], [3]]
+
+    def test_text_longer_than_bound_gets_own_bucket(self):
+        assert length_buckets([500, 3], max_batch_size=64, max_batch_tokens=100) == [[1], [0]]
+
+
+class TestModes:
+    """Test beam sizes and statistics per request class"""
+
+    def test_beam_size_per_mode(self):
+        with (
+            patch("services.translationservice.translation_scheduler.settings.translation_live_beam_size", 1),
+            patch("services.translationservice.translation_scheduler.settings.translation_offline_beam_size", 4),
+        ):
+            assert beam_size_for(LIVE) == 1
+            assert beam_size_for(OFFLINE) == 4
+
+        with pytest.raises(ValueError):
+            beam_size_for("batch")
+
+    def test_stats_report_throughput_padding_and_log_prob(self):
+        stats = TranslationModeStats()
+
+        stats.record(
+            OFFLINE,
+            beam_size=4,
+            batches=1,
+            source_lengths=[3, 5],
+            padded_tokens=10,
+            target_tokens=8,
+            log_prob=-4.0,
+            seconds=2.0,
+        )
+
+        offline = stats.snapshot()[OFFLINE]
+        assert offline["beam_size"] == 4
+        assert offline["target_tokens_per_second"] == 4.0
+        assert offline["padding_ratio"] == 0.2
+        assert offline["mean_token_log_prob"] == -0.5
+        assert stats.snapshot()[LIVE]["texts"] == 0
+
+
+class _FakeTranslator:
+    """CTranslate2 Translator echoing its input pieces"""
+
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, batch, beam_size, **kwargs):
+        self.calls.append((batch, beam_size))
+        return [SimpleNamespace(hypotheses=[pieces[:-1]], scores=[-0.5]) for pieces in batch]
+
+
+def test_translate_batch_decodes_buckets_and_restores_order():
+    service = OpusCT2TranslationService()
+    service._translator = _FakeTranslator()
+    service._encode_batch = lambda texts: [[*text.split(), "</s>"] for text in texts]
+    service._decode_batch = lambda hypotheses: [" ".join(pieces) for pieces in hypotheses]
+    texts = ["a b c d", "e", "f g", "h"]
+
+    results = service.translate_batch(texts, "de", "en", mode=OFFLINE, beam_size=3, max_batch_size=2)
+
+    assert [result.translated_text for result in results] == texts
+    assert [len(batch) for batch, _ in service._translator.calls] == [2, 2]
+    assert service._translator.calls[0][0] == [["e", "</s>"], ["h", "</s>"]]
+    assert {beam for _, beam in service._translator.calls} == {3}
+    assert results[0].metadata["mode"] == OFFLINE
+
+
+def test_translate_batch_rejects_unknown_mode_with_explicit_beam_size():
+    service = OpusCT2TranslationService()
+    service._translator = _FakeTranslator()
+
+    with pytest.raises(ValueError, match="Unknown translation mode"):
+        service.translate_batch(["a"], "de", "en", mode="batch", beam_size=2)
+
+    assert service._translator.calls == []
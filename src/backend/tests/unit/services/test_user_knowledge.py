@@ -0,0 +1,137 @@
+"""
+Unit tests for UserKnowledge
+Tests bitset membership, level coverage, unknown-word selection, patching, blob round trips
+and snapshot reuse
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from database.models import Base, UserVocabularyProgress
+from services.vocabulary.user_knowledge import UserKnowledge, load_user_knowledge
+from services.vocabulary.vocabulary_index import VocabularyIndex
+
+ROWS = [
+    (1, "Haus", "Haus", "A1", "NOUN", "house"),
+    (2, "laufen", "laufen", "A2", "VERB", "to run"),
+    (3, "Häuser", "Haus", "B1", "NOUN", None),
+]
+
+
+@pytest.fixture
+def index():
+    return VocabularyIndex("de", ROWS)
+
+
+@pytest.fixture
+def knowledge(index):
+    return UserKnowledge.from_lemmas(["Haus", "selbstgemacht"], index)
+
+
+class TestUserKnowledgeSet:
+    """Test the read-only set behaviour"""
+
+    def test_lemmas_in_index_are_bits(self, knowledge):
+        assert knowledge.bits == 0b101  # both records of "Haus"
+        assert knowledge.extra == frozenset({"selbstgemacht"})
+
+    def test_membership_is_case_insensitive(self, knowledge):
+        assert "haus" in knowledge
+        assert "HAUS" in knowledge
+        assert "selbstgemacht" in knowledge
+        assert "laufen" not in knowledge
+
+    def test_counts_lemmas_not_records(self, knowledge):
+        assert len(knowledge) == 2
+        assert knowledge == frozenset({"haus", "selbstgemacht"})
+
+    def test_without_index_everything_is_extra(self):
+        knowledge = UserKnowledge.from_lemmas(["Haus"], None)
+
+        assert knowledge.bits == 0
+        assert knowledge == frozenset({"haus"})
+        assert knowledge.level_coverage() == {}
+        assert knowledge.unknown_records(["A1"], 10) == []
+
+
+class TestUserKnowledgeQueries:
+    """Test the bitwise statistics and selection"""
+
+    def test_level_coverage(self, knowledge):
+        assert knowledge.level_coverage() == {
+            "A1": {"total": 1, "known": 1},
+            "A2": {"total": 1, "known": 0},
+            "B1": {"total": 1, "known": 1},
+        }
+
+    def test_unknown_records(self, index, knowledge):
+        records = knowledge.unknown_records(["A1", "A2"], limit=10)
+
+        assert [index.record_info(record)["lemma"] for record in records] == ["laufen"]
+
+
+class TestUserKnowledgeUpdates:
+    """Test copy-on-write patches, rebasing and persistence"""
+
+    def test_with_lemmas_returns_patched_copy(self, knowledge):
+        patched = knowledge.with_lemmas(["Laufen", "neu"], is_known=True).with_lemmas(["haus"], is_known=False)
+
+        assert patched == frozenset({"laufen", "neu", "selbstgemacht"})
+        assert knowledge == frozenset({"haus", "selbstgemacht"})
+
+    def test_blob_round_trip(self, index, knowledge):
+        blob = knowledge.to_blob()
+        restored = UserKnowledge.from_blob(index, blob, "\n".join(sorted(knowledge.extra)))
+
+        assert len(blob) == 1
+        assert restored.bits == knowledge.bits
+        assert restored == knowledge
+
+    def test_rebase_onto_rebuilt_index(self, knowledge):
+        rebuilt = VocabularyIndex("de", [(7, "laufen", "laufen", "A2", "VERB", None), *ROWS])
+        rebased = knowledge.rebase(rebuilt)
+
+        assert rebased.index is rebuilt
+        assert rebased == knowledge
+        assert rebased.level_coverage()["A2"] == {"total": 2, "known": 0}
+
+
+class TestLoadUserKnowledge:
+    """Test the persisted snapshot against an in-memory database"""
+
+    @pytest.fixture
+    async def session_factory(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        yield async_sessionmaker(engine, expire_on_commit=False)
+        await engine.dispose()
+
+    async def _set_known(self, session_factory, ids: list[int], is_known: bool, updated_at: datetime) -> None:
+        async with session_factory() as session:
+            await session.execute(
+                update(UserVocabularyProgress)
+                .where(UserVocabularyProgress.id.in_(ids))
+                .values(is_known=is_known, updated_at=updated_at)
+            )
+            await session.commit()
+
+    async def test_swapped_known_rows_invalidate_snapshot(self, index, session_factory):
+        """Unmarking ids 3 and 5 and marking 2 and 6 keeps count, id sum and highest id"""
+        async with session_factory() as session:
+            session.add_all(
+                UserVocabularyProgress(user_id=1, lemma=lemma, language="de", updated_at=datetime(2026, 1, 1))
+                for lemma in ("a", "b", "c", "d", "e", "f")
+            )
+            await session.commit()
+        await self._set_known(session_factory, [3, 5], True, datetime(2026, 1, 1))
+
+        assert await load_user_knowledge(1, "de", index, session_factory) == frozenset({"c", "e"})
+
+        await self._set_known(session_factory, [3, 5], False, datetime(2026, 1, 2))
+        await self._set_known(session_factory, [2, 6], True, datetime(2026, 1, 2))
+
+        assert await load_user_knowledge(1, "de", index, session_factory) == frozenset({"b", "f"})
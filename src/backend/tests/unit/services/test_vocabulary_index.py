@@ -0,0 +1,99 @@
+"""
+Unit tests for VocabularyIndex and VocabularyIndexRegistry
+Tests in-memory lemma/surface-form lookup, stats and event-driven invalidation
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from services.vocabulary.events import EventBus, VocabularyAddedEvent
+from services.vocabulary.vocabulary_index import VocabularyIndex, VocabularyIndexRegistry
+
+ROWS = [
+    (1, "Haus", "Haus", "A1", "NOUN", "house"),
+    (2, "laufen", "laufen", "A2", "VERB", "to run"),
+    (3, "Häuser", "Haus", "B1", "NOUN", None),
+]
+
+
+@pytest.fixture
+def index():
+    return VocabularyIndex("de", ROWS)
+
+
+class TestVocabularyIndexLookup:
+    """Test lookups against the immutable index"""
+
+    def test_lookup_by_lemma(self, index):
+        info = index.lookup("läuft", lemma="laufen")
+
+        assert info == {
+            "id": 2,
+            "word": "läuft",
+            "lemma": "laufen",
+            "found_word": "laufen",
+            "language": "de",
+            "difficulty_level": "A2",
+            "part_of_speech": "VERB",
+            "translation_en": "to run",
+            "found": True,
+        }
+
+    def test_lookup_by_surface_form_is_case_insensitive(self, index):
+        info = index.lookup("häuser")
+
+        assert info["id"] == 3
+        assert info["difficulty_level"] == "B1"
+        assert info["translation_en"] is None
+
+    def test_first_row_wins_for_duplicate_lemma(self, index):
+        assert index.lookup("haus", lemma="Haus")["id"] == 1
+
+    def test_unknown_word(self, index):
+        assert index.lookup("xyz", lemma="xyz") is None
+
+    def test_stats(self, index):
+        stats = index.get_stats()
+
+        assert stats["entries"] == 3
+        assert stats["lemmas"] == 2
+        assert stats["surface_forms"] == 3
+        assert stats["memory_bytes"] > 0
+
+
+class TestVocabularyIndexRegistry:
+    """Test build-on-demand and invalidation via VocabularyAddedEvent"""
+
+    @pytest.fixture
+    def registry(self):
+        registry = VocabularyIndexRegistry()
+        with patch.object(VocabularyIndexRegistry, "enabled", new_callable=PropertyMock, return_value=True):
+            yield registry
+
+    @pytest.mark.asyncio
+    async def test_index_reused_until_vocabulary_added(self, registry):
+        event_bus = EventBus()
+        registry.register_event_handlers(event_bus)
+        load = AsyncMock(side_effect=lambda language, session_factory: VocabularyIndex(language, ROWS))
+
+        with patch.object(VocabularyIndex, "load", load):
+            first = await registry.get("de")
+            assert await registry.get("de") is first
+            assert load.await_count == 1
+
+            event_bus.publish(VocabularyAddedEvent(metadata={"language": "de"}, source="import"))
+            assert registry.get_stats()["de"]["stale"] is True
+
+            second = await registry.get("de")
+            await asyncio.sleep(0)  # let the background rebuild scheduled by the event finish
+
+        assert second is not first
+        assert registry.get_stats()["de"]["stale"] is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_returns_none(self):
+        registry = VocabularyIndexRegistry()
+        with patch.object(VocabularyIndexRegistry, "enabled", new_callable=PropertyMock, return_value=False):
+            assert await registry.get("de") is None
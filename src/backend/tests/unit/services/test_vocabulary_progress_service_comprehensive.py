@@ -8,9 +8,11 @@ Coverage Target: Bring vocabulary_progress_service.py from 38% to 85%+
 
 Test Categories:
 1. mark_word_known edge cases (confidence boundaries, marking as unknown)
-2. bulk_mark_level functionality (complete coverage)
-3. get_user_vocabulary_stats functionality (complete coverage)
-4. Factory function testing
+2. get_user_vocabulary_stats functionality (complete coverage)
+3. Factory function testing
+
+bulk_mark_level is a single upsert statement and is tested against SQLite in
+tests/integration/test_vocabulary_service_real_integration.py.
 """
 
 from unittest.mock import AsyncMock, Mock, patch
@@ -18,7 +20,6 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.models import UserVocabularyProgress
 from services.vocabulary.vocabulary_progress_service import (
     VocabularyProgressService,
     get_vocabulary_progress_service,
@@ -189,211 +190,6 @@ class TestMarkWordKnownEdgeCases:
         assert mock_progress.review_count == 3
 
 
-class TestBulkMarkLevel:
-    """Test bulk_mark_level functionality (lines 189-246)"""
-
-    @pytest.fixture
-    def service(self):
-        return VocabularyProgressService()
-
-    @pytest.fixture
-    def mock_db_session(self):
-        session = AsyncMock(spec=AsyncSession)
-        session.add = Mock()
-        session.add_all = Mock()
-        return session
-
-    async def test_bulk_mark_level_empty_level(self, service, mock_db_session):
-        """Test bulk marking when level has no words"""
-        # Mock empty word list
-        mock_vocab_result = Mock()
-        mock_vocab_result.all.return_value = []
-
-        mock_db_session.execute.return_value = mock_vocab_result
-
-        # Execute
-        result = await service.bulk_mark_level(db=mock_db_session, user_id=1, language="de", level="C2", is_known=True)
-
-        # Assert
-        assert result["success"] is True
-        assert result["updated_count"] == 0
-        assert result["level"] == "C2"
-        assert result["language"] == "de"
-        assert result["is_known"] is True
-
-        # No database writes for empty level
-        mock_db_session.add_all.assert_not_called()
-
-    async def test_bulk_mark_level_creates_new_progress_records(self, service, mock_db_session):
-        """Test bulk marking creates new progress records when none exist"""
-        # Mock word list for A1 level
-        mock_words = [(1, "der"), (2, "die"), (3, "das")]
-        mock_vocab_result = Mock()
-        mock_vocab_result.all.return_value = mock_words
-
-        # Mock empty existing progress
-        mock_progress_result = Mock()
-        mock_progress_result.scalars.return_value = []
-
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_vocab_result  # First call: get words
-            else:
-                return mock_progress_result  # Second call: get existing progress
-
-        mock_db_session.execute.side_effect = mock_execute
-
-        # Execute
-        result = await service.bulk_mark_level(db=mock_db_session, user_id=1, language="de", level="A1", is_known=True)
-
-        # Assert
-        assert result["success"] is True
-        assert result["updated_count"] == 3
-        assert result["level"] == "A1"
-        assert result["is_known"] is True
-
-        # Verify add_all called with 3 new progress records
-        mock_db_session.add_all.assert_called_once()
-        added_records = mock_db_session.add_all.call_args[0][0]
-        assert len(added_records) == 3
-        assert all(isinstance(record, UserVocabularyProgress) for record in added_records)
-        assert all(record.is_known is True for record in added_records)
-        assert all(record.confidence_level == 3 for record in added_records)  # Bulk sets to 3
-
-        # Transaction managed externally - verify behavior (data persisted), not implementation
-
-    async def test_bulk_mark_level_updates_existing_progress_records(self, service, mock_db_session):
-        """Test bulk marking updates existing progress records"""
-        # Mock word list
-        mock_words = [(1, "der"), (2, "die")]
-        mock_vocab_result = Mock()
-        mock_vocab_result.all.return_value = mock_words
-
-        # Mock existing progress for both words
-        mock_progress_1 = Mock()
-        mock_progress_1.vocabulary_id = 1
-        mock_progress_1.lemma = "der"
-        mock_progress_1.confidence_level = 2
-        mock_progress_1.is_known = False
-
-        mock_progress_2 = Mock()
-        mock_progress_2.vocabulary_id = 2
-        mock_progress_2.lemma = "die"
-        mock_progress_2.confidence_level = 1
-        mock_progress_2.is_known = False
-
-        mock_progress_result = Mock()
-        mock_progress_result.scalars.return_value = [mock_progress_1, mock_progress_2]
-
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_vocab_result
-            else:
-                return mock_progress_result
-
-        mock_db_session.execute.side_effect = mock_execute
-
-        # Execute
-        result = await service.bulk_mark_level(db=mock_db_session, user_id=1, language="de", level="A1", is_known=True)
-
-        # Assert
-        assert result["success"] is True
-        assert result["updated_count"] == 2
-
-        # Verify existing records were updated (not created)
-        assert mock_progress_1.is_known is True
-        assert mock_progress_1.confidence_level == 3
-        assert mock_progress_2.is_known is True
-        assert mock_progress_2.confidence_level == 3
-
-        # No new records added
-        mock_db_session.add_all.assert_not_called()
-
-    async def test_bulk_mark_level_mixed_existing_and_new(self, service, mock_db_session):
-        """Test bulk marking with mix of existing and new progress records"""
-        # Mock 3 words
-        mock_words = [(1, "der"), (2, "die"), (3, "das")]
-        mock_vocab_result = Mock()
-        mock_vocab_result.all.return_value = mock_words
-
-        # Mock existing progress for only first word
-        mock_progress_1 = Mock()
-        mock_progress_1.vocabulary_id = 1
-        mock_progress_1.lemma = "der"
-        mock_progress_1.confidence_level = 2
-        mock_progress_1.is_known = False
-
-        mock_progress_result = Mock()
-        mock_progress_result.scalars.return_value = [mock_progress_1]
-
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_vocab_result
-            else:
-                return mock_progress_result
-
-        mock_db_session.execute.side_effect = mock_execute
-
-        # Execute
-        result = await service.bulk_mark_level(db=mock_db_session, user_id=1, language="de", level="A1", is_known=True)
-
-        # Assert
-        assert result["success"] is True
-        assert result["updated_count"] == 3
-
-        # Verify existing record updated
-        assert mock_progress_1.is_known is True
-        assert mock_progress_1.confidence_level == 3
-
-        # Verify 2 new records created
-        mock_db_session.add_all.assert_called_once()
-        added_records = mock_db_session.add_all.call_args[0][0]
-        assert len(added_records) == 2
-
-    async def test_bulk_mark_level_as_unknown(self, service, mock_db_session):
-        """Test bulk marking words as UNKNOWN (is_known=False)"""
-        # Mock word list
-        mock_words = [(1, "der"), (2, "die")]
-        mock_vocab_result = Mock()
-        mock_vocab_result.all.return_value = mock_words
-
-        # Mock empty existing progress
-        mock_progress_result = Mock()
-        mock_progress_result.scalars.return_value = []
-
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                return mock_vocab_result
-            else:
-                return mock_progress_result
-
-        mock_db_session.execute.side_effect = mock_execute
-
-        # Execute - mark as UNKNOWN
-        result = await service.bulk_mark_level(db=mock_db_session, user_id=1, language="de", level="A1", is_known=False)
-
-        # Assert
-        assert result["success"] is True
-        assert result["is_known"] is False
-
-        # Verify confidence set to 0 for unknown
-        added_records = mock_db_session.add_all.call_args[0][0]
-        assert all(record.is_known is False for record in added_records)
-        assert all(record.confidence_level == 0 for record in added_records)
-
-
 class TestGetUserVocabularyStats:
     """Test get_user_vocabulary_stats functionality (lines 248-301)"""
 
@@ -0,0 +1,101 @@
+"""
+Unit tests for VocabularyStatsCache
+Tests hits, TTL expiry, event-driven invalidation and LRU bounds
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from services.vocabulary.events import EventBus, ProgressUpdatedEvent, VocabularyAddedEvent, WordLearnedEvent
+from services.vocabulary.vocabulary_stats_cache import VocabularyStatsCache
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+@pytest.fixture
+def cache(bus):
+    with patch.object(VocabularyStatsCache, "enabled", new_callable=PropertyMock, return_value=True):
+        cache = VocabularyStatsCache(ttl_seconds=60, max_entries=2)
+        cache.register_event_handlers(bus)  # keep the global bus out of the tests
+        yield cache
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_recomputed(cache):
+    cache.ttl_seconds = 0
+    loader = AsyncMock(return_value={"total_words": 10})
+
+    await cache.get(1, ("summary",), loader)
+    await cache.get(1, ("summary",), loader)
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_progress_events_drop_only_that_user(cache, bus):
+    await cache.get(1, ("summary",), AsyncMock(return_value={}))
+    await cache.get(2, ("summary",), AsyncMock(return_value={}))
+
+    bus.publish(ProgressUpdatedEvent(user_id=1))
+
+    assert cache.get_stats()["entries"] == 1
+    assert cache.invalidations == 1
+
+    bus.publish(WordLearnedEvent(user_id=2))
+
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_vocabulary_added_drops_all_users(cache, bus):
+    await cache.get(1, ("summary",), AsyncMock(return_value={}))
+    await cache.get(2, ("summary",), AsyncMock(return_value={}))
+
+    bus.publish(VocabularyAddedEvent(metadata={"language": "de"}))
+
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_load_overlapping_an_event_is_not_stored(cache):
+    release = asyncio.Event()
+
+    async def slow_loader():
+        await release.wait()
+        return {"total_words": 10}
+
+    pending = asyncio.create_task(cache.get(1, ("summary",), slow_loader))
+    await asyncio.sleep(0)
+    cache.invalidate(1)
+    release.set()
+
+    assert await pending == {"total_words": 10}
+    assert cache.get_stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_state_of_dropped_users_is_not_kept(cache):
+    for user_id in range(10):
+        await cache.get(user_id, ("summary",), AsyncMock(return_value={}))
+        cache.invalidate(user_id)
+
+    assert cache.get_stats()["entries"] == 0
+    assert not cache._loads
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_dropped(cache):
+    for user_id in (1, 2, 3):
+        await cache.get(user_id, ("summary",), AsyncMock(return_value={}))
+
+    loader = AsyncMock(return_value={})
+    await cache.get(3, ("summary",), loader)  # still cached
+    await cache.get(1, ("summary",), loader)  # dropped when user 3 was added
+
+    assert loader.await_count == 1
+    assert cache.get_stats()["entries"] == 2
@@ -23,6 +23,13 @@ from services.vocabulary.vocabulary_stats_service import (
 )
 
 
+def _rows(rows):
+    """Result of the grouped (level, total, known) query"""
+    result = Mock()
+    result.all.return_value = rows
+    return result
+
+
 class TestGetVocabularyStats:
     """Test get_vocabulary_stats functionality (lines 20-28, 93-166)"""
 
@@ -55,34 +62,7 @@ class TestGetVocabularyStats:
 
     async def test_get_vocabulary_stats_with_session_all_levels_empty(self, service, mock_db_session):
         """Test statistics when all CEFR levels are empty"""
-        # Mock empty results for all queries
-        mock_total_result = Mock()
-        mock_total_result.scalar.return_value = 0
-
-        mock_known_result = Mock()
-        mock_known_result.scalar.return_value = 0
-
-        mock_unknown_result = Mock()
-        mock_unknown_result.scalar.return_value = 0
-
-        # Setup execute to return mocks based on call count
-        call_count = [0]
-        total_calls_per_level = 2  # 1 total + 1 known per level
-        num_levels = 6  # A1, A2, B1, B2, C1, C2
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            if call_count[0] <= num_levels * total_calls_per_level:
-                # Level queries
-                if call_count[0] % 2 == 1:
-                    return mock_total_result  # Odd calls: total words
-                else:
-                    return mock_known_result  # Even calls: known words
-            else:
-                # Final query: unknown words (vocabulary_id IS NULL)
-                return mock_unknown_result
-
-        mock_db_session.execute.side_effect = mock_execute
+        mock_db_session.execute.return_value = _rows([(None, 0, 0)])
 
         # Execute
         result = await service._get_vocabulary_stats_with_session(
@@ -98,30 +78,8 @@ class TestGetVocabularyStats:
 
     async def test_get_vocabulary_stats_with_session_some_known_words(self, service, mock_db_session):
         """Test statistics with partial vocabulary knowledge across levels"""
-        # Mock results for A1: 100 total, 50 known
-        # All other levels: 0 total, 0 known
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-
-            mock_result = Mock()
-
-            # First level (A1): 100 total, 50 known
-            if call_count[0] == 1:
-                mock_result.scalar.return_value = 100  # A1 total
-            elif call_count[0] == 2:
-                mock_result.scalar.return_value = 50  # A1 known
-            # All other levels (A2-C2): 0 total, 0 known
-            elif call_count[0] <= 12:  # 5 more levels * 2 queries each
-                mock_result.scalar.return_value = 0
-            # Unknown words (vocabulary_id IS NULL)
-            else:
-                mock_result.scalar.return_value = 10  # 10 unknown words marked as known
-
-            return mock_result
-
-        mock_db_session.execute.side_effect = mock_execute
+        # A1: 100 total, 50 known; 10 known words without vocabulary entry (level NULL row)
+        mock_db_session.execute.return_value = _rows([("A1", 100, 50), (None, 0, 10)])
 
         # Execute
         result = await service._get_vocabulary_stats_with_session(
@@ -133,19 +91,25 @@ class TestGetVocabularyStats:
         assert result.total_known == 60  # 50 from A1 + 10 unknown words
         assert result.levels["A1"]["total_words"] == 100
         assert result.levels["A1"]["user_known"] == 50
+        assert result.levels["B2"] == {"total_words": 0, "user_known": 0}
 
-    async def test_get_vocabulary_stats_with_session_handles_none_results(self, service, mock_db_session):
-        """Test statistics handles NULL/None results from database"""
-        # Mock None results (empty database)
-        call_count = [0]
+    async def test_get_vocabulary_stats_with_session_uses_one_query(self, service, mock_db_session):
+        """Test all levels and the unlisted known words come from a single round trip"""
+        # Level totals and the user's known words per level arrive as separate rows
+        mock_db_session.execute.return_value = _rows([("A1", 10, 0), ("B1", 20, 0), ("A1", 0, 1), (None, 0, 3)])
 
-        async def mock_execute(*args):
-            call_count[0] += 1
-            mock_result = Mock()
-            mock_result.scalar.return_value = None  # SQLAlchemy returns None for empty counts
-            return mock_result
+        result = await service._get_vocabulary_stats_with_session(
+            db_session=mock_db_session, user_id=1, target_language="de", native_language="en"
+        )
 
-        mock_db_session.execute.side_effect = mock_execute
+        assert mock_db_session.execute.await_count == 1
+        assert result.levels["A1"] == {"total_words": 10, "user_known": 1}
+        assert result.levels["B1"] == {"total_words": 20, "user_known": 0}
+        assert result.total_known == 4
+
+    async def test_get_vocabulary_stats_with_session_handles_none_results(self, service, mock_db_session):
+        """Test statistics handles NULL/None results from database"""
+        mock_db_session.execute.return_value = _rows([("A1", None, None), (None, 0, None)])
 
         # Execute
         result = await service._get_vocabulary_stats_with_session(
@@ -170,16 +134,7 @@ class TestGetUserProgressSummary:
 
     async def test_progress_summary_no_words(self, service, mock_db_session):
         """Test progress summary when no words exist"""
-        # Mock 0 total words, 0 known words, 0 per level
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            mock_result = Mock()
-            mock_result.scalar.return_value = 0
-            return mock_result
-
-        mock_db_session.execute.side_effect = mock_execute
+        mock_db_session.execute.return_value = _rows([(None, 0, 0)])
 
         # Execute
         result = await service.get_user_progress_summary(db_session=mock_db_session, user_id=1)
@@ -202,40 +157,10 @@ class TestGetUserProgressSummary:
 
     async def test_progress_summary_partial_knowledge(self, service, mock_db_session):
         """Test progress summary with partial vocabulary knowledge"""
-        # Mock: 1000 total words, 250 known words overall
         # A1: 200 total, 150 known (75%)
         # A2: 300 total, 100 known (33.3%)
-        # Others: 0
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            mock_result = Mock()
-
-            # First 2 calls: overall stats
-            if call_count[0] == 1:
-                mock_result.scalar.return_value = 1000  # Total words
-            elif call_count[0] == 2:
-                mock_result.scalar.return_value = 250  # Known words
-            # Level queries (2 per level: total + known)
-            elif call_count[0] == 3:
-                mock_result.scalar.return_value = 200  # A1 total
-            elif call_count[0] == 4:
-                mock_result.scalar.return_value = 150  # A1 known
-            elif call_count[0] == 5:
-                mock_result.scalar.return_value = 300  # A2 total
-            elif call_count[0] == 6:
-                mock_result.scalar.return_value = 100  # A2 known
-            elif call_count[0] == 7:
-                mock_result.scalar.return_value = 500  # B1 total
-            elif call_count[0] == 8:
-                mock_result.scalar.return_value = 0  # B1 known
-            else:
-                mock_result.scalar.return_value = 0  # Rest: 0
-
-            return mock_result
-
-        mock_db_session.execute.side_effect = mock_execute
+        # B1: 500 total, 0 known
+        mock_db_session.execute.return_value = _rows([("A1", 200, 150), ("A2", 300, 100), ("B1", 500, 0), (None, 0, 0)])
 
         # Execute
         result = await service.get_user_progress_summary(db_session=mock_db_session, user_id=1)
@@ -244,6 +169,7 @@ class TestGetUserProgressSummary:
         assert result["total_words"] == 1000
         assert result["known_words"] == 250
         assert result["percentage_known"] == 25.0
+        assert mock_db_session.execute.await_count == 1
 
         # Assert level breakdown
         assert len(result["levels_progress"]) == 6
@@ -268,34 +194,15 @@ class TestGetUserProgressSummary:
 
     async def test_progress_summary_percentage_rounding(self, service, mock_db_session):
         """Test percentage calculations are rounded to 1 decimal place"""
-        # Mock: 300 total, 123 known = 41.0%
-        # A1: 77 known / 200 total = 38.5%
-        call_count = [0]
-
-        async def mock_execute(*args):
-            call_count[0] += 1
-            mock_result = Mock()
-
-            if call_count[0] == 1:
-                mock_result.scalar.return_value = 300  # Total
-            elif call_count[0] == 2:
-                mock_result.scalar.return_value = 123  # Known (41.0%)
-            elif call_count[0] == 3:
-                mock_result.scalar.return_value = 200  # A1 total
-            elif call_count[0] == 4:
-                mock_result.scalar.return_value = 77  # A1 known (38.5%)
-            else:
-                mock_result.scalar.return_value = 0
-
-            return mock_result
-
-        mock_db_session.execute.side_effect = mock_execute
+        # A1: 77 known / 200 total = 38.5%; 46 known words without vocabulary entry
+        # Overall: 123 known / 200 total = 61.5%
+        mock_db_session.execute.return_value = _rows([("A1", 200, 77), (None, 0, 46)])
 
         # Execute
         result = await service.get_user_progress_summary(db_session=mock_db_session, user_id=1)
 
         # Assert rounding to 1 decimal
-        assert result["percentage_known"] == 41.0
+        assert result["percentage_known"] == 61.5
         assert result["levels_progress"][0]["percentage"] == 38.5
 
 
@@ -0,0 +1,50 @@
+"""
+Unit tests shared by the per-user vocabulary caches
+Tests the lookup contract KnownLemmaCache and VocabularyStatsCache have in common
+"""
+
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+import pytest
+
+from services.vocabulary.events import EventBus
+from services.vocabulary.known_lemma_cache import KnownLemmaCache
+from services.vocabulary.vocabulary_stats_cache import VocabularyStatsCache
+
+# (cache class, lookup of one user's entry)
+CACHES = [
+    pytest.param(KnownLemmaCache, lambda cache, user_id, loader: cache.get(user_id, "de", loader), id="known_lemmas"),
+    pytest.param(
+        VocabularyStatsCache, lambda cache, user_id, loader: cache.get(user_id, ("levels", "de"), loader), id="stats"
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_class, lookup", CACHES)
+async def test_second_lookup_is_served_from_cache(cache_class, lookup):
+    loader = AsyncMock(return_value=["haus"])
+
+    with patch.object(cache_class, "enabled", new_callable=PropertyMock, return_value=True):
+        cache = cache_class()
+        cache.register_event_handlers(EventBus())  # keep the global bus out of the tests
+        first = await lookup(cache, 1, loader)
+        second = await lookup(cache, "1", loader)
+
+    assert second is first
+    assert loader.await_count == 1
+    assert cache.get_stats()["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_class, lookup", CACHES)
+async def test_disabled_cache_always_loads(cache_class, lookup):
+    cache = cache_class()
+    loader = AsyncMock(return_value=["haus"])
+
+    with patch.object(cache_class, "enabled", new_callable=PropertyMock, return_value=False):
+        await lookup(cache, 1, loader)
+        await lookup(cache, 1, loader)
+
+    assert loader.await_count == 2
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,117 @@
+"""
+Unit tests for word timings
+Tests the per-segment word timing array, the SRT sidecar and FilteredWord timing from it
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from services.filterservice.subtitle_processing.srt_file_handler import SRTFileHandler
+from services.transcriptionservice.interface import TranscriptionSegment
+from services.transcriptionservice.word_timings import (
+    WORD_TIMING_FIELDS,
+    read_word_sidecar,
+    sidecar_path,
+    word_timings,
+    write_word_sidecar,
+)
+
+SRT_CONTENT = "1\n00:00:01,000 --> 00:00:04,000\nIch heiße Anna.\n\n2\n00:00:05,000 --> 00:00:06,000\nJa!\n\n"
+
+
+def _words(*rows: tuple[str, float, float]) -> list[SimpleNamespace]:
+    return [SimpleNamespace(word=word, start=start, end=end) for word, start, end in rows]
+
+
+def _timings(*rows: tuple[float, float, int, int]) -> np.ndarray:
+    return np.array(list(rows), dtype=WORD_TIMING_FIELDS)
+
+
+class TestWordTimings:
+    """Test character spans of faster-whisper words in the stripped segment text"""
+
+    def test_spans_index_the_stripped_text(self):
+        text = " Ich heiße Anna."
+        timings = word_timings(_words((" Ich", 1.0, 1.3), (" heiße", 1.3, 2.9), (" Anna.", 3.0, 3.8)))
+
+        stripped = text.strip()
+        assert [stripped[s:e] for s, e in zip(timings["char_start"], timings["char_end"], strict=True)] == [
+            "Ich",
+            "heiße",
+            "Anna.",
+        ]
+        np.testing.assert_allclose(timings["start"], [1.0, 1.3, 3.0])
+
+    def test_empty_words(self):
+        assert len(word_timings([])) == 0
+
+
+class TestWordSidecar:
+    """Test writing and reading the .words.npy sidecar"""
+
+    def test_round_trip_by_cue(self, tmp_path):
+        srt = tmp_path / "episode.srt"
+        segments = [
+            TranscriptionSegment(1.0, 4.0, "Ich heiße Anna.", words=_timings((1.0, 1.3, 0, 3), (3.0, 3.8, 10, 15))),
+            TranscriptionSegment(4.5, 4.9, "Hm."),
+            TranscriptionSegment(5.0, 6.0, "Ja!", words=_timings((5.2, 5.6, 0, 2))),
+        ]
+
+        assert write_word_sidecar(srt, segments) == tmp_path / "episode.words.npy"
+
+        cues = read_word_sidecar(srt)
+        assert sorted(cues) == [1, 3]
+        np.testing.assert_allclose(cues[1]["end"], [1.3, 3.8])
+        assert cues[3]["char_end"].tolist() == [2]
+
+    def test_segments_without_words_remove_stale_sidecar(self, tmp_path):
+        srt = tmp_path / "episode.srt"
+        sidecar_path(srt).write_bytes(b"stale")
+
+        assert write_word_sidecar(srt, [TranscriptionSegment(0.0, 1.0, "Ja")]) is None
+        assert not sidecar_path(srt).exists()
+
+    def test_unreadable_sidecar_is_ignored(self, tmp_path):
+        srt = tmp_path / "episode.srt"
+        sidecar_path(srt).write_bytes(b"not numpy")
+
+        assert read_word_sidecar(srt) == {}
+
+
+class TestSRTFileHandlerWordTiming:
+    """Test FilteredWord start/end come from the sidecar"""
+
+    @pytest.mark.asyncio
+    async def test_words_are_timed_from_sidecar(self, tmp_path):
+        srt = tmp_path / "episode.srt"
+        srt.write_text(SRT_CONTENT, encoding="utf-8")
+        write_word_sidecar(
+            srt,
+            [
+                TranscriptionSegment(
+                    1.0,
+                    4.0,
+                    "Ich heiße Anna.",
+                    words=_timings((1.0, 1.25, 0, 3), (1.25, 2.5, 4, 9), (3.0, 3.75, 10, 15)),
+                ),
+                TranscriptionSegment(5.0, 6.0, "Ja!"),
+            ],
+        )
+
+        subtitles = await SRTFileHandler().parse_srt_file(str(srt))
+
+        assert [(w.text, w.start_time, w.end_time) for w in subtitles[0].words] == [
+            ("ich", 1.0, 1.25),
+            ("heiße", 1.25, 2.5),
+            ("anna", 3.0, 3.75),
+        ]
+        assert [(w.start_time, w.end_time) for w in subtitles[1].words] == [(5.0, 6.0)]  # evenly spaced
+
+    def test_timings_of_another_text_fall_back_to_even_spacing(self):
+        words = SRTFileHandler().extract_words_from_text(
+            "Hallo Welt", 0.0, 2.0, _timings((0.0, 0.4, 0, 5), (0.5, 1.9, 6, 30))
+        )
+
+        assert [(w.start_time, w.end_time) for w in words] == [(0.0, 1.0), (1.0, 2.0)]